@@ -14,7 +14,7 @@ limitations under the License.
 """
 
 from dapr.actor.actor_interface import ActorInterface, actormethod
-from dapr.actor.client.proxy import ActorProxy, ActorProxyFactory
+from dapr.actor.client.proxy import ActorInvocationResult, ActorProxy, ActorProxyFactory
 from dapr.actor.error import (
     ActorMethodNotFoundError,
     ActorNotFoundError,
@@ -22,6 +22,8 @@ from dapr.actor.error import (
     ActorTypeNotFoundError,
 )
 from dapr.actor.id import ActorId
+from dapr.actor.runtime._reminder_data import ActorReminderData
+from dapr.actor.runtime._timer_data import ActorTimerData
 from dapr.actor.runtime.actor import Actor
 from dapr.actor.runtime.failure_policy import ActorReminderFailurePolicy
 from dapr.actor.runtime.grpc_host import ActorGrpcHost
@@ -31,6 +33,7 @@ from dapr.actor.runtime.runtime import ActorRuntime
 __all__ = [
     'ActorInterface',
     'ActorGrpcHost',
+    'ActorInvocationResult',
     'ActorProxy',
     'ActorProxyFactory',
     'ActorId',
@@ -38,8 +41,10 @@ __all__ = [
     'ActorMethodNotFoundError',
     'ActorNotFoundError',
     'ActorPayloadDecodeError',
+    'ActorReminderData',
     'ActorReminderFailurePolicy',
     'ActorRuntime',
+    'ActorTimerData',
     'ActorTypeNotFoundError',
     'Remindable',
     'actormethod',
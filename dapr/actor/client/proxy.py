@@ -13,8 +13,10 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, Optional, Type
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Set, Type, Union
 
 from dapr.actor.actor_interface import ActorInterface
 from dapr.actor.id import ActorId
@@ -27,6 +29,41 @@ from dapr.serializers import DefaultJSONSerializer, Serializer
 # Actor factory Callable type hint.
 ACTOR_FACTORY_CALLBACK = Callable[[ActorInterface, str, str], 'ActorProxy']
 
+DEFAULT_INVOKE_MANY_CONCURRENCY = 64
+
+# Dispatchable attributes per actor interface. Interfaces are immutable class
+# definitions, so the map is built once and shared by every proxy.
+_interface_attrs_cache: Dict[Type[ActorInterface], Dict[str, Dict[str, Any]]] = {}
+
+
+def _get_interface_attrs(actor_interface: Type[ActorInterface]) -> Dict[str, Dict[str, Any]]:
+    attrs = _interface_attrs_cache.get(actor_interface)
+    if attrs is None:
+        attrs = {}
+        get_dispatchable_attrs_from_interface(actor_interface, attrs)
+        _interface_attrs_cache[actor_interface] = attrs
+    return attrs
+
+
+@dataclass
+class ActorInvocationResult:
+    """The outcome of one actor call made by :meth:`ActorProxyFactory.invoke_many`.
+
+    Attributes:
+        actor_id (:class:`ActorId`): the actor that was invoked.
+        result (Any): the response; raw bytes, or the deserialized return value when an
+            actor interface was given. ``None`` if the call failed.
+        error (Exception, optional): the exception raised by the call, if any.
+    """
+
+    actor_id: ActorId
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
 
 class ActorFactoryBase(ABC):
     @abstractmethod
@@ -68,6 +105,89 @@ class ActorProxyFactory(ActorFactoryBase):
             self._dapr_client, actor_type, actor_id, actor_interface, self._message_serializer
         )
 
+    async def invoke_many(
+        self,
+        actor_type: str,
+        ids: Iterable[Union[str, ActorId]],
+        method: str,
+        payload: Any = None,
+        max_concurrency: int = DEFAULT_INVOKE_MANY_CONCURRENCY,
+        actor_interface: Optional[Type[ActorInterface]] = None,
+    ) -> AsyncIterator[ActorInvocationResult]:
+        """Invokes the same method with the same payload on many actors.
+
+        The payload is serialized once and shared by every call. At most
+        ``max_concurrency`` calls are in flight, and ``ids`` is consumed lazily,
+        so it can be a generator over a large id space. Results are yielded in
+        completion order; a failing call is reported through
+        :attr:`ActorInvocationResult.error` and does not stop the others.
+
+        Args:
+            actor_type (str): the name of actor type.
+            ids (Iterable[str | ActorId]): the ids of the actors to invoke.
+            method (str): the actor method name.
+            payload (Any, optional): the request body; bytes are sent as-is, other values
+                are serialized with the factory's message serializer.
+            max_concurrency (int): the maximum number of calls in flight.
+            actor_interface (:class:`ActorInterface`, optional): the actor interface used to
+                validate ``method`` and deserialize the responses.
+
+        Yields:
+            :class:`ActorInvocationResult`: one result per actor id.
+        """
+        if max_concurrency < 1:
+            raise ValueError('max_concurrency must be at least 1')
+
+        return_type = None
+        if actor_interface is not None:
+            attr_call_type = _get_interface_attrs(actor_interface).get(method)
+            if attr_call_type is None:
+                raise AttributeError(f'{actor_interface.__name__} has no attribute {method}')
+            method = attr_call_type['actor_method']
+            return_type = attr_call_type['return_types']
+
+        body = payload
+        if payload is not None and not isinstance(payload, bytes):
+            body = self._message_serializer.serialize(payload)
+
+        async def invoke(actor_id: ActorId) -> ActorInvocationResult:
+            try:
+                rtnval = await self._dapr_client.invoke_method(
+                    actor_type, str(actor_id), method, body
+                )
+                if return_type is not None:
+                    rtnval = self._message_serializer.deserialize(rtnval, return_type)
+                return ActorInvocationResult(actor_id, rtnval)
+            except Exception as ex:
+                return ActorInvocationResult(actor_id, error=ex)
+
+        id_iter = iter(ids)
+        pending: Set['asyncio.Task[ActorInvocationResult]'] = set()
+
+        def fill() -> None:
+            while len(pending) < max_concurrency:
+                next_id = next(id_iter, None)
+                if next_id is None:
+                    return
+                if not isinstance(next_id, ActorId):
+                    next_id = ActorId(next_id)
+                pending.add(asyncio.ensure_future(invoke(next_id)))
+
+        try:
+            fill()
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pending.discard(task)
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
 
 class CallableProxy:
     def __init__(
@@ -204,8 +324,8 @@ class ActorProxy:
         if not self._actor_interface:
             raise ValueError('actor_interface is not set. use invoke method.')
 
-        if name not in self._dispatchable_attr:
-            get_dispatchable_attrs_from_interface(self._actor_interface, self._dispatchable_attr)
+        if not self._dispatchable_attr:
+            self._dispatchable_attr = _get_interface_attrs(self._actor_interface)
 
         attr_call_type = self._dispatchable_attr.get(name)
         if attr_call_type is None:
@@ -125,7 +125,7 @@ class ActorReminderData:
             state_bytes = base64.b64decode(b64encoded_state)
         if 'ttl' in obj:
             return ActorReminderData(
-                reminder_name, state_bytes, obj['dueTime'], obj['period'], obj['ttl']
+                reminder_name, state_bytes, obj['dueTime'], obj.get('period'), obj['ttl']
             )
         else:
-            return ActorReminderData(reminder_name, state_bytes, obj['dueTime'], obj['period'])
+            return ActorReminderData(reminder_name, state_bytes, obj['dueTime'], obj.get('period'))
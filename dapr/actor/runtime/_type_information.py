@@ -13,9 +13,13 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import TYPE_CHECKING, List, Type
+from typing import TYPE_CHECKING, Any, Dict, List, Type
 
-from dapr.actor.runtime._type_utils import get_actor_interfaces, is_dapr_actor
+from dapr.actor.runtime._type_utils import (
+    get_actor_interfaces,
+    get_dispatchable_attrs,
+    is_dapr_actor,
+)
 from dapr.actor.runtime.remindable import Remindable
 
 if TYPE_CHECKING:
@@ -37,6 +41,7 @@ class ActorTypeInformation:
         self._name = name
         self._impl_type = implementation_class
         self._actor_bases = actor_bases
+        self._dispatchable_attrs: Dict[str, Any] = get_dispatchable_attrs(implementation_class)
 
     @property
     def type_name(self) -> str:
@@ -53,6 +58,15 @@ class ActorTypeInformation:
         """Returns the list of :class:`ActorInterface` of this type."""
         return self._actor_bases
 
+    @property
+    def dispatchable_attrs(self) -> Dict[str, Any]:
+        """Returns the map from actor method name to its dispatch metadata.
+
+        Computed once when the type information is created, so dispatchers
+        built from the same type share a single copy.
+        """
+        return self._dispatchable_attrs
+
     def is_remindable(self) -> bool:
         """Returns True if this actor implements :class:`Remindable`."""
         return Remindable in self._impl_type.__bases__
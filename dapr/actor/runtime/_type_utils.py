@@ -13,6 +13,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import typing
 from typing import Any, Dict, List, Type
 
 from dapr.actor.actor_interface import ActorInterface
@@ -28,8 +29,23 @@ def get_class_method_args(func: Any) -> List[str]:
     return list(args)
 
 
-def get_method_arg_types(func: Any) -> List[Type]:
+def _get_annotations(func: Any) -> Dict[str, Any]:
+    # Resolve string annotations (``from __future__ import annotations``) so the
+    # serializer sees real types; keep the raw ones if they cannot be resolved.
     annotations = getattr(func, '__annotations__')
+    if not any(isinstance(hint, str) for hint in annotations.values()):
+        return annotations
+    try:
+        resolved = typing.get_type_hints(func)
+    except Exception:
+        return annotations
+    if resolved.get('return') is type(None):
+        resolved['return'] = None
+    return resolved
+
+
+def get_method_arg_types(func: Any) -> List[Type]:
+    annotations = _get_annotations(func)
     args = get_class_method_args(func)
     arg_types = []
     for arg_name in args:
@@ -39,7 +55,7 @@ def get_method_arg_types(func: Any) -> List[Type]:
 
 
 def get_method_return_types(func: Any) -> Type:
-    annotations = getattr(func, '__annotations__')
+    annotations = _get_annotations(func)
     if len(annotations) == 0 or not annotations['return']:
         return object
     return annotations['return']
@@ -15,7 +15,7 @@ limitations under the License.
 
 import uuid
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Iterable, List, Optional
 
 from dapr.actor.id import ActorId
 from dapr.actor.runtime._method_context import ActorMethodContext
@@ -24,6 +24,7 @@ from dapr.actor.runtime._timer_data import TIMER_CALLBACK, ActorTimerData
 from dapr.actor.runtime.context import ActorRuntimeContext
 from dapr.actor.runtime.failure_policy import ActorReminderFailurePolicy
 from dapr.actor.runtime.state_manager import ActorStateManager
+from dapr.clients.base import DEFAULT_BATCH_CONCURRENCY
 
 
 class Actor:
@@ -156,6 +157,93 @@ class Actor:
             self._runtime_ctx.actor_type_info.type_name, self.id.id, name
         )
 
+    async def register_reminders(
+        self,
+        reminders: Iterable[ActorReminderData],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        """Registers many actor reminders with up to ``max_concurrency`` calls in flight.
+
+        Every registration is attempted; if any fail, the first error is raised
+        after the others have finished.
+
+        Args:
+            reminders (Iterable[ActorReminderData]): the reminders to register.
+            max_concurrency (int): the maximum number of registrations in flight.
+        """
+        serializer = self._runtime_ctx.message_serializer
+        await self._runtime_ctx.dapr_client.register_reminders(
+            self._runtime_ctx.actor_type_info.type_name,
+            (
+                (self.id.id, reminder.reminder_name, serializer.serialize(reminder.as_dict()))
+                for reminder in reminders
+            ),
+            max_concurrency,
+        )
+
+    async def register_timers(
+        self,
+        timers: Iterable[ActorTimerData],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        """Registers many actor timers with up to ``max_concurrency`` calls in flight.
+
+        Every registration is attempted; if any fail, the first error is raised
+        after the others have finished.
+
+        Args:
+            timers (Iterable[ActorTimerData]): the timers to register.
+            max_concurrency (int): the maximum number of registrations in flight.
+        """
+        serializer = self._runtime_ctx.message_serializer
+        await self._runtime_ctx.dapr_client.register_timers(
+            self._runtime_ctx.actor_type_info.type_name,
+            (
+                (self.id.id, timer.timer_name, serializer.serialize(timer.as_dict()))
+                for timer in timers
+            ),
+            max_concurrency,
+        )
+
+    async def get_reminder(self, name: str) -> Optional[ActorReminderData]:
+        """Gets a registered actor reminder.
+
+        Args:
+            name (str): the name of the reminder.
+
+        Returns:
+            :class:`ActorReminderData`: the reminder, or None if it is not registered.
+        """
+        body = await self._runtime_ctx.dapr_client.get_reminder(
+            self._runtime_ctx.actor_type_info.type_name, self.id.id, name
+        )
+        if not body:
+            return None
+        obj = self._runtime_ctx.message_serializer.deserialize(body, object)
+        return ActorReminderData.from_dict(name, obj)
+
+    async def list_reminders(self) -> List[ActorReminderData]:
+        """Lists the reminders registered for this actor.
+
+        Lets reconciliation code diff the registered reminders against the
+        desired ones instead of re-registering all of them.
+
+        Returns:
+            List[ActorReminderData]: the registered reminders.
+
+        Raises:
+            NotImplementedError: the actor uses the default HTTP client
+                (:class:`DaprActorHttpClient`); Dapr has no HTTP endpoint for listing
+                reminders. Pass a :class:`DaprActorGrpcClient` as ``actor_client`` to
+                :meth:`ActorRuntime.register_actor`, or host the actor with
+                :class:`ActorGrpcHost`.
+        """
+        body = await self._runtime_ctx.dapr_client.list_reminders(
+            self._runtime_ctx.actor_type_info.type_name, self.id.id
+        )
+        objs = self._runtime_ctx.message_serializer.deserialize(body, object) or []
+        return [ActorReminderData.from_dict(obj['name'], obj) for obj in objs]
+
     async def _on_activate_internal(self) -> None:
         """Clears all state cache, calls the overridden :meth:`_on_activate`,
         and then save the states.
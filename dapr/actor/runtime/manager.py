@@ -40,7 +40,7 @@ class ActorManager:
         self._active_actors: Dict[str, Actor] = {}
         self._active_actors_lock = asyncio.Lock()
 
-        self._dispatcher = ActorMethodDispatcher(ctx.actor_type_info)
+        self._dispatcher = ActorMethodDispatcher(ctx.actor_type_info, self._message_serializer)
         self._timer_method_context = ActorMethodContext.create_for_timer(TIMER_METHOD_NAME)
         self._reminder_method_context = ActorMethodContext.create_for_reminder(REMINDER_METHOD_NAME)
 
@@ -97,23 +97,13 @@ class ActorManager:
     async def dispatch(
         self, actor_id: ActorId, actor_method_name: str, request_body: bytes
     ) -> bytes:
-        method_context = ActorMethodContext.create_for_actor(actor_method_name)
-        arg_types = self._dispatcher.get_arg_types(actor_method_name)
+        invoker = self._dispatcher.get_invoker(actor_method_name)
 
         async def invoke_method(actor):
-            if len(arg_types) > 0:
-                # Limitation:
-                # * Support only one argument
-                # * If you use the default DaprJSONSerializer, it support only object type
-                # as a argument
-                input_obj = self._message_serializer.deserialize(request_body, arg_types[0])
-                rtnval = await self._dispatcher.dispatch(actor, actor_method_name, input_obj)
-            else:
-                rtnval = await self._dispatcher.dispatch(actor, actor_method_name)
-            return rtnval
-
-        rtn_obj = await self._dispatch_internal(actor_id, method_context, invoke_method)
-        return self._message_serializer.serialize(rtn_obj)
+            return await invoker.invoke(actor, request_body)
+
+        rtn_obj = await self._dispatch_internal(actor_id, invoker.method_context, invoke_method)
+        return invoker.encode(rtn_obj)
 
     async def _dispatch_internal(
         self,
@@ -13,22 +13,90 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Type
 
 from dapr.actor.error import ActorMethodNotFoundError
+from dapr.actor.runtime._method_context import ActorMethodContext
 from dapr.actor.runtime._type_information import ActorTypeInformation
-from dapr.actor.runtime._type_utils import get_dispatchable_attrs
 from dapr.actor.runtime.actor import Actor
+from dapr.serializers import Serializer
+
+
+class ActorMethodInvoker:
+    """Precompiled call path for a single actor method.
+
+    Bundles the method's function resolved from the actor class, its
+    :class:`ActorMethodContext`, and the serializer calls bound to the method's
+    argument type, so a dispatch only needs one dict lookup instead of
+    rebuilding them or resolving the bound method on every call.
+    """
+
+    __slots__ = (
+        'actor_method',
+        'method_name',
+        'method_context',
+        '_fn',
+        '_arg_type',
+        '_decode',
+        '_encode',
+    )
+
+    def __init__(
+        self, actor_class: Type[Actor], attrs: Dict[str, Any], message_serializer: Serializer
+    ):
+        self.actor_method: str = attrs['actor_method']
+        self.method_name: str = attrs['method_name']
+        self._fn = getattr(actor_class, self.method_name)
+        self.method_context = ActorMethodContext.create_for_actor(self.actor_method)
+        arg_types = attrs['arg_types']
+        # Limitation:
+        # * Support only one argument
+        # * If you use the default DaprJSONSerializer, it support only object type
+        # as a argument
+        self._arg_type = arg_types[0] if len(arg_types) > 0 else None
+        self._decode = message_serializer.deserialize
+        self._encode = message_serializer.serialize
+
+    async def invoke(self, actor: Actor, request_body: bytes) -> Any:
+        """Decodes ``request_body`` and awaits the method on ``actor``."""
+        if self._arg_type is None:
+            return await self._fn(actor)
+        return await self._fn(actor, self._decode(request_body, self._arg_type))
+
+    def encode(self, obj: Any) -> bytes:
+        """Serializes the value returned by the method."""
+        return self._encode(obj)
 
 
 class ActorMethodDispatcher:
-    def __init__(self, type_info: ActorTypeInformation):
-        self._dispatch_mapping = get_dispatchable_attrs(type_info.implementation_type)
+    def __init__(
+        self, type_info: ActorTypeInformation, message_serializer: Optional[Serializer] = None
+    ):
+        self._dispatch_mapping = type_info.dispatchable_attrs
+        self._invokers: Dict[str, ActorMethodInvoker] = {}
+        if message_serializer is not None:
+            self._invokers = {
+                name: ActorMethodInvoker(type_info.implementation_type, attrs, message_serializer)
+                for name, attrs in self._dispatch_mapping.items()
+            }
 
     async def dispatch(self, actor: Actor, name: str, *args, **kwargs) -> Any:
         self._check_name_exist(name)
         return await getattr(actor, self._dispatch_mapping[name]['method_name'])(*args, **kwargs)
 
+    def get_invoker(self, name: str) -> ActorMethodInvoker:
+        """Returns the precompiled invoker for actor method ``name``.
+
+        Raises:
+            ActorMethodNotFoundError: the actor type has no method ``name``.
+            ValueError: the dispatcher was created without a message serializer.
+        """
+        invoker = self._invokers.get(name)
+        if invoker is None:
+            self._check_name_exist(name)
+            raise ValueError('invokers are only compiled when a message serializer is provided')
+        return invoker
+
     def get_arg_names(self, name: str) -> List[str]:
         self._check_name_exist(name)
         return self._dispatch_mapping[name]['arg_names']
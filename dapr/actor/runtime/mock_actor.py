@@ -14,7 +14,7 @@ limitations under the License.
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import Any, Optional, TypeVar
+from typing import Any, Iterable, List, Optional, TypeVar
 
 from dapr.actor.id import ActorId
 from dapr.actor.runtime._reminder_data import ActorReminderData
@@ -22,6 +22,7 @@ from dapr.actor.runtime._timer_data import TIMER_CALLBACK, ActorTimerData
 from dapr.actor.runtime.actor import Actor
 from dapr.actor.runtime.failure_policy import ActorReminderFailurePolicy
 from dapr.actor.runtime.mock_state_manager import MockStateManager
+from dapr.clients.base import DEFAULT_BATCH_CONCURRENCY
 
 
 class MockActor(Actor):
@@ -118,6 +119,46 @@ class MockActor(Actor):
         """
         self._state_manager._mock_reminders.pop(name, None)  # type: ignore
 
+    async def register_reminders(
+        self,
+        reminders: Iterable[ActorReminderData],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        """Adds each actor reminder to self._state_manager._mock_reminders.
+
+        Args:
+            reminders (Iterable[ActorReminderData]): the reminders to register.
+            max_concurrency (int): unused by the mock.
+        """
+        for reminder in reminders:
+            self._state_manager._mock_reminders[reminder.reminder_name] = reminder  # type: ignore
+
+    async def register_timers(
+        self,
+        timers: Iterable[ActorTimerData],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        """Adds each actor timer to self._state_manager._mock_timers.
+
+        Args:
+            timers (Iterable[ActorTimerData]): the timers to register.
+            max_concurrency (int): unused by the mock.
+        """
+        for timer in timers:
+            self._state_manager._mock_timers[timer.timer_name] = timer  # type: ignore
+
+    async def get_reminder(self, name: str) -> Optional[ActorReminderData]:
+        """Gets an actor reminder from self._state_manager._mock_reminders.
+
+        Args:
+            name (str): the name of the reminder.
+        """
+        return self._state_manager._mock_reminders.get(name)  # type: ignore
+
+    async def list_reminders(self) -> List[ActorReminderData]:
+        """Lists the actor reminders in self._state_manager._mock_reminders."""
+        return list(self._state_manager._mock_reminders.values())  # type: ignore
+
 
 T = TypeVar('T', bound=Actor)
 
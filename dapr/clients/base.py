@@ -13,11 +13,52 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Awaitable, Iterable, Optional, Set, Tuple
 
 DAPR_REENTRANCY_ID_HEADER = 'Dapr-Reentrancy-Id'
 
+DEFAULT_BATCH_CONCURRENCY = 16
+
+
+async def gather_bounded(aws: Iterable[Awaitable[None]], max_concurrency: int) -> None:
+    """Awaits ``aws`` with at most ``max_concurrency`` of them in flight.
+
+    ``aws`` is consumed lazily, so a generator producing coroutines only creates
+    each one when a slot is free. Every awaitable runs even if some fail; the
+    first failure is raised once all of them have finished. If the caller is
+    cancelled or ``aws`` raises, the awaitables still in flight are cancelled.
+    """
+    if max_concurrency < 1:
+        raise ValueError('max_concurrency must be at least 1')
+
+    pending: Set[asyncio.Future] = set()
+    first_error: Optional[BaseException] = None
+
+    def collect(done: Set[asyncio.Future]) -> None:
+        nonlocal first_error
+        for fut in done:
+            if first_error is None and fut.exception() is not None:
+                first_error = fut.exception()
+
+    try:
+        for aw in aws:
+            pending.add(asyncio.ensure_future(aw))
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+        if pending:
+            done, pending = await asyncio.wait(pending)
+            collect(done)
+    finally:
+        for fut in pending:
+            fut.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    if first_error is not None:
+        raise first_error
+
 
 class DaprActorClientBase(ABC):
     """A base class that represents Dapr Actor Client."""
@@ -50,3 +91,60 @@ class DaprActorClientBase(ABC):
 
     @abstractmethod
     async def unregister_timer(self, actor_type: str, actor_id: str, name: str) -> None: ...
+
+    async def register_reminders(
+        self,
+        actor_type: str,
+        reminders: Iterable[Tuple[str, str, bytes]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        """Registers many reminders, pipelining up to ``max_concurrency`` calls.
+
+        Args:
+            actor_type (str): Actor type.
+            reminders (Iterable[Tuple[str, str, bytes]]): ``(actor_id, name, data)``
+                tuples, where ``data`` is the reminder request json body. The actor
+                ids may differ, so one call can re-register reminders across actors.
+            max_concurrency (int): the maximum number of registrations in flight.
+        """
+        await gather_bounded(
+            (
+                self.register_reminder(actor_type, actor_id, name, data)
+                for actor_id, name, data in reminders
+            ),
+            max_concurrency,
+        )
+
+    async def register_timers(
+        self,
+        actor_type: str,
+        timers: Iterable[Tuple[str, str, bytes]],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> None:
+        """Registers many timers, pipelining up to ``max_concurrency`` calls.
+
+        Args:
+            actor_type (str): Actor type.
+            timers (Iterable[Tuple[str, str, bytes]]): ``(actor_id, name, data)``
+                tuples, where ``data`` is the timer request json body.
+            max_concurrency (int): the maximum number of registrations in flight.
+        """
+        await gather_bounded(
+            (
+                self.register_timer(actor_type, actor_id, name, data)
+                for actor_id, name, data in timers
+            ),
+            max_concurrency,
+        )
+
+    async def get_reminder(self, actor_type: str, actor_id: str, name: str) -> Optional[bytes]:
+        """Gets a registered reminder as a json body, or None if it does not exist."""
+        raise NotImplementedError(f'{type(self).__name__} does not support getting reminders')
+
+    async def list_reminders(self, actor_type: str, actor_id: Optional[str] = None) -> bytes:
+        """Lists the reminders of an actor, or of every actor of the type.
+
+        Returns:
+            bytes: a json list of reminder bodies, each with ``actorId`` and ``name``.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not support listing reminders')
@@ -168,6 +168,45 @@ class DaprActorGrpcClient(DaprActorClientBase):
             request.failure_policy.CopyFrom(failure_policy)
         await self._stub.RegisterActorReminder(request, timeout=self._timeout)
 
+    async def get_reminder(self, actor_type: str, actor_id: str, name: str) -> Optional[bytes]:
+        """Gets a reminder through the GetActorReminder RPC.
+
+        Returns:
+            bytes: the reminder json body, shaped like the one sent on
+            registration, or None when the reminder does not exist.
+        """
+        request = api_v1.GetActorReminderRequest(
+            actor_type=actor_type, actor_id=actor_id, name=name
+        )
+        try:
+            response = await self._stub.GetActorReminder(request, timeout=self._timeout)
+        except AioRpcError as error:
+            if error.code() == StatusCode.NOT_FOUND:
+                return None
+            raise
+        return json.dumps(_reminder_to_dict(response)).encode('utf-8')
+
+    async def list_reminders(self, actor_type: str, actor_id: Optional[str] = None) -> bytes:
+        """Lists reminders through the ListActorReminders RPC.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str, optional): Id of Actor type; lists the reminders of
+                every actor of the type when omitted.
+
+        Returns:
+            bytes: a json list of reminder bodies, each with ``actorId`` and ``name``.
+        """
+        request = api_v1.ListActorRemindersRequest(actor_type=actor_type, actor_id=actor_id)
+        response = await self._stub.ListActorReminders(request, timeout=self._timeout)
+        reminders = []
+        for named in response.reminders:
+            reminder = _reminder_to_dict(named.reminder)
+            reminder['actorId'] = named.reminder.actor_id
+            reminder['name'] = named.name
+            reminders.append(reminder)
+        return json.dumps(reminders).encode('utf-8')
+
     async def unregister_reminder(self, actor_type: str, actor_id: str, name: str) -> None:
         """Unregisters a reminder through the UnregisterActorReminder RPC."""
         request = api_v1.UnregisterActorReminderRequest(
@@ -230,6 +269,22 @@ def _to_transactional_operation(
     return proto_operation
 
 
+def _reminder_to_dict(reminder: Any) -> Dict[str, Any]:
+    """Converts an ActorReminder (or GetActorReminderResponse) to its json body form.
+
+    The state bytes are base64-encoded into ``data``, mirroring
+    :func:`_decode_reminder_state` on registration.
+    """
+    body: Dict[str, Any] = {
+        'dueTime': reminder.due_time,
+        'period': reminder.period if reminder.HasField('period') else None,
+        'data': base64.b64encode(reminder.data.value).decode('utf-8'),
+    }
+    if reminder.HasField('ttl'):
+        body['ttl'] = reminder.ttl
+    return body
+
+
 def _decode_reminder_state(encoded_state: Optional[str]) -> bytes:
     """Recovers raw reminder state bytes from the JSON body's base64 field.
 
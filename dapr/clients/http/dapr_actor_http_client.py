@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from dapr.serializers import Serializer
 
 from dapr.clients.base import DAPR_REENTRANCY_ID_HEADER, DaprActorClientBase
+from dapr.clients.exceptions import DaprHttpError
 from dapr.clients.http.client import DaprHttpClient
 from dapr.clients.retry import RetryPolicy
 from dapr.common.reentrancy_context import reentrancy_ctx
@@ -111,6 +112,26 @@ class DaprActorHttpClient(DaprActorClientBase):
         url = f'{self._get_base_url(actor_type, actor_id)}/reminders/{name}'
         await self._client.send_bytes(method='PUT', url=url, data=data)
 
+    async def get_reminder(self, actor_type: str, actor_id: str, name: str) -> Optional[bytes]:
+        """Get actor reminder.
+
+        Args:
+            actor_type (str): Actor type.
+            actor_id (str): Id of Actor type.
+            name (str): The name of reminder.
+
+        Returns:
+            bytes: the reminder json body, or None if the reminder does not exist.
+        """
+        url = f'{self._get_base_url(actor_type, actor_id)}/reminders/{name}'
+        try:
+            body, _ = await self._client.send_bytes(method='GET', url=url, data=None)
+        except DaprHttpError as ex:
+            if ex.status_code == 404:
+                return None
+            raise
+        return body or None
+
     async def unregister_reminder(self, actor_type: str, actor_id: str, name: str) -> None:
         """Unregister actor reminder.
 
@@ -14,7 +14,9 @@ limitations under the License.
 """
 
 import asyncio
-from typing import Any, Optional, Type
+import atexit
+import threading
+from typing import Any, Awaitable, Optional, Type, TypeVar
 
 from flask import jsonify, make_response, request
 
@@ -25,11 +27,21 @@ from dapr.serializers import DefaultJSONSerializer
 DEFAULT_CONTENT_TYPE = 'application/json; utf-8'
 DAPR_REENTRANCY_ID_HEADER = 'Dapr-Reentrancy-Id'
 
+T = TypeVar('T')
+
 
 class DaprActor(object):
     def __init__(self, app=None):
         self._app = app
         self._dapr_serializer = DefaultJSONSerializer()
+        # Flask handlers are synchronous, so actor coroutines are submitted to a
+        # single long-lived event loop instead of creating one per request. This
+        # keeps the actor clients' connection pools and the runtime's asyncio
+        # primitives bound to the same loop for the lifetime of the extension.
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._shut_down = False
 
         if app is not None:
             self.init_routes(app)
@@ -64,9 +76,66 @@ class DaprActor(object):
 
     def teardown(self, exception):
         self._app.logger.debug('actor service is shutting down.')
+        self.shutdown()
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stops the background event loop used to run actor coroutines.
+
+        Called automatically at interpreter exit. Active actors hold asyncio
+        primitives bound to this loop, so the loop is not restarted: actor
+        calls made after shutdown fail.
+
+        Args:
+            timeout (float, optional): seconds to wait for the loop thread to exit.
+        """
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+            self._shut_down = True
+        if loop is None or thread is None:
+            return
+        atexit.unregister(self.shutdown)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            if self._shut_down:
+                raise RuntimeError('The actor service has been shut down.')
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=self._run_loop, args=(loop,), name='DaprActorLoop', daemon=True
+                )
+                thread.start()
+                self._loop = loop
+                self._loop_thread = thread
+                # Lets pending actor calls finish cleanly instead of dying with the daemon thread.
+                atexit.register(self.shutdown)
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            pending = asyncio.all_tasks(loop)
+            for t in pending:
+                t.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def _run(self, coro: Awaitable[T]) -> T:
+        """Runs ``coro`` on the extension's event loop and blocks until it completes."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())  # type: ignore[arg-type]
+        return future.result()
 
     def register_actor(self, actor: Type[Actor], **kwargs) -> None:
-        asyncio.run(ActorRuntime.register_actor(actor, **kwargs))
+        self._run(ActorRuntime.register_actor(actor, **kwargs))
         self._app.logger.debug(f'registered actor: {actor.__class__.__name__}')
 
     def _healthz_handler(self):
@@ -78,7 +147,7 @@ class DaprActor(object):
 
     def _deactivation_handler(self, actor_type_name, actor_id):
         try:
-            asyncio.run(ActorRuntime.deactivate(actor_type_name, actor_id))
+            self._run(ActorRuntime.deactivate(actor_type_name, actor_id))
         except DaprInternalError as ex:
             return wrap_response(500, ex.as_json_safe_dict())
         except Exception as ex:
@@ -93,7 +162,7 @@ class DaprActor(object):
             # Read raw bytes from request stream
             req_body = request.stream.read()
             reentrancy_id = request.headers.get(DAPR_REENTRANCY_ID_HEADER)
-            result = asyncio.run(
+            result = self._run(
                 ActorRuntime.dispatch(
                     actor_type_name, actor_id, method_name, req_body, reentrancy_id
                 )
@@ -111,7 +180,7 @@ class DaprActor(object):
         try:
             # Read raw bytes from request stream
             req_body = request.stream.read()
-            asyncio.run(ActorRuntime.fire_timer(actor_type_name, actor_id, timer_name, req_body))
+            self._run(ActorRuntime.fire_timer(actor_type_name, actor_id, timer_name, req_body))
         except DaprInternalError as ex:
             return wrap_response(500, ex.as_json_safe_dict())
         except Exception as ex:
@@ -125,7 +194,7 @@ class DaprActor(object):
         try:
             # Read raw bytes from request stream
             req_body = request.stream.read()
-            asyncio.run(
+            self._run(
                 ActorRuntime.fire_reminder(actor_type_name, actor_id, reminder_name, req_body)
             )
         except DaprInternalError as ex:
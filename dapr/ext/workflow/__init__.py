@@ -14,10 +14,30 @@ limitations under the License.
 """
 
 # Import your main classes here
+from dapr.ext.workflow._durabletask.codecs import (
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    PayloadCodec,
+)
+from dapr.ext.workflow._durabletask.metrics import (
+    ActivityWorkItemMetrics,
+    OpenTelemetryWorkerMetrics,
+    OrchestrationWorkItemMetrics,
+    PrometheusWorkerMetrics,
+    WorkerMetrics,
+)
 from dapr.ext.workflow._durabletask.task import TaskFailedError
+from dapr.ext.workflow.bulk import BulkResult
 from dapr.ext.workflow.dapr_workflow_client import DaprWorkflowClient
-from dapr.ext.workflow.dapr_workflow_context import DaprWorkflowContext, when_all, when_any
-from dapr.ext.workflow.mcp import DaprMCPClient, MCPToolDef
+from dapr.ext.workflow.dapr_workflow_context import (
+    DaprWorkflowContext,
+    when_all,
+    when_all_reduce,
+    when_any,
+)
+from dapr.ext.workflow.mcp import DaprMCPClient, MCPToolCache, MCPToolDef
+from dapr.ext.workflow.payload_store import DaprStatePayloadStore, PayloadStore, PayloadStoreError
 from dapr.ext.workflow.propagation import (
     ActivityResult,
     ChildWorkflowResult,
@@ -26,6 +46,7 @@ from dapr.ext.workflow.propagation import (
     PropagationScope,
     WorkflowResult,
 )
+from dapr.ext.workflow.replay import HotFrame, ReplayReport, TurnCost, WorkflowReplayer
 from dapr.ext.workflow.retry_policy import RetryPolicy
 from dapr.ext.workflow.workflow_activity_context import WorkflowActivityContext
 from dapr.ext.workflow.workflow_runtime import WorkflowRuntime, alternate_name
@@ -38,7 +59,25 @@ __all__ = [
     'WorkflowActivityContext',
     'WorkflowState',
     'WorkflowStatus',
+    'BulkResult',
+    'PayloadStore',
+    'PayloadStoreError',
+    'DaprStatePayloadStore',
+    'PayloadCodec',
+    'JsonCodec',
+    'OrjsonCodec',
+    'MsgpackCodec',
+    'WorkerMetrics',
+    'OrchestrationWorkItemMetrics',
+    'ActivityWorkItemMetrics',
+    'OpenTelemetryWorkerMetrics',
+    'PrometheusWorkerMetrics',
+    'WorkflowReplayer',
+    'ReplayReport',
+    'TurnCost',
+    'HotFrame',
     'when_all',
+    'when_all_reduce',
     'when_any',
     'alternate_name',
     'RetryPolicy',
@@ -51,4 +90,5 @@ __all__ = [
     'ChildWorkflowResult',
     'DaprMCPClient',
     'MCPToolDef',
+    'MCPToolCache',
 ]
@@ -32,14 +32,26 @@ from dapr.ext.workflow._durabletask.aio.internal.shared import (
     get_grpc_aio_channel,
 )
 from dapr.ext.workflow._durabletask.client import (
+    InstanceIdPage,
     OrchestrationStatus,
+    PurgeInstancesResult,
     TaskHubGrpcClient,
     TInput,
     TOutput,
     WorkflowIdReusePolicy,
     WorkflowState,
     _TransientTimeout,
+    new_instance_id_page,
+    new_list_instance_ids_request,
     new_orchestration_state,
+    new_purge_filter_request,
+    new_purge_instances_result,
+)
+from dapr.ext.workflow._durabletask.codecs import DEFAULT_CODEC, PayloadCodec
+from dapr.ext.workflow._durabletask.payloads import (
+    DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+    PayloadStore,
+    _PayloadClaimCheck,
 )
 
 # If `opentelemetry-instrumentation-grpc` is available, enable the gRPC client interceptor
@@ -62,6 +74,9 @@ class AsyncTaskHubGrpcClient:
         secure_channel: bool = False,
         interceptors: Optional[Sequence[ClientInterceptor]] = None,
         channel_options: Optional[Sequence[tuple[str, Any]]] = None,
+        payload_store: Optional[PayloadStore] = None,
+        payload_threshold_bytes: int = DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+        codec: Optional[PayloadCodec] = None,
     ):
         if interceptors is not None:
             interceptors = list(interceptors)
@@ -79,6 +94,8 @@ class AsyncTaskHubGrpcClient:
         self._channel: grpc.aio.Channel | None = None
         self._stub: stubs.TaskHubSidecarServiceStub | None = None
         self._logger = shared.get_logger('client', log_handler, log_formatter)
+        self._payloads = _PayloadClaimCheck(payload_store, threshold_bytes=payload_threshold_bytes)
+        self._codec = codec if codec is not None else DEFAULT_CODEC
 
     def _get_stub(self) -> stubs.TaskHubSidecarServiceStub:
         """Lazily create the channel and stub on first use.
@@ -117,11 +134,16 @@ class AsyncTaskHubGrpcClient:
     ) -> str:
         name = orchestrator if isinstance(orchestrator, str) else task.get_name(orchestrator)
 
+        encoded_input = (
+            await self._payloads.externalize_async(self._codec.encode(input))
+            if input is not None
+            else None
+        )
         req = pb.CreateInstanceRequest(
             name=name,
             instanceId=instance_id if instance_id else uuid.uuid4().hex,
-            input=wrappers_pb2.StringValue(value=shared.to_json(input))
-            if input is not None
+            input=wrappers_pb2.StringValue(value=encoded_input)
+            if encoded_input is not None
             else None,
             scheduledStartTimestamp=helpers.new_timestamp(start_at) if start_at else None,
             version=helpers.get_string_value(None),
@@ -136,7 +158,7 @@ class AsyncTaskHubGrpcClient:
     ) -> Optional[WorkflowState]:
         req = pb.GetInstanceRequest(instanceId=instance_id, getInputsAndOutputs=fetch_payloads)
         res: pb.GetInstanceResponse = await self._get_stub().GetInstance(req)
-        return new_orchestration_state(req.instanceId, res)
+        return await self._resolve_payloads(new_orchestration_state(req.instanceId, res))
 
     async def wait_for_orchestration_start(
         self, instance_id: str, *, fetch_payloads: bool = False, timeout: Optional[int] = 0
@@ -150,7 +172,7 @@ class AsyncTaskHubGrpcClient:
             res: pb.GetInstanceResponse = await self._get_stub().WaitForInstanceStart(
                 req, timeout=grpc_timeout
             )
-            return new_orchestration_state(req.instanceId, res)
+            return await self._resolve_payloads(new_orchestration_state(req.instanceId, res))
 
         try:
             return await self._call_with_transient_retry(instance_id, timeout, _call)
@@ -160,10 +182,19 @@ class AsyncTaskHubGrpcClient:
     async def wait_for_orchestration_completion(
         self, instance_id: str, *, fetch_payloads: bool = True, timeout: Optional[int] = 0
     ) -> Optional[WorkflowState]:
-        req = pb.GetInstanceRequest(instanceId=instance_id, getInputsAndOutputs=fetch_payloads)
         self._logger.info(
             f"Waiting {'indefinitely' if timeout in (0, None) else f'up to {timeout}s'} for instance '{instance_id}' to complete."
         )
+        try:
+            return await self._poll_orchestration_completion(instance_id, fetch_payloads, timeout)
+        except _TransientTimeout:
+            raise TimeoutError('Timed-out waiting for the orchestration to complete')
+
+    async def _poll_orchestration_completion(
+        self, instance_id: str, fetch_payloads: bool, timeout: Optional[float]
+    ) -> Optional[WorkflowState]:
+        """One WaitForInstanceCompletion long-poll, raising _TransientTimeout when it expires."""
+        req = pb.GetInstanceRequest(instanceId=instance_id, getInputsAndOutputs=fetch_payloads)
 
         async def _call(grpc_timeout):
             res: pb.GetInstanceResponse = await self._get_stub().WaitForInstanceCompletion(
@@ -185,12 +216,21 @@ class AsyncTaskHubGrpcClient:
                 self._logger.info(f"Instance '{instance_id}' was terminated.")
             elif state.runtime_status == OrchestrationStatus.COMPLETED:
                 self._logger.info(f"Instance '{instance_id}' completed.")
-            return state
+            return await self._resolve_payloads(state)
 
-        try:
-            return await self._call_with_transient_retry(instance_id, timeout, _call)
-        except _TransientTimeout:
-            raise TimeoutError('Timed-out waiting for the orchestration to complete')
+        return await self._call_with_transient_retry(instance_id, timeout, _call)
+
+    async def _resolve_payloads(self, state: Optional[WorkflowState]) -> Optional[WorkflowState]:
+        """Swaps payload-store references and codec-tagged payloads in a state's input and
+        output for plain JSON."""
+        if state is not None:
+            state.serialized_input = self._codec.to_json(
+                await self._payloads.resolve_async(state.serialized_input)
+            )
+            state.serialized_output = self._codec.to_json(
+                await self._payloads.resolve_async(state.serialized_output)
+            )
+        return state
 
     # Transient gRPC codes that indicate the workflow runtime is temporarily
     # unable to locate the workflow actor — typically immediately after a Dapr
@@ -307,3 +347,27 @@ class AsyncTaskHubGrpcClient:
         req = pb.PurgeInstancesRequest(instanceId=instance_id, recursive=recursive)
         self._logger.info(f"Purging instance '{instance_id}'.")
         await self._get_stub().PurgeInstances(req)
+
+    async def purge_orchestrations_by(
+        self,
+        created_time_from: Optional[datetime] = None,
+        created_time_to: Optional[datetime] = None,
+        runtime_status: Optional[Sequence[OrchestrationStatus]] = None,
+        recursive: bool = True,
+    ) -> PurgeInstancesResult:
+        req = new_purge_filter_request(
+            created_time_from, created_time_to, runtime_status, recursive
+        )
+        self._logger.info(
+            f'Purging instances created between {created_time_from} and {created_time_to} '
+            f'with status {[str(status) for status in runtime_status or ()]}.'
+        )
+        res: pb.PurgeInstancesResponse = await self._get_stub().PurgeInstances(req)
+        return new_purge_instances_result(res)
+
+    async def list_instance_ids(
+        self, page_size: Optional[int] = None, continuation_token: Optional[str] = None
+    ) -> InstanceIdPage:
+        req = new_list_instance_ids_request(page_size, continuation_token)
+        res: pb.ListInstanceIDsResponse = await self._get_stub().ListInstanceIDs(req)
+        return new_instance_id_page(res)
@@ -25,7 +25,13 @@ import dapr.ext.workflow._durabletask.internal.orchestrator_service_pb2_grpc as
 import dapr.ext.workflow._durabletask.internal.protos as pb
 import dapr.ext.workflow._durabletask.internal.shared as shared
 from dapr.ext.workflow._durabletask import task
+from dapr.ext.workflow._durabletask.codecs import DEFAULT_CODEC, PayloadCodec
 from dapr.ext.workflow._durabletask.internal.grpc_interceptor import DefaultClientInterceptorImpl
+from dapr.ext.workflow._durabletask.payloads import (
+    DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+    PayloadStore,
+    _PayloadClaimCheck,
+)
 
 
 class _TransientTimeout(Exception):
@@ -109,6 +115,18 @@ class WorkflowState:
             )
 
 
+@dataclass
+class PurgeInstancesResult:
+    deleted_instance_count: int
+    is_complete: Optional[bool]
+
+
+@dataclass
+class InstanceIdPage:
+    instance_ids: list[str]
+    continuation_token: Optional[str]
+
+
 class OrchestrationFailedError(Exception):
     def __init__(self, message: str, failure_details: task.FailureDetails):
         super().__init__(message)
@@ -119,6 +137,41 @@ class OrchestrationFailedError(Exception):
         return self._failure_details
 
 
+def new_purge_filter_request(
+    created_time_from: Optional[datetime],
+    created_time_to: Optional[datetime],
+    runtime_status: Optional[Sequence[OrchestrationStatus]],
+    recursive: bool,
+) -> pb.PurgeInstancesRequest:
+    return pb.PurgeInstancesRequest(
+        purgeInstanceFilter=pb.PurgeInstanceFilter(
+            createdTimeFrom=helpers.new_timestamp(created_time_from) if created_time_from else None,
+            createdTimeTo=helpers.new_timestamp(created_time_to) if created_time_to else None,
+            runtimeStatus=[status.value for status in runtime_status or ()],
+        ),
+        recursive=recursive,
+    )
+
+
+def new_purge_instances_result(res: pb.PurgeInstancesResponse) -> PurgeInstancesResult:
+    return PurgeInstancesResult(
+        res.deletedInstanceCount,
+        res.isComplete.value if res.HasField('isComplete') else None,
+    )
+
+
+def new_list_instance_ids_request(
+    page_size: Optional[int], continuation_token: Optional[str]
+) -> pb.ListInstanceIDsRequest:
+    return pb.ListInstanceIDsRequest(pageSize=page_size, continuationToken=continuation_token)
+
+
+def new_instance_id_page(res: pb.ListInstanceIDsResponse) -> InstanceIdPage:
+    # The last page has no token; treat an empty one the same way.
+    token = res.continuationToken if res.HasField('continuationToken') else None
+    return InstanceIdPage(list(res.instanceIds), token or None)
+
+
 def new_orchestration_state(
     instance_id: str, res: pb.GetInstanceResponse
 ) -> Optional[WorkflowState]:
@@ -161,6 +214,9 @@ class TaskHubGrpcClient:
         secure_channel: bool = False,
         interceptors: Optional[Sequence[shared.ClientInterceptor]] = None,
         channel_options: Optional[Sequence[tuple[str, Any]]] = None,
+        payload_store: Optional[PayloadStore] = None,
+        payload_threshold_bytes: int = DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+        codec: Optional[PayloadCodec] = None,
     ):
         # If the caller provided metadata, we need to create a new interceptor for it and
         # add it to the list of interceptors.
@@ -182,6 +238,8 @@ class TaskHubGrpcClient:
         self._channel = channel
         self._stub = stubs.TaskHubSidecarServiceStub(channel)
         self._logger = shared.get_logger('client', log_handler, log_formatter)
+        self._payloads = _PayloadClaimCheck(payload_store, threshold_bytes=payload_threshold_bytes)
+        self._codec = codec if codec is not None else DEFAULT_CODEC
 
     def __enter__(self):
         return self
@@ -214,7 +272,9 @@ class TaskHubGrpcClient:
         name = orchestrator if isinstance(orchestrator, str) else task.get_name(orchestrator)
 
         input_pb = (
-            wrappers_pb2.StringValue(value=shared.to_json(input)) if input is not None else None
+            wrappers_pb2.StringValue(value=self._payloads.externalize(self._codec.encode(input)))
+            if input is not None
+            else None
         )
 
         req = pb.CreateInstanceRequest(
@@ -234,7 +294,7 @@ class TaskHubGrpcClient:
     ) -> Optional[WorkflowState]:
         req = pb.GetInstanceRequest(instanceId=instance_id, getInputsAndOutputs=fetch_payloads)
         res: pb.GetInstanceResponse = self._stub.GetInstance(req)
-        return new_orchestration_state(req.instanceId, res)
+        return self._resolve_payloads(new_orchestration_state(req.instanceId, res))
 
     def wait_for_orchestration_start(
         self, instance_id: str, *, fetch_payloads: bool = False, timeout: Optional[int] = 0
@@ -246,7 +306,7 @@ class TaskHubGrpcClient:
 
         def _call(grpc_timeout):
             res: pb.GetInstanceResponse = self._stub.WaitForInstanceStart(req, timeout=grpc_timeout)
-            return new_orchestration_state(req.instanceId, res)
+            return self._resolve_payloads(new_orchestration_state(req.instanceId, res))
 
         try:
             return self._call_with_transient_retry(instance_id, timeout, _call)
@@ -281,13 +341,25 @@ class TaskHubGrpcClient:
                 self._logger.info(f"Instance '{instance_id}' was terminated.")
             elif state.runtime_status == OrchestrationStatus.COMPLETED:
                 self._logger.info(f"Instance '{instance_id}' completed.")
-            return state
+            return self._resolve_payloads(state)
 
         try:
             return self._call_with_transient_retry(instance_id, timeout, _call)
         except _TransientTimeout:
             raise TimeoutError('Timed-out waiting for the orchestration to complete')
 
+    def _resolve_payloads(self, state: Optional[WorkflowState]) -> Optional[WorkflowState]:
+        """Swaps payload-store references and codec-tagged payloads in a state's input and
+        output for plain JSON."""
+        if state is not None:
+            state.serialized_input = self._codec.to_json(
+                self._payloads.resolve(state.serialized_input)
+            )
+            state.serialized_output = self._codec.to_json(
+                self._payloads.resolve(state.serialized_output)
+            )
+        return state
+
     # Transient gRPC codes that indicate the workflow runtime is temporarily
     # unable to locate the workflow actor — typically immediately after a Dapr
     # sidecar restart (e.g. recovery from chaos). The placement service has the
@@ -430,3 +502,27 @@ class TaskHubGrpcClient:
         req = pb.PurgeInstancesRequest(instanceId=instance_id, recursive=recursive)
         self._logger.info(f"Purging instance '{instance_id}'.")
         self._stub.PurgeInstances(req)
+
+    def purge_orchestrations_by(
+        self,
+        created_time_from: Optional[datetime] = None,
+        created_time_to: Optional[datetime] = None,
+        runtime_status: Optional[Sequence[OrchestrationStatus]] = None,
+        recursive: bool = True,
+    ) -> PurgeInstancesResult:
+        req = new_purge_filter_request(
+            created_time_from, created_time_to, runtime_status, recursive
+        )
+        self._logger.info(
+            f'Purging instances created between {created_time_from} and {created_time_to} '
+            f'with status {[str(status) for status in runtime_status or ()]}.'
+        )
+        res: pb.PurgeInstancesResponse = self._stub.PurgeInstances(req)
+        return new_purge_instances_result(res)
+
+    def list_instance_ids(
+        self, page_size: Optional[int] = None, continuation_token: Optional[str] = None
+    ) -> InstanceIdPage:
+        req = new_list_instance_ids_request(page_size, continuation_token)
+        res: pb.ListInstanceIDsResponse = self._stub.ListInstanceIDs(req)
+        return new_instance_id_page(res)
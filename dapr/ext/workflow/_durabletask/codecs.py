@@ -0,0 +1,275 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Codecs for the workflow and activity data carried in workflow history.
+
+Plain JSON is written as is, exactly as before codecs existed. Anything else is tagged::
+
+    ~<format>[+zlib]:<base64 body>
+
+``~`` cannot start a JSON text, so untagged strings, including every payload written
+before codecs existed, decode as JSON. Every codec decodes every tag, so changing the
+configured codec never strands in-flight histories; only decoding ``msgpack`` needs the
+``msgpack`` package.
+"""
+
+from __future__ import annotations
+
+import base64
+import dataclasses
+import zlib
+from abc import ABC, abstractmethod
+from types import SimpleNamespace
+from typing import Any, Optional, Union
+
+from dapr.ext.workflow import _model_protocol
+from dapr.ext.workflow._durabletask.internal import shared
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+_TAG_PREFIX = '~'
+# Maps digits to '0' and every other byte to ' ', so a run of digits can be found with a
+# substring search, which is much faster than a regular expression.
+_DIGITS_TO_ZEROS = bytes(0x30 if 0x30 <= b <= 0x39 else 0x20 for b in range(256))
+# 2**64, the smallest integer orjson reads as a float, has 20 digits.
+_WIDE_INTEGER = b'0' * 20
+_AUTO_SERIALIZED_BYTES = shared.AUTO_SERIALIZED.encode()
+_COMPRESSION_SUFFIX = '+zlib'
+
+
+class PayloadCodec(ABC):
+    """Encodes workflow and activity data to the strings carried in workflow history.
+
+    Args:
+        compression_threshold_bytes: Encoded size above which payloads are compressed with
+            zlib. Defaults to None, meaning never compress.
+        compression_level: zlib compression level, from 1 (fastest) to 9 (smallest).
+    """
+
+    #: Name of the body format in tags. JSON bodies are written untagged when not
+    #: compressed.
+    format: str = 'json'
+
+    def __init__(
+        self,
+        *,
+        compression_threshold_bytes: Optional[int] = None,
+        compression_level: int = 6,
+    ):
+        if compression_threshold_bytes is not None and compression_threshold_bytes < 0:
+            raise ValueError('compression_threshold_bytes must not be negative')
+        if not 1 <= compression_level <= 9:
+            raise ValueError('compression_level must be between 1 and 9')
+        self._compression_threshold_bytes = compression_threshold_bytes
+        self._compression_level = compression_level
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> Union[str, bytes]:
+        """Serializes ``obj`` to this codec's body format."""
+        pass
+
+    @abstractmethod
+    def loads(self, body: Union[str, bytes]) -> Any:
+        """Deserializes a body written by :meth:`dumps`."""
+        pass
+
+    def loads_json(self, text: str) -> Any:
+        """Deserializes untagged JSON text."""
+        return shared.from_json(text)
+
+    def encode(self, obj: Any) -> str:
+        body = self.dumps(obj)
+        threshold = self._compression_threshold_bytes
+        if threshold is not None and len(body) > threshold:
+            raw = body.encode('utf-8') if isinstance(body, str) else body
+            return _tagged(
+                self.format + _COMPRESSION_SUFFIX, zlib.compress(raw, self._compression_level)
+            )
+        if isinstance(body, str):
+            return body
+        return _tagged(self.format, body)
+
+    def decode(self, encoded: str) -> Any:
+        if not encoded.startswith(_TAG_PREFIX):
+            return self.loads_json(encoded)
+        tag, sep, data = encoded[1:].partition(':')
+        if not sep:
+            raise ValueError(f"Malformed encoded payload tag '{encoded[:32]}'")
+        body = base64.b64decode(data)
+        format = tag
+        if tag.endswith(_COMPRESSION_SUFFIX):
+            format = tag[: -len(_COMPRESSION_SUFFIX)]
+            body = zlib.decompress(body)
+        if format == 'json':
+            return self.loads_json(body.decode('utf-8'))
+        if format == self.format:
+            return self.loads(body)
+        codec = _CODECS_BY_FORMAT.get(format)
+        if codec is None:
+            raise ValueError(f"Unknown payload format '{format}'")
+        return codec().loads(body)
+
+    def to_json(self, encoded: Optional[str]) -> Optional[str]:
+        """Returns ``encoded`` as plain JSON text, decoding it first if it is tagged."""
+        if encoded is None or not encoded.startswith(_TAG_PREFIX):
+            return encoded
+        return shared.to_json(self.decode(encoded))
+
+
+def is_tagged(encoded: Optional[str]) -> bool:
+    return encoded is not None and encoded.startswith(_TAG_PREFIX)
+
+
+def _tagged(tag: str, body: bytes) -> str:
+    return _TAG_PREFIX + tag + ':' + base64.b64encode(body).decode('ascii')
+
+
+def _default(obj: Any) -> Any:
+    # Mirrors InternalJSONEncoder.default, for codecs that take a ``default`` hook.
+    if _model_protocol.is_model(obj):
+        return _model_protocol.dump_model(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        d = dataclasses.asdict(obj)
+        d[shared.AUTO_SERIALIZED] = True
+        return d
+    if isinstance(obj, SimpleNamespace):
+        d = dict(vars(obj))
+        d[shared.AUTO_SERIALIZED] = True
+        return d
+    raise TypeError(f'Object of type {type(obj).__name__} is not serializable')
+
+
+def _top_level(obj: Any) -> Any:
+    # Mirrors InternalJSONEncoder.encode, which marks a top-level namedtuple for decoding.
+    if isinstance(obj, tuple) and hasattr(obj, '_fields') and hasattr(obj, '_asdict'):
+        d = obj._asdict()
+        d[shared.AUTO_SERIALIZED] = True
+        return d
+    return obj
+
+
+def _object_hook(d: dict[str, Any]) -> Any:
+    if d.pop(shared.AUTO_SERIALIZED, False):
+        return SimpleNamespace(**d)
+    return d
+
+
+def _revive(value: Any) -> Any:
+    # Applies _object_hook bottom-up, as json.loads does, for decoders without a hook.
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = _revive(item)
+        return _object_hook(value)
+    if isinstance(value, list):
+        for i, item in enumerate(value):
+            if isinstance(item, (dict, list)):
+                value[i] = _revive(item)
+    return value
+
+
+# Dataclasses and datetimes go through _default, so orjson writes what the json module does.
+_ORJSON_OPTIONS = (
+    (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME)
+    if orjson is not None
+    else 0
+)
+
+
+class JsonCodec(PayloadCodec):
+    """The default codec: JSON through the standard library's ``json`` module."""
+
+    def dumps(self, obj: Any) -> str:
+        return shared.to_json(obj)
+
+    def loads(self, body: Union[str, bytes]) -> Any:
+        return shared.from_json(body)
+
+
+class OrjsonCodec(PayloadCodec):
+    """JSON through ``orjson``, which must be installed.
+
+    Writes the same JSON as :class:`JsonCodec`, minus insignificant whitespace, so
+    payloads stay readable by other SDKs and by workers using the default codec. Integers
+    wider than 64 bits, which ``orjson`` does not support, go through the ``json`` module
+    instead. Unlike the ``json`` module, NaN and infinities are written as ``null``.
+    """
+
+    def __init__(self, **kwargs):
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires the orjson package')
+        super().__init__(**kwargs)
+
+    def dumps(self, obj: Any) -> str:
+        try:
+            return orjson.dumps(_top_level(obj), default=_default, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            return shared.to_json(obj)
+
+    def loads(self, body: Union[str, bytes]) -> Any:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        # orjson reads integers wider than 64 bits as floats; leave anything that might
+        # hold one to the json module.
+        if _WIDE_INTEGER in body.translate(_DIGITS_TO_ZEROS):
+            return shared.from_json(body)
+        try:
+            value = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # e.g. NaN and Infinity, which the json module accepts.
+            return shared.from_json(body)
+        if _AUTO_SERIALIZED_BYTES in body:
+            return _revive(value)
+        return value
+
+    def loads_json(self, text: str) -> Any:
+        return self.loads(text)
+
+
+class MsgpackCodec(PayloadCodec):
+    """MessagePack through ``msgpack``, which must be installed.
+
+    Payloads are base64-encoded and tagged, so only Python workers and clients can read
+    them; keep the default codec for workflows whose data other SDKs consume. Integers
+    must fit in 64 bits, and mappings may have non-string keys, which JSON would turn
+    into strings.
+    """
+
+    format = 'msgpack'
+
+    def __init__(self, **kwargs):
+        if msgpack is None:
+            raise ImportError('MsgpackCodec requires the msgpack package')
+        super().__init__(**kwargs)
+
+    def dumps(self, obj: Any) -> bytes:
+        return msgpack.packb(_top_level(obj), default=_default, use_bin_type=True)
+
+    def loads(self, body: Union[str, bytes]) -> Any:
+        # The hook runs for every map; skip it when no map can carry the marker.
+        hook = _object_hook if _AUTO_SERIALIZED_BYTES in body else None
+        return msgpack.unpackb(body, object_hook=hook, raw=False, strict_map_key=False)
+
+
+_CODECS_BY_FORMAT: dict[str, type[PayloadCodec]] = {
+    'json': JsonCodec,
+    'msgpack': MsgpackCodec,
+}
+
+DEFAULT_CODEC: PayloadCodec = JsonCodec()
@@ -0,0 +1,257 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-work-item measurements of the workflow worker.
+
+A :class:`WorkerMetrics` passed to the worker receives one record per orchestration and
+activity work item, once its response has been sent. The hook itself has no
+dependencies; :class:`OpenTelemetryWorkerMetrics` and :class:`PrometheusWorkerMetrics`
+turn the records into histograms and need ``opentelemetry-api`` and
+``prometheus-client`` respectively.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+try:
+    from opentelemetry import metrics as otel_metrics
+except ImportError:
+    otel_metrics = None
+
+try:
+    import prometheus_client
+except ImportError:
+    prometheus_client = None
+
+#: The history came with the work item: a full send.
+HISTORY_FULL = 'full'
+#: The history was rebuilt from the worker's history cache and the delta sent with it.
+HISTORY_CACHED = 'cached'
+#: The cache missed, so the history was fetched with ``GetInstanceHistory``.
+HISTORY_FETCHED = 'fetched'
+
+
+@dataclass(frozen=True)
+class OrchestrationWorkItemMetrics:
+    """Measurements of one orchestration work item (one workflow turn).
+
+    Attributes:
+        instance_id: The workflow instance the turn ran for.
+        name: The workflow name, or an empty string if the turn failed before it was known.
+        queue_wait_seconds: Time from receiving the work item to starting it, waiting for
+            a free concurrency slot. None when the item did not go through the worker's
+            queues.
+        history_source: How the committed history was obtained: :data:`HISTORY_FULL`,
+            :data:`HISTORY_CACHED` or :data:`HISTORY_FETCHED`.
+        history_seconds: Time spent obtaining the committed history.
+        history_events: Number of committed history events.
+        history_bytes: Encoded size of the committed history and the new events.
+        replayed_events: Committed events fed to the workflow this turn. Lower than
+            ``history_events`` when the live execution was kept from the previous turn.
+        replay_seconds: Time spent replaying ``replayed_events``.
+        new_events: Number of new events delivered by the turn.
+        new_events_seconds: Time spent running the workflow on the new events.
+        actions: Number of actions the turn sent back.
+        complete_seconds: Latency of the ``CompleteOrchestratorTask`` call, or None if the
+            response could not be delivered.
+    """
+
+    instance_id: str
+    name: str
+    queue_wait_seconds: Optional[float]
+    history_source: str
+    history_seconds: float
+    history_events: int
+    history_bytes: int
+    replayed_events: int
+    replay_seconds: float
+    new_events: int
+    new_events_seconds: float
+    actions: int
+    complete_seconds: Optional[float]
+
+
+@dataclass(frozen=True)
+class ActivityWorkItemMetrics:
+    """Measurements of one activity work item.
+
+    Attributes:
+        instance_id: The workflow instance that scheduled the activity.
+        name: The activity name.
+        task_id: The activity's task id within its workflow.
+        queue_wait_seconds: Time from receiving the work item to starting it, waiting for
+            a free concurrency slot. None when the item did not go through the worker's
+            queues.
+        execution_seconds: Time spent running the activity, including decoding its input
+            and encoding its output.
+        failed: Whether the activity raised.
+        complete_seconds: Latency of the ``CompleteActivityTask`` call, or None if the
+            response could not be delivered.
+    """
+
+    instance_id: str
+    name: str
+    task_id: int
+    queue_wait_seconds: Optional[float]
+    execution_seconds: float
+    failed: bool
+    complete_seconds: Optional[float]
+
+
+class WorkerMetrics:
+    """Receives measurements of every work item a worker processes.
+
+    Override the methods you need; the defaults do nothing. They are called from worker
+    threads and the worker's event loop, so they should be quick and thread-safe. An
+    exception raised by a hook is logged and never affects the work item.
+    """
+
+    def on_orchestration(self, metrics: OrchestrationWorkItemMetrics) -> None:
+        """Called after an orchestration work item's response has been sent."""
+
+    def on_activity(self, metrics: ActivityWorkItemMetrics) -> None:
+        """Called after an activity work item's response has been sent."""
+
+
+# (name, unit, description) of the histograms recorded by the adapters.
+_QUEUE_WAIT = ('work_item.queue_wait', 's', 'Time work items wait for a concurrency slot')
+_COMPLETE = ('work_item.complete', 's', 'Latency of sending work item responses to the sidecar')
+_HISTORY = ('orchestration.history', 's', 'Time spent obtaining workflow histories')
+_HISTORY_BYTES = ('orchestration.history_size', 'By', 'Encoded size of workflow histories')
+_REPLAY = ('orchestration.replay', 's', 'Time spent replaying committed history events')
+_NEW_EVENTS = ('orchestration.new_events', 's', 'Time spent running workflows on new events')
+_EVENTS = ('orchestration.events', '{event}', 'History events per workflow turn')
+_ACTIONS = ('orchestration.actions', '{action}', 'Actions sent per workflow turn')
+_EXECUTION = ('activity.execution', 's', 'Time spent running activities')
+
+
+class OpenTelemetryWorkerMetrics(WorkerMetrics):
+    """Records work item measurements as OpenTelemetry histograms.
+
+    Instruments are named ``<prefix>.<measurement>``, for example
+    ``dapr.workflow.orchestration.replay``, and carry ``work_item`` (``orchestration`` or
+    ``activity``), ``history.source``, ``workflow.name`` or ``activity.name`` attributes.
+
+    Args:
+        meter: The meter to create the instruments with. Defaults to a meter from the
+            global meter provider.
+        prefix: Prefix of the instrument names.
+    """
+
+    def __init__(self, meter: Any = None, *, prefix: str = 'dapr.workflow'):
+        if meter is None:
+            if otel_metrics is None:
+                raise ImportError('OpenTelemetryWorkerMetrics requires opentelemetry-api')
+            meter = otel_metrics.get_meter(__name__)
+
+        def histogram(spec: tuple[str, str, str]):
+            name, unit, description = spec
+            return meter.create_histogram(f'{prefix}.{name}', unit=unit, description=description)
+
+        self._queue_wait = histogram(_QUEUE_WAIT)
+        self._complete = histogram(_COMPLETE)
+        self._history = histogram(_HISTORY)
+        self._history_bytes = histogram(_HISTORY_BYTES)
+        self._replay = histogram(_REPLAY)
+        self._new_events = histogram(_NEW_EVENTS)
+        self._events = histogram(_EVENTS)
+        self._actions = histogram(_ACTIONS)
+        self._execution = histogram(_EXECUTION)
+
+    def on_orchestration(self, metrics: OrchestrationWorkItemMetrics) -> None:
+        attributes = {'work_item': 'orchestration', 'workflow.name': metrics.name}
+        if metrics.queue_wait_seconds is not None:
+            self._queue_wait.record(metrics.queue_wait_seconds, attributes)
+        self._history.record(
+            metrics.history_seconds, {**attributes, 'history.source': metrics.history_source}
+        )
+        self._history_bytes.record(metrics.history_bytes, attributes)
+        self._replay.record(metrics.replay_seconds, attributes)
+        self._new_events.record(metrics.new_events_seconds, attributes)
+        self._events.record(metrics.history_events + metrics.new_events, attributes)
+        self._actions.record(metrics.actions, attributes)
+        if metrics.complete_seconds is not None:
+            self._complete.record(metrics.complete_seconds, attributes)
+
+    def on_activity(self, metrics: ActivityWorkItemMetrics) -> None:
+        attributes = {'work_item': 'activity', 'activity.name': metrics.name}
+        if metrics.queue_wait_seconds is not None:
+            self._queue_wait.record(metrics.queue_wait_seconds, attributes)
+        self._execution.record(
+            metrics.execution_seconds, {**attributes, 'activity.failed': metrics.failed}
+        )
+        if metrics.complete_seconds is not None:
+            self._complete.record(metrics.complete_seconds, attributes)
+
+
+class PrometheusWorkerMetrics(WorkerMetrics):
+    """Records work item measurements as Prometheus histograms.
+
+    Metrics are named ``<namespace>_<measurement>``, with a ``_seconds`` or ``_bytes``
+    suffix for durations and sizes, for example ``dapr_workflow_orchestration_replay_seconds``.
+    Workflow and activity names are not used as labels, to keep their cardinality bounded.
+
+    Args:
+        registry: The registry to register the metrics in. Defaults to the
+            ``prometheus_client`` default registry.
+        namespace: Prefix of the metric names.
+    """
+
+    def __init__(self, registry: Any = None, *, namespace: str = 'dapr_workflow'):
+        if prometheus_client is None:
+            raise ImportError('PrometheusWorkerMetrics requires prometheus-client')
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+        units = {'s': '_seconds', 'By': '_bytes'}
+
+        def histogram(spec: tuple[str, str, str], labels: tuple[str, ...] = (), **kwargs):
+            name, unit, description = spec
+            return prometheus_client.Histogram(
+                f'{namespace}_{name.replace(".", "_")}{units.get(unit, "")}',
+                description,
+                labels,
+                registry=registry,
+                **kwargs,
+            )
+
+        counts = (1, 10, 100, 1_000, 10_000, 100_000)
+        self._queue_wait = histogram(_QUEUE_WAIT, ('work_item',))
+        self._complete = histogram(_COMPLETE, ('work_item',))
+        self._history = histogram(_HISTORY, ('source',))
+        self._history_bytes = histogram(
+            _HISTORY_BYTES, buckets=(1 << 10, 1 << 14, 1 << 17, 1 << 20, 1 << 23, 1 << 26)
+        )
+        self._replay = histogram(_REPLAY)
+        self._new_events = histogram(_NEW_EVENTS)
+        self._events = histogram(_EVENTS, buckets=counts)
+        self._actions = histogram(_ACTIONS, buckets=counts)
+        self._execution = histogram(_EXECUTION, ('failed',))
+
+    def on_orchestration(self, metrics: OrchestrationWorkItemMetrics) -> None:
+        if metrics.queue_wait_seconds is not None:
+            self._queue_wait.labels('orchestration').observe(metrics.queue_wait_seconds)
+        self._history.labels(metrics.history_source).observe(metrics.history_seconds)
+        self._history_bytes.observe(metrics.history_bytes)
+        self._replay.observe(metrics.replay_seconds)
+        self._new_events.observe(metrics.new_events_seconds)
+        self._events.observe(metrics.history_events + metrics.new_events)
+        self._actions.observe(metrics.actions)
+        if metrics.complete_seconds is not None:
+            self._complete.labels('orchestration').observe(metrics.complete_seconds)
+
+    def on_activity(self, metrics: ActivityWorkItemMetrics) -> None:
+        if metrics.queue_wait_seconds is not None:
+            self._queue_wait.labels('activity').observe(metrics.queue_wait_seconds)
+        self._execution.labels(str(metrics.failed).lower()).observe(metrics.execution_seconds)
+        if metrics.complete_seconds is not None:
+            self._complete.labels('activity').observe(metrics.complete_seconds)
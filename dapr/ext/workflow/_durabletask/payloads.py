@@ -0,0 +1,198 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Claim-check externalization of large workflow payloads.
+
+A payload whose encoded JSON exceeds a threshold is written to a :class:`PayloadStore`
+and replaced, wherever it would travel inline in workflow history, by a small JSON
+reference. Readers swap the reference back for the payload, loading it from the store on
+first use and from a bounded in-memory cache on every replay after that.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Iterable, Optional
+
+import dapr.ext.workflow._durabletask.internal.protos as pb
+
+DEFAULT_PAYLOAD_THRESHOLD_BYTES = 64 * 1024
+DEFAULT_PAYLOAD_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_REFERENCE_KEY = '__dapr_payload_ref__'
+# References are always written with this key first, so they can be recognised without
+# parsing the (possibly large) payload they might otherwise be.
+_REFERENCE_PREFIX = '{"' + _REFERENCE_KEY + '": '
+
+
+class PayloadStoreError(Exception):
+    """Raised when a payload could not be written to or read from the payload store."""
+
+
+class PayloadStore(ABC):
+    """Storage for payloads too large to carry inline in workflow history."""
+
+    @abstractmethod
+    def save(self, key: str, payload: str) -> None:
+        """Stores an encoded payload under ``key``, overwriting any existing value."""
+        pass
+
+    @abstractmethod
+    def load(self, key: str) -> str:
+        """Returns the encoded payload stored under ``key``.
+
+        Raises:
+            KeyError: If nothing is stored under ``key``.
+        """
+        pass
+
+
+def is_payload_reference(encoded: Optional[str]) -> bool:
+    return encoded is not None and encoded.startswith(_REFERENCE_PREFIX)
+
+
+def _utf8_length_exceeds(value: str, limit: int) -> bool:
+    # A UTF-8 encoding takes between one and four bytes per character, so only strings
+    # in between need encoding to measure.
+    if len(value) > limit:
+        return True
+    if len(value) * 4 <= limit:
+        return False
+    return len(value.encode('utf-8')) > limit
+
+
+class _PayloadClaimCheck:
+    """Externalizes encoded payloads above a threshold and resolves references to them.
+
+    Keys are derived from the payload's content, so a payload written again on replay, or
+    by several instances, maps to the same entry. Without a store every method passes its
+    input through unchanged.
+    """
+
+    def __init__(
+        self,
+        store: Optional[PayloadStore],
+        *,
+        threshold_bytes: int = DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+        cache_max_bytes: int = DEFAULT_PAYLOAD_CACHE_MAX_BYTES,
+        key_prefix: str = 'dapr-workflow-payload-',
+    ):
+        if threshold_bytes < 1:
+            raise ValueError('threshold_bytes must be at least 1')
+        self._store = store
+        self._threshold_bytes = threshold_bytes
+        self._cache_max_bytes = cache_max_bytes
+        self._key_prefix = key_prefix
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._store is not None
+
+    def needs_io(self, encoded: Optional[str]) -> bool:
+        """Whether externalizing or resolving ``encoded`` may call the store."""
+        if self._store is None or encoded is None:
+            return False
+        return is_payload_reference(encoded) or _utf8_length_exceeds(encoded, self._threshold_bytes)
+
+    def externalize(self, encoded: Optional[str]) -> Optional[str]:
+        """Returns ``encoded``, or a reference to it once stored if it is over the threshold."""
+        if self._store is None or encoded is None or is_payload_reference(encoded):
+            return encoded
+        if not _utf8_length_exceeds(encoded, self._threshold_bytes):
+            return encoded
+        key = self._key_prefix + hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+        if self._cached(key) is None:
+            try:
+                self._store.save(key, encoded)
+            except Exception as ex:
+                raise PayloadStoreError(f"Failed to save payload '{key}': {ex}") from ex
+            self._cache_put(key, encoded)
+        return json.dumps({_REFERENCE_KEY: key, 'size': len(encoded)})
+
+    def resolve(self, encoded: Optional[str]) -> Optional[str]:
+        """Returns ``encoded``, or the payload it refers to if it is a reference."""
+        if self._store is None or not is_payload_reference(encoded):
+            return encoded
+        key = json.loads(encoded)[_REFERENCE_KEY]  # type: ignore[arg-type]
+        payload = self._cached(key)
+        if payload is None:
+            try:
+                payload = self._store.load(key)
+            except Exception as ex:
+                raise PayloadStoreError(f"Failed to load payload '{key}': {ex}") from ex
+            self._cache_put(key, payload)
+        return payload
+
+    async def externalize_async(self, encoded: Optional[str]) -> Optional[str]:
+        """:meth:`externalize` that moves store calls off the event loop."""
+        if not self.needs_io(encoded):
+            return encoded
+        return await asyncio.to_thread(self.externalize, encoded)
+
+    async def resolve_async(self, encoded: Optional[str]) -> Optional[str]:
+        """:meth:`resolve` that moves store calls off the event loop."""
+        if not self.needs_io(encoded):
+            return encoded
+        return await asyncio.to_thread(self.resolve, encoded)
+
+    def externalize_actions(
+        self, actions: Iterable[pb.WorkflowAction], *, has_parent: bool = False
+    ) -> None:
+        """Externalizes the payloads of actions that stay within this app, in place.
+
+        Actions routed to another app, events sent to other instances and detached
+        workflows are left inline, since their receivers may not share the store. So is
+        the result of a child workflow (``has_parent``), which its parent may read from
+        another app.
+        """
+        if self._store is None:
+            return
+        for action in actions:
+            router = action.router
+            if router.targetAppID and router.targetAppID != router.sourceAppID:
+                continue
+            if action.HasField('scheduleTask'):
+                self._externalize_field(action.scheduleTask.input)
+            elif action.HasField('createChildWorkflow'):
+                self._externalize_field(action.createChildWorkflow.input)
+            elif action.HasField('completeWorkflow') and not has_parent:
+                self._externalize_field(action.completeWorkflow.result)
+
+    def _externalize_field(self, field) -> None:
+        if field.value:
+            field.value = self.externalize(field.value)
+
+    def _cached(self, key: str) -> Optional[str]:
+        with self._lock:
+            payload = self._cache.get(key)
+            if payload is not None:
+                self._cache.move_to_end(key)
+            return payload
+
+    def _cache_put(self, key: str, payload: str) -> None:
+        if len(payload) > self._cache_max_bytes:
+            return
+        with self._lock:
+            if key in self._cache:
+                return
+            self._cache[key] = payload
+            self._cache_bytes += len(payload)
+            while self._cache_bytes > self._cache_max_bytes:
+                _, evicted = self._cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
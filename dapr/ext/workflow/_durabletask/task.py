@@ -24,6 +24,7 @@ from dapr.ext.workflow.propagation import PropagatedHistory, PropagationScope
 T = TypeVar('T')
 TInput = TypeVar('TInput')
 TOutput = TypeVar('TOutput')
+TAccumulator = TypeVar('TAccumulator')
 
 
 class OrchestrationContext(ABC):
@@ -450,6 +451,67 @@ class WhenAllTask(CompositeTask[list[T]]):
         return self._completed_tasks
 
 
+class WhenAllReduceTask(CompositeTask[TAccumulator]):
+    """A task that folds each child's result into an accumulator as the child completes,
+    and completes with the accumulator once all of them have.
+
+    Results are folded in completion order, which replay reproduces, and are not kept,
+    so a fan-out's results never need to be held in memory all at once. Like
+    :class:`WhenAllTask`, a failure (of a child or of ``reducer``) surfaces only after
+    every child has finished; no results are folded after it.
+    """
+
+    def __init__(
+        self,
+        tasks: list[Task[T]],
+        reducer: Callable[[TAccumulator, T], TAccumulator],
+        initial: TAccumulator,
+    ):
+        # Set before super().__init__(), which replays pre-completed children.
+        self._reducer = reducer
+        self._accumulator = initial
+        self._total = len(tasks)
+        self._pending_exception: Optional[Exception] = None
+        super().__init__(tasks)
+        # Only the count is needed from here on; dropping the children lets each
+        # completed task, and its result, be freed once folded.
+        self._tasks = []
+        if self._total == 0:
+            self._result = initial
+            self._is_complete = True
+
+    @property
+    def pending_tasks(self) -> int:
+        """Returns the number of tasks that have not yet completed."""
+        return self._total - self._completed_tasks
+
+    def on_child_completed(self, task: Task[T]):
+        if self.is_complete:
+            return
+        self._completed_tasks += 1
+        if self._pending_exception is None:
+            if task.is_failed:
+                self._pending_exception = task.get_exception()
+            else:
+                try:
+                    self._accumulator = self._reducer(self._accumulator, task.get_result())
+                except Exception as ex:
+                    self._pending_exception = ex
+        if self._completed_tasks < self._total:
+            return
+        self._is_complete = True
+        if self._pending_exception is not None:
+            self._exception = self._pending_exception
+        else:
+            self._result = self._accumulator
+        self._accumulator = None
+        if self._parent is not None:
+            self._parent.on_child_completed(self)
+
+    def get_completed_tasks(self) -> int:
+        return self._completed_tasks
+
+
 class CompletableTask(Task[T]):
     def __init__(self):
         super().__init__()
@@ -642,6 +704,16 @@ def when_all(tasks: list[Task[T]]) -> WhenAllTask[T]:
     return WhenAllTask(tasks)
 
 
+def when_all_reduce(
+    tasks: list[Task[T]],
+    reducer: Callable[[TAccumulator, T], TAccumulator],
+    initial: TAccumulator,
+) -> WhenAllReduceTask[TAccumulator]:
+    """Returns a task that folds each task's result into ``initial`` with ``reducer`` as
+    it completes, and completes with the accumulated value once all of them have."""
+    return WhenAllReduceTask(tasks, reducer, initial)
+
+
 def when_any(tasks: list[Task]) -> WhenAnyTask:
     """Returns a task that completes when any of the provided tasks complete or fail."""
     return WhenAnyTask(tasks)
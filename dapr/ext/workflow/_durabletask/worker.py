@@ -10,15 +10,22 @@
 # limitations under the License.
 
 import asyncio
+import bisect
 import contextlib
+import contextvars
 import inspect
 import logging
+import math
+import multiprocessing
 import os
 import random
 import threading
 import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from threading import Event, Thread
 from types import GeneratorType
@@ -27,13 +34,30 @@ from typing import Any, Callable, Generator, Iterator, Optional, Sequence, TypeV
 import grpc
 from google.protobuf import empty_pb2, timestamp_pb2
 
+import dapr.ext.workflow._durabletask.aio.internal.grpc_interceptor as aio_interceptor
+import dapr.ext.workflow._durabletask.aio.internal.shared as aio_shared
 import dapr.ext.workflow._durabletask.internal.helpers as ph
 import dapr.ext.workflow._durabletask.internal.orchestrator_service_pb2_grpc as stubs
 import dapr.ext.workflow._durabletask.internal.protos as pb
 import dapr.ext.workflow._durabletask.internal.shared as shared
 from dapr.ext.workflow._durabletask import deterministic, task
+from dapr.ext.workflow._durabletask.codecs import DEFAULT_CODEC, PayloadCodec
 from dapr.ext.workflow._durabletask.internal.grpc_interceptor import DefaultClientInterceptorImpl
 from dapr.ext.workflow._durabletask.internal.shared import is_async_callable
+from dapr.ext.workflow._durabletask.metrics import (
+    HISTORY_CACHED,
+    HISTORY_FETCHED,
+    HISTORY_FULL,
+    ActivityWorkItemMetrics,
+    OrchestrationWorkItemMetrics,
+    WorkerMetrics,
+)
+from dapr.ext.workflow._durabletask.payloads import (
+    DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+    PayloadStore,
+    PayloadStoreError,
+    _PayloadClaimCheck,
+)
 from dapr.ext.workflow.propagation import PropagatedHistory, PropagationScope
 
 TInput = TypeVar('TInput')
@@ -71,7 +95,12 @@ class ConcurrencyOptions:
     """Concurrency limits for the worker.
 
     ``maximum_thread_pool_workers`` sizes the pool used to run sync activities and to
-    deliver async-activity responses to the sidecar.
+    deliver async-activity responses to the sidecar. ``maximum_process_pool_workers`` sizes
+    the pool of worker processes for activities registered with ``executor='process'``.
+
+    With ``adaptive_concurrency`` the two work-item caps become upper bounds: each limit
+    starts at its minimum and moves at runtime with observed completion latency and
+    sidecar deadline errors (see :class:`_AdaptiveLimit`).
     """
 
     def __init__(
@@ -79,6 +108,11 @@ class ConcurrencyOptions:
         maximum_concurrent_activity_work_items: Optional[int] = None,
         maximum_concurrent_orchestration_work_items: Optional[int] = None,
         maximum_thread_pool_workers: Optional[int] = None,
+        maximum_process_pool_workers: Optional[int] = None,
+        process_activity_timeout: Optional[float] = None,
+        adaptive_concurrency: bool = False,
+        minimum_concurrent_activity_work_items: Optional[int] = None,
+        minimum_concurrent_orchestration_work_items: Optional[int] = None,
     ):
         """Initialize concurrency options.
 
@@ -90,6 +124,17 @@ class ConcurrencyOptions:
             maximum_thread_pool_workers: Size of the worker thread pool. Sync activities run
                 on this pool, and async-activity gRPC response sends also borrow a thread
                 from it. Defaults to ``cpu_count + 4``.
+            maximum_process_pool_workers: Number of worker processes for process-pool
+                activities. Defaults to ``cpu_count``.
+            process_activity_timeout: Seconds a process-pool activity may run before it is
+                failed. A call that times out while running is stopped by replacing the
+                process pool and terminating its worker processes, which also fails the
+                other activities running on them. Defaults to None (no timeout).
+            adaptive_concurrency: Adjust the activity and orchestration work-item limits at
+                runtime, between their minimum and maximum. Defaults to False (fixed limits).
+            minimum_concurrent_activity_work_items: Lower bound, and starting point, of the
+                adaptive activity limit. Defaults to ``cpu_count``, capped at the maximum.
+            minimum_concurrent_orchestration_work_items: Same, for orchestrations.
         """
         processor_count = os.cpu_count() or 1
         default_concurrency = 100 * processor_count
@@ -114,18 +159,61 @@ class ConcurrencyOptions:
             else default_max_workers
         )
 
+        self.maximum_process_pool_workers = (
+            maximum_process_pool_workers
+            if maximum_process_pool_workers is not None
+            else processor_count
+        )
+        self.process_activity_timeout = process_activity_timeout
+
+        self.adaptive_concurrency = adaptive_concurrency
+        self.minimum_concurrent_activity_work_items = min(
+            self.maximum_concurrent_activity_work_items,
+            minimum_concurrent_activity_work_items
+            if minimum_concurrent_activity_work_items is not None
+            else processor_count,
+        )
+        self.minimum_concurrent_orchestration_work_items = min(
+            self.maximum_concurrent_orchestration_work_items,
+            minimum_concurrent_orchestration_work_items
+            if minimum_concurrent_orchestration_work_items is not None
+            else processor_count,
+        )
+        if (
+            self.minimum_concurrent_activity_work_items < 1
+            or self.minimum_concurrent_orchestration_work_items < 1
+        ):
+            raise ValueError('Minimum concurrent work items must be at least 1')
+
+
+@dataclass(frozen=True)
+class ConcurrencyLimits:
+    """A point-in-time snapshot of a worker's work-item concurrency limits and usage."""
+
+    activity_limit: int
+    activity_in_flight: int
+    orchestration_limit: int
+    orchestration_in_flight: int
+
+
+_ACTIVITY_EXECUTORS = ('thread', 'process')
+
 
 class _Registry:
     orchestrators: dict[str, task.Orchestrator]
     versioned_orchestrators: dict[str, dict[str, task.Orchestrator]]
     latest_versioned_orchestrators_version_name: dict[str, str]
     activities: dict[str, task.Activity]
+    process_activities: set[str]
+    externalized_activities: set[str]
 
     def __init__(self):
         self.orchestrators = {}
         self.versioned_orchestrators = {}
         self.latest_versioned_orchestrators_version_name = {}
         self.activities = {}
+        self.process_activities = set()
+        self.externalized_activities = set()
 
     def add_orchestrator(
         self, fn: task.Orchestrator, version_name: Optional[str] = None, is_latest: bool = False
@@ -182,21 +270,42 @@ class _Registry:
 
         return None, None
 
-    def add_activity(self, fn: task.Activity) -> str:
+    def add_activity(
+        self, fn: task.Activity, *, executor: str = 'thread', externalize_output: bool = False
+    ) -> str:
         if fn is None:
             raise ValueError('An activity function argument is required.')
 
         name = task.get_name(fn)
-        self.add_named_activity(name, fn)
+        self.add_named_activity(name, fn, executor=executor, externalize_output=externalize_output)
         return name
 
-    def add_named_activity(self, name: str, fn: task.Activity) -> None:
+    def add_named_activity(
+        self,
+        name: str,
+        fn: task.Activity,
+        *,
+        executor: str = 'thread',
+        externalize_output: bool = False,
+    ) -> None:
         if not name:
             raise ValueError('A non-empty activity name is required.')
         if name in self.activities:
             raise ValueError(f"A '{name}' activity already exists.")
+        if executor not in _ACTIVITY_EXECUTORS:
+            raise ValueError(
+                f"Unknown activity executor '{executor}'; expected one of {_ACTIVITY_EXECUTORS}."
+            )
+        if executor == 'process' and is_async_callable(fn):
+            raise ValueError(
+                f"Activity '{name}' is async; only sync activities can run in a process pool."
+            )
 
         self.activities[name] = fn
+        if executor == 'process':
+            self.process_activities.add(name)
+        if externalize_output:
+            self.externalized_activities.add(name)
 
     def get_activity(self, name: str) -> Optional[task.Activity]:
         return self.activities.get(name)
@@ -214,6 +323,11 @@ class ActivityNotRegisteredError(ValueError):
     pass
 
 
+# Completion errors that mean the sidecar is overloaded, as opposed to a dropped
+# connection. RESOURCE_EXHAUSTED is not one: here it always means an oversized message.
+_OVERLOAD_STATUS_CODES = frozenset({grpc.StatusCode.DEADLINE_EXCEEDED})
+
+
 def _is_message_too_large(rpc_error: grpc.RpcError) -> bool:
     """Return True if the gRPC error is RESOURCE_EXHAUSTED.
 
@@ -223,29 +337,164 @@ def _is_message_too_large(rpc_error: grpc.RpcError) -> bool:
     return rpc_error.code() == grpc.StatusCode.RESOURCE_EXHAUSTED
 
 
+def _history_fetch_error(req: pb.WorkflowRequest, ex: Exception) -> '_HistoryResolutionError':
+    return _HistoryResolutionError(
+        f"Failed to fetch the committed history for '{req.instanceId}': {ex}"
+    )
+
+
+def _reconnect_delay(attempt: int, max_delay: float = 15) -> float:
+    """Exponential backoff with jitter before reconnection attempt ``attempt``."""
+    return min(max_delay, (2 ** min(attempt, 6)) + random.uniform(0, 1))
+
+
 # TODO: refactor this to closely match durabletask-go/client/worker_grpc.go instead of this.
 _DEFAULT_HISTORY_CACHE_TTL = 3600.0
 _DEFAULT_HISTORY_CACHE_MAX_INSTANCES = 100_000
 _HISTORY_CACHE_SWEEP_INTERVAL = 60.0
+_DEFAULT_STICKY_EXECUTION_MAX_INSTANCES = 10_000
+# gRPC's default maximum message size, which the sidecar also applies to responses.
+_DEFAULT_GRPC_MAX_MESSAGE_BYTES = 4 * 1024 * 1024
+# Share of the maximum message size a turn's actions may take; the rest is headroom for
+# the custom status and the other response fields.
+_ACTION_BYTES_SHARE = 0.75
+# Actions that are answered by a completion event, so a turn that sends one is always
+# followed by another turn; only these are held back when a turn's actions are batched.
+_DEFERRABLE_ACTION_TYPES = frozenset({'scheduleTask', 'createChildWorkflow'})
+# How long the running work item waited in the _AsyncWorkerManager queues before it
+# started; set by the manager for the duration of each work item.
+_queue_wait: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    'queue_wait', default=None
+)
+
+
+def _max_send_message_bytes(channel_options: Optional[Sequence[tuple[str, Any]]]) -> int:
+    for name, value in channel_options or ():
+        if name == 'grpc.max_send_message_length' and value > 0:
+            return value
+    return _DEFAULT_GRPC_MAX_MESSAGE_BYTES
 
 
 class _HistoryResolutionError(Exception):
-    """Raised when a delta work item's committed history could not be recovered.
+    """Raised when a delta work item's committed history, or a payload it refers to in
+    the payload store, could not be recovered.
 
     Distinct from an orchestrator failure: the workflow itself is healthy, we just could
     not reconstruct what to replay, so the item must be re-dispatched rather than failed.
     """
 
 
+class _CompactHistory(Sequence[pb.HistoryEvent]):
+    """An instance's committed history as append-only segments, one per turn.
+
+    Segments are appended as the parsed events the turn replays. With ``serialized``,
+    :meth:`compact` later moves them to wire form, which takes a fraction of the memory of
+    parsed messages, and they are parsed on access; replay parses each event once as it
+    goes. :meth:`extended` shares the segments of the history it extends rather than copying
+    them, like a slice over a shared buffer: each view only sees its own first segments,
+    so appending for one turn never changes a history another reference still holds.
+    """
+
+    __slots__ = ('_segments', '_ends', '_nsegments', '_serialized', 'num_bytes')
+
+    def __init__(
+        self,
+        segments: list[tuple],
+        ends: list[int],
+        nsegments: int,
+        serialized: bool,
+        num_bytes: int,
+    ):
+        self._segments = segments
+        self._ends = ends
+        self._nsegments = nsegments
+        self._serialized = serialized
+        self.num_bytes = num_bytes
+
+    @classmethod
+    def of(cls, events: Sequence[pb.HistoryEvent], *, serialized: bool = True) -> '_CompactHistory':
+        history = cls([], [], 0, serialized, 0)
+        return history.extended(events) if events else history
+
+    def extended(self, events: Sequence[pb.HistoryEvent]) -> '_CompactHistory':
+        """Returns this history with ``events`` appended as a new, parsed segment."""
+        segment = tuple(events)
+        num_bytes = sum(event.ByteSize() for event in segment)
+        segments, ends = self._segments, self._ends
+        if len(segments) != self._nsegments:
+            # Another view already appended past this one: branch off a copy.
+            segments, ends = segments[: self._nsegments], ends[: self._nsegments]
+        segments.append(segment)
+        ends.append(len(self) + len(segment))
+        return _CompactHistory(
+            segments, ends, self._nsegments + 1, self._serialized, self.num_bytes + num_bytes
+        )
+
+    def compact(self) -> None:
+        """Moves parsed segments to wire form, when ``serialized``.
+
+        Segments are replaced in place with equal content, so views sharing them, and
+        iterations already running over them, are unaffected.
+        """
+        if not self._serialized:
+            return
+        segments = self._segments
+        for i in range(self._nsegments):
+            segment = segments[i]
+            if segment and not isinstance(segment[0], bytes):
+                segments[i] = tuple(event.SerializeToString() for event in segment)
+
+    def __len__(self) -> int:
+        return self._ends[self._nsegments - 1] if self._nsegments else 0
+
+    def __iter__(self) -> Iterator[pb.HistoryEvent]:
+        for segment in self._segments[: self._nsegments]:
+            if segment and isinstance(segment[0], bytes):
+                for raw in segment:
+                    yield pb.HistoryEvent.FromString(raw)
+            else:
+                yield from segment
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('history index out of range')
+        seg = bisect.bisect_right(self._ends, index, 0, self._nsegments)
+        start = self._ends[seg - 1] if seg else 0
+        item = self._segments[seg][index - start]
+        return pb.HistoryEvent.FromString(item) if isinstance(item, bytes) else item
+
+
 class _CachedHistory:
     """One instance's cached committed history on a work-item stream."""
 
     __slots__ = ('events', 'last_access', 'num_bytes')
 
-    def __init__(self, events: list[pb.HistoryEvent], last_access: float, num_bytes: int):
+    def __init__(self, events: _CompactHistory, last_access: float):
         self.events = events
         self.last_access = last_access
-        self.num_bytes = num_bytes
+        self.num_bytes = events.num_bytes
+
+
+@dataclass(frozen=True)
+class HistoryCacheStats:
+    """A point-in-time snapshot of a worker's history cache counters."""
+
+    entries: int
+    total_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
 
 class _WorkflowHistoryCache:
@@ -256,6 +505,9 @@ class _WorkflowHistoryCache:
     Entries are reclaimed by a sliding TTL, an instance-count cap, and an optional byte
     budget (LRU eviction). Eviction is always safe: a miss is recovered via the
     GetInstanceHistory RPC, so it only costs one extra fetch.
+
+    Entries are kept in access order (coldest first), so touching, evicting and sweeping
+    never scan the whole cache.
     """
 
     def __init__(
@@ -273,27 +525,41 @@ class _WorkflowHistoryCache:
         self._max_bytes = max_bytes if max_bytes > 0 else 0
         self._clock = clock
         self._lock = threading.Lock()
-        self._entries: dict[str, _CachedHistory] = {}
+        self._entries: OrderedDict[str, _CachedHistory] = OrderedDict()
         self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
 
-    def get(self, instance_id: str) -> Optional[list[pb.HistoryEvent]]:
+    def get(self, instance_id: str) -> Optional[_CompactHistory]:
         """Returns an instance's cached committed history, refreshing its TTL."""
         with self._lock:
             entry = self._entries.get(instance_id)
             if entry is None:
+                self._misses += 1
                 return None
+            self._hits += 1
             entry.last_access = self._clock()
+            self._entries.move_to_end(instance_id)
             return entry.events
 
-    def put(self, instance_id: str, events: list[pb.HistoryEvent]) -> None:
-        """Caches an instance's committed history, evicting LRU entries to stay in bounds."""
-        num_bytes = sum(event.ByteSize() for event in events)
+    def put(self, instance_id: str, events: Sequence[pb.HistoryEvent]) -> None:
+        """Caches an instance's committed history, evicting LRU entries to stay in bounds.
+
+        A :class:`_CompactHistory` is stored as is and already knows its size, so a history
+        extended from the cached one is only ever sized by its appended events.
+        """
+        if not isinstance(events, _CompactHistory):
+            events = _CompactHistory.of(events)
+            events.compact()
         with self._lock:
-            existing = self._entries.get(instance_id)
+            existing = self._entries.pop(instance_id, None)
             if existing is not None:
                 self._total_bytes -= existing.num_bytes
-            self._entries[instance_id] = _CachedHistory(events, self._clock(), num_bytes)
-            self._total_bytes += num_bytes
+            entry = _CachedHistory(events, self._clock())
+            self._entries[instance_id] = entry
+            self._total_bytes += entry.num_bytes
             self._evict_to_fit(instance_id)
 
     def delete(self, instance_id: str) -> None:
@@ -311,13 +577,24 @@ class _WorkflowHistoryCache:
         """Evicts entries whose last turn was longer ago than the TTL."""
         now = self._clock()
         with self._lock:
-            expired = [
-                instance_id
-                for instance_id, entry in self._entries.items()
-                if now - entry.last_access > self._ttl
-            ]
-            for instance_id in expired:
+            while self._entries:
+                instance_id, entry = next(iter(self._entries.items()))
+                if now - entry.last_access <= self._ttl:
+                    return
                 self._remove(instance_id)
+                self._expirations += 1
+
+    def stats(self) -> HistoryCacheStats:
+        """Returns a snapshot of the cache's size and hit/eviction counters."""
+        with self._lock:
+            return HistoryCacheStats(
+                entries=len(self._entries),
+                total_bytes=self._total_bytes,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
 
     def _remove(self, instance_id: str) -> None:
         entry = self._entries.pop(instance_id, None)
@@ -335,20 +612,149 @@ class _WorkflowHistoryCache:
             over_bytes = self._max_bytes > 0 and self._total_bytes > self._max_bytes
             if not over_count and not over_bytes:
                 return
-            victim = self._lru_except(keep)
-            if victim is None:
+            victim = next(iter(self._entries))
+            if victim == keep:
                 return
             self._remove(victim)
+            self._evictions += 1
 
-    def _lru_except(self, keep: str) -> Optional[str]:
-        oldest_id: Optional[str] = None
-        oldest_access = 0.0
-        for instance_id, entry in self._entries.items():
-            if instance_id == keep:
-                continue
-            if oldest_id is None or entry.last_access < oldest_access:
-                oldest_id, oldest_access = instance_id, entry.last_access
-        return oldest_id
+
+class _StickyExecution:
+    """A live orchestration kept between turns so the next turn can skip the replay.
+
+    Holds the executor (and through it the context and suspended generator) after a turn,
+    plus what that turn consumed: the committed history it replayed and the new events it
+    ran. The next turn may continue it only if its committed history extends exactly that.
+    """
+
+    __slots__ = ('executor', 'committed_count', 'last_committed', 'turn_events', 'last_access')
+
+    def __init__(
+        self,
+        executor: '_OrchestrationExecutor',
+        committed_history: Sequence[pb.HistoryEvent],
+        turn_events: Sequence[pb.HistoryEvent],
+        last_access: float,
+    ):
+        self.executor = executor
+        self.committed_count = len(committed_history)
+        self.last_committed = committed_history[-1] if committed_history else None
+        self.turn_events = list(turn_events)
+        self.last_access = last_access
+
+    def delta(
+        self, committed_history: Sequence[pb.HistoryEvent]
+    ) -> Optional[list[pb.HistoryEvent]]:
+        """Returns the committed events this execution has not seen yet, or None on a mismatch.
+
+        The sidecar commits a turn's new events right after the history it was built on,
+        followed by the events confirming the turn's actions (taskScheduled, timerCreated,
+        ...). Only the boundary event and the last turn's events are compared, so the check
+        stays O(delta) however long the history grows. A workflowStarted carrying a different
+        version than the live context runs is also treated as a mismatch.
+        """
+        end = self.committed_count + len(self.turn_events)
+        if len(committed_history) < end:
+            return None
+        if (
+            self.last_committed is not None
+            and committed_history[self.committed_count - 1] != self.last_committed
+        ):
+            return None
+        for i, event in enumerate(self.turn_events):
+            if committed_history[self.committed_count + i] != event:
+                return None
+        delta = list(committed_history[end:])
+        running_version = self.executor.context._orchestrator_version_name
+        for event in delta:
+            if event.HasField('workflowStarted') and event.workflowStarted.version.name:
+                if event.workflowStarted.version.name != running_version:
+                    return None
+        return delta
+
+
+class _StickyExecutionCache:
+    """Per-worker cache of live orchestrations, keyed by instance ID.
+
+    Bounded by an instance-count cap (LRU eviction) and a sliding TTL swept by the history
+    janitor. Entries are taken out for the duration of a turn and put back only once the
+    turn's response was delivered, so a failed or abandoned turn always falls back to a
+    full replay. Eviction is always safe for the same reason.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = _DEFAULT_HISTORY_CACHE_TTL,
+        max_instances: int = _DEFAULT_STICKY_EXECUTION_MAX_INSTANCES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl if ttl > 0 else _DEFAULT_HISTORY_CACHE_TTL
+        self._max_instances = (
+            max_instances if max_instances > 0 else _DEFAULT_STICKY_EXECUTION_MAX_INSTANCES
+        )
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _StickyExecution] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def take(self, instance_id: str) -> Optional[_StickyExecution]:
+        """Removes and returns an instance's live execution, if any."""
+        with self._lock:
+            return self._entries.pop(instance_id, None)
+
+    def put(
+        self,
+        instance_id: str,
+        executor: '_OrchestrationExecutor',
+        committed_history: Sequence[pb.HistoryEvent],
+        turn_events: Sequence[pb.HistoryEvent],
+    ) -> None:
+        """Keeps an instance's live execution, evicting the LRU entry beyond the cap."""
+        entry = _StickyExecution(executor, committed_history, turn_events, self._clock())
+        with self._lock:
+            self._entries.pop(instance_id, None)
+            self._entries[instance_id] = entry
+            while len(self._entries) > self._max_instances:
+                self._entries.popitem(last=False)
+
+    def delete(self, instance_id: str) -> None:
+        with self._lock:
+            self._entries.pop(instance_id, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def sweep_expired(self) -> None:
+        """Drops executions whose last turn was longer ago than the TTL."""
+        now = self._clock()
+        with self._lock:
+            while self._entries:
+                instance_id, entry = next(iter(self._entries.items()))
+                if now - entry.last_access <= self._ttl:
+                    return
+                del self._entries[instance_id]
+
+
+@dataclass
+class _OrchestrationSample:
+    """Measurements of an orchestration work item, filled in as it is processed."""
+
+    queue_wait_seconds: Optional[float]
+    name: str = ''
+    history_source: str = HISTORY_FULL
+    history_seconds: float = 0.0
+    history_events: int = 0
+    history_bytes: int = 0
+    replayed_events: int = 0
+    replay_seconds: float = 0.0
+    new_events: int = 0
+    new_events_seconds: float = 0.0
+    actions: int = 0
+    complete_seconds: Optional[float] = None
 
 
 class TaskHubGrpcWorker:
@@ -384,6 +790,46 @@ class TaskHubGrpcWorker:
         keepalive_interval (float, optional): Interval in seconds between application-level
             keepalive Hello RPCs sent to prevent L7 load balancers (e.g. AWS ALB) from closing
             idle HTTP/2 connections. Set to 0 or negative to disable. Defaults to 30.0.
+        history_cache_serialized (bool, optional): Keep cached histories in their compact wire
+            form and parse events only when replaying them. Defaults to True.
+        enable_sticky_execution (bool, optional): Keep each orchestration's live generator
+            in memory between turns and feed it only the new events, instead of rebuilding
+            it from a full replay of its history on each turn. Orchestrator code then runs
+            once rather than once per turn. Defaults to False.
+        sticky_execution_max_instances (int, optional): Maximum number of live orchestrations
+            kept in memory, LRU-evicted beyond that. Defaults to 10,000.
+        use_grpc_aio (bool, optional): Talk to the sidecar over a ``grpc.aio`` channel: the
+            work-item stream, history fetches and completions are awaited on the worker's
+            event loop instead of occupying a reader thread and pool threads. Defaults to
+            False.
+        aio_interceptors (Optional[Sequence[aio_shared.ClientInterceptor]], optional):
+            ``grpc.aio`` interceptors for the channel used when ``use_grpc_aio`` is set.
+            ``interceptors`` only applies to the sync channel. Defaults to None.
+        payload_store (Optional[PayloadStore], optional): Where to keep activity inputs,
+            child workflow inputs and workflow results whose encoded JSON exceeds
+            ``payload_threshold_bytes``; history then carries a small reference instead.
+            Payloads sent to other apps, results of child workflows and activity outputs
+            stay inline, since their receivers may not share the store; activities
+            registered with ``externalize_output=True`` are the exception. Defaults to None
+            (payloads always travel inline).
+        payload_threshold_bytes (int, optional): Encoded size above which a payload is
+            moved to ``payload_store``. Defaults to 64 KiB.
+        codec (Optional[PayloadCodec], optional): How workflow and activity inputs and
+            top-level workflow results are encoded in history, and whether large ones are
+            compressed. Activity outputs and child workflow results, which callers in other
+            apps or SDKs may read, always use plain JSON. Defaults to None (plain JSON
+            through the ``json`` module).
+        max_actions_per_turn (Optional[int], optional): Most activities and child
+            workflows an orchestration schedules per turn. The rest stay pending and are
+            scheduled in later turns, as earlier ones complete. Defaults to None (no limit).
+        max_action_bytes_per_turn (Optional[int], optional): Encoded size of the actions
+            a turn may send before further activities and child workflows are held back
+            for later turns, so large fan-outs fit in one gRPC message. Defaults to three
+            quarters of the channel's ``grpc.max_send_message_length`` (4 MiB when
+            unset); 0 disables the limit.
+        metrics (Optional[WorkerMetrics], optional): Receives the queue wait, history
+            resolution, replay, execution and completion timings of every work item.
+            Defaults to None (nothing is measured).
 
     Attributes:
         concurrency_options (ConcurrencyOptions): The current concurrency configuration.
@@ -455,6 +901,17 @@ class TaskHubGrpcWorker:
         history_cache_ttl: float = _DEFAULT_HISTORY_CACHE_TTL,
         history_cache_max_instances: int = _DEFAULT_HISTORY_CACHE_MAX_INSTANCES,
         history_cache_max_bytes: int = 0,
+        history_cache_serialized: bool = True,
+        enable_sticky_execution: bool = False,
+        sticky_execution_max_instances: int = _DEFAULT_STICKY_EXECUTION_MAX_INSTANCES,
+        use_grpc_aio: bool = False,
+        aio_interceptors: Optional[Sequence[aio_shared.ClientInterceptor]] = None,
+        payload_store: Optional[PayloadStore] = None,
+        payload_threshold_bytes: int = DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+        codec: Optional[PayloadCodec] = None,
+        max_actions_per_turn: Optional[int] = None,
+        max_action_bytes_per_turn: Optional[int] = None,
+        metrics: Optional[WorkerMetrics] = None,
     ):
         self._registry = _Registry()
         self._host_address = host_address if host_address else shared.get_default_host_address()
@@ -484,8 +941,19 @@ class TaskHubGrpcWorker:
         else:
             self._interceptors = None
 
+        self._use_grpc_aio = use_grpc_aio
+        self._aio_interceptors: list[aio_shared.ClientInterceptor] = list(aio_interceptors or [])
+        if metadata:
+            self._aio_interceptors.append(aio_interceptor.DefaultClientInterceptorImpl(metadata))
+        # Set while the grpc.aio run loop is running, so stop() can reach it from another thread.
+        self._aio_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._aio_wakeup: Optional[asyncio.Event] = None
+
         self._async_worker_manager = _AsyncWorkerManager(self._concurrency_options, self._logger)
-        self._activity_executor = _ActivityExecutor(self._logger)
+        self._codec = codec if codec is not None else DEFAULT_CODEC
+        self._activity_executor = _ActivityExecutor(self._logger, self._codec)
+        # Created by start() when any activity is registered with executor='process'.
+        self._activity_processes: Optional[_ActivityProcessPool] = None
 
         self._disable_stateful_history = disable_stateful_history
         self._history_cache = _WorkflowHistoryCache(
@@ -493,13 +961,39 @@ class TaskHubGrpcWorker:
             max_instances=history_cache_max_instances,
             max_bytes=history_cache_max_bytes,
         )
+        self._enable_sticky_execution = enable_sticky_execution
+        self._sticky_executions = _StickyExecutionCache(
+            ttl=history_cache_ttl,
+            max_instances=sticky_execution_max_instances,
+        )
+        self._history_cache_serialized = history_cache_serialized
         self._history_janitor: Optional[Thread] = None
+        self._payloads = _PayloadClaimCheck(payload_store, threshold_bytes=payload_threshold_bytes)
+        if max_actions_per_turn is not None and max_actions_per_turn < 1:
+            raise ValueError('max_actions_per_turn must be at least 1')
+        self._max_actions_per_turn = max_actions_per_turn
+        if max_action_bytes_per_turn is None:
+            max_action_bytes_per_turn = int(
+                _max_send_message_bytes(channel_options) * _ACTION_BYTES_SHARE
+            )
+        self._max_action_bytes_per_turn = max_action_bytes_per_turn or None
+        self._metrics = metrics
+
+    @property
+    def history_cache_stats(self) -> HistoryCacheStats:
+        """Size and hit/eviction counters of the stateful-history cache."""
+        return self._history_cache.stats()
 
     @property
     def concurrency_options(self) -> ConcurrencyOptions:
         """Get the current concurrency options for this worker."""
         return self._concurrency_options
 
+    @property
+    def concurrency_limits(self) -> ConcurrencyLimits:
+        """Current work-item limits, which move at runtime with ``adaptive_concurrency``."""
+        return self._async_worker_manager.limits()
+
     def __enter__(self):
         return self
 
@@ -512,11 +1006,24 @@ class TaskHubGrpcWorker:
             raise RuntimeError('Orchestrators cannot be added while the worker is running.')
         return self._registry.add_orchestrator(fn)
 
-    def add_activity(self, fn: task.Activity) -> str:
-        """Registers an activity function with the worker."""
+    def add_activity(
+        self, fn: task.Activity, *, executor: str = 'thread', externalize_output: bool = False
+    ) -> str:
+        """Registers an activity function with the worker.
+
+        ``executor='process'`` runs a sync activity in a pool of worker processes instead of
+        the thread pool, for CPU-bound work that would otherwise serialize on the GIL. The
+        function, its input and its result must be picklable: define it at module level.
+
+        ``externalize_output=True`` moves large results of the activity to the worker's
+        ``payload_store``. Only use it when every app that calls the activity shares that
+        store; otherwise results stay inline.
+        """
         if self._is_running:
             raise RuntimeError('Activities cannot be added while the worker is running.')
-        return self._registry.add_activity(fn)
+        return self._registry.add_activity(
+            fn, executor=executor, externalize_output=externalize_output
+        )
 
     def is_worker_ready(self) -> bool:
         return self._stream_ready.is_set() and self._is_running
@@ -529,10 +1036,27 @@ class TaskHubGrpcWorker:
         def run_loop():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
-            loop.run_until_complete(self._async_run_loop())
+            try:
+                if self._use_grpc_aio:
+                    loop.run_until_complete(self._async_run_loop_aio())
+                else:
+                    loop.run_until_complete(self._async_run_loop())
+            finally:
+                loop.close()
 
         self._logger.info(f'Starting gRPC worker that connects to {self._host_address}')
-        if not self._disable_stateful_history:
+        if self._registry.process_activities and self._activity_processes is None:
+            self._activity_processes = _ActivityProcessPool(
+                {
+                    name: self._registry.activities[name]
+                    for name in self._registry.process_activities
+                },
+                self._concurrency_options.maximum_process_pool_workers,
+                self._concurrency_options.process_activity_timeout,
+                self._logger,
+                self._codec,
+            )
+        if not self._disable_stateful_history or self._enable_sticky_execution:
             self._history_janitor = Thread(
                 target=self._sweep_history_cache_loop, name='WorkerHistoryJanitor', daemon=True
             )
@@ -584,7 +1108,6 @@ class TaskHubGrpcWorker:
         current_stub = None
         current_reader_thread = None
         conn_retry_count = 0
-        conn_max_retry_delay = 15
 
         def create_fresh_connection():
             nonlocal current_channel, current_stub, conn_retry_count
@@ -656,10 +1179,7 @@ class TaskHubGrpcWorker:
                     create_fresh_connection()
                 except Exception:
                     conn_retry_count += 1
-                    delay = min(
-                        conn_max_retry_delay,
-                        (2 ** min(conn_retry_count, 6)) + random.uniform(0, 1),
-                    )
+                    delay = _reconnect_delay(conn_retry_count)
                     self._logger.warning(
                         f'Connection failed, retrying in {delay:.2f} seconds (attempt {conn_retry_count})'
                     )
@@ -670,13 +1190,8 @@ class TaskHubGrpcWorker:
             try:
                 assert current_stub is not None
                 stub = current_stub
-                get_work_items_request = pb.GetWorkItemsRequest()
-                if not self._disable_stateful_history:
-                    get_work_items_request.capabilities.append(
-                        pb.WORKER_CAPABILITY_STATEFUL_HISTORY
-                    )
                 try:
-                    self._response_stream = stub.GetWorkItems(get_work_items_request)
+                    self._response_stream = stub.GetWorkItems(self._new_work_items_request())
                     self._logger.info(
                         f'Successfully connected to {self._host_address}. Waiting for work items...'
                     )
@@ -807,38 +1322,7 @@ class TaskHubGrpcWorker:
                             break
                         if isinstance(work_item, Exception):
                             raise work_item
-                        request_type = work_item.WhichOneof('request')
-                        self._logger.debug(f'Received "{request_type}" work item')
-                        if work_item.HasField('workflowRequest'):
-                            self._async_worker_manager.submit_orchestration(
-                                self._execute_orchestrator,
-                                work_item.workflowRequest,
-                                stub,
-                                work_item.completionToken,
-                                teardown_stream,
-                            )
-                        elif work_item.HasField('activityRequest'):
-                            # Async user activities run on the event loop. Sync ones fall through
-                            # to the thread pool via _execute_activity.
-                            activity_fn = self._registry.get_activity(
-                                work_item.activityRequest.name
-                            )
-                            activity_handler = (
-                                self._execute_activity_async
-                                if activity_fn is not None and is_async_callable(activity_fn)
-                                else self._execute_activity
-                            )
-                            self._async_worker_manager.submit_activity(
-                                activity_handler,
-                                activity_fn,
-                                work_item.activityRequest,
-                                stub,
-                                work_item.completionToken,
-                            )
-                        elif work_item.HasField('healthPing'):
-                            pass
-                        else:
-                            self._logger.warning(f'Unexpected work item type: {request_type}')
+                        self._dispatch_work_item(work_item, stub, teardown_stream, aio=False)
                     except queue.Empty:
                         continue
                     except grpc.RpcError:
@@ -932,7 +1416,55 @@ class TaskHubGrpcWorker:
                 self._logger.warning(f'Unexpected error: {ex}')
         invalidate_connection()
         self._logger.info('No longer listening for work items')
+        await self._stop_worker_task(worker_task)
+
+    def _new_work_items_request(self) -> pb.GetWorkItemsRequest:
+        request = pb.GetWorkItemsRequest()
+        if not self._disable_stateful_history:
+            request.capabilities.append(pb.WORKER_CAPABILITY_STATEFUL_HISTORY)
+        return request
+
+    def _dispatch_work_item(
+        self,
+        work_item: pb.WorkItem,
+        stub: stubs.TaskHubSidecarServiceStub,
+        teardown_stream: Callable[[], None],
+        *,
+        aio: bool,
+    ) -> None:
+        """Submits a work item received on either transport to the worker manager."""
+        request_type = work_item.WhichOneof('request')
+        self._logger.debug(f'Received "{request_type}" work item')
+        if request_type == 'workflowRequest':
+            self._async_worker_manager.submit_orchestration(
+                self._execute_orchestrator_aio if aio else self._execute_orchestrator,
+                work_item.workflowRequest,
+                stub,
+                work_item.completionToken,
+                teardown_stream,
+            )
+        elif request_type == 'activityRequest':
+            name = work_item.activityRequest.name
+            activity_fn = self._registry.get_activity(name)
+            if aio:
+                activity_handler = self._execute_activity_aio
+            elif self._is_loop_activity(activity_fn, name):
+                # Async user activities (and process-pool ones, which are awaited) run on
+                # the event loop. Sync ones go to the thread pool via _execute_activity.
+                activity_handler = self._execute_activity_async
+            else:
+                activity_handler = self._execute_activity
+            self._async_worker_manager.submit_activity(
+                activity_handler,
+                activity_fn,
+                work_item.activityRequest,
+                stub,
+                work_item.completionToken,
+            )
+        elif request_type != 'healthPing':
+            self._logger.warning(f'Unexpected work item type: {request_type}')
 
+    async def _stop_worker_task(self, worker_task: asyncio.Task) -> None:
         # Cancel worker_task to ensure shutdown completes even if tasks are still running
         worker_task.cancel()
         try:
@@ -945,6 +1477,141 @@ class TaskHubGrpcWorker:
         except Exception as e:
             self._logger.warning(f'Error while waiting for worker task shutdown: {e}')
 
+    def _interrupt_aio_stream(self) -> None:
+        """Cancels the current ``grpc.aio`` stream and wakes any reconnect backoff."""
+        if self._response_stream is not None:
+            self._response_stream.cancel()
+        if self._aio_wakeup is not None:
+            self._aio_wakeup.set()
+
+    async def _aio_keepalive_loop(self, stub):
+        """:meth:`_keepalive_loop` for a ``grpc.aio`` stub."""
+        while not self._shutdown.is_set():
+            await asyncio.sleep(self._keepalive_interval)
+            try:
+                await stub.Hello(empty_pb2.Empty(), timeout=10)
+            except Exception as e:
+                self._logger.debug(f'keepalive failed: {e}')
+
+    async def _async_run_loop_aio(self):
+        """The worker loop over a ``grpc.aio`` channel.
+
+        Same lifecycle as :meth:`_async_run_loop` (connect, stream, reconnect with backoff,
+        shut down), but the stream is consumed with ``async for`` on this loop, so there is
+        no reader thread and no queue hop between it and the dispatcher.
+        """
+        self._aio_loop = asyncio.get_running_loop()
+        self._aio_wakeup = asyncio.Event()
+        worker_task = asyncio.create_task(self._async_worker_manager.run())
+        options = dict(shared.DEFAULT_GRPC_KEEPALIVE_OPTIONS)
+        options.update(dict(self._channel_options or ()))
+        channel_closers: set[asyncio.Task] = set()
+        conn_retry_count = 0
+
+        while not self._shutdown.is_set():
+            channel = aio_shared.get_grpc_aio_channel(
+                self._host_address,
+                self._secure_channel,
+                self._aio_interceptors or None,
+                options=list(options.items()),
+            )
+            call = None
+            keepalive_task = None
+            try:
+                stub = stubs.TaskHubSidecarServiceStub(channel)
+                await stub.Hello(empty_pb2.Empty())
+                conn_retry_count = 0
+                self._logger.info(f'Created fresh connection to {self._host_address}')
+
+                call = stub.GetWorkItems(self._new_work_items_request())
+                self._response_stream = call
+                if self._shutdown.is_set():  # stop() ran before the stream existed
+                    call.cancel()
+                teardown_stream = self._make_stream_teardown(call)
+                self._stream_ready.set()
+                self._logger.info(
+                    f'Successfully connected to {self._host_address}. Waiting for work items...'
+                )
+                if self._keepalive_interval > 0:
+                    keepalive_task = asyncio.ensure_future(self._aio_keepalive_loop(stub))
+
+                async for work_item in call:
+                    self._dispatch_work_item(work_item, stub, teardown_stream, aio=True)
+
+                if self._shutdown.is_set():
+                    break
+                # Stream ended without shutdown being requested - reconnect right away.
+                self._logger.info(
+                    f'Work item stream ended. Will attempt to reconnect to {self._host_address}...'
+                )
+                continue
+            except asyncio.CancelledError:
+                # grpc.aio raises CancelledError from a locally cancelled call: either stop()
+                # or a stream teardown. Anything else is this task being cancelled.
+                if call is None or not call.cancelled():
+                    raise
+                if self._shutdown.is_set():
+                    break
+                self._logger.info(
+                    f'Work item stream cancelled. Will attempt to reconnect to {self._host_address}...'
+                )
+                continue
+            except grpc.RpcError as rpc_error:
+                if self._shutdown.is_set():
+                    break
+                self._logger.warning(
+                    f'Connection error ({rpc_error.code()}): {rpc_error.details()}'  # type: ignore
+                )
+            except Exception as ex:
+                if self._shutdown.is_set():
+                    break
+                self._logger.warning(f'Unexpected error: {ex}')
+            finally:
+                self._response_stream = None
+                await self._cancel_keepalive(keepalive_task)
+                # The sidecar drops this stream's warm set on disconnect, so start the next
+                # stream cold to stay in sync.
+                self._history_cache.reset()
+                closer = asyncio.ensure_future(self._close_aio_channel(channel))
+                channel_closers.add(closer)
+                closer.add_done_callback(channel_closers.discard)
+
+            conn_retry_count += 1
+            delay = _reconnect_delay(conn_retry_count)
+            self._logger.warning(
+                f'Connection failed, retrying in {delay:.2f} seconds (attempt {conn_retry_count})'
+            )
+            self._aio_wakeup.clear()
+            if self._shutdown.is_set():
+                break
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._aio_wakeup.wait(), timeout=delay)
+
+        self._logger.info('No longer listening for work items')
+        await self._stop_worker_task(worker_task)
+        # Cut the grace period of channels still waiting to close.
+        for closer in list(channel_closers):
+            closer.cancel()
+        if channel_closers:
+            await asyncio.wait(channel_closers, timeout=5.0)
+        self._aio_loop = None
+
+    async def _close_aio_channel(self, channel, grace_timeout: float = 10.0) -> None:
+        """Closes a ``grpc.aio`` channel after a grace period for in-flight RPCs.
+
+        Mirrors :meth:`_schedule_deferred_channel_close`: completions for work items
+        received on this channel may still be in flight. During shutdown it closes at once.
+        """
+        try:
+            if not self._shutdown.is_set():
+                await asyncio.sleep(grace_timeout)
+        finally:
+            try:
+                await channel.close()
+                self._logger.debug('Deferred channel close completed')
+            except Exception as e:
+                self._logger.debug(f'Error during deferred channel close: {e}')
+
     def _schedule_deferred_channel_close(
         self, old_channel: grpc.Channel, grace_timeout: float = 10.0
     ):
@@ -986,8 +1653,13 @@ class TaskHubGrpcWorker:
 
         self._logger.info('Stopping gRPC worker...')
         self._shutdown.set()
+        aio_loop = self._aio_loop
+        if aio_loop is not None:
+            # The grpc.aio stream lives on the run loop; cancel it there.
+            with contextlib.suppress(RuntimeError):  # loop already closed
+                aio_loop.call_soon_threadsafe(self._interrupt_aio_stream)
         # Close the channel — propagates cancellation to all streams and cleans up resources
-        if self._current_channel is not None:
+        elif self._current_channel is not None:
             try:
                 self._current_channel.close()
             except Exception as e:
@@ -1011,6 +1683,9 @@ class TaskHubGrpcWorker:
         self._channel_cleanup_threads.clear()
 
         self._async_worker_manager.shutdown()
+        if self._activity_processes is not None:
+            self._activity_processes.shutdown()
+            self._activity_processes = None
         self._logger.info('Worker shutdown completed')
         self._is_running = False
         self._runLoop = None
@@ -1026,6 +1701,8 @@ class TaskHubGrpcWorker:
             grpc.StatusCode.UNKNOWN,
             grpc.StatusCode.INTERNAL,
         }
+        if rpc_error.code() in _OVERLOAD_STATUS_CODES:
+            self._async_worker_manager.record_overload(request_type)
         is_transient = rpc_error.code() in transient_errors
         is_benign = (
             'unknown instance id/task id combo' in details
@@ -1060,40 +1737,154 @@ class TaskHubGrpcWorker:
         return teardown_stream
 
     def _sweep_history_cache_loop(self):
-        """Periodically reclaims TTL-expired history cache entries until shutdown."""
+        """Periodically reclaims TTL-expired history and sticky executions until shutdown."""
         while not self._shutdown.wait(_HISTORY_CACHE_SWEEP_INTERVAL):
             self._history_cache.sweep_expired()
+            self._sticky_executions.sweep_expired()
 
     def _resolve_history(
-        self, req: pb.WorkflowRequest, stub: stubs.TaskHubSidecarServiceStub
-    ) -> list[pb.HistoryEvent]:
+        self,
+        req: pb.WorkflowRequest,
+        stub: stubs.TaskHubSidecarServiceStub,
+        sample: Optional[_OrchestrationSample] = None,
+    ) -> Sequence[pb.HistoryEvent]:
         """Resolves the full committed history to replay for a workflow work item.
 
         For a full send it is the request's pastEvents. For a delta send (cachedHistory) it
-        is the cached prefix plus the delta, recovered via GetInstanceHistory on any cache
-        miss (cold stream, eviction, or a prefix-length mismatch).
+        is the cached prefix extended by the delta (without copying the prefix), recovered
+        via GetInstanceHistory on any cache miss (cold stream, eviction, or a prefix-length
+        mismatch).
 
         Raises:
             _HistoryResolutionError: If the cache-miss fetch failed.
         """
-        if not req.HasField('cachedHistory'):
-            return list(req.pastEvents)
+        started = time.perf_counter()
+        history = self._resolve_local_history(req, sample, started)
+        if history is not None:
+            return history
+        try:
+            response = stub.GetInstanceHistory(
+                pb.GetInstanceHistoryRequest(instanceId=req.instanceId)
+            )
+        except Exception as ex:
+            raise _history_fetch_error(req, ex) from ex
+        return self._fetched_history(req, response, sample, started)
+
+    async def _resolve_history_aio(
+        self,
+        req: pb.WorkflowRequest,
+        stub: stubs.TaskHubSidecarServiceStub,
+        sample: Optional[_OrchestrationSample] = None,
+    ) -> Sequence[pb.HistoryEvent]:
+        """:meth:`_resolve_history` for a ``grpc.aio`` stub; the cache-miss fetch is awaited."""
+        started = time.perf_counter()
+        history = self._resolve_local_history(req, sample, started)
+        if history is not None:
+            return history
+        try:
+            response = await stub.GetInstanceHistory(
+                pb.GetInstanceHistoryRequest(instanceId=req.instanceId)
+            )
+        except Exception as ex:
+            raise _history_fetch_error(req, ex) from ex
+        return self._fetched_history(req, response, sample, started)
+
+    def _resolve_local_history(
+        self,
+        req: pb.WorkflowRequest,
+        sample: Optional[_OrchestrationSample] = None,
+        started: float = 0.0,
+    ) -> Optional[Sequence[pb.HistoryEvent]]:
+        """Resolves a work item's history without the sidecar, or None if it must be fetched."""
+        if self._disable_stateful_history:
+            history: Optional[Sequence[pb.HistoryEvent]] = list(req.pastEvents)
+        elif not req.HasField('cachedHistory'):
+            history = _CompactHistory.of(req.pastEvents, serialized=self._history_cache_serialized)
+        else:
+            cached = self._history_cache.get(req.instanceId)
+            if cached is None or len(cached) != req.cachedHistory.eventCount:
+                return None
+            history = cached.extended(req.pastEvents)
+        self._sample_history(sample, req, history, started, fetched=False)
+        return history
+
+    def _fetched_history(
+        self,
+        req: pb.WorkflowRequest,
+        response: pb.GetInstanceHistoryResponse,
+        sample: Optional[_OrchestrationSample],
+        started: float,
+    ) -> _CompactHistory:
+        history = _CompactHistory.of(response.events, serialized=self._history_cache_serialized)
+        self._sample_history(sample, req, history, started, fetched=True)
+        return history
+
+    def _sample_history(
+        self,
+        sample: Optional[_OrchestrationSample],
+        req: pb.WorkflowRequest,
+        history: Sequence[pb.HistoryEvent],
+        started: float,
+        *,
+        fetched: bool,
+    ) -> None:
+        if sample is None:
+            return
+        sample.history_seconds = time.perf_counter() - started
+        if fetched:
+            sample.history_source = HISTORY_FETCHED
+        elif req.HasField('cachedHistory') and not self._disable_stateful_history:
+            sample.history_source = HISTORY_CACHED
+        sample.history_events = len(history)
+        if isinstance(history, _CompactHistory):
+            num_bytes = history.num_bytes
+        else:
+            num_bytes = sum(event.ByteSize() for event in history)
+        sample.history_bytes = num_bytes + sum(event.ByteSize() for event in req.newEvents)
 
-        cached = self._history_cache.get(req.instanceId)
-        if cached is not None and len(cached) == req.cachedHistory.eventCount:
-            return cached + list(req.pastEvents)
+    def _new_orchestration_sample(self) -> Optional[_OrchestrationSample]:
+        if self._metrics is None:
+            return None
+        return _OrchestrationSample(queue_wait_seconds=_queue_wait.get())
 
-        history_request = pb.GetInstanceHistoryRequest(instanceId=req.instanceId)
+    def _report_orchestration(
+        self, req: pb.WorkflowRequest, sample: Optional[_OrchestrationSample]
+    ) -> None:
+        if self._metrics is None or sample is None:
+            return
+        metrics = OrchestrationWorkItemMetrics(instance_id=req.instanceId, **vars(sample))
         try:
-            response = stub.GetInstanceHistory(history_request)
+            self._metrics.on_orchestration(metrics)
         except Exception as ex:
-            raise _HistoryResolutionError(
-                f"Failed to fetch the committed history for '{req.instanceId}': {ex}"
-            ) from ex
-        return list(response.events)
+            self._logger.warning(f"Metrics hook failed for '{req.instanceId}': {ex}")
+
+    def _report_activity(
+        self,
+        req: pb.ActivityRequest,
+        instance_id: str,
+        queue_wait_seconds: Optional[float],
+        execution_seconds: float,
+        res: pb.ActivityResponse,
+        complete_seconds: Optional[float],
+    ) -> None:
+        if self._metrics is None:
+            return
+        metrics = ActivityWorkItemMetrics(
+            instance_id=instance_id,
+            name=req.name,
+            task_id=req.taskId,
+            queue_wait_seconds=queue_wait_seconds,
+            execution_seconds=execution_seconds,
+            failed=res.HasField('failureDetails'),
+            complete_seconds=complete_seconds,
+        )
+        try:
+            self._metrics.on_activity(metrics)
+        except Exception as ex:
+            self._logger.warning(f"Metrics hook failed for '{req.name}#{req.taskId}': {ex}")
 
     def _update_history_cache(
-        self, instance_id: str, committed_history: list[pb.HistoryEvent], actions
+        self, instance_id: str, committed_history: Sequence[pb.HistoryEvent], actions
     ) -> None:
         """Refreshes the per-stream history cache after a turn.
 
@@ -1111,23 +1902,182 @@ class TaskHubGrpcWorker:
             return
         self._history_cache.put(instance_id, committed_history)
 
-    def _execute_orchestrator(
+    def _new_orchestration_executor(self) -> '_OrchestrationExecutor':
+        return _OrchestrationExecutor(
+            self._registry,
+            self._logger,
+            self._payloads,
+            self._codec,
+            max_actions_per_turn=self._max_actions_per_turn,
+            max_action_bytes_per_turn=self._max_action_bytes_per_turn,
+        )
+
+    def _run_orchestrator(
         self,
-        req: pb.WorkflowRequest,
-        stub: stubs.TaskHubSidecarServiceStub,
-        completionToken,
-        teardown_stream: Callable[[], None],
-    ):
-        try:
-            executor = _OrchestrationExecutor(self._registry, self._logger)
-            propagated = (
+        instance_id: str,
+        old_events: Sequence[pb.HistoryEvent],
+        new_events: Sequence[pb.HistoryEvent],
+        propagated: Optional[PropagatedHistory],
+    ) -> tuple['_OrchestrationExecutor', 'ExecutionResults']:
+        """Runs one orchestration turn, continuing the instance's live execution if possible.
+
+        A sticky hit only feeds the committed events the live generator has not seen yet;
+        a miss (first turn, eviction, redelivery, or any history mismatch) falls back to a
+        full replay on a fresh executor.
+        """
+        sticky = (
+            self._sticky_executions.take(instance_id) if self._enable_sticky_execution else None
+        )
+        if sticky is not None:
+            delta = sticky.delta(old_events)
+            if delta is not None:
+                self._logger.debug(
+                    f'{instance_id}: Continuing live execution with {len(delta)} committed event(s).'
+                )
+                result = sticky.executor.execute_delta(
+                    delta, new_events, propagated_history=propagated
+                )
+                return sticky.executor, result
+            self._logger.debug(f'{instance_id}: Live execution is stale, replaying full history.')
+
+        executor = self._new_orchestration_executor()
+        result = executor.execute(
+            instance_id, old_events, new_events, propagated_history=propagated
+        )
+        return executor, result
+
+    def _can_stay_sticky(self, executor: '_OrchestrationExecutor', actions) -> bool:
+        """Whether a turn's live execution may be kept for the next turn.
+
+        Ended executions have no next turn, and a stalled one (version not registered)
+        must be rebuilt once the version is available.
+        """
+        if not self._enable_sticky_execution:
+            return False
+        ctx = executor.context
+        if ctx is None or ctx._is_complete:
+            return False
+        if ctx._completion_status == pb.ORCHESTRATION_STATUS_STALLED:
+            return False
+        return not any(a.WhichOneof('workflowActionType') == 'completeWorkflow' for a in actions)
+
+    def _execute_orchestrator(
+        self,
+        req: pb.WorkflowRequest,
+        stub: stubs.TaskHubSidecarServiceStub,
+        completionToken,
+        teardown_stream: Callable[[], None],
+    ):
+        sample = self._new_orchestration_sample()
+        try:
+            old_events = self._resolve_history(req, stub, sample)
+            res, executor = self._build_orchestrator_response(
+                req, old_events, completionToken, sample
+            )
+        except _HistoryResolutionError as ex:
+            self._on_history_resolution_error(ex, teardown_stream)
+            return
+
+        try:
+            started = time.perf_counter()
+            stub.CompleteOrchestratorTask(res)
+            self._on_orchestrator_delivered(req, executor, old_events, sample, started)
+        except Exception as ex:
+            failure_res = self._on_orchestrator_delivery_error(req, completionToken, ex)
+            if failure_res is not None:
+                try:
+                    stub.CompleteOrchestratorTask(failure_res)
+                except Exception as failure_ex:
+                    self._log_undelivered(
+                        f"orchestrator failure response for '{req.instanceId}'", failure_ex
+                    )
+        if isinstance(old_events, _CompactHistory):
+            old_events.compact()
+        self._report_orchestration(req, sample)
+
+    def _on_orchestrator_delivered(
+        self,
+        req: pb.WorkflowRequest,
+        executor: Optional['_OrchestrationExecutor'],
+        old_events: Sequence[pb.HistoryEvent],
+        sample: Optional[_OrchestrationSample],
+        started: float,
+    ) -> None:
+        if sample is not None:
+            sample.complete_seconds = time.perf_counter() - started
+        if executor is not None:
+            self._sticky_executions.put(req.instanceId, executor, old_events, req.newEvents)
+
+    def _on_orchestrator_delivery_error(
+        self, req: pb.WorkflowRequest, completion_token, ex: Exception
+    ) -> Optional[pb.WorkflowResponse]:
+        """Handles a failed orchestrator completion on either transport.
+
+        Returns the failure response to send instead when the response was too large to
+        deliver; anything else is logged, and the sidecar re-dispatches the work item.
+        """
+        if isinstance(ex, grpc.RpcError):
+            if _is_message_too_large(ex):
+                return self._build_oversized_orchestrator_response(req, completion_token, ex)
+            self._handle_grpc_execution_error(ex, 'orchestrator')
+            return None
+        self._log_undelivered(f"orchestrator response for '{req.instanceId}'", ex)
+        return None
+
+    def _log_undelivered(self, what: str, ex: Exception) -> None:
+        """Logs a response that could not be sent for a reason other than a gRPC error."""
+        # gRPC raises ValueError when the underlying channel has been closed (e.g. during
+        # reconnection); during shutdown any failure is expected.
+        if isinstance(ex, ValueError) or self._shutdown.is_set():
+            self._logger.debug(
+                f'Could not deliver {what}: {ex}. The sidecar will re-dispatch this work item.'
+            )
+        else:
+            self._logger.exception(f'Failed to deliver {what} to sidecar: {ex}')
+
+    def _on_history_resolution_error(
+        self, ex: _HistoryResolutionError, teardown_stream: Callable[[], None]
+    ) -> None:
+        # The instance is healthy, we just cannot tell what to replay. Dropping the
+        # stream makes the sidecar cancel and re-dispatch its pending items, and the
+        # next (cold) stream sends a full history. Responding with a failure here
+        # would terminally kill the workflow over a transient fetch error.
+        self._logger.error(f'{ex}. Resetting the work-item stream to force a re-dispatch.')
+        teardown_stream()
+
+    def _build_orchestrator_response(
+        self,
+        req: pb.WorkflowRequest,
+        old_events: Sequence[pb.HistoryEvent],
+        completionToken,
+        sample: Optional[_OrchestrationSample] = None,
+    ) -> tuple[pb.WorkflowResponse, Optional['_OrchestrationExecutor']]:
+        """Runs one orchestration turn and builds the response to send to the sidecar.
+
+        Returns the response and, when the live execution may be kept for the next turn,
+        its executor. An orchestrator failure becomes a failed-completion response; a
+        payload store failure raises _HistoryResolutionError, as the turn can be retried.
+        """
+        try:
+            propagated = (
                 PropagatedHistory.from_proto(req.propagatedHistory)
                 if req.HasField('propagatedHistory')
                 else None
             )
-            old_events = self._resolve_history(req, stub)
-            result = executor.execute(
-                req.instanceId, old_events, req.newEvents, propagated_history=propagated
+            executor, result = self._run_orchestrator(
+                req.instanceId, old_events, req.newEvents, propagated
+            )
+            if sample is not None:
+                ctx = executor.context
+                sample.name = (ctx._workflow_name if ctx is not None else None) or ''
+                sample.replayed_events = result.replayed_events
+                sample.replay_seconds = result.replay_seconds
+                sample.new_events = len(req.newEvents)
+                sample.new_events_seconds = result.new_events_seconds
+                sample.actions = len(result.actions)
+            self._payloads.externalize_actions(
+                result.actions,
+                has_parent=executor.context is not None and executor.context._has_parent,
             )
             self._update_history_cache(req.instanceId, old_events, result.actions)
 
@@ -1146,14 +2096,12 @@ class TaskHubGrpcWorker:
                 completionToken=completionToken,
                 version=version,
             )
-        except _HistoryResolutionError as ex:
-            # The instance is healthy, we just cannot tell what to replay. Dropping the
-            # stream makes the sidecar cancel and re-dispatch its pending items, and the
-            # next (cold) stream sends a full history. Responding with a failure here
-            # would terminally kill the workflow over a transient fetch error.
-            self._logger.error(f'{ex}. Resetting the work-item stream to force a re-dispatch.')
-            teardown_stream()
-            return
+            sticky = executor if self._can_stay_sticky(executor, result.actions) else None
+            return res, sticky
+        except PayloadStoreError as ex:
+            raise _HistoryResolutionError(
+                f"Payload store unavailable for instance '{req.instanceId}': {ex}"
+            ) from ex
         except Exception as ex:
             self._logger.exception(
                 f"An error occurred while trying to execute instance '{req.instanceId}': {ex}"
@@ -1169,53 +2117,34 @@ class TaskHubGrpcWorker:
                 actions=actions,
                 completionToken=completionToken,
             )
-
-        try:
-            stub.CompleteOrchestratorTask(res)
-        except grpc.RpcError as rpc_error:  # type: ignore
-            if _is_message_too_large(rpc_error):
-                # Response is too large to deliver - fail the orchestration immediately.
-                # This can only be fixed with infrastructure changes (increasing gRPC max message size).
-                self._logger.error(
-                    f"Orchestrator response for '{req.instanceId}' is too large to deliver "
-                    f'(RESOURCE_EXHAUSTED). Failing the orchestration task: {rpc_error.details()}'
-                )
-                failure_actions = [
-                    ph.new_complete_workflow_action(
-                        -1,
-                        pb.ORCHESTRATION_STATUS_FAILED,
-                        '',
-                        ph.new_failure_details(
-                            RuntimeError(
-                                f'Orchestrator response exceeds gRPC max message size: {rpc_error.details()}'
-                            )
-                        ),
-                    )
-                ]
-                failure_res = pb.WorkflowResponse(
-                    instanceId=req.instanceId,
-                    actions=failure_actions,
-                    completionToken=completionToken,
-                )
-                try:
-                    stub.CompleteOrchestratorTask(failure_res)
-                except Exception as ex:
-                    self._logger.exception(
-                        f"Failed to deliver orchestrator failure response for '{req.instanceId}': {ex}"
+            return res, None
+
+    def _build_oversized_orchestrator_response(
+        self, req: pb.WorkflowRequest, completionToken, rpc_error: grpc.RpcError
+    ) -> pb.WorkflowResponse:
+        # Response is too large to deliver - fail the orchestration immediately.
+        # This can only be fixed with infrastructure changes (increasing gRPC max message size).
+        self._logger.error(
+            f"Orchestrator response for '{req.instanceId}' is too large to deliver "
+            f'(RESOURCE_EXHAUSTED). Failing the orchestration task: {rpc_error.details()}'
+        )
+        failure_actions = [
+            ph.new_complete_workflow_action(
+                -1,
+                pb.ORCHESTRATION_STATUS_FAILED,
+                '',
+                ph.new_failure_details(
+                    RuntimeError(
+                        f'Orchestrator response exceeds gRPC max message size: {rpc_error.details()}'
                     )
-            else:
-                self._handle_grpc_execution_error(rpc_error, 'orchestrator')
-        except ValueError:
-            # gRPC raises ValueError when the underlying channel has been closed (e.g. during reconnection).
-            self._logger.debug(
-                f"Could not deliver orchestrator response for '{req.instanceId}': "
-                f'channel was closed (likely due to reconnection). '
-                f'The sidecar will re-dispatch this work item.'
-            )
-        except Exception as ex:
-            self._logger.exception(
-                f"Failed to deliver orchestrator response for '{req.instanceId}' to sidecar: {ex}"
+                ),
             )
+        ]
+        return pb.WorkflowResponse(
+            instanceId=req.instanceId,
+            actions=failure_actions,
+            completionToken=completionToken,
+        )
 
     def _activity_span(self, req: pb.ActivityRequest, instance_id: str):
         """Return an OTel span context manager, or a nullcontext if OTel is not installed."""
@@ -1273,45 +2202,58 @@ class TaskHubGrpcWorker:
         res: pb.ActivityResponse,
         completion_token,
         instance_id: str,
-    ):
+    ) -> Optional[float]:
         """Send an activity response, falling back to a failure response when the
-        result is too large to deliver."""
+        result is too large to deliver.
+
+        Returns the latency of the call, or None if the response was not delivered.
+        """
         try:
+            started = time.perf_counter()
             stub.CompleteActivityTask(res)
-        except grpc.RpcError as rpc_error:  # type: ignore
-            if _is_message_too_large(rpc_error):
+            return time.perf_counter() - started
+        except Exception as ex:
+            failure_res = self._on_activity_delivery_error(req, instance_id, completion_token, ex)
+            if failure_res is not None:
+                try:
+                    stub.CompleteActivityTask(failure_res)
+                except Exception as failure_ex:
+                    self._log_undelivered(
+                        f"activity failure response for '{req.name}#{req.taskId}' of "
+                        f"orchestration ID '{instance_id}'",
+                        failure_ex,
+                    )
+        return None
+
+    def _on_activity_delivery_error(
+        self, req: pb.ActivityRequest, instance_id: str, completion_token, ex: Exception
+    ) -> Optional[pb.ActivityResponse]:
+        """Handles a failed activity completion on either transport.
+
+        Returns the failure response to send instead when the result was too large to
+        deliver; anything else is logged, and the sidecar re-dispatches the work item.
+        """
+        if isinstance(ex, grpc.RpcError):
+            if _is_message_too_large(ex):
                 # Result is too large to deliver - fail the activity immediately.
                 # This can only be fixed with infrastructure changes (increasing gRPC max message size).
                 self._logger.error(
                     f"Activity '{req.name}#{req.taskId}' result is too large to deliver "
-                    f'(RESOURCE_EXHAUSTED). Failing the activity task: {rpc_error.details()}'
+                    f'(RESOURCE_EXHAUSTED). Failing the activity task: {ex.details()}'
                 )
                 oversize_error = RuntimeError(
-                    f'Activity result exceeds gRPC max message size: {rpc_error.details()}'
+                    f'Activity result exceeds gRPC max message size: {ex.details()}'
                 )
-                failure_res = self._build_activity_failure_response(
+                return self._build_activity_failure_response(
                     req, instance_id, oversize_error, completion_token
                 )
-                try:
-                    stub.CompleteActivityTask(failure_res)
-                except Exception as ex:
-                    self._logger.exception(
-                        f"Failed to deliver activity failure response for '{req.name}#{req.taskId}' "
-                        f"of orchestration ID '{instance_id}': {ex}"
-                    )
-            else:
-                self._handle_grpc_execution_error(rpc_error, 'activity')
-        except ValueError:
-            # gRPC raises ValueError when the underlying channel has been closed (e.g. during reconnection).
-            self._logger.debug(
-                f"Could not deliver activity response for '{req.name}#{req.taskId}' of "
-                f"orchestration ID '{instance_id}': channel was closed (likely due to "
-                f'reconnection). The sidecar will re-dispatch this work item.'
-            )
-        except Exception as ex:
-            self._logger.exception(
-                f"Failed to deliver activity response for '{req.name}#{req.taskId}' of orchestration ID '{instance_id}' to sidecar: {ex}"
-            )
+            self._handle_grpc_execution_error(ex, 'activity')
+            return None
+        self._log_undelivered(
+            f"activity response for '{req.name}#{req.taskId}' of orchestration ID '{instance_id}'",
+            ex,
+        )
+        return None
 
     def _execute_activity(
         self,
@@ -1321,23 +2263,74 @@ class TaskHubGrpcWorker:
         completionToken,
     ):
         instance_id = req.workflowInstance.instanceId
+        queue_wait = _queue_wait.get()
         with self._activity_span(req, instance_id):
-            try:
-                result = self._activity_executor.execute(
-                    fn,
-                    instance_id,
-                    req.name,
-                    req.taskId,
-                    req.input.value,
-                    req.taskExecutionId,
-                    propagated_history=self._propagated_history(req),
-                )
-                res = self._build_activity_result_response(
-                    req, instance_id, result, completionToken
-                )
-            except Exception as ex:
-                res = self._build_activity_failure_response(req, instance_id, ex, completionToken)
-            self._send_activity_response(req, stub, res, completionToken, instance_id)
+            started = time.perf_counter()
+            res = self._run_activity(fn, req, instance_id, completionToken)
+            execution_seconds = time.perf_counter() - started
+            complete_seconds = self._send_activity_response(
+                req, stub, res, completionToken, instance_id
+            )
+        self._report_activity(
+            req, instance_id, queue_wait, execution_seconds, res, complete_seconds
+        )
+
+    def _run_activity(
+        self, fn: task.Activity | None, req: pb.ActivityRequest, instance_id: str, completionToken
+    ) -> pb.ActivityResponse:
+        """Runs a sync activity and builds its result or failure response."""
+        try:
+            result = self._activity_executor.execute(
+                fn,
+                instance_id,
+                req.name,
+                req.taskId,
+                self._payloads.resolve(req.input.value),
+                req.taskExecutionId,
+                propagated_history=self._propagated_history(req),
+            )
+            if req.name in self._registry.externalized_activities:
+                result = self._payloads.externalize(result)
+            return self._build_activity_result_response(req, instance_id, result, completionToken)
+        except Exception as ex:
+            return self._build_activity_failure_response(req, instance_id, ex, completionToken)
+
+    def _is_loop_activity(self, fn: task.Activity | None, name: str) -> bool:
+        """Whether an activity is driven from the event loop rather than a pool thread."""
+        if fn is None:
+            return False
+        return is_async_callable(fn) or (
+            self._activity_processes is not None and name in self._registry.process_activities
+        )
+
+    async def _run_loop_activity(
+        self, fn: task.Activity, req: pb.ActivityRequest, instance_id: str
+    ) -> str | None:
+        """Runs an async activity, or hands a process-pool one to its worker process."""
+        encoded_input = await self._payloads.resolve_async(req.input.value)
+        if not is_async_callable(fn):
+            assert self._activity_processes is not None
+            result = await self._activity_processes.execute(
+                req.name,
+                instance_id,
+                req.taskId,
+                encoded_input,
+                req.taskExecutionId,
+                self._propagated_history(req),
+            )
+        else:
+            result = await self._activity_executor.execute_async(
+                fn,
+                instance_id,
+                req.name,
+                req.taskId,
+                encoded_input,
+                req.taskExecutionId,
+                propagated_history=self._propagated_history(req),
+            )
+        if req.name in self._registry.externalized_activities:
+            result = await self._payloads.externalize_async(result)
+        return result
 
     async def _execute_activity_async(
         self,
@@ -1346,21 +2339,16 @@ class TaskHubGrpcWorker:
         stub: stubs.TaskHubSidecarServiceStub,
         completionToken,
     ):
-        """Run an async activity on the event loop and send its result to the sidecar.
-        The gRPC send runs on the worker thread pool to avoid blocking the loop.
+        """Run an async or process-pool activity from the event loop and send its result to
+        the sidecar. The gRPC send runs on the worker thread pool to avoid blocking the loop.
         """
         instance_id = req.workflowInstance.instanceId
+        queue_wait = _queue_wait.get()
+        complete_seconds = None
         with self._activity_span(req, instance_id):
+            started = time.perf_counter()
             try:
-                result = await self._activity_executor.execute_async(
-                    fn,
-                    instance_id,
-                    req.name,
-                    req.taskId,
-                    req.input.value,
-                    req.taskExecutionId,
-                    propagated_history=self._propagated_history(req),
-                )
+                result = await self._run_loop_activity(fn, req, instance_id)
                 res = self._build_activity_result_response(
                     req, instance_id, result, completionToken
                 )
@@ -1368,9 +2356,10 @@ class TaskHubGrpcWorker:
                 raise
             except Exception as ex:
                 res = self._build_activity_failure_response(req, instance_id, ex, completionToken)
+            execution_seconds = time.perf_counter() - started
             loop = asyncio.get_running_loop()
             try:
-                await loop.run_in_executor(
+                complete_seconds = await loop.run_in_executor(
                     self._async_worker_manager.thread_pool,
                     self._send_activity_response,
                     req,
@@ -1390,6 +2379,138 @@ class TaskHubGrpcWorker:
                     f"Could not deliver activity response for '{req.name}#{req.taskId}': "
                     f'{exc}. The sidecar will re-dispatch this work item.'
                 )
+        self._report_activity(
+            req, instance_id, queue_wait, execution_seconds, res, complete_seconds
+        )
+
+    # --- grpc.aio work-item path ------------------------------------------------------
+
+    async def _execute_orchestrator_aio(
+        self,
+        req: pb.WorkflowRequest,
+        stub: stubs.TaskHubSidecarServiceStub,
+        completionToken,
+        teardown_stream: Callable[[], None],
+    ):
+        """:meth:`_execute_orchestrator` for a ``grpc.aio`` stub.
+
+        The history fetch and the completion are awaited on the loop; only the turn itself
+        runs on the worker thread pool, so a long replay never blocks the loop.
+        """
+        sample = self._new_orchestration_sample()
+        try:
+            old_events = await self._resolve_history_aio(req, stub, sample)
+            loop = asyncio.get_running_loop()
+            res, executor = await loop.run_in_executor(
+                self._async_worker_manager.thread_pool,
+                self._build_orchestrator_response,
+                req,
+                old_events,
+                completionToken,
+                sample,
+            )
+        except _HistoryResolutionError as ex:
+            self._on_history_resolution_error(ex, teardown_stream)
+            return
+
+        try:
+            started = time.perf_counter()
+            await stub.CompleteOrchestratorTask(res)
+            self._on_orchestrator_delivered(req, executor, old_events, sample, started)
+        except Exception as ex:
+            failure_res = self._on_orchestrator_delivery_error(req, completionToken, ex)
+            if failure_res is not None:
+                try:
+                    await stub.CompleteOrchestratorTask(failure_res)
+                except Exception as failure_ex:
+                    self._log_undelivered(
+                        f"orchestrator failure response for '{req.instanceId}'", failure_ex
+                    )
+        if isinstance(old_events, _CompactHistory):
+            await loop.run_in_executor(self._async_worker_manager.thread_pool, old_events.compact)
+        self._report_orchestration(req, sample)
+
+    async def _execute_activity_aio(
+        self,
+        fn: task.Activity | None,
+        req: pb.ActivityRequest,
+        stub: stubs.TaskHubSidecarServiceStub,
+        completionToken,
+    ):
+        """Runs an activity and awaits its completion on a ``grpc.aio`` stub.
+
+        Async activities run on the loop with no thread hop at all (process-pool ones are
+        awaited from it); sync ones run on the worker thread pool and only their result
+        comes back to the loop.
+        """
+        instance_id = req.workflowInstance.instanceId
+        queue_wait = _queue_wait.get()
+        if self._is_loop_activity(fn, req.name):
+            with self._activity_span(req, instance_id):
+                started = time.perf_counter()
+                try:
+                    result = await self._run_loop_activity(fn, req, instance_id)
+                    res = self._build_activity_result_response(
+                        req, instance_id, result, completionToken
+                    )
+                except asyncio.CancelledError:
+                    raise
+                except Exception as ex:
+                    res = self._build_activity_failure_response(
+                        req, instance_id, ex, completionToken
+                    )
+                execution_seconds = time.perf_counter() - started
+        else:
+            loop = asyncio.get_running_loop()
+            res, execution_seconds = await loop.run_in_executor(
+                self._async_worker_manager.thread_pool,
+                self._run_activity_in_span,
+                fn,
+                req,
+                instance_id,
+                completionToken,
+            )
+        complete_seconds = await self._send_activity_response_aio(
+            req, stub, res, completionToken, instance_id
+        )
+        self._report_activity(
+            req, instance_id, queue_wait, execution_seconds, res, complete_seconds
+        )
+
+    def _run_activity_in_span(
+        self, fn: task.Activity | None, req: pb.ActivityRequest, instance_id: str, completionToken
+    ) -> tuple[pb.ActivityResponse, float]:
+        """Runs a sync activity in its span; returns its response and execution time."""
+        with self._activity_span(req, instance_id):
+            started = time.perf_counter()
+            res = self._run_activity(fn, req, instance_id, completionToken)
+            return res, time.perf_counter() - started
+
+    async def _send_activity_response_aio(
+        self,
+        req: pb.ActivityRequest,
+        stub: stubs.TaskHubSidecarServiceStub,
+        res: pb.ActivityResponse,
+        completion_token,
+        instance_id: str,
+    ) -> Optional[float]:
+        """:meth:`_send_activity_response` for a ``grpc.aio`` stub."""
+        try:
+            started = time.perf_counter()
+            await stub.CompleteActivityTask(res)
+            return time.perf_counter() - started
+        except Exception as ex:
+            failure_res = self._on_activity_delivery_error(req, instance_id, completion_token, ex)
+            if failure_res is not None:
+                try:
+                    await stub.CompleteActivityTask(failure_res)
+                except Exception as failure_ex:
+                    self._log_undelivered(
+                        f"activity failure response for '{req.name}#{req.taskId}' of "
+                        f"orchestration ID '{instance_id}'",
+                        failure_ex,
+                    )
+        return None
 
 
 class _RuntimeOrchestrationContext(
@@ -1398,8 +2519,9 @@ class _RuntimeOrchestrationContext(
     _generator: Optional[Generator[task.Task, Any, Any]]
     _previous_task: Optional[task.Task]
 
-    def __init__(self, instance_id: str):
+    def __init__(self, instance_id: str, codec: PayloadCodec = DEFAULT_CODEC):
         super().__init__()
+        self._codec = codec
         self._generator = None
         self._is_replaying = True
         self._is_complete = False
@@ -1411,8 +2533,8 @@ class _RuntimeOrchestrationContext(
         self._instance_id = instance_id
         self._app_id = None
         self._completion_status: Optional[pb.OrchestrationStatus] = None
-        self._received_events: dict[str, list[Any]] = {}
-        self._pending_events: dict[str, list[task.CompletableTask]] = {}
+        self._received_events: dict[str, deque[Any]] = {}
+        self._pending_events: dict[str, deque[task.CompletableTask]] = {}
         self._new_input: Optional[Any] = None
         self._save_events = False
         self._encoded_custom_status: Optional[str] = None
@@ -1422,6 +2544,8 @@ class _RuntimeOrchestrationContext(
         self._applied_patches: dict[str, bool] = {}
         self._encountered_patches: list[str] = []
         self._propagated_history: Optional[PropagatedHistory] = None
+        self._workflow_name: Optional[str] = None
+        self._has_parent = False
 
     def set_propagated_history(self, history: Optional[PropagatedHistory]) -> None:
         self._propagated_history = history
@@ -1483,7 +2607,9 @@ class _RuntimeOrchestrationContext(
         self._result = result
         result_json: Optional[str] = None
         if result is not None:
-            result_json = result if is_result_encoded else shared.to_json(result)
+            # A parent may run in another app or SDK, so child results use plain JSON.
+            codec = DEFAULT_CODEC if self._has_parent else self._codec
+            result_json = result if is_result_encoded else codec.encode(result)
         action = ph.new_complete_workflow_action(
             self.next_sequence_number(),
             status,
@@ -1535,14 +2661,16 @@ class _RuntimeOrchestrationContext(
                 # replayed when the new instance starts.
                 for event_name, values in self._received_events.items():
                     for event_value in values:
-                        encoded_value = shared.to_json(event_value) if event_value else None
+                        encoded_value = self._codec.encode(event_value) if event_value else None
                         carryover_events.append(
                             ph.new_event_raised_event(event_name, encoded_value)
                         )
             action = ph.new_complete_workflow_action(
                 self.next_sequence_number(),
                 pb.ORCHESTRATION_STATUS_CONTINUED_AS_NEW,
-                result=shared.to_json(self._new_input) if self._new_input is not None else None,
+                result=(
+                    self._codec.encode(self._new_input) if self._new_input is not None else None
+                ),
                 failure_details=None,
                 carryover_events=carryover_events,
                 router=pb.TaskRouter(sourceAppID=self._app_id) if self._app_id else None,
@@ -1575,16 +2703,15 @@ class _RuntimeOrchestrationContext(
         del self._pending_actions[action_id]
         self._pending_tasks.pop(action_id, None)
 
-        # Shift every id > action_id down by one.
-        higher_action_ids = sorted(k for k in self._pending_actions if k > action_id)
-        for old_id in higher_action_ids:
-            a = self._pending_actions.pop(old_id)
-            a.id = old_id - 1
-            self._pending_actions[old_id - 1] = a
-        higher_task_ids = sorted(k for k in self._pending_tasks if k > action_id)
-        for old_id in higher_task_ids:
-            t = self._pending_tasks.pop(old_id)
-            self._pending_tasks[old_id - 1] = t
+        # Shift every id > action_id down by one, rebuilding each map in a single pass
+        # that keeps scheduling order, rather than re-keying ids one at a time.
+        for a in self._pending_actions.values():
+            if a.id > action_id:
+                a.id -= 1
+        self._pending_actions = {a.id: a for a in self._pending_actions.values()}
+        self._pending_tasks = {
+            (k - 1 if k > action_id else k): t for k, t in self._pending_tasks.items()
+        }
 
         self._sequence_number -= 1
         return True
@@ -1726,7 +2853,9 @@ class _RuntimeOrchestrationContext(
             router.targetAppID = app_id
 
         if fn_task is None:
-            encoded_input = shared.to_json(input) if input is not None else None
+            # Apps other than this one may not share its codec.
+            codec = self._codec if app_id is None or app_id == self._app_id else DEFAULT_CODEC
+            encoded_input = codec.encode(input) if input is not None else None
         else:
             # When retrying, input is already encoded as a string (or None).
             encoded_input = str(input) if input is not None else None
@@ -1793,14 +2922,14 @@ class _RuntimeOrchestrationContext(
         event_name = name.casefold()
         event_list = self._received_events.get(event_name, None)
         if event_list:
-            event_data = event_list.pop(0)
+            event_data = event_list.popleft()
             if not event_list:
                 del self._received_events[event_name]
             external_event_task.complete(event_data)
         else:
             task_list = self._pending_events.get(event_name, None)
             if not task_list:
-                task_list = []
+                task_list = deque()
                 self._pending_events[event_name] = task_list
             task_list.append(external_event_task)
 
@@ -1894,6 +3023,9 @@ class ExecutionResults:
     encoded_custom_status: Optional[str]
     version_name: Optional[str]
     patches: Optional[list[str]]
+    replayed_events: int
+    replay_seconds: float
+    new_events_seconds: float
 
     def __init__(
         self,
@@ -1901,21 +3033,46 @@ class ExecutionResults:
         encoded_custom_status: Optional[str],
         version_name: Optional[str] = None,
         patches: Optional[list[str]] = None,
+        replayed_events: int = 0,
+        replay_seconds: float = 0.0,
+        new_events_seconds: float = 0.0,
     ):
         self.actions = actions
         self.encoded_custom_status = encoded_custom_status
         self.version_name = version_name
         self.patches = patches
+        self.replayed_events = replayed_events
+        self.replay_seconds = replay_seconds
+        self.new_events_seconds = new_events_seconds
 
 
 class _OrchestrationExecutor:
     _generator: Optional[task.Orchestrator] = None
 
-    def __init__(self, registry: _Registry, logger: logging.Logger):
+    def __init__(
+        self,
+        registry: _Registry,
+        logger: logging.Logger,
+        payloads: Optional[_PayloadClaimCheck] = None,
+        codec: PayloadCodec = DEFAULT_CODEC,
+        *,
+        max_actions_per_turn: Optional[int] = None,
+        max_action_bytes_per_turn: Optional[int] = None,
+    ):
         self._registry = registry
         self._logger = logger
+        self._payloads = payloads if payloads is not None else _PayloadClaimCheck(None)
+        self._codec = codec
+        self._max_actions_per_turn = max_actions_per_turn
+        self._max_action_bytes_per_turn = max_action_bytes_per_turn
         self._is_suspended = False
         self._suspended_events: list[pb.HistoryEvent] = []
+        self._context: Optional[_RuntimeOrchestrationContext] = None
+
+    @property
+    def context(self) -> Optional[_RuntimeOrchestrationContext]:
+        """The context of the last turn run by this executor, if any."""
+        return self._context
 
     def execute(
         self,
@@ -1929,8 +3086,39 @@ class _OrchestrationExecutor:
                 'The new history event list must have at least one event in it.'
             )
 
-        ctx = _RuntimeOrchestrationContext(instance_id)
+        self._context = _RuntimeOrchestrationContext(instance_id, self._codec)
+        return self._execute_turn(self._context, old_events, new_events, propagated_history)
+
+    def execute_delta(
+        self,
+        old_events: Sequence[pb.HistoryEvent],
+        new_events: Sequence[pb.HistoryEvent],
+        propagated_history: Optional[PropagatedHistory] = None,
+    ) -> ExecutionResults:
+        """Runs the next turn on the live context of a previous :meth:`execute`.
+
+        ``old_events`` are only the committed events appended since that turn; the
+        orchestrator generator already reflects everything before them.
+        """
+        if self._context is None:
+            raise task.WorkflowStateError('There is no live execution to continue.')
+        if not new_events:
+            raise task.WorkflowStateError(
+                'The new history event list must have at least one event in it.'
+            )
+        return self._execute_turn(self._context, old_events, new_events, propagated_history)
+
+    def _execute_turn(
+        self,
+        ctx: _RuntimeOrchestrationContext,
+        old_events: Sequence[pb.HistoryEvent],
+        new_events: Sequence[pb.HistoryEvent],
+        propagated_history: Optional[PropagatedHistory],
+    ) -> ExecutionResults:
+        instance_id = ctx.instance_id
         ctx.set_propagated_history(propagated_history)
+        started = time.perf_counter()
+        replay_seconds: Optional[float] = None
         try:
             # Rebuild local state by replaying old history into the orchestrator function
             self._logger.debug(
@@ -1939,6 +3127,7 @@ class _OrchestrationExecutor:
             ctx._is_replaying = True
             for old_event in old_events:
                 self.process_event(ctx, old_event)
+            replay_seconds = time.perf_counter() - started
 
             # Get new actions by executing newly received events into the orchestrator function
             if self._logger.level <= logging.DEBUG:
@@ -1952,9 +3141,15 @@ class _OrchestrationExecutor:
 
         except VersionNotRegisteredException:
             ctx.set_version_not_registered()
+        except PayloadStoreError:
+            # The workflow is healthy; the turn is retried once the store is reachable.
+            raise
         except Exception as ex:
             # Unhandled exceptions fail the orchestration
             ctx.set_failed(ex)
+        turn_seconds = time.perf_counter() - started
+        if replay_seconds is None:
+            replay_seconds = turn_seconds
 
         if not ctx._is_complete:
             task_count = len(ctx._pending_tasks)
@@ -1971,7 +3166,7 @@ class _OrchestrationExecutor:
                 f'{instance_id}: Orchestration completed with status: {completion_status_str}'
             )
 
-        actions = ctx.get_actions()
+        actions = self._batch_actions(instance_id, ctx.get_actions())
         if self._logger.level <= logging.DEBUG:
             self._logger.debug(
                 f'{instance_id}: Returning {len(actions)} action(s): {_get_action_summary(actions)}'
@@ -1981,364 +3176,461 @@ class _OrchestrationExecutor:
             encoded_custom_status=ctx._encoded_custom_status,
             version_name=getattr(ctx, '_version_name', None),
             patches=ctx._encountered_patches,
+            replayed_events=len(old_events),
+            replay_seconds=replay_seconds,
+            new_events_seconds=turn_seconds - replay_seconds,
         )
 
+    def _batch_actions(
+        self, instance_id: str, actions: list[pb.WorkflowAction]
+    ) -> list[pb.WorkflowAction]:
+        """Holds back activities and child workflows beyond the per-turn limits.
+
+        Held-back actions stay pending in the context and keep their sequence ids, so
+        they go out, in scheduling order, in the turns that follow the completions of
+        the ones sent now, and replay matches them whichever turn they went out in.
+        Other actions are always sent, and so is at least one deferrable action, so a
+        batched turn is always followed by another.
+        """
+        max_count = self._max_actions_per_turn
+        max_bytes = self._max_action_bytes_per_turn
+        if (max_count is None and max_bytes is None) or len(actions) < 2:
+            return actions
+        batch: list[pb.WorkflowAction] = []
+        count = size = deferred = 0
+        for action in actions:
+            if action.WhichOneof('workflowActionType') not in _DEFERRABLE_ACTION_TYPES:
+                batch.append(action)
+                if max_bytes is not None:
+                    size += action.ByteSize()
+            elif deferred or (max_count is not None and count >= max_count):
+                deferred += 1
+            else:
+                action_size = action.ByteSize() if max_bytes is not None else 0
+                if count and max_bytes is not None and size + action_size > max_bytes:
+                    deferred += 1
+                    continue
+                batch.append(action)
+                count += 1
+                size += action_size
+        if deferred:
+            self._logger.info(
+                f'{instance_id}: Scheduling {count} task(s) this turn, holding back {deferred}.'
+            )
+        return batch
+
     def process_event(self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent) -> None:
-        if self._is_suspended and _is_suspendable(event):
+        event_type = event.WhichOneof('eventType')
+        if self._is_suspended and event_type not in _UNSUSPENDABLE_EVENT_TYPES:
             # We are suspended, so we need to buffer this event until we are resumed
             self._suspended_events.append(event)
             return
 
-        # CONSIDER: change to a switch statement with event.WhichOneof("eventType")
+        handler = self._EVENT_HANDLERS.get(event_type)
+        if handler is None:
+            raise _get_unhandled_event_error(event_type)
         try:
-            if event.HasField('workflowStarted'):
-                ctx.current_utc_datetime = event.timestamp.ToDatetime()
-                if event.workflowStarted.version:
-                    if event.workflowStarted.version.name:
-                        ctx._orchestrator_version_name = event.workflowStarted.version.name
-                    for patch in event.workflowStarted.version.patches:
-                        ctx._history_patches[patch] = True
-            elif event.HasField('executionStarted'):
-                if event.router.targetAppID:
-                    ctx._app_id = event.router.targetAppID
-                else:
-                    ctx._app_id = event.router.sourceAppID
+            handler(self, ctx, event)
+        except StopIteration as generatorStopped:
+            # The orchestrator generator function completed
+            ctx.set_complete(generatorStopped.value, pb.ORCHESTRATION_STATUS_COMPLETED)
 
-                version_name = None
-                if ctx._orchestrator_version_name:
-                    version_name = ctx._orchestrator_version_name
+    def _decode(self, encoded: str) -> Any:
+        """Decodes a payload from history, fetching it first if it was externalized."""
+        return self._codec.decode(self._payloads.resolve(encoded))
 
-                # TODO: Check if we already started the orchestration
-                fn, version_used = self._registry.get_orchestrator(
-                    event.executionStarted.name, version_name=version_name
-                )
+    def _on_workflow_started(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        ctx.current_utc_datetime = event.timestamp.ToDatetime()
+        if event.workflowStarted.version:
+            if event.workflowStarted.version.name:
+                ctx._orchestrator_version_name = event.workflowStarted.version.name
+            for patch in event.workflowStarted.version.patches:
+                ctx._history_patches[patch] = True
+
+    def _on_execution_started(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        if event.router.targetAppID:
+            ctx._app_id = event.router.targetAppID
+        else:
+            ctx._app_id = event.router.sourceAppID
+        ctx._workflow_name = event.executionStarted.name
+        ctx._has_parent = event.executionStarted.HasField('parentInstance')
 
-                if fn is None:
-                    raise OrchestratorNotRegisteredError(
-                        f"A '{event.executionStarted.name}' orchestrator was not registered."
-                    )
+        version_name = None
+        if ctx._orchestrator_version_name:
+            version_name = ctx._orchestrator_version_name
 
-                if version_used is not None:
-                    ctx._version_name = version_used
+        # TODO: Check if we already started the orchestration
+        fn, version_used = self._registry.get_orchestrator(
+            event.executionStarted.name, version_name=version_name
+        )
 
-                # deserialize the input, if any
-                input = None
-                if (
-                    event.executionStarted.input is not None
-                    and event.executionStarted.input.value != ''
-                ):
-                    input = shared.from_json(event.executionStarted.input.value)
+        if fn is None:
+            raise OrchestratorNotRegisteredError(
+                f"A '{event.executionStarted.name}' orchestrator was not registered."
+            )
 
-                result = fn(ctx, input)  # this does not execute the generator, only creates it
-                if isinstance(result, GeneratorType):
-                    # Start the orchestrator's generator function
-                    ctx.run(result)
-                else:
-                    # This is an orchestrator that doesn't schedule any tasks
-                    ctx.set_complete(result, pb.ORCHESTRATION_STATUS_COMPLETED)
-            elif event.HasField('timerCreated'):
-                # This history event confirms that the timer was successfully scheduled.
-                # Remove the timerCreated event from the pending action list so we don't schedule it again.
-                timer_id = event.eventId
-                # Asymmetric case: pending is an optional timer but the incoming
-                # TimerCreated is a different (non-optional) timer — e.g., a user
-                # CreateTimer emitted by pre-patch code right after an indefinite
-                # wait_for_external_event. Drop the optional and shift so the
-                # real timer matches at the same id.
-                pending = ctx._pending_actions.get(timer_id)
-                if (
-                    pending is not None
-                    and ph.is_optional_timer_action(pending)
-                    and not ph.is_optional_timer_event(event)
-                ):
-                    ctx._drop_optional_pending_at(timer_id)
-                    pending = ctx._pending_actions.get(timer_id)
-                # Reverse asymmetric: the incoming TimerCreated is an optional timer
-                # from an older code version, but the current code has a different
-                # action at this id (or none at all). This happens when a patch adds
-                # new actions before the wait_for_external_event that originally
-                # produced the timer. Silently drop the stale optional event; the
-                # pending action stays in place to match its own future event.
-                if ph.is_optional_timer_event(event) and (
-                    pending is None or not ph.is_optional_timer_action(pending)
-                ):
-                    return
-                action = ctx._pending_actions.pop(timer_id, None)
-                if not action:
-                    raise _get_non_determinism_error(timer_id, task.get_name(ctx.create_timer))
-                elif not action.HasField('createTimer'):
-                    expected_method_name = task.get_name(ctx.create_timer)
-                    raise _get_wrong_action_type_error(timer_id, expected_method_name, action)
-            elif event.HasField('timerFired'):
-                timer_id = event.timerFired.timerId
-                timer_task = ctx._pending_tasks.pop(timer_id, None)
-                if not timer_task:
-                    # TODO: Should this be an error? When would it ever happen?
-                    if not ctx._is_replaying:
-                        self._logger.warning(
-                            f'{ctx.instance_id}: Ignoring unexpected timerFired event with ID = {timer_id}.'
-                        )
-                    return
-                timer_task.complete(None)
-                if timer_task._retryable_parent is not None:
-                    retryable = timer_task._retryable_parent
-
-                    ctx.call_activity_function_helper(
-                        id=None,  # Get a new sequence number
-                        activity_function=retryable._task_name,
-                        input=retryable._encoded_input,
-                        retry_policy=retryable._retry_policy,
-                        is_sub_orch=retryable._is_sub_orch,
-                        instance_id=retryable._instance_id,
-                        fn_task=retryable,
-                        app_id=retryable._app_id,
-                        task_execution_id=retryable._task_execution_id,
-                        propagation=retryable._propagation,
-                    )
-                else:
-                    ctx.resume()
-            elif event.HasField('taskScheduled'):
-                # This history event confirms that the activity execution was successfully scheduled.
-                # Remove the taskScheduled event from the pending action list so we don't schedule it again.
-                task_id = event.eventId
-                # If the pending action at this id is an optional timer from an
-                # indefinite wait_for_external_event that wasn't present in the
-                # pre-patch history, drop it and shift so this schedule matches.
-                if task_id in ctx._pending_actions and ph.is_optional_timer_action(
-                    ctx._pending_actions[task_id]
-                ):
-                    ctx._drop_optional_pending_at(task_id)
-                action = ctx._pending_actions.pop(task_id, None)
-                activity_task = ctx._pending_tasks.get(task_id, None)
-                if not action:
-                    raise _get_non_determinism_error(task_id, task.get_name(ctx.call_activity))
-                elif not action.HasField('scheduleTask'):
-                    expected_method_name = task.get_name(ctx.call_activity)
-                    raise _get_wrong_action_type_error(task_id, expected_method_name, action)
-                elif action.scheduleTask.name != event.taskScheduled.name:
-                    raise _get_wrong_action_name_error(
-                        task_id,
-                        method_name=task.get_name(ctx.call_activity),
-                        expected_task_name=event.taskScheduled.name,
-                        actual_task_name=action.scheduleTask.name,
-                    )
-            elif event.HasField('taskCompleted'):
-                # This history event contains the result of a completed activity task.
-                task_id = event.taskCompleted.taskScheduledId
-                activity_task = ctx._pending_tasks.pop(task_id, None)
-                if not activity_task:
-                    # TODO: Should this be an error? When would it ever happen?
-                    if not ctx.is_replaying:
-                        self._logger.warning(
-                            f'{ctx.instance_id}: Ignoring unexpected taskCompleted event with ID = {task_id}.'
-                        )
-                    return
-                result = None
-                if not ph.is_empty(event.taskCompleted.result):
-                    result = shared.from_json(event.taskCompleted.result.value)
-                activity_task.complete(result)
-                ctx.resume()
-            elif event.HasField('taskFailed'):
-                task_id = event.taskFailed.taskScheduledId
-                activity_task = ctx._pending_tasks.pop(task_id, None)
-                if not activity_task:
-                    # TODO: Should this be an error? When would it ever happen?
-                    if not ctx.is_replaying:
-                        self._logger.warning(
-                            f'{ctx.instance_id}: Ignoring unexpected taskFailed event with ID = {task_id}.'
-                        )
-                    return
+        if version_used is not None:
+            ctx._version_name = version_used
 
-                if isinstance(activity_task, task.RetryableTask):
-                    if activity_task._retry_policy is not None:
-                        # Check for non-retryable errors by type name
-                        if task.is_error_non_retryable(
-                            event.taskFailed.failureDetails.errorType, activity_task._retry_policy
-                        ):
-                            activity_task.fail(
-                                f'{ctx.instance_id}: Activity task #{task_id} failed: {event.taskFailed.failureDetails.errorMessage}',
-                                event.taskFailed.failureDetails,
-                            )
-                            ctx.resume()
-                        else:
-                            next_delay = activity_task.compute_next_delay()
-                            if next_delay is None:
-                                activity_task.fail(
-                                    f'{ctx.instance_id}: Activity task #{task_id} failed: {event.taskFailed.failureDetails.errorMessage}',
-                                    event.taskFailed.failureDetails,
-                                )
-                                ctx.resume()
-                            else:
-                                activity_task.increment_attempt_count()
-                                ctx.create_timer_internal(
-                                    next_delay,
-                                    activity_task,
-                                    origin=pb.TimerOriginActivityRetry(
-                                        taskExecutionId=activity_task._task_execution_id,
-                                    ),
-                                )
-                elif isinstance(activity_task, task.CompletableTask):
+        # deserialize the input, if any
+        input = None
+        if event.executionStarted.input is not None and event.executionStarted.input.value != '':
+            input = self._decode(event.executionStarted.input.value)
+
+        result = fn(ctx, input)  # this does not execute the generator, only creates it
+        if isinstance(result, GeneratorType):
+            # Start the orchestrator's generator function
+            ctx.run(result)
+        else:
+            # This is an orchestrator that doesn't schedule any tasks
+            ctx.set_complete(result, pb.ORCHESTRATION_STATUS_COMPLETED)
+
+    def _on_timer_created(self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent) -> None:
+        # This history event confirms that the timer was successfully scheduled.
+        # Remove the timerCreated event from the pending action list so we don't schedule it again.
+        timer_id = event.eventId
+        # Asymmetric case: pending is an optional timer but the incoming
+        # TimerCreated is a different (non-optional) timer — e.g., a user
+        # CreateTimer emitted by pre-patch code right after an indefinite
+        # wait_for_external_event. Drop the optional and shift so the
+        # real timer matches at the same id.
+        pending = ctx._pending_actions.get(timer_id)
+        if (
+            pending is not None
+            and ph.is_optional_timer_action(pending)
+            and not ph.is_optional_timer_event(event)
+        ):
+            ctx._drop_optional_pending_at(timer_id)
+            pending = ctx._pending_actions.get(timer_id)
+        # Reverse asymmetric: the incoming TimerCreated is an optional timer
+        # from an older code version, but the current code has a different
+        # action at this id (or none at all). This happens when a patch adds
+        # new actions before the wait_for_external_event that originally
+        # produced the timer. Silently drop the stale optional event; the
+        # pending action stays in place to match its own future event.
+        if ph.is_optional_timer_event(event) and (
+            pending is None or not ph.is_optional_timer_action(pending)
+        ):
+            return
+        action = ctx._pending_actions.pop(timer_id, None)
+        if not action:
+            raise _get_non_determinism_error(timer_id, task.get_name(ctx.create_timer))
+        elif not action.HasField('createTimer'):
+            expected_method_name = task.get_name(ctx.create_timer)
+            raise _get_wrong_action_type_error(timer_id, expected_method_name, action)
+
+    def _on_timer_fired(self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent) -> None:
+        timer_id = event.timerFired.timerId
+        timer_task = ctx._pending_tasks.pop(timer_id, None)
+        if not timer_task:
+            # TODO: Should this be an error? When would it ever happen?
+            if not ctx._is_replaying:
+                self._logger.warning(
+                    f'{ctx.instance_id}: Ignoring unexpected timerFired event with ID = {timer_id}.'
+                )
+            return
+        timer_task.complete(None)
+        if timer_task._retryable_parent is not None:
+            retryable = timer_task._retryable_parent
+
+            ctx.call_activity_function_helper(
+                id=None,  # Get a new sequence number
+                activity_function=retryable._task_name,
+                input=retryable._encoded_input,
+                retry_policy=retryable._retry_policy,
+                is_sub_orch=retryable._is_sub_orch,
+                instance_id=retryable._instance_id,
+                fn_task=retryable,
+                app_id=retryable._app_id,
+                task_execution_id=retryable._task_execution_id,
+                propagation=retryable._propagation,
+            )
+        else:
+            ctx.resume()
+
+    def _on_task_scheduled(self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent) -> None:
+        # This history event confirms that the activity execution was successfully scheduled.
+        # Remove the taskScheduled event from the pending action list so we don't schedule it again.
+        task_id = event.eventId
+        # If the pending action at this id is an optional timer from an
+        # indefinite wait_for_external_event that wasn't present in the
+        # pre-patch history, drop it and shift so this schedule matches.
+        if task_id in ctx._pending_actions and ph.is_optional_timer_action(
+            ctx._pending_actions[task_id]
+        ):
+            ctx._drop_optional_pending_at(task_id)
+        action = ctx._pending_actions.pop(task_id, None)
+        if not action:
+            raise _get_non_determinism_error(task_id, task.get_name(ctx.call_activity))
+        elif not action.HasField('scheduleTask'):
+            expected_method_name = task.get_name(ctx.call_activity)
+            raise _get_wrong_action_type_error(task_id, expected_method_name, action)
+        elif action.scheduleTask.name != event.taskScheduled.name:
+            raise _get_wrong_action_name_error(
+                task_id,
+                method_name=task.get_name(ctx.call_activity),
+                expected_task_name=event.taskScheduled.name,
+                actual_task_name=action.scheduleTask.name,
+            )
+
+    def _on_task_completed(self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent) -> None:
+        # This history event contains the result of a completed activity task.
+        task_id = event.taskCompleted.taskScheduledId
+        activity_task = ctx._pending_tasks.pop(task_id, None)
+        if not activity_task:
+            # TODO: Should this be an error? When would it ever happen?
+            if not ctx.is_replaying:
+                self._logger.warning(
+                    f'{ctx.instance_id}: Ignoring unexpected taskCompleted event with ID = {task_id}.'
+                )
+            return
+        result = None
+        if not ph.is_empty(event.taskCompleted.result):
+            result = self._decode(event.taskCompleted.result.value)
+        activity_task.complete(result)
+        ctx.resume()
+
+    def _on_task_failed(self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent) -> None:
+        task_id = event.taskFailed.taskScheduledId
+        activity_task = ctx._pending_tasks.pop(task_id, None)
+        if not activity_task:
+            # TODO: Should this be an error? When would it ever happen?
+            if not ctx.is_replaying:
+                self._logger.warning(
+                    f'{ctx.instance_id}: Ignoring unexpected taskFailed event with ID = {task_id}.'
+                )
+            return
+
+        if isinstance(activity_task, task.RetryableTask):
+            if activity_task._retry_policy is not None:
+                # Check for non-retryable errors by type name
+                if task.is_error_non_retryable(
+                    event.taskFailed.failureDetails.errorType, activity_task._retry_policy
+                ):
                     activity_task.fail(
                         f'{ctx.instance_id}: Activity task #{task_id} failed: {event.taskFailed.failureDetails.errorMessage}',
                         event.taskFailed.failureDetails,
                     )
                     ctx.resume()
                 else:
-                    raise TypeError('Unexpected task type')
-            elif event.HasField('childWorkflowInstanceCreated'):
-                # This history event confirms that the sub-orchestration execution was successfully scheduled.
-                # Remove the childWorkflowInstanceCreated event from the pending action list so we don't schedule it again.
-                task_id = event.eventId
-                # If the pending action at this id is an optional timer, drop+shift.
-                if task_id in ctx._pending_actions and ph.is_optional_timer_action(
-                    ctx._pending_actions[task_id]
-                ):
-                    ctx._drop_optional_pending_at(task_id)
-                action = ctx._pending_actions.pop(task_id, None)
-                if not action:
-                    raise _get_non_determinism_error(
-                        task_id, task.get_name(ctx.call_sub_orchestrator)
-                    )
-                elif not action.HasField('createChildWorkflow'):
-                    expected_method_name = task.get_name(ctx.call_sub_orchestrator)
-                    raise _get_wrong_action_type_error(task_id, expected_method_name, action)
-                elif action.createChildWorkflow.name != event.childWorkflowInstanceCreated.name:
-                    raise _get_wrong_action_name_error(
-                        task_id,
-                        method_name=task.get_name(ctx.call_sub_orchestrator),
-                        expected_task_name=event.childWorkflowInstanceCreated.name,
-                        actual_task_name=action.createChildWorkflow.name,
-                    )
-            elif event.HasField('childWorkflowInstanceCompleted'):
-                task_id = event.childWorkflowInstanceCompleted.taskScheduledId
-                sub_orch_task = ctx._pending_tasks.pop(task_id, None)
-                if not sub_orch_task:
-                    # TODO: Should this be an error? When would it ever happen?
-                    if not ctx.is_replaying:
-                        self._logger.warning(
-                            f'{ctx.instance_id}: Ignoring unexpected childWorkflowInstanceCompleted event with ID = {task_id}.'
+                    next_delay = activity_task.compute_next_delay()
+                    if next_delay is None:
+                        activity_task.fail(
+                            f'{ctx.instance_id}: Activity task #{task_id} failed: {event.taskFailed.failureDetails.errorMessage}',
+                            event.taskFailed.failureDetails,
                         )
-                    return
-                result = None
-                if not ph.is_empty(event.childWorkflowInstanceCompleted.result):
-                    result = shared.from_json(event.childWorkflowInstanceCompleted.result.value)
-                sub_orch_task.complete(result)
-                ctx.resume()
-            elif event.HasField('childWorkflowInstanceFailed'):
-                failedEvent = event.childWorkflowInstanceFailed
-                task_id = failedEvent.taskScheduledId
-                sub_orch_task = ctx._pending_tasks.pop(task_id, None)
-                if not sub_orch_task:
-                    # TODO: Should this be an error? When would it ever happen?
-                    if not ctx.is_replaying:
-                        self._logger.warning(
-                            f'{ctx.instance_id}: Ignoring unexpected childWorkflowInstanceFailed event with ID = {task_id}.'
+                        ctx.resume()
+                    else:
+                        activity_task.increment_attempt_count()
+                        ctx.create_timer_internal(
+                            next_delay,
+                            activity_task,
+                            origin=pb.TimerOriginActivityRetry(
+                                taskExecutionId=activity_task._task_execution_id,
+                            ),
                         )
-                    return
-                if isinstance(sub_orch_task, task.RetryableTask):
-                    if sub_orch_task._retry_policy is not None:
-                        # Check for non-retryable errors by type name
-                        if task.is_error_non_retryable(
-                            failedEvent.failureDetails.errorType, sub_orch_task._retry_policy
-                        ):
-                            sub_orch_task.fail(
-                                f'Sub-orchestration task #{task_id} failed: {failedEvent.failureDetails.errorMessage}',
-                                failedEvent.failureDetails,
-                            )
-                            ctx.resume()
-                        else:
-                            next_delay = sub_orch_task.compute_next_delay()
-                            if next_delay is None:
-                                sub_orch_task.fail(
-                                    f'Sub-orchestration task #{task_id} failed: {failedEvent.failureDetails.errorMessage}',
-                                    failedEvent.failureDetails,
-                                )
-                                ctx.resume()
-                            else:
-                                sub_orch_task.increment_attempt_count()
-                                ctx.create_timer_internal(
-                                    next_delay,
-                                    sub_orch_task,
-                                    origin=pb.TimerOriginChildWorkflowRetry(
-                                        instanceId=sub_orch_task._instance_id,
-                                    ),
-                                )
-                elif isinstance(sub_orch_task, task.CompletableTask):
+        elif isinstance(activity_task, task.CompletableTask):
+            activity_task.fail(
+                f'{ctx.instance_id}: Activity task #{task_id} failed: {event.taskFailed.failureDetails.errorMessage}',
+                event.taskFailed.failureDetails,
+            )
+            ctx.resume()
+        else:
+            raise TypeError('Unexpected task type')
+
+    def _on_child_workflow_instance_created(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        # This history event confirms that the sub-orchestration execution was successfully scheduled.
+        # Remove the childWorkflowInstanceCreated event from the pending action list so we don't schedule it again.
+        task_id = event.eventId
+        # If the pending action at this id is an optional timer, drop+shift.
+        if task_id in ctx._pending_actions and ph.is_optional_timer_action(
+            ctx._pending_actions[task_id]
+        ):
+            ctx._drop_optional_pending_at(task_id)
+        action = ctx._pending_actions.pop(task_id, None)
+        if not action:
+            raise _get_non_determinism_error(task_id, task.get_name(ctx.call_sub_orchestrator))
+        elif not action.HasField('createChildWorkflow'):
+            expected_method_name = task.get_name(ctx.call_sub_orchestrator)
+            raise _get_wrong_action_type_error(task_id, expected_method_name, action)
+        elif action.createChildWorkflow.name != event.childWorkflowInstanceCreated.name:
+            raise _get_wrong_action_name_error(
+                task_id,
+                method_name=task.get_name(ctx.call_sub_orchestrator),
+                expected_task_name=event.childWorkflowInstanceCreated.name,
+                actual_task_name=action.createChildWorkflow.name,
+            )
+
+    def _on_child_workflow_instance_completed(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        task_id = event.childWorkflowInstanceCompleted.taskScheduledId
+        sub_orch_task = ctx._pending_tasks.pop(task_id, None)
+        if not sub_orch_task:
+            # TODO: Should this be an error? When would it ever happen?
+            if not ctx.is_replaying:
+                self._logger.warning(
+                    f'{ctx.instance_id}: Ignoring unexpected childWorkflowInstanceCompleted event with ID = {task_id}.'
+                )
+            return
+        result = None
+        if not ph.is_empty(event.childWorkflowInstanceCompleted.result):
+            result = self._decode(event.childWorkflowInstanceCompleted.result.value)
+        sub_orch_task.complete(result)
+        ctx.resume()
+
+    def _on_child_workflow_instance_failed(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        failedEvent = event.childWorkflowInstanceFailed
+        task_id = failedEvent.taskScheduledId
+        sub_orch_task = ctx._pending_tasks.pop(task_id, None)
+        if not sub_orch_task:
+            # TODO: Should this be an error? When would it ever happen?
+            if not ctx.is_replaying:
+                self._logger.warning(
+                    f'{ctx.instance_id}: Ignoring unexpected childWorkflowInstanceFailed event with ID = {task_id}.'
+                )
+            return
+        if isinstance(sub_orch_task, task.RetryableTask):
+            if sub_orch_task._retry_policy is not None:
+                # Check for non-retryable errors by type name
+                if task.is_error_non_retryable(
+                    failedEvent.failureDetails.errorType, sub_orch_task._retry_policy
+                ):
                     sub_orch_task.fail(
                         f'Sub-orchestration task #{task_id} failed: {failedEvent.failureDetails.errorMessage}',
                         failedEvent.failureDetails,
                     )
                     ctx.resume()
                 else:
-                    raise TypeError('Unexpected sub-orchestration task type')
-            elif event.HasField('eventRaised'):
-                # event names are case-insensitive
-                event_name = event.eventRaised.name.casefold()
-                if not ctx.is_replaying:
-                    self._logger.info(f'{ctx.instance_id} Event raised: {event_name}')
-                task_list = ctx._pending_events.get(event_name, None)
-                decoded_result: Optional[Any] = None
-                if task_list:
-                    event_task = task_list.pop(0)
-                    if not ph.is_empty(event.eventRaised.input):
-                        decoded_result = shared.from_json(event.eventRaised.input.value)
-                    event_task.complete(decoded_result)
-                    if not task_list:
-                        del ctx._pending_events[event_name]
-                    ctx.resume()
-                else:
-                    # buffer the event
-                    event_list = ctx._received_events.get(event_name, None)
-                    if not event_list:
-                        event_list = []
-                        ctx._received_events[event_name] = event_list
-                    if not ph.is_empty(event.eventRaised.input):
-                        decoded_result = shared.from_json(event.eventRaised.input.value)
-                    event_list.append(decoded_result)
-                    if not ctx.is_replaying:
-                        self._logger.info(
-                            f"{ctx.instance_id}: Event '{event_name}' has been buffered as there are no tasks waiting for it."
+                    next_delay = sub_orch_task.compute_next_delay()
+                    if next_delay is None:
+                        sub_orch_task.fail(
+                            f'Sub-orchestration task #{task_id} failed: {failedEvent.failureDetails.errorMessage}',
+                            failedEvent.failureDetails,
                         )
-            elif event.HasField('executionSuspended'):
-                if not self._is_suspended and not ctx.is_replaying:
-                    self._logger.info(f'{ctx.instance_id}: Execution suspended.')
-                self._is_suspended = True
-            elif event.HasField('executionResumed') and self._is_suspended:
-                if not ctx.is_replaying:
-                    self._logger.info(f'{ctx.instance_id}: Resuming execution.')
-                self._is_suspended = False
-                for e in self._suspended_events:
-                    self.process_event(ctx, e)
-                self._suspended_events = []
-            elif event.HasField('executionTerminated'):
-                if not ctx.is_replaying:
-                    self._logger.info(f'{ctx.instance_id}: Execution terminating.')
-                encoded_output = (
-                    event.executionTerminated.input.value
-                    if not ph.is_empty(event.executionTerminated.input)
-                    else None
-                )
-                ctx.set_complete(
-                    encoded_output,
-                    pb.ORCHESTRATION_STATUS_TERMINATED,
-                    is_result_encoded=True,
-                )
-            elif event.HasField('executionStalled'):
-                # Nothing to do
-                pass
-            else:
-                eventType = event.WhichOneof('eventType')
-                raise task.WorkflowStateError(
-                    f"Don't know how to handle event of type '{eventType}'"
+                        ctx.resume()
+                    else:
+                        sub_orch_task.increment_attempt_count()
+                        ctx.create_timer_internal(
+                            next_delay,
+                            sub_orch_task,
+                            origin=pb.TimerOriginChildWorkflowRetry(
+                                instanceId=sub_orch_task._instance_id,
+                            ),
+                        )
+        elif isinstance(sub_orch_task, task.CompletableTask):
+            sub_orch_task.fail(
+                f'Sub-orchestration task #{task_id} failed: {failedEvent.failureDetails.errorMessage}',
+                failedEvent.failureDetails,
+            )
+            ctx.resume()
+        else:
+            raise TypeError('Unexpected sub-orchestration task type')
+
+    def _on_event_raised(self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent) -> None:
+        # event names are case-insensitive
+        event_name = event.eventRaised.name.casefold()
+        if not ctx.is_replaying:
+            self._logger.info(f'{ctx.instance_id} Event raised: {event_name}')
+        task_list = ctx._pending_events.get(event_name, None)
+        decoded_result: Optional[Any] = None
+        if task_list:
+            event_task = task_list.popleft()
+            if not ph.is_empty(event.eventRaised.input):
+                decoded_result = self._decode(event.eventRaised.input.value)
+            event_task.complete(decoded_result)
+            if not task_list:
+                del ctx._pending_events[event_name]
+            ctx.resume()
+        else:
+            # buffer the event
+            event_list = ctx._received_events.get(event_name, None)
+            if not event_list:
+                event_list = deque()
+                ctx._received_events[event_name] = event_list
+            if not ph.is_empty(event.eventRaised.input):
+                decoded_result = self._decode(event.eventRaised.input.value)
+            event_list.append(decoded_result)
+            if not ctx.is_replaying:
+                self._logger.info(
+                    f"{ctx.instance_id}: Event '{event_name}' has been buffered as there are no tasks waiting for it."
                 )
-        except StopIteration as generatorStopped:
-            # The orchestrator generator function completed
-            ctx.set_complete(generatorStopped.value, pb.ORCHESTRATION_STATUS_COMPLETED)
+
+    def _on_execution_suspended(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        if not self._is_suspended and not ctx.is_replaying:
+            self._logger.info(f'{ctx.instance_id}: Execution suspended.')
+        self._is_suspended = True
+
+    def _on_execution_resumed(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        if not self._is_suspended:
+            # A resume without a preceding suspend is not a valid transition.
+            raise _get_unhandled_event_error('executionResumed')
+        if not ctx.is_replaying:
+            self._logger.info(f'{ctx.instance_id}: Resuming execution.')
+        self._is_suspended = False
+        for e in self._suspended_events:
+            self.process_event(ctx, e)
+        self._suspended_events = []
+
+    def _on_execution_terminated(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        if not ctx.is_replaying:
+            self._logger.info(f'{ctx.instance_id}: Execution terminating.')
+        encoded_output = (
+            event.executionTerminated.input.value
+            if not ph.is_empty(event.executionTerminated.input)
+            else None
+        )
+        ctx.set_complete(
+            encoded_output,
+            pb.ORCHESTRATION_STATUS_TERMINATED,
+            is_result_encoded=True,
+        )
+
+    def _on_execution_stalled(
+        self, ctx: _RuntimeOrchestrationContext, event: pb.HistoryEvent
+    ) -> None:
+        # Nothing to do
+        pass
+
+    # Keyed by HistoryEvent.WhichOneof('eventType'); one lookup per event instead of a
+    # HasField probe per known type.
+    _EVENT_HANDLERS: dict[str, Callable[..., None]] = {
+        'workflowStarted': _on_workflow_started,
+        'executionStarted': _on_execution_started,
+        'timerCreated': _on_timer_created,
+        'timerFired': _on_timer_fired,
+        'taskScheduled': _on_task_scheduled,
+        'taskCompleted': _on_task_completed,
+        'taskFailed': _on_task_failed,
+        'childWorkflowInstanceCreated': _on_child_workflow_instance_created,
+        'childWorkflowInstanceCompleted': _on_child_workflow_instance_completed,
+        'childWorkflowInstanceFailed': _on_child_workflow_instance_failed,
+        'eventRaised': _on_event_raised,
+        'executionSuspended': _on_execution_suspended,
+        'executionResumed': _on_execution_resumed,
+        'executionTerminated': _on_execution_terminated,
+        'executionStalled': _on_execution_stalled,
+    }
 
 
 class _ActivityExecutor:
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, codec: PayloadCodec = DEFAULT_CODEC):
         self._logger = logger
+        self._codec = codec
 
     def _resolve(
         self,
@@ -2356,7 +3648,7 @@ class _ActivityExecutor:
             raise ActivityNotRegisteredError(
                 f"Activity function named '{name}' was not registered!"
             )
-        activity_input = shared.from_json(encoded_input) if encoded_input else None
+        activity_input = self._codec.decode(encoded_input) if encoded_input else None
         ctx = task.ActivityContext(
             orchestration_id,
             task_id,
@@ -2368,7 +3660,10 @@ class _ActivityExecutor:
     def _encode_output(
         self, orchestration_id: str, name: str, task_id: int, activity_output: Any
     ) -> str | None:
-        encoded_output = shared.to_json(activity_output) if activity_output is not None else None
+        # Outputs may be read by workflows in other apps or SDKs, so they use plain JSON.
+        encoded_output = (
+            DEFAULT_CODEC.encode(activity_output) if activity_output is not None else None
+        )
         chars = len(encoded_output) if encoded_output else 0
         self._logger.debug(
             f"{orchestration_id}/{task_id}: Activity '{name}' completed successfully with {chars} char(s) of encoded output."
@@ -2434,6 +3729,155 @@ class _ActivityExecutor:
         return self._encode_output(orchestration_id, name, task_id, activity_output)
 
 
+# Process-pool activities. The registered process activities are handed to each worker
+# process once, by the pool initializer; a call then only ships the activity name and its
+# (already encoded) input, and returns the encoded output.
+_process_activities: dict[str, task.Activity] = {}
+_process_activity_executor: Optional[_ActivityExecutor] = None
+
+
+def _init_activity_process(activities: dict[str, task.Activity], codec: PayloadCodec) -> None:
+    global _process_activities, _process_activity_executor
+    _process_activities = activities
+    _process_activity_executor = _ActivityExecutor(logging.getLogger('durabletask-worker'), codec)
+
+
+def _warm_up_activity_process() -> None:
+    pass
+
+
+def _run_activity_in_process(
+    name: str,
+    orchestration_id: str,
+    task_id: int,
+    encoded_input: str | None,
+    task_execution_id: str,
+    propagated_history: PropagatedHistory | None,
+) -> str | None:
+    assert _process_activity_executor is not None
+    return _process_activity_executor.execute(
+        _process_activities.get(name),
+        orchestration_id,
+        name,
+        task_id,
+        encoded_input,
+        task_execution_id,
+        propagated_history=propagated_history,
+    )
+
+
+class _ActivityProcessPool:
+    """Runs the activities registered with ``executor='process'`` on warm worker processes.
+
+    Worker processes are started with ``spawn`` (forking a process that holds live gRPC
+    channels is unsafe), so they import the activities' modules fresh. A worker process
+    that dies breaks the whole pool; the pool is then replaced and the in-flight
+    activities fail like any other activity error. A call that times out while running
+    would keep its worker process busy, so the pool is replaced then too, and its worker
+    processes are terminated.
+    """
+
+    def __init__(
+        self,
+        activities: dict[str, task.Activity],
+        max_workers: int,
+        timeout: Optional[float],
+        logger: logging.Logger,
+        codec: PayloadCodec = DEFAULT_CODEC,
+    ):
+        self._activities = activities
+        self._max_workers = max_workers
+        self._timeout = timeout
+        self._logger = logger
+        self._codec = codec
+        self._lock = threading.Lock()
+        self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        pool = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_activity_process,
+            initargs=(self._activities, self._codec),
+        )
+        # Spawned workers start on demand; start them all now rather than on the first
+        # activities' clock (and timeout).
+        for _ in range(self._max_workers):
+            pool.submit(_warm_up_activity_process)
+        return pool
+
+    async def execute(
+        self,
+        name: str,
+        orchestration_id: str,
+        task_id: int,
+        encoded_input: str | None,
+        task_execution_id: str,
+        propagated_history: PropagatedHistory | None,
+    ) -> str | None:
+        """Runs one activity call in a worker process and returns its encoded output.
+
+        The timeout runs from submission, so it includes any wait for a free worker process.
+        If the call had already started, the pool is replaced and its worker processes are
+        terminated, failing the other calls running on it.
+
+        Raises:
+            TimeoutError: If the call exceeded the configured timeout.
+        """
+        pool = self._pool
+        future = pool.submit(
+            _run_activity_in_process,
+            name,
+            orchestration_id,
+            task_id,
+            encoded_input,
+            task_execution_id,
+            propagated_history,
+        )
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self._timeout)
+        except asyncio.TimeoutError:
+            if not future.cancel():
+                # Still running: its worker process would hold a pool slot indefinitely.
+                self._replace(
+                    pool,
+                    f"Activity '{name}' timed out in a worker process; restarting the process pool",
+                    terminate=True,
+                )
+            raise TimeoutError(
+                f"Activity '{name}' did not complete within {self._timeout}s"
+            ) from None
+        except BrokenProcessPool:
+            self._replace(pool, 'An activity worker process died; restarting the process pool')
+            raise
+
+    def _replace(self, old: ProcessPoolExecutor, reason: str, terminate: bool = False) -> None:
+        with self._lock:
+            if self._pool is not old:
+                return  # another failed call already replaced it
+            self._logger.warning(reason)
+            self._pool = self._new_pool()
+        if terminate:
+            _terminate_pool_processes(old)
+        old.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _terminate_pool_processes(pool: ProcessPoolExecutor) -> None:
+    terminate_workers = getattr(pool, 'terminate_workers', None)  # Python 3.14+
+    if terminate_workers is not None:
+        terminate_workers()
+        return
+    for process in list((pool._processes or {}).values()):
+        process.terminate()
+
+
+def _get_unhandled_event_error(event_type: Optional[str]) -> task.WorkflowStateError:
+    return task.WorkflowStateError(f"Don't know how to handle event of type '{event_type}'")
+
+
 def _get_non_determinism_error(task_id: int, action_name: str) -> task.NonDeterminismError:
     return task.NonDeterminismError(
         f'A previous execution called {action_name} with ID={task_id}, but the current '
@@ -2510,19 +3954,148 @@ def _get_action_summary(new_actions: Sequence[pb.WorkflowAction]) -> str:
         return f'[{", ".join(f"{name}={count}" for name, count in counts.items())}]'
 
 
-def _is_suspendable(event: pb.HistoryEvent) -> bool:
-    """Returns true if the event is one that can be suspended and resumed."""
-    return event.WhichOneof('eventType') not in [
-        'executionResumed',
-        'executionTerminated',
-    ]
+# Events still processed while the orchestration is suspended; all others are buffered.
+_UNSUSPENDABLE_EVENT_TYPES = frozenset(('executionResumed', 'executionTerminated'))
+
+
+class _ConcurrencyLimit:
+    """An asyncio semaphore whose capacity can be changed while it is in use.
+
+    Lowering the limit never interrupts work already admitted; new work simply waits
+    until enough of it has finished.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._in_use = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def saturated(self) -> bool:
+        """Whether work is waiting for, or using up, every slot."""
+        return self._in_use >= self._limit or bool(self._waiters)
+
+    def set_limit(self, limit: int) -> None:
+        self._limit = limit
+        self._wake()
+
+    async def __aenter__(self):
+        while self._in_use >= self._limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()  # pass the slot we were handed on
+                else:
+                    try:
+                        self._waiters.remove(waiter)
+                    except ValueError:
+                        pass  # already dropped by _wake
+                raise
+        self._in_use += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._in_use -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        free = self._limit - self._in_use
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
+# Adaptive-limit tuning, after the AIMD and gradient limiters of Netflix's
+# concurrency-limits: back off multiplicatively on overload or queueing latency,
+# grow by sqrt(limit) per window while the limit is the bottleneck.
+_ADAPTIVE_MIN_WINDOW = 10  # samples per adjustment, at least; else one per limit slot
+_ADAPTIVE_BACKOFF = 0.75  # multiplicative decrease on sidecar overload
+_ADAPTIVE_LATENCY_TOLERANCE = 2.0  # latency over baseline tolerated before shrinking
+_ADAPTIVE_BASELINE_SMOOTHING = 0.1  # weight of each window in the baseline latency
+
+
+class _AdaptiveLimit:
+    """AIMD/gradient policy driving one :class:`_ConcurrencyLimit` between two bounds.
+
+    Completion latencies are collected in windows of about one sample per slot. At the
+    end of each window the limit is:
+
+    * cut by ``_ADAPTIVE_BACKOFF`` if the sidecar reported overload in the window;
+    * otherwise scaled by the latency gradient, ``tolerance * baseline / latency``
+      clamped to [0.5, 1], so it shrinks once work queues up behind a bottleneck;
+    * otherwise, if the limit itself was the bottleneck, raised by ``sqrt(limit)``.
+
+    The baseline is a slow moving average of healthy window latencies.
+    """
+
+    def __init__(self, limiter: _ConcurrencyLimit, minimum: int, maximum: int):
+        self._limiter = limiter
+        self._minimum = minimum
+        self._maximum = maximum
+        self._limit = float(limiter.limit)
+        self._baseline: Optional[float] = None
+        self._overloads = 0
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self._samples = 0
+        self._latency_total = 0.0
+        self._saturated = False
+
+    def record_overload(self) -> None:
+        # May be called from any thread; a lost increment only delays a backoff.
+        self._overloads += 1
+
+    def record(self, latency: float, saturated: bool) -> None:
+        """Records one completed work item; may adjust the limit."""
+        self._samples += 1
+        self._latency_total += latency
+        self._saturated = self._saturated or saturated
+        if self._samples >= max(_ADAPTIVE_MIN_WINDOW, self._limiter.limit):
+            self._adjust()
+
+    def _adjust(self) -> None:
+        latency = self._latency_total / self._samples
+        overloads, self._overloads = self._overloads, 0
+        if overloads:
+            limit = self._limit * _ADAPTIVE_BACKOFF
+        else:
+            if self._baseline is None:
+                self._baseline = latency
+            gradient = 1.0
+            if latency > 0:
+                gradient = max(
+                    0.5, min(1.0, _ADAPTIVE_LATENCY_TOLERANCE * self._baseline / latency)
+                )
+            limit = self._limit * gradient
+            if gradient == 1.0 and self._saturated:
+                limit += math.sqrt(self._limit)
+            self._baseline += _ADAPTIVE_BASELINE_SMOOTHING * (latency - self._baseline)
+        self._limit = min(float(self._maximum), max(float(self._minimum), limit))
+        self._limiter.set_limit(int(self._limit))
+        self._reset_window()
 
 
 class _AsyncWorkerManager:
     def __init__(self, concurrency_options: ConcurrencyOptions, logger: logging.Logger):
         self.concurrency_options = concurrency_options
-        self.activity_semaphore = None
-        self.orchestration_semaphore = None
+        self.activity_semaphore: Optional[_ConcurrencyLimit] = None
+        self.orchestration_semaphore: Optional[_ConcurrencyLimit] = None
+        # Set only with adaptive_concurrency
+        self._activity_policy: Optional[_AdaptiveLimit] = None
+        self._orchestration_policy: Optional[_AdaptiveLimit] = None
         # Don't create queues here - defer until we have an event loop
         self.activity_queue: Optional[asyncio.Queue] = None
         self.orchestration_queue: Optional[asyncio.Queue] = None
@@ -2604,21 +4177,67 @@ class _AsyncWorkerManager:
         self._ensure_queues_for_current_loop()
 
         # Create semaphores in the current event loop
-        self.activity_semaphore = asyncio.Semaphore(
-            self.concurrency_options.maximum_concurrent_activity_work_items
+        options = self.concurrency_options
+        self.activity_semaphore, self._activity_policy = self._new_limit(
+            options.minimum_concurrent_activity_work_items,
+            options.maximum_concurrent_activity_work_items,
         )
-        self.orchestration_semaphore = asyncio.Semaphore(
-            self.concurrency_options.maximum_concurrent_orchestration_work_items
+        self.orchestration_semaphore, self._orchestration_policy = self._new_limit(
+            options.minimum_concurrent_orchestration_work_items,
+            options.maximum_concurrent_orchestration_work_items,
         )
 
         # Start background consumers for each work type
         if self.activity_queue is not None and self.orchestration_queue is not None:
             await asyncio.gather(
-                self._consume_queue(self.activity_queue, self.activity_semaphore),
-                self._consume_queue(self.orchestration_queue, self.orchestration_semaphore),
+                self._consume_queue(
+                    self.activity_queue, self.activity_semaphore, self._activity_policy
+                ),
+                self._consume_queue(
+                    self.orchestration_queue,
+                    self.orchestration_semaphore,
+                    self._orchestration_policy,
+                ),
             )
 
-    async def _consume_queue(self, queue: asyncio.Queue, semaphore: asyncio.Semaphore):
+    def _new_limit(
+        self, minimum: int, maximum: int
+    ) -> tuple[_ConcurrencyLimit, Optional[_AdaptiveLimit]]:
+        if not self.concurrency_options.adaptive_concurrency:
+            return _ConcurrencyLimit(maximum), None
+        limiter = _ConcurrencyLimit(minimum)
+        return limiter, _AdaptiveLimit(limiter, minimum, maximum)
+
+    def record_overload(self, request_type: str) -> None:
+        """Reports a sidecar overload error for an ``'activity'`` or ``'orchestrator'``."""
+        policy = self._activity_policy if request_type == 'activity' else self._orchestration_policy
+        if policy is not None:
+            policy.record_overload()
+
+    def limits(self) -> ConcurrencyLimits:
+        options = self.concurrency_options
+        activity, orchestration = self.activity_semaphore, self.orchestration_semaphore
+        return ConcurrencyLimits(
+            activity_limit=(
+                activity.limit
+                if activity is not None
+                else options.maximum_concurrent_activity_work_items
+            ),
+            activity_in_flight=activity.in_use if activity is not None else 0,
+            orchestration_limit=(
+                orchestration.limit
+                if orchestration is not None
+                else options.maximum_concurrent_orchestration_work_items
+            ),
+            orchestration_in_flight=orchestration.in_use if orchestration is not None else 0,
+        )
+
+    async def _consume_queue(
+        self,
+        queue: asyncio.Queue,
+        semaphore: _ConcurrencyLimit,
+        policy: Optional[_AdaptiveLimit] = None,
+    ):
         # List to track running tasks
         running_tasks: set[asyncio.Task] = set()
 
@@ -2643,10 +4262,12 @@ class _AsyncWorkerManager:
                     # Propagate cancellation
                     raise
 
-                func, args, kwargs = work
+                func, args, kwargs, enqueued_at = work
                 # Create a concurrent task for processing
                 task = asyncio.create_task(
-                    self._process_work_item(semaphore, queue, func, args, kwargs)
+                    self._process_work_item(
+                        semaphore, policy, queue, func, args, kwargs, enqueued_at
+                    )
                 )
                 running_tasks.add(task)
         # handle the cancellation bubbled up from the loop
@@ -2661,12 +4282,24 @@ class _AsyncWorkerManager:
             raise
 
     async def _process_work_item(
-        self, semaphore: asyncio.Semaphore, queue: asyncio.Queue, func, args, kwargs
+        self,
+        semaphore: _ConcurrencyLimit,
+        policy: Optional[_AdaptiveLimit],
+        queue: asyncio.Queue,
+        func,
+        args,
+        kwargs,
+        enqueued_at: float,
     ):
         async with semaphore:
+            started = time.monotonic()
+            # Each work item runs in its own task, so this only applies to this item.
+            _queue_wait.set(started - enqueued_at)
             try:
                 await self._run_func(func, *args, **kwargs)
             finally:
+                if policy is not None:
+                    policy.record(time.monotonic() - started, semaphore.saturated)
                 queue.task_done()
 
     async def _run_func(self, func, *args, **kwargs):
@@ -2681,11 +4314,16 @@ class _AsyncWorkerManager:
                 and getattr(self.thread_pool, '_shutdown', False)
             ):
                 return None
-            result = await loop.run_in_executor(self.thread_pool, lambda: func(*args, **kwargs))
+            # Like asyncio.to_thread, run in a copy of the context so the function sees the
+            # work item's context variables.
+            context = contextvars.copy_context()
+            result = await loop.run_in_executor(
+                self.thread_pool, lambda: context.run(func, *args, **kwargs)
+            )
             return result
 
     def submit_activity(self, func, *args, **kwargs):
-        work_item = (func, args, kwargs)
+        work_item = (func, args, kwargs, time.monotonic())
         self._ensure_queues_for_current_loop()
         if self.activity_queue is not None:
             self.activity_queue.put_nowait(work_item)
@@ -2694,7 +4332,7 @@ class _AsyncWorkerManager:
             self._pending_activity_work.append(work_item)
 
     def submit_orchestration(self, func, *args, **kwargs):
-        work_item = (func, args, kwargs)
+        work_item = (func, args, kwargs, time.monotonic())
         self._ensure_queues_for_current_loop()
         if self.orchestration_queue is not None:
             self.orchestration_queue.put_nowait(work_item)
@@ -2734,4 +4372,4 @@ class _AsyncWorkerManager:
 
 
 # Export public API
-__all__ = ['ConcurrencyOptions', 'TaskHubGrpcWorker']
+__all__ = ['ConcurrencyLimits', 'ConcurrencyOptions', 'TaskHubGrpcWorker']
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import atexit
+import ctypes
+import multiprocessing
+import os
+import signal
+import time
+from dataclasses import astuple, fields
+from typing import Any
+
+from dapr.ext.workflow._durabletask.worker import (
+    ConcurrencyLimits,
+    HistoryCacheStats,
+    TaskHubGrpcWorker,
+)
+from dapr.ext.workflow.logger import Logger
+
+# How often a worker process checks whether it was asked to stop or orphaned.
+_SHARD_POLL_INTERVAL = 0.5
+
+# Layout of the counters each worker process publishes: its history cache stats
+# followed by its concurrency limits.
+_CACHE_FIELDS = len(fields(HistoryCacheStats))
+_STATS_FIELDS = _CACHE_FIELDS + len(fields(ConcurrencyLimits))
+
+
+def _publish_stats(worker: TaskHubGrpcWorker, stats: Any) -> None:
+    stats[:] = astuple(worker.history_cache_stats) + astuple(worker.concurrency_limits)
+
+
+def _run_shard(
+    worker: TaskHubGrpcWorker, index: int, ready: Any, stats: Any, logger: Logger
+) -> None:
+    """Body of one worker process: run the inherited worker until told to stop.
+
+    SIGINT is left to the supervisor. SIGTERM, sent by :meth:`_WorkerSupervisor.stop`,
+    stops a started worker gracefully and ends a still-starting one outright. Exits on
+    its own once the supervisor is gone. The worker's stats are copied into ``stats``
+    every poll interval.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    supervisor_pid = os.getppid()
+    try:
+        worker.start()
+    except Exception as ex:
+        logger.error(f'Workflow worker process {index} did not start: {ex}')
+        raise SystemExit(1)
+
+    terminated = False
+
+    def _on_sigterm(signum, frame):
+        nonlocal terminated
+        terminated = True
+
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    _publish_stats(worker, stats)
+    ready.value = True
+    try:
+        while not terminated:
+            if os.getppid() != supervisor_pid:
+                logger.warning(f'Workflow worker process {index} lost its supervisor; stopping')
+                break
+            time.sleep(_SHARD_POLL_INTERVAL)
+            _publish_stats(worker, stats)
+    finally:
+        worker.stop()
+
+
+class _WorkerSupervisor:
+    """Runs one unstarted worker as N forked processes, each with its own work-item stream.
+
+    Forking (rather than spawning) is what lets every process inherit the registered
+    workflows and activities, which are closures and cannot be pickled. It is safe because
+    the supervisor never starts its own copy of the worker, so no gRPC channel exists in
+    the parent when it forks; start it before creating any other gRPC client.
+
+    Processes are coordinated only through signals and lock-free shared memory (a
+    readiness flag and a block of stats counters), so a process killed from outside (e.g.
+    by the OOM killer) cannot leave a shared lock held and wedge the shutdown of the others.
+
+    The worker processes are not daemonic, so they can start the process pool of
+    ``executor='process'`` activities. They are stopped at interpreter exit if
+    :meth:`stop` was not called, and stop on their own if the supervisor dies.
+    """
+
+    def __init__(self, worker: TaskHubGrpcWorker, processes: int, logger: Logger):
+        if processes < 1:
+            raise ValueError('worker_processes must be at least 1')
+        self._worker = worker
+        self._processes = processes
+        self._logger = logger
+        self._shards: list[tuple[Any, Any, Any]] = []  # (process, ready flag, stats)
+
+    def start(self, timeout: float) -> None:
+        """Forks the worker processes and waits until each has its stream ready.
+
+        Raises:
+            RuntimeError: If a worker process exits, or not all of them are ready within
+                ``timeout`` seconds. Any processes already started are stopped first.
+        """
+        if self._shards:
+            raise RuntimeError('The worker processes are already running.')
+        try:
+            context = multiprocessing.get_context('fork')
+        except ValueError as ex:
+            raise RuntimeError('worker_processes > 1 requires the fork start method') from ex
+
+        for index in range(self._processes):
+            ready = context.RawValue(ctypes.c_bool, False)
+            stats = context.RawArray(ctypes.c_longlong, _STATS_FIELDS)
+            process = context.Process(
+                target=_run_shard,
+                args=(self._worker, index, ready, stats, self._logger),
+                name=f'WorkflowWorker-{index}',
+                # Daemonic processes cannot have children, such as activity worker processes.
+                daemon=False,
+            )
+            process.start()
+            self._shards.append((process, ready, stats))
+        # Runs before multiprocessing's own exit hook, which would wait for them forever.
+        atexit.register(self.stop)
+        self._logger.info(f'Started {self._processes} workflow worker processes')
+
+        deadline = time.monotonic() + timeout
+        while not self.is_ready():
+            for index, (process, _, _) in enumerate(self._shards):
+                if not process.is_alive():
+                    self.stop()
+                    raise RuntimeError(
+                        f'Workflow worker process {index} exited with code {process.exitcode} '
+                        'before its work item stream was established'
+                    )
+            if time.monotonic() >= deadline:
+                self.stop()
+                raise RuntimeError(
+                    f'Workflow worker processes were not ready within {timeout} seconds'
+                )
+            time.sleep(0.1)
+
+    def is_ready(self) -> bool:
+        """Whether every worker process is alive and has its stream established."""
+        return bool(self._shards) and all(
+            ready.value and process.is_alive() for process, ready, _ in self._shards
+        )
+
+    def history_cache_stats(self) -> HistoryCacheStats:
+        """History cache stats summed over the live worker processes.
+
+        Each process refreshes its counters every poll interval, so the sum may lag the
+        processes by up to half a second.
+        """
+        return HistoryCacheStats(*self._sum_stats()[:_CACHE_FIELDS])
+
+    def concurrency_limits(self) -> ConcurrencyLimits:
+        """Work-item limits and in-flight counts summed over the live worker processes.
+
+        Refreshed like :meth:`history_cache_stats`.
+        """
+        return ConcurrencyLimits(*self._sum_stats()[_CACHE_FIELDS:])
+
+    def _sum_stats(self) -> list[int]:
+        totals = [0] * _STATS_FIELDS
+        for process, ready, stats in self._shards:
+            if ready.value and process.is_alive():
+                totals = [total + value for total, value in zip(totals, stats[:])]
+        return totals
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Asks every worker process to stop gracefully, killing those that don't."""
+        if not self._shards:
+            return
+        atexit.unregister(self.stop)
+        for process, _, _ in self._shards:
+            process.terminate()  # SIGTERM, handled gracefully by _run_shard
+        deadline = time.monotonic() + timeout
+        for index, (process, _, _) in enumerate(self._shards):
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                self._logger.warning(
+                    f'Workflow worker process {index} did not stop within {timeout}s; killing it'
+                )
+                process.kill()
+                process.join()
+        self._shards = []
+        self._logger.info('Workflow worker processes stopped')
@@ -13,14 +13,17 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
-# Re-export MCPToolDef so async users don't need to import from the sync module.
-from dapr.ext.workflow.mcp import MCPToolDef
+# Re-export MCPToolDef and MCPToolCache so async users don't need to import from the sync module.
+from dapr.ext.workflow.mcp import MCPToolCache, MCPToolDef
 
+from .completion_watcher import CompletionWatcher
 from .dapr_workflow_client import DaprWorkflowClient
 from .mcp import DaprMCPClient
 
 __all__ = [
+    'CompletionWatcher',
     'DaprWorkflowClient',
     'DaprMCPClient',
     'MCPToolDef',
+    'MCPToolCache',
 ]
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Optional
+
+from dapr.ext.workflow._durabletask.aio import client as aioclient
+from dapr.ext.workflow._durabletask.client import _TransientTimeout
+from dapr.ext.workflow.bulk import BulkResult
+from dapr.ext.workflow.workflow_state import WorkflowState
+
+# Long-polls held open at once unless the caller says otherwise.
+DEFAULT_MAX_CONCURRENT_POLLS = 100
+
+# How long one long-poll waits before its instance goes to the back of the line.
+DEFAULT_POLL_TIMEOUT_SECONDS = 30
+
+
+@dataclass
+class _Watch:
+    index: int
+    future: asyncio.Future
+    deadline: Optional[float]
+
+
+class CompletionWatcher:
+    """Waits for many workflow instances to complete over a bounded set of long-polls.
+
+    Each watched instance gets a ``WaitForInstanceCompletion`` long-poll of at most
+    ``poll_timeout_in_seconds``. At most ``max_concurrent_polls`` are open at once; when a
+    poll expires its instance goes to the back of the line, so every instance gets a turn
+    however many are watched. Transient sidecar errors are retried within each poll, as
+    in :meth:`DaprWorkflowClient.wait_for_workflow_completion`.
+
+    Results are available both as futures returned by :meth:`watch` and by iterating the
+    watcher, which yields a :class:`~dapr.ext.workflow.bulk.BulkResult` per instance in
+    completion order until nothing is left to watch.
+
+    Create one with :meth:`DaprWorkflowClient.completion_watcher` and use it as an async
+    context manager, or call :meth:`aclose` when done.
+    """
+
+    def __init__(
+        self,
+        client: aioclient.AsyncTaskHubGrpcClient,
+        *,
+        max_concurrent_polls: int = DEFAULT_MAX_CONCURRENT_POLLS,
+        poll_timeout_in_seconds: float = DEFAULT_POLL_TIMEOUT_SECONDS,
+        fetch_payloads: bool = True,
+    ):
+        if max_concurrent_polls < 1:
+            raise ValueError('max_concurrent_polls must be at least 1')
+        if poll_timeout_in_seconds <= 0:
+            raise ValueError('poll_timeout_in_seconds must be positive')
+        self._client = client
+        self._max_concurrent_polls = max_concurrent_polls
+        self._poll_timeout = poll_timeout_in_seconds
+        self._fetch_payloads = fetch_payloads
+        self._watches: dict[str, _Watch] = {}
+        self._waiting: deque[str] = deque()
+        self._polls: dict[str, asyncio.Task] = {}
+        # None wakes an iterator to re-check whether anything is left to wait for.
+        self._results: asyncio.Queue[Optional[BulkResult[Optional[WorkflowState]]]] = (
+            asyncio.Queue()
+        )
+        self._registered = 0
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """The number of watched instances that have not completed yet."""
+        return len(self._watches)
+
+    def watch(
+        self, instance_ids: Iterable[str], *, timeout_in_seconds: float = 0
+    ) -> list[asyncio.Future]:
+        """Starts watching workflow instances for completion.
+
+        Args:
+            instance_ids: The instances to watch. An instance that is already being watched
+                keeps its existing future.
+            timeout_in_seconds: How long to wait for each instance before its future fails
+                with ``TimeoutError``. Defaults to 0, meaning no timeout.
+
+        Returns:
+            One future per instance ID, in input order. Each resolves to the instance's
+            final WorkflowState, or to ``None`` if the instance does not exist.
+        """
+        if self._closed:
+            raise RuntimeError('The completion watcher is closed')
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout_in_seconds if timeout_in_seconds else None
+        futures = []
+        for instance_id in instance_ids:
+            watch = self._watches.get(instance_id)
+            if watch is None:
+                watch = _Watch(self._registered, loop.create_future(), deadline)
+                watch.future.add_done_callback(
+                    lambda future, instance_id=instance_id: self._on_done(instance_id, future)
+                )
+                self._registered += 1
+                self._watches[instance_id] = watch
+                self._waiting.append(instance_id)
+            futures.append(watch.future)
+        self._fill()
+        return futures
+
+    async def __aiter__(self) -> AsyncIterator[BulkResult[Optional[WorkflowState]]]:
+        while (self._watches and not self._closed) or not self._results.empty():
+            result = await self._results.get()
+            if result is not None:
+                yield result
+
+    async def aclose(self) -> None:
+        """Stops all polls and cancels the futures of instances still being watched."""
+        self._closed = True
+        polls = list(self._polls.values())
+        for poll in polls:
+            poll.cancel()
+        for watch in list(self._watches.values()):
+            watch.future.cancel()
+        self._results.put_nowait(None)
+        await asyncio.gather(*polls, return_exceptions=True)
+
+    async def __aenter__(self) -> CompletionWatcher:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def _fill(self) -> None:
+        while self._waiting and len(self._polls) < self._max_concurrent_polls:
+            instance_id = self._waiting.popleft()
+            # Skip instances cancelled while they waited for a turn.
+            if instance_id in self._watches and instance_id not in self._polls:
+                self._polls[instance_id] = asyncio.ensure_future(self._poll(instance_id))
+
+    async def _poll(self, instance_id: str) -> None:
+        watch = self._watches[instance_id]
+        try:
+            timeout = self._poll_timeout
+            if watch.deadline is not None:
+                timeout = min(timeout, watch.deadline - time.monotonic())
+                if timeout <= 0:
+                    raise _TransientTimeout()
+            state = await self._client._poll_orchestration_completion(
+                instance_id, self._fetch_payloads, timeout
+            )
+        except _TransientTimeout:
+            if watch.deadline is not None and time.monotonic() >= watch.deadline:
+                self._resolve(
+                    instance_id,
+                    error=TimeoutError('Timed-out waiting for the orchestration to complete'),
+                )
+            else:
+                self._waiting.append(instance_id)
+        except Exception as error:
+            self._resolve(instance_id, error=error)
+        else:
+            self._resolve(instance_id, value=WorkflowState(state) if state else None)
+        finally:
+            del self._polls[instance_id]
+            # The instance was cancelled and watched again while this poll wound down.
+            if self._watches.get(instance_id, watch) is not watch:
+                self._waiting.append(instance_id)
+            if not self._closed:
+                self._fill()
+
+    def _resolve(
+        self,
+        instance_id: str,
+        value: Optional[WorkflowState] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        watch = self._watches.pop(instance_id)
+        if error is None:
+            watch.future.set_result(value)
+        else:
+            watch.future.set_exception(error)
+            # The error is also delivered through iteration, so don't log it as unretrieved.
+            watch.future.exception()
+        self._results.put_nowait(BulkResult(watch.index, instance_id, value, error))
+
+    def _on_done(self, instance_id: str, future: asyncio.Future) -> None:
+        if not future.cancelled():
+            return
+        watch = self._watches.get(instance_id)
+        if watch is not None and watch.future is future:
+            del self._watches[instance_id]
+            poll = self._polls.get(instance_id)
+            if poll is not None:
+                poll.cancel()
+            self._results.put_nowait(None)
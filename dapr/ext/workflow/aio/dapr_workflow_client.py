@@ -15,10 +15,21 @@ limitations under the License.
 
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
-from typing import Any, Optional, TypeVar, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Iterable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 from warnings import warn
 
+from grpc import StatusCode
 from grpc.aio import AioRpcError
 
 from dapr.aio.clients.grpc.interceptors import DaprClientTimeoutInterceptorAsync
@@ -28,16 +39,46 @@ from dapr.conf import settings
 from dapr.conf.helpers import GrpcEndpoint
 from dapr.ext.workflow._durabletask import client
 from dapr.ext.workflow._durabletask.aio import client as aioclient
+from dapr.ext.workflow._durabletask.codecs import PayloadCodec
+from dapr.ext.workflow.aio.completion_watcher import (
+    DEFAULT_MAX_CONCURRENT_POLLS,
+    DEFAULT_POLL_TIMEOUT_SECONDS,
+    CompletionWatcher,
+)
+from dapr.ext.workflow.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_LIST_PAGE_SIZE,
+    BulkResult,
+    iter_pages_async,
+    run_bulk_async,
+)
 from dapr.ext.workflow.logger import Logger, LoggerOptions
+from dapr.ext.workflow.payload_store import DEFAULT_PAYLOAD_THRESHOLD_BYTES, PayloadStore
 from dapr.ext.workflow.util import get_grpc_channel_options, getAddress
 from dapr.ext.workflow.workflow_context import Workflow
-from dapr.ext.workflow.workflow_state import WorkflowState
+from dapr.ext.workflow.workflow_state import (
+    WorkflowState,
+    WorkflowStatus,
+    _to_orchestration_status,
+)
 
 T = TypeVar('T')
 TInput = TypeVar('TInput')
 TOutput = TypeVar('TOutput')
 
 
+async def _with_instance_ids(
+    instances: Union[Iterable[tuple[Optional[str], Any]], AsyncIterable[tuple[Optional[str], Any]]],
+) -> AsyncIterator[tuple[str, Any]]:
+    """Yields ``(instance_id, input)`` pairs, giving each missing ID a new GUID."""
+    if isinstance(instances, AsyncIterable):
+        async for instance_id, input in instances:
+            yield instance_id or uuid.uuid4().hex, input
+    else:
+        for instance_id, input in instances:
+            yield instance_id or uuid.uuid4().hex, input
+
+
 class DaprWorkflowClient:
     """Async client for managing Dapr Workflow instances.
 
@@ -51,6 +92,9 @@ class DaprWorkflowClient:
         port: Optional[str] = None,
         logger_options: Optional[LoggerOptions] = None,
         max_grpc_message_length: Optional[int] = None,
+        payload_store: Optional[PayloadStore] = None,
+        payload_threshold_bytes: int = DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+        codec: Optional[PayloadCodec] = None,
     ):
         """Initializes the async workflow client.
 
@@ -65,6 +109,15 @@ class DaprWorkflowClient:
                 ``DAPR_GRPC_MAX_INBOUND_MESSAGE_SIZE_BYTES`` env var (if non-zero),
                 then the gRPC default (4 MiB). ``0`` in either source means
                 "no opinion" and falls through to the next source.
+            payload_store: The store the workflow runtime externalizes large payloads to.
+                Workflow inputs and outputs read through this client are loaded from it,
+                and scheduled inputs over ``payload_threshold_bytes`` are written to it.
+                Defaults to None.
+            payload_threshold_bytes: Encoded size above which a scheduled input is moved to
+                ``payload_store``. Defaults to 64 KiB.
+            codec: How scheduled workflow inputs are encoded. Inputs and outputs read
+                through this client are returned as plain JSON whatever codec wrote them.
+                Defaults to None (plain JSON through the ``json`` module).
         """
         address = getAddress(host, port)
 
@@ -88,6 +141,9 @@ class DaprWorkflowClient:
             log_formatter=options.log_formatter,
             interceptors=[DaprClientTimeoutInterceptorAsync()],
             channel_options=channel_options,
+            payload_store=payload_store,
+            payload_threshold_bytes=payload_threshold_bytes,
+            codec=codec,
         )
 
     async def schedule_new_workflow(
@@ -228,6 +284,35 @@ class DaprWorkflowClient:
         )
         return WorkflowState(state) if state else None
 
+    def completion_watcher(
+        self,
+        *,
+        max_concurrent_polls: int = DEFAULT_MAX_CONCURRENT_POLLS,
+        poll_timeout_in_seconds: float = DEFAULT_POLL_TIMEOUT_SECONDS,
+        fetch_payloads: bool = True,
+    ) -> CompletionWatcher:
+        """Creates a watcher that waits on many workflow instances at once.
+
+        Unlike calling :meth:`wait_for_workflow_completion` per instance, the watcher keeps
+        at most ``max_concurrent_polls`` long-polls open and rotates instances through them.
+
+        Args:
+            max_concurrent_polls: The number of completion long-polls to keep open at once.
+            poll_timeout_in_seconds: How long each long-poll waits before its instance yields
+                its turn to the next one.
+            fetch_payloads: If true, fetches the input, output payloads and custom status
+                of each completed instance.
+
+        Returns:
+            A CompletionWatcher bound to this client.
+        """
+        return CompletionWatcher(
+            self.__obj,
+            max_concurrent_polls=max_concurrent_polls,
+            poll_timeout_in_seconds=poll_timeout_in_seconds,
+            fetch_payloads=fetch_payloads,
+        )
+
     async def raise_workflow_event(
         self, instance_id: str, event_name: str, *, data: Optional[Any] = None
     ) -> None:
@@ -306,3 +391,247 @@ class DaprWorkflowClient:
             recursive: The optional flag to also purge data from all child workflows.
         """
         return await self.__obj.purge_orchestration(instance_id, recursive)
+
+    async def schedule_new_workflows(
+        self,
+        workflow: Union[Workflow, str],
+        instances: Union[
+            Iterable[tuple[Optional[str], Any]], AsyncIterable[tuple[Optional[str], Any]]
+        ],
+        *,
+        start_at: Optional[datetime] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[str]]:
+        """Schedules many instances of one workflow, ``max_concurrency`` RPCs at a time.
+
+        Args:
+            workflow: The workflow to schedule. Can be a workflow callable or a workflow name string.
+            instances: ``(instance_id, input)`` pairs, consumed lazily; may be an async
+            iterable. A ``None`` instance ID gets a new GUID, reported back in the item's result.
+            start_at: The time when the workflow instances should start executing.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            One result per item, in input order, holding the instance ID or the error.
+        """
+        return await run_bulk_async(
+            _with_instance_ids(instances),
+            lambda item: item[0],
+            lambda item: self.schedule_new_workflow(
+                workflow, input=item[1], instance_id=item[0], start_at=start_at
+            ),
+            max_concurrency,
+        )
+
+    async def get_workflow_states(
+        self,
+        instance_ids: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        fetch_payloads: bool = True,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[Optional[WorkflowState]]]:
+        """Fetches the state of many workflow instances, ``max_concurrency`` RPCs at a time.
+
+        Returns:
+            One result per instance ID, in input order. A missing instance has a ``None`` value.
+        """
+        return await run_bulk_async(
+            instance_ids,
+            str,
+            lambda instance_id: self.get_workflow_state(instance_id, fetch_payloads=fetch_payloads),
+            max_concurrency,
+        )
+
+    async def raise_workflow_events(
+        self,
+        instance_ids: Union[Iterable[str], AsyncIterable[str]],
+        event_name: str,
+        *,
+        data: Optional[Any] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[None]]:
+        """Sends the same event to many workflow instances, ``max_concurrency`` RPCs at a time.
+
+        Returns:
+            One result per instance ID, in input order, holding the error if the call failed.
+        """
+        return await run_bulk_async(
+            instance_ids,
+            str,
+            lambda instance_id: self.raise_workflow_event(instance_id, event_name, data=data),
+            max_concurrency,
+        )
+
+    async def terminate_workflows(
+        self,
+        instance_ids: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        output: Optional[Any] = None,
+        recursive: bool = True,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[None]]:
+        """Terminates many workflow instances, ``max_concurrency`` RPCs at a time.
+
+        Returns:
+            One result per instance ID, in input order, holding the error if the call failed.
+        """
+        return await run_bulk_async(
+            instance_ids,
+            str,
+            lambda instance_id: self.terminate_workflow(
+                instance_id, output=output, recursive=recursive
+            ),
+            max_concurrency,
+        )
+
+    async def purge_workflows(
+        self,
+        instance_ids: Union[Iterable[str], AsyncIterable[str]],
+        *,
+        recursive: bool = True,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[None]]:
+        """Purges many workflow instances by ID, ``max_concurrency`` RPCs at a time.
+
+        To purge by creation time or status instead, see :meth:`purge_workflows_by_filter`.
+
+        Returns:
+            One result per instance ID, in input order, holding the error if the call failed.
+        """
+        return await run_bulk_async(
+            instance_ids,
+            str,
+            lambda instance_id: self.purge_workflow(instance_id, recursive),
+            max_concurrency,
+        )
+
+    async def purge_workflows_by_filter(
+        self,
+        *,
+        created_time_from: Optional[datetime] = None,
+        created_time_to: Optional[datetime] = None,
+        runtime_statuses: Optional[Sequence[WorkflowStatus]] = None,
+        recursive: bool = True,
+    ) -> int:
+        """Purges every workflow instance matching a filter, server-side.
+
+        Uses the sidecar's ``PurgeInstances`` filter, so no instance IDs cross the wire.
+        Repeats the request while the sidecar reports a partial purge.
+
+        Args:
+            created_time_from: Only purge instances created at or after this time.
+            created_time_to: Only purge instances created before this time.
+            runtime_statuses: Only purge instances in one of these states.
+            recursive: The optional flag to also purge data from all child workflows.
+
+        Returns:
+            The number of instances purged.
+
+        Raises:
+            NotImplementedError: If the sidecar does not support purge filters.
+        """
+        statuses = [_to_orchestration_status(status) for status in runtime_statuses or ()]
+        purged = 0
+        while True:
+            try:
+                result = await self.__obj.purge_orchestrations_by(
+                    created_time_from, created_time_to, statuses, recursive
+                )
+            except AioRpcError as error:
+                if error.code() == StatusCode.UNIMPLEMENTED:
+                    raise NotImplementedError(
+                        'The sidecar does not support purging by filter; '
+                        'purge by instance ID with purge_workflows instead.'
+                    ) from error
+                raise
+            purged += result.deleted_instance_count
+            if result.is_complete is not False or result.deleted_instance_count == 0:
+                return purged
+
+    def list_workflow_instance_ids(
+        self, *, page_size: int = DEFAULT_LIST_PAGE_SIZE, prefetch: bool = True
+    ) -> AsyncIterator[str]:
+        """Iterates over the IDs of every workflow instance known to the sidecar.
+
+        IDs are fetched a page at a time with ``ListInstanceIDs``, so only the pages in hand are
+        held in memory. With ``prefetch`` the next page is requested while the current one is
+        being consumed.
+
+        Args:
+            page_size: The number of instance IDs to request per page.
+            prefetch: Whether to fetch the next page in the background.
+
+        Raises:
+            NotImplementedError: If the sidecar does not support listing instances.
+        """
+        pages = self._iter_instance_id_pages(page_size, prefetch)
+
+        async def instance_ids() -> AsyncIterator[str]:
+            async for page in pages:
+                for instance_id in page:
+                    yield instance_id
+
+        return instance_ids()
+
+    def list_workflow_states(
+        self,
+        *,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        fetch_payloads: bool = False,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        prefetch: bool = True,
+    ) -> AsyncIterator[BulkResult[Optional[WorkflowState]]]:
+        """Iterates over the state of every workflow instance known to the sidecar.
+
+        Each page of instance IDs is fetched as in :meth:`list_workflow_instance_ids` and its
+        states are then fetched ``max_concurrency`` at a time. Payloads are left out by default,
+        as housekeeping scans usually only look at status and timestamps.
+
+        Args:
+            page_size: The number of instance IDs to request per page.
+            fetch_payloads: Whether to fetch the input, output and custom status of each instance.
+            max_concurrency: The number of state lookups to run at once.
+            prefetch: Whether to fetch the next page of IDs in the background.
+
+        Returns:
+            One result per instance, numbered in listing order. An instance purged between the
+            listing and the lookup has a ``None`` value.
+
+        Raises:
+            NotImplementedError: If the sidecar does not support listing instances.
+        """
+        pages = self._iter_instance_id_pages(page_size, prefetch)
+
+        async def results() -> AsyncIterator[BulkResult[Optional[WorkflowState]]]:
+            offset = 0
+            async for page in pages:
+                for result in await run_bulk_async(
+                    page,
+                    str,
+                    lambda instance_id: self.get_workflow_state(
+                        instance_id, fetch_payloads=fetch_payloads
+                    ),
+                    max_concurrency,
+                    offset,
+                ):
+                    yield result
+                offset += len(page)
+
+        return results()
+
+    def _iter_instance_id_pages(self, page_size: int, prefetch: bool) -> AsyncIterator[list[str]]:
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+
+        async def fetch_page(token: Optional[str]) -> tuple[list[str], Optional[str]]:
+            try:
+                page = await self.__obj.list_instance_ids(page_size, token)
+            except AioRpcError as error:
+                if error.code() == StatusCode.UNIMPLEMENTED:
+                    raise NotImplementedError(
+                        'The sidecar does not support listing workflow instances.'
+                    ) from error
+                raise
+            return page.instance_ids, page.continuation_token
+
+        return iter_pages_async(fetch_page, prefetch)
@@ -19,13 +19,16 @@ import asyncio
 import logging
 import time
 import uuid
-from typing import Optional, Set
+from typing import Dict, Iterable, List, Optional, Set
 
 from dapr.ext.workflow.aio.dapr_workflow_client import DaprWorkflowClient
 from dapr.ext.workflow.mcp import (
+    _MAX_PARALLEL_DISCOVERIES,
     _MCP_METHOD_LIST_TOOLS,
     _SCHEDULE_RETRY_INTERVAL_SECONDS,
     MCP_WORKFLOW_PREFIX,
+    MCPToolCache,
+    MCPToolDef,
     _DaprMCPClientBase,
     _is_transient_schedule_error,
 )
@@ -45,6 +48,9 @@ class DaprMCPClient(_DaprMCPClientBase):
             workflow to complete.
         allowed_tools: Optional set of tool names to keep.
         wf_client: Optional pre-configured async :class:`DaprWorkflowClient`.
+        tool_cache: Optional :class:`~dapr.ext.workflow.mcp.MCPToolCache` to
+            reuse catalogues from.  Its state store, if any, is reached from a
+            worker thread so the event loop is never blocked.
 
     Example::
 
@@ -61,31 +67,132 @@ class DaprMCPClient(_DaprMCPClientBase):
         timeout_in_seconds: int = 60,
         allowed_tools: Optional[Set[str]] = None,
         wf_client: Optional[DaprWorkflowClient] = None,
+        tool_cache: Optional[MCPToolCache] = None,
     ) -> None:
         super().__init__(
             timeout_in_seconds=timeout_in_seconds,
             allowed_tools=allowed_tools,
+            tool_cache=tool_cache,
         )
         self._wf_client = wf_client or DaprWorkflowClient()
+        self._refresh_task: Optional[asyncio.Task] = None
 
-    async def connect(self, mcpserver_name: str) -> None:
+    async def connect(self, mcpserver_name: str, *, refresh: bool = False) -> None:
         """Discover tools from a Dapr MCPServer resource.
 
         Schedules ``dapr.internal.mcp.<name>.ListTools``, awaits workflow
         completion, and caches the resulting :class:`MCPToolDef` list.
+        With a ``tool_cache``, an unexpired cached catalogue is used instead.
 
         Args:
             mcpserver_name: Name of the ``MCPServer`` Dapr resource (must
                 match the ``metadata.name`` in the MCPServer YAML).
+            refresh: Discover the tools even if the ``tool_cache`` has them.
 
         Raises:
             RuntimeError: If the workflow times out or ends with a non-COMPLETED
                 status.
             ValueError: If *mcpserver_name* is empty.
         """
-        if not mcpserver_name or not mcpserver_name.strip():
-            raise ValueError('mcpserver_name must be a non-empty string')
+        (mcpserver_name,) = self._validate_server_names([mcpserver_name])
+        self._set_server_tools(mcpserver_name, await self._fetch_tools(mcpserver_name, refresh))
 
+    async def connect_many(self, mcpserver_names: Iterable[str], *, refresh: bool = False) -> None:
+        """Discover tools from several MCPServer resources concurrently.
+
+        Like :meth:`connect` for each server, with the ``ListTools`` workflows
+        awaited together.  Servers that connect are kept even if others fail.
+
+        Args:
+            mcpserver_names: Names of the ``MCPServer`` Dapr resources.
+            refresh: Discover the tools even if the ``tool_cache`` has them.
+
+        Raises:
+            RuntimeError: If any server could not be connected, listing each
+                failure.
+        """
+        names = self._validate_server_names(mcpserver_names)
+        limit = asyncio.Semaphore(_MAX_PARALLEL_DISCOVERIES)
+
+        async def fetch(name: str) -> List[MCPToolDef]:
+            async with limit:
+                return await self._fetch_tools(name, refresh)
+
+        results = await asyncio.gather(*(fetch(name) for name in names), return_exceptions=True)
+        failures: Dict[str, BaseException] = {}
+        for name, result in zip(names, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                failures[name] = result
+            else:
+                self._set_server_tools(name, result)
+        self._raise_for_failures(failures)
+
+    def start_background_refresh(self, interval_in_seconds: float) -> None:
+        """Rediscover the tools of every connected server periodically.
+
+        Runs as a task on the running event loop, which also refreshes the
+        ``tool_cache``.  A failed refresh is logged and keeps the previous tools.
+
+        Args:
+            interval_in_seconds: Time between refreshes.
+
+        Raises:
+            RuntimeError: If a background refresh is already running, or there
+                is no running event loop.
+        """
+        if interval_in_seconds <= 0:
+            raise ValueError('interval_in_seconds must be positive')
+        if self._refresh_task is not None and not self._refresh_task.done():
+            raise RuntimeError('A background refresh is already running')
+        self._refresh_task = asyncio.get_running_loop().create_task(
+            self._refresh_loop(interval_in_seconds)
+        )
+
+    async def stop_background_refresh(self) -> None:
+        """Stop the refresh started by :meth:`start_background_refresh`, if any."""
+        task, self._refresh_task = self._refresh_task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _refresh_loop(self, interval_in_seconds: float) -> None:
+        while True:
+            await asyncio.sleep(interval_in_seconds)
+            servers = self.get_connected_servers()
+            if not servers:
+                continue
+            try:
+                await self.connect_many(servers, refresh=True)
+            except Exception as exc:  # noqa: BLE001 — keep refreshing
+                logger.warning('Background refresh of MCP tools failed: %s', exc)
+
+    async def _fetch_tools(self, mcpserver_name: str, refresh: bool) -> List[MCPToolDef]:
+        """Returns a server's full catalogue from the tool cache or a ListTools run."""
+        cache = self._tool_cache
+        if cache is not None and not refresh:
+            tools = await self._call_cache(cache.get, mcpserver_name)
+            if tools is not None:
+                logger.debug("Using cached tools of MCPServer '%s'", mcpserver_name)
+                return tools
+        tools = await self._list_tools(mcpserver_name)
+        if cache is not None:
+            await self._call_cache(cache.put, mcpserver_name, tools)
+        return tools
+
+    async def _call_cache(self, method, *args):
+        """Calls a tool cache method, off the loop when it reaches a state store."""
+        if self._tool_cache is not None and self._tool_cache.persistent:
+            return await asyncio.to_thread(method, *args)
+        return method(*args)
+
+    async def _list_tools(self, mcpserver_name: str) -> List[MCPToolDef]:
+        """Runs the server's ListTools workflow and returns its full catalogue."""
         instance_id = str(uuid.uuid4())
         # TODO(@sicoyle): reminder to add a func like I have in durabletask-go to use for here instead of building like this!
         workflow_name = f'{MCP_WORKFLOW_PREFIX}{mcpserver_name}{_MCP_METHOD_LIST_TOOLS}'
@@ -137,4 +244,4 @@ class DaprMCPClient(_DaprMCPClientBase):
                 f'{state.serialized_output or ""}'
             )
 
-        self._process_list_tools_result(mcpserver_name, state.serialized_output)
+        return self._parse_list_tools_result(mcpserver_name, state.serialized_output)
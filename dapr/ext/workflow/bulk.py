@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar('T')
+TItem = TypeVar('TItem')
+
+# In-flight RPCs per bulk call unless the caller says otherwise.
+DEFAULT_BULK_CONCURRENCY = 32
+
+# Instance IDs requested per ListInstanceIDs call unless the caller says otherwise.
+DEFAULT_LIST_PAGE_SIZE = 1000
+
+# A page of items plus the token for the next page, or None on the last page.
+Page = tuple[list[T], Optional[str]]
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[T]):
+    """Outcome of one item of a bulk workflow operation.
+
+    Attributes:
+        index: Position of the item in the input.
+        instance_id: The workflow instance the item targeted.
+        value: What the single-instance call returned, if it succeeded.
+        error: The exception the single-instance call raised, if it failed.
+    """
+
+    index: int
+    instance_id: str
+    value: Optional[T] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _check_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError('max_concurrency must be at least 1')
+
+
+def run_bulk(
+    items: Iterable[TItem],
+    instance_id_of: Callable[[TItem], str],
+    call: Callable[[TItem], T],
+    max_concurrency: int,
+    start: int = 0,
+) -> list[BulkResult[T]]:
+    """Runs ``call`` for every item on a thread pool, ``max_concurrency`` at a time.
+
+    ``items`` is consumed lazily, so at most ``max_concurrency`` items are held at once.
+    Results come back in input order, numbered from ``start``.
+    """
+    _check_concurrency(max_concurrency)
+    results: list[BulkResult[T]] = []
+    pending: dict[Future, tuple[int, str]] = {}
+    source = enumerate(items, start)
+    with ThreadPoolExecutor(max_concurrency, thread_name_prefix='DaprWorkflowBulk') as pool:
+
+        def fill() -> None:
+            for index, item in source:
+                pending[pool.submit(call, item)] = (index, instance_id_of(item))
+                if len(pending) >= max_concurrency:
+                    return
+
+        fill()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, instance_id = pending.pop(future)
+                error = future.exception()
+                if error is None:
+                    results.append(BulkResult(index, instance_id, value=future.result()))
+                else:
+                    results.append(BulkResult(index, instance_id, error=error))  # type: ignore[arg-type]
+            fill()
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+async def run_bulk_async(
+    items: Union[Iterable[TItem], AsyncIterable[TItem]],
+    instance_id_of: Callable[[TItem], str],
+    call: Callable[[TItem], Awaitable[T]],
+    max_concurrency: int,
+    start: int = 0,
+) -> list[BulkResult[T]]:
+    """:func:`run_bulk` for coroutines, which may also take an async iterable."""
+    _check_concurrency(max_concurrency)
+    results: list[BulkResult[T]] = []
+    pending: dict[asyncio.Task, tuple[int, str]] = {}
+
+    async def collect(return_when: str) -> None:
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for done_task in done:
+            index, instance_id = pending.pop(done_task)
+            error = done_task.exception()
+            if error is None:
+                results.append(BulkResult(index, instance_id, value=done_task.result()))
+            elif isinstance(error, Exception):
+                results.append(BulkResult(index, instance_id, error=error))
+            else:
+                raise error
+
+    async def submit(index: int, item: TItem) -> None:
+        if len(pending) >= max_concurrency:
+            await collect(asyncio.FIRST_COMPLETED)
+        pending[asyncio.ensure_future(call(item))] = (index, instance_id_of(item))
+
+    try:
+        if isinstance(items, AsyncIterable):
+            index = start
+            async for item in items:
+                await submit(index, item)
+                index += 1
+        else:
+            for index, item in enumerate(items, start):
+                await submit(index, item)
+        if pending:
+            await collect(asyncio.ALL_COMPLETED)
+    finally:
+        for pending_task in pending:
+            pending_task.cancel()
+    results.sort(key=lambda result: result.index)
+    return results
+
+
+def iter_pages(fetch_page: Callable[[Optional[str]], Page[T]], prefetch: bool) -> Iterator[list[T]]:
+    """Follows continuation tokens through ``fetch_page`` and yields each non-empty page.
+
+    With ``prefetch`` the next page is requested on a background thread while the caller
+    works through the current one, so at most two pages are held at once.
+    """
+    if not prefetch:
+        token = None
+        while True:
+            items, token = fetch_page(token)
+            if items:
+                yield items
+            if token is None:
+                return
+
+    pool = ThreadPoolExecutor(1, thread_name_prefix='DaprWorkflowPrefetch')
+    future: Optional[Future] = pool.submit(fetch_page, None)
+    try:
+        while future is not None:
+            items, token = future.result()
+            future = pool.submit(fetch_page, token) if token is not None else None
+            if items:
+                yield items
+    finally:
+        if future is not None:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+async def iter_pages_async(
+    fetch_page: Callable[[Optional[str]], Awaitable[Page[T]]], prefetch: bool
+) -> AsyncIterator[list[T]]:
+    """:func:`iter_pages` for coroutines; the prefetch runs as a task on the running loop."""
+    if not prefetch:
+        token = None
+        while True:
+            items, token = await fetch_page(token)
+            if items:
+                yield items
+            if token is None:
+                return
+
+    task: Optional[asyncio.Future] = asyncio.ensure_future(fetch_page(None))
+    try:
+        while task is not None:
+            items, token = await task
+            task = asyncio.ensure_future(fetch_page(token)) if token is not None else None
+            if items:
+                yield items
+    finally:
+        if task is not None:
+            task.cancel()
@@ -15,11 +15,12 @@ limitations under the License.
 
 from __future__ import annotations
 
+import uuid
 from datetime import datetime
-from typing import Any, Optional, TypeVar, Union
+from typing import Any, Iterable, Iterator, Optional, Sequence, TypeVar, Union
 from warnings import warn
 
-from grpc import RpcError
+from grpc import RpcError, StatusCode
 
 from dapr.clients import DaprInternalError
 from dapr.clients.grpc.interceptors import DaprClientTimeoutInterceptor
@@ -27,10 +28,23 @@ from dapr.clients.http.client import DAPR_API_TOKEN_HEADER
 from dapr.conf import settings
 from dapr.conf.helpers import GrpcEndpoint
 from dapr.ext.workflow._durabletask import client
+from dapr.ext.workflow._durabletask.codecs import PayloadCodec
+from dapr.ext.workflow.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_LIST_PAGE_SIZE,
+    BulkResult,
+    iter_pages,
+    run_bulk,
+)
 from dapr.ext.workflow.logger import Logger, LoggerOptions
+from dapr.ext.workflow.payload_store import DEFAULT_PAYLOAD_THRESHOLD_BYTES, PayloadStore
 from dapr.ext.workflow.util import get_grpc_channel_options, getAddress
 from dapr.ext.workflow.workflow_context import Workflow
-from dapr.ext.workflow.workflow_state import WorkflowState
+from dapr.ext.workflow.workflow_state import (
+    WorkflowState,
+    WorkflowStatus,
+    _to_orchestration_status,
+)
 
 T = TypeVar('T')
 TInput = TypeVar('TInput')
@@ -53,6 +67,9 @@ class DaprWorkflowClient:
         port: Optional[str] = None,
         logger_options: Optional[LoggerOptions] = None,
         max_grpc_message_length: Optional[int] = None,
+        payload_store: Optional[PayloadStore] = None,
+        payload_threshold_bytes: int = DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+        codec: Optional[PayloadCodec] = None,
     ):
         """Initializes the sync workflow client.
 
@@ -67,6 +84,15 @@ class DaprWorkflowClient:
                 ``DAPR_GRPC_MAX_INBOUND_MESSAGE_SIZE_BYTES`` env var (if non-zero),
                 then the gRPC default (4 MiB). ``0`` in either source means
                 "no opinion" and falls through to the next source.
+            payload_store: The store the workflow runtime externalizes large payloads to.
+                Workflow inputs and outputs read through this client are loaded from it,
+                and scheduled inputs over ``payload_threshold_bytes`` are written to it.
+                Defaults to None.
+            payload_threshold_bytes: Encoded size above which a scheduled input is moved to
+                ``payload_store``. Defaults to 64 KiB.
+            codec: How scheduled workflow inputs are encoded. Inputs and outputs read
+                through this client are returned as plain JSON whatever codec wrote them.
+                Defaults to None (plain JSON through the ``json`` module).
         """
         address = getAddress(host, port)
 
@@ -90,6 +116,9 @@ class DaprWorkflowClient:
             log_formatter=options.log_formatter,
             interceptors=[DaprClientTimeoutInterceptor()],
             channel_options=channel_options,
+            payload_store=payload_store,
+            payload_threshold_bytes=payload_threshold_bytes,
+            codec=codec,
         )
 
     def schedule_new_workflow(
@@ -305,6 +334,241 @@ class DaprWorkflowClient:
         """
         return self.__obj.purge_orchestration(instance_id, recursive)
 
+    def schedule_new_workflows(
+        self,
+        workflow: Union[Workflow, str],
+        instances: Iterable[tuple[Optional[str], Any]],
+        *,
+        start_at: Optional[datetime] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[str]]:
+        """Schedules many instances of one workflow, ``max_concurrency`` RPCs at a time.
+
+        Args:
+            workflow: The workflow to schedule. Can be a workflow callable or a workflow name string.
+            instances: ``(instance_id, input)`` pairs, consumed lazily. A ``None`` instance ID
+            gets a new GUID, reported back in the item's result.
+            start_at: The time when the workflow instances should start executing.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            One result per item, in input order, holding the instance ID or the error.
+        """
+        return run_bulk(
+            ((instance_id or uuid.uuid4().hex, input) for instance_id, input in instances),
+            lambda item: item[0],
+            lambda item: self.schedule_new_workflow(
+                workflow, input=item[1], instance_id=item[0], start_at=start_at
+            ),
+            max_concurrency,
+        )
+
+    def get_workflow_states(
+        self,
+        instance_ids: Iterable[str],
+        *,
+        fetch_payloads: bool = True,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[Optional[WorkflowState]]]:
+        """Fetches the state of many workflow instances, ``max_concurrency`` RPCs at a time.
+
+        Returns:
+            One result per instance ID, in input order. A missing instance has a ``None`` value.
+        """
+        return run_bulk(
+            instance_ids,
+            str,
+            lambda instance_id: self.get_workflow_state(instance_id, fetch_payloads=fetch_payloads),
+            max_concurrency,
+        )
+
+    def raise_workflow_events(
+        self,
+        instance_ids: Iterable[str],
+        event_name: str,
+        *,
+        data: Optional[Any] = None,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[None]]:
+        """Sends the same event to many workflow instances, ``max_concurrency`` RPCs at a time.
+
+        Returns:
+            One result per instance ID, in input order, holding the error if the call failed.
+        """
+        return run_bulk(
+            instance_ids,
+            str,
+            lambda instance_id: self.raise_workflow_event(instance_id, event_name, data=data),
+            max_concurrency,
+        )
+
+    def terminate_workflows(
+        self,
+        instance_ids: Iterable[str],
+        *,
+        output: Optional[Any] = None,
+        recursive: bool = True,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[None]]:
+        """Terminates many workflow instances, ``max_concurrency`` RPCs at a time.
+
+        Returns:
+            One result per instance ID, in input order, holding the error if the call failed.
+        """
+        return run_bulk(
+            instance_ids,
+            str,
+            lambda instance_id: self.terminate_workflow(
+                instance_id, output=output, recursive=recursive
+            ),
+            max_concurrency,
+        )
+
+    def purge_workflows(
+        self,
+        instance_ids: Iterable[str],
+        *,
+        recursive: bool = True,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    ) -> list[BulkResult[None]]:
+        """Purges many workflow instances by ID, ``max_concurrency`` RPCs at a time.
+
+        To purge by creation time or status instead, see :meth:`purge_workflows_by_filter`.
+
+        Returns:
+            One result per instance ID, in input order, holding the error if the call failed.
+        """
+        return run_bulk(
+            instance_ids,
+            str,
+            lambda instance_id: self.purge_workflow(instance_id, recursive),
+            max_concurrency,
+        )
+
+    def purge_workflows_by_filter(
+        self,
+        *,
+        created_time_from: Optional[datetime] = None,
+        created_time_to: Optional[datetime] = None,
+        runtime_statuses: Optional[Sequence[WorkflowStatus]] = None,
+        recursive: bool = True,
+    ) -> int:
+        """Purges every workflow instance matching a filter, server-side.
+
+        Uses the sidecar's ``PurgeInstances`` filter, so no instance IDs cross the wire.
+        Repeats the request while the sidecar reports a partial purge.
+
+        Args:
+            created_time_from: Only purge instances created at or after this time.
+            created_time_to: Only purge instances created before this time.
+            runtime_statuses: Only purge instances in one of these states.
+            recursive: The optional flag to also purge data from all child workflows.
+
+        Returns:
+            The number of instances purged.
+
+        Raises:
+            NotImplementedError: If the sidecar does not support purge filters.
+        """
+        statuses = [_to_orchestration_status(status) for status in runtime_statuses or ()]
+        purged = 0
+        while True:
+            try:
+                result = self.__obj.purge_orchestrations_by(
+                    created_time_from, created_time_to, statuses, recursive
+                )
+            except RpcError as error:
+                if error.code() == StatusCode.UNIMPLEMENTED:
+                    raise NotImplementedError(
+                        'The sidecar does not support purging by filter; '
+                        'purge by instance ID with purge_workflows instead.'
+                    ) from error
+                raise
+            purged += result.deleted_instance_count
+            if result.is_complete is not False or result.deleted_instance_count == 0:
+                return purged
+
+    def list_workflow_instance_ids(
+        self, *, page_size: int = DEFAULT_LIST_PAGE_SIZE, prefetch: bool = True
+    ) -> Iterator[str]:
+        """Iterates over the IDs of every workflow instance known to the sidecar.
+
+        IDs are fetched a page at a time with ``ListInstanceIDs``, so only the pages in hand are
+        held in memory. With ``prefetch`` the next page is requested while the current one is
+        being consumed.
+
+        Args:
+            page_size: The number of instance IDs to request per page.
+            prefetch: Whether to fetch the next page in the background.
+
+        Raises:
+            NotImplementedError: If the sidecar does not support listing instances.
+        """
+        pages = self._iter_instance_id_pages(page_size, prefetch)
+        return (instance_id for page in pages for instance_id in page)
+
+    def list_workflow_states(
+        self,
+        *,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        fetch_payloads: bool = False,
+        max_concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        prefetch: bool = True,
+    ) -> Iterator[BulkResult[Optional[WorkflowState]]]:
+        """Iterates over the state of every workflow instance known to the sidecar.
+
+        Each page of instance IDs is fetched as in :meth:`list_workflow_instance_ids` and its
+        states are then fetched ``max_concurrency`` at a time. Payloads are left out by default,
+        as housekeeping scans usually only look at status and timestamps.
+
+        Args:
+            page_size: The number of instance IDs to request per page.
+            fetch_payloads: Whether to fetch the input, output and custom status of each instance.
+            max_concurrency: The number of state lookups to run at once.
+            prefetch: Whether to fetch the next page of IDs in the background.
+
+        Returns:
+            One result per instance, numbered in listing order. An instance purged between the
+            listing and the lookup has a ``None`` value.
+
+        Raises:
+            NotImplementedError: If the sidecar does not support listing instances.
+        """
+        pages = self._iter_instance_id_pages(page_size, prefetch)
+
+        def results() -> Iterator[BulkResult[Optional[WorkflowState]]]:
+            offset = 0
+            for page in pages:
+                yield from run_bulk(
+                    page,
+                    str,
+                    lambda instance_id: self.get_workflow_state(
+                        instance_id, fetch_payloads=fetch_payloads
+                    ),
+                    max_concurrency,
+                    offset,
+                )
+                offset += len(page)
+
+        return results()
+
+    def _iter_instance_id_pages(self, page_size: int, prefetch: bool) -> Iterator[list[str]]:
+        if page_size < 1:
+            raise ValueError('page_size must be at least 1')
+
+        def fetch_page(token: Optional[str]) -> tuple[list[str], Optional[str]]:
+            try:
+                page = self.__obj.list_instance_ids(page_size, token)
+            except RpcError as error:
+                if error.code() == StatusCode.UNIMPLEMENTED:
+                    raise NotImplementedError(
+                        'The sidecar does not support listing workflow instances.'
+                    ) from error
+                raise
+            return page.instance_ids, page.continuation_token
+
+        return iter_pages(fetch_page, prefetch)
+
     def close(self):
         """Closes the gRPC connection used by the client."""
         return self.__obj.close()
@@ -26,6 +26,7 @@ from dapr.ext.workflow.workflow_context import Workflow, WorkflowContext
 T = TypeVar('T')
 TInput = TypeVar('TInput')
 TOutput = TypeVar('TOutput')
+TAccumulator = TypeVar('TAccumulator')
 
 
 class DaprWorkflowContext(WorkflowContext):
@@ -177,6 +178,21 @@ def when_all(tasks: List[task.Task[T]]) -> task.WhenAllTask[T]:
     return task.when_all(tasks)
 
 
+def when_all_reduce(
+    tasks: List[task.Task[T]],
+    reducer: Callable[[TAccumulator, T], TAccumulator],
+    initial: TAccumulator,
+) -> task.WhenAllReduceTask[TAccumulator]:
+    """Returns a task that folds each task's result into ``initial`` with ``reducer`` as
+    it completes, and completes with the accumulated value once all of them have.
+
+    Use it instead of :func:`when_all` for large fan-outs whose results are aggregated,
+    so they are never all held in memory at once. Results are folded in completion
+    order, not in the order of ``tasks``.
+    """
+    return task.when_all_reduce(tasks, reducer, initial)
+
+
 def when_any(tasks: List[task.Task]) -> task.WhenAnyTask:
     """Returns a task that completes when any of the provided tasks complete or fail."""
     return task.when_any(tasks)
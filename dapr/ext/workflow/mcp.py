@@ -27,19 +27,31 @@ Usage::
     client.connect("weather")
     for tool in client.get_all_tools():
         print(tool.name, tool.description)
+
+Discovering several servers, reusing catalogues other clients and processes found::
+
+    cache = MCPToolCache(ttl_in_seconds=600, store_name="statestore")
+    client = DaprMCPClient(tool_cache=cache)
+    client.connect_many(["weather", "search", "calendar"])
+    client.start_background_refresh(300)
 """
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
+import math
+import threading
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import grpc
 
+from dapr.clients import DaprClient
 from dapr.ext.workflow.dapr_workflow_client import DaprWorkflowClient
 from dapr.ext.workflow.workflow_state import WorkflowStatus
 
@@ -60,6 +72,10 @@ _TRANSIENT_GRPC_CODES = frozenset(
     }
 )
 _SCHEDULE_RETRY_INTERVAL_SECONDS = 0.5
+# Most ListTools workflows connect_many waits on at once.
+_MAX_PARALLEL_DISCOVERIES = 32
+# Version of the layout of persisted tool catalogues, part of their state key.
+_TOOL_CACHE_FORMAT_VERSION = 1
 
 
 def _is_transient_schedule_error(exc: BaseException) -> bool:
@@ -102,6 +118,127 @@ class MCPToolDef:
     call_tool_workflow: str = ''
 
 
+class MCPToolCache:
+    """A TTL cache of the tools each MCPServer exposes, shared by the clients given it.
+
+    Clients look servers up here before scheduling a ``ListTools`` workflow, and store
+    what they discover. Catalogues are cached whole, so clients with different
+    ``allowed_tools`` can share a cache.
+
+    With ``store_name``, catalogues are also saved in that Dapr state store, so a
+    restarted process starts from the tools an earlier one found instead of rediscovering
+    them. State keys carry a format version, so entries written in another format are
+    ignored rather than misread. A state store failure is logged and treated as a cache
+    miss; it never fails a connect.
+
+    Args:
+        ttl_in_seconds: How long a discovered catalogue is used before it is discovered
+            again. Defaults to 300.
+        store_name: Name of a Dapr state store to persist catalogues in. Defaults to
+            None (in-memory only).
+        dapr_client: Client to reach the state store with. Defaults to a
+            :class:`DaprClient` created on first use.
+        key_prefix: Prefix of the state keys.
+    """
+
+    def __init__(
+        self,
+        ttl_in_seconds: float = 300.0,
+        *,
+        store_name: Optional[str] = None,
+        dapr_client: Optional[DaprClient] = None,
+        key_prefix: str = 'dapr-mcp-tools',
+    ) -> None:
+        if ttl_in_seconds <= 0:
+            raise ValueError('ttl_in_seconds must be positive')
+        self._ttl = ttl_in_seconds
+        self._store_name = store_name
+        self._client = dapr_client
+        self._key_prefix = key_prefix
+        self._state_metadata = {'ttlInSeconds': str(math.ceil(ttl_in_seconds))}
+        # Server name to (expiry as a wall-clock time, tools).
+        self._entries: Dict[str, Tuple[float, Tuple[MCPToolDef, ...]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def persistent(self) -> bool:
+        """Whether catalogues are also kept in a Dapr state store."""
+        return self._store_name is not None
+
+    def get(self, server_name: str) -> Optional[List[MCPToolDef]]:
+        """Returns the unexpired cached tools of a server, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(server_name)
+        if entry is not None and entry[0] > now:
+            return list(entry[1])
+        if not self.persistent:
+            return None
+        entry = self._load(server_name)
+        if entry is None or entry[0] <= now:
+            return None
+        with self._lock:
+            self._entries[server_name] = entry
+        return list(entry[1])
+
+    def put(self, server_name: str, tools: Iterable[MCPToolDef]) -> None:
+        """Caches the tools of a server for the cache's TTL."""
+        entry = (time.time() + self._ttl, tuple(tools))
+        with self._lock:
+            self._entries[server_name] = entry
+        if self.persistent:
+            self._save(server_name, entry)
+
+    def invalidate(self, server_name: str) -> None:
+        """Drops a server's catalogue, so the next connect discovers it again."""
+        with self._lock:
+            self._entries.pop(server_name, None)
+        if self.persistent:
+            try:
+                self._get_client().delete_state(self._store_name, self._key(server_name))
+            except Exception as exc:  # noqa: BLE001 — the cache is best effort
+                logger.warning(
+                    "Could not delete cached tools of MCPServer '%s': %s", server_name, exc
+                )
+
+    def _key(self, server_name: str) -> str:
+        return f'{self._key_prefix}||v{_TOOL_CACHE_FORMAT_VERSION}||{server_name}'
+
+    def _load(self, server_name: str) -> Optional[Tuple[float, Tuple[MCPToolDef, ...]]]:
+        try:
+            response = self._get_client().get_state(self._store_name, self._key(server_name))
+            if not response.data:
+                return None
+            data = json.loads(response.data)
+            tools = tuple(MCPToolDef(**tool) for tool in data['tools'])
+            return float(data['expiresAt']), tools
+        except Exception as exc:  # noqa: BLE001 — the cache is best effort
+            logger.warning("Could not load cached tools of MCPServer '%s': %s", server_name, exc)
+            return None
+
+    def _save(self, server_name: str, entry: Tuple[float, Tuple[MCPToolDef, ...]]) -> None:
+        expires_at, tools = entry
+        data = {
+            'expiresAt': expires_at,
+            'tools': [dataclasses.asdict(tool) for tool in tools],
+        }
+        try:
+            self._get_client().save_state(
+                self._store_name,
+                self._key(server_name),
+                json.dumps(data),
+                state_metadata=self._state_metadata,
+            )
+        except Exception as exc:  # noqa: BLE001 — the cache is best effort
+            logger.warning("Could not save cached tools of MCPServer '%s': %s", server_name, exc)
+
+    def _get_client(self) -> DaprClient:
+        with self._lock:
+            if self._client is None:
+                self._client = DaprClient()
+            return self._client
+
+
 class _DaprMCPClientBase:
     """Shared state and getters for sync/async MCP clients."""
 
@@ -110,17 +247,29 @@ class _DaprMCPClientBase:
         *,
         timeout_in_seconds: int = 60,
         allowed_tools: Optional[Set[str]] = None,
+        tool_cache: Optional[MCPToolCache] = None,
     ) -> None:
         if timeout_in_seconds <= 0:
             raise ValueError('timeout_in_seconds must be a positive integer')
         self._timeout = timeout_in_seconds
         self._allowed_tools = allowed_tools
+        self._tool_cache = tool_cache
         self._server_tools: Dict[str, List[MCPToolDef]] = {}
 
-    def _process_list_tools_result(
-        self, mcpserver_name: str, serialized_output: Optional[str]
-    ) -> None:
-        """Parse a ListTools workflow output and cache the MCPToolDef list."""
+    @staticmethod
+    def _validate_server_names(mcpserver_names: Iterable[str]) -> List[str]:
+        """Returns the names without duplicates, raising ValueError on empty ones."""
+        names = list(dict.fromkeys(mcpserver_names))
+        for name in names:
+            if not name or not name.strip():
+                raise ValueError('mcpserver_name must be a non-empty string')
+        return names
+
+    @staticmethod
+    def _parse_list_tools_result(
+        mcpserver_name: str, serialized_output: Optional[str]
+    ) -> List[MCPToolDef]:
+        """Parse a ListTools workflow output into the server's MCPToolDef list."""
         try:
             result = json.loads(serialized_output) if serialized_output else {}
         except json.JSONDecodeError as exc:
@@ -132,9 +281,6 @@ class _DaprMCPClientBase:
         tools: List[MCPToolDef] = []
         for tool_def in result.get('tools', []):
             name = tool_def.get('name', '')
-            if self._allowed_tools is not None and name not in self._allowed_tools:
-                logger.debug("Skipping tool '%s' (not in allowed_tools)", name)
-                continue
             # Workflow name includes the tool name for per-tool observability:
             # dapr.internal.mcp.<server>.CallTool.<tool>
             call_tool_wf = f'{MCP_WORKFLOW_PREFIX}{mcpserver_name}{_MCP_METHOD_CALL_TOOL}.{name}'
@@ -147,6 +293,15 @@ class _DaprMCPClientBase:
                     call_tool_workflow=call_tool_wf,
                 )
             )
+        return tools
+
+    def _set_server_tools(self, mcpserver_name: str, tools: List[MCPToolDef]) -> None:
+        """Keep the allowed tools of a server in the catalogue."""
+        if self._allowed_tools is not None:
+            for tool in tools:
+                if tool.name not in self._allowed_tools:
+                    logger.debug("Skipping tool '%s' (not in allowed_tools)", tool.name)
+            tools = [tool for tool in tools if tool.name in self._allowed_tools]
 
         self._server_tools[mcpserver_name] = tools
         logger.info(
@@ -155,6 +310,15 @@ class _DaprMCPClientBase:
             len(tools),
         )
 
+    @staticmethod
+    def _raise_for_failures(failures: Dict[str, BaseException]) -> None:
+        if not failures:
+            return
+        details = '; '.join(f"'{name}': {exc}" for name, exc in failures.items())
+        raise RuntimeError(
+            f'Failed to connect to {len(failures)} MCPServer(s): {details}'
+        ) from next(iter(failures.values()))
+
     def get_all_tools(self) -> List[MCPToolDef]:
         """Return all cached tools from every connected MCPServer."""
         return [t for tools in self._server_tools.values() for t in tools]
@@ -185,6 +349,9 @@ class DaprMCPClient(_DaprMCPClientBase):
             catalogue.  ``None`` (default) keeps all tools.
         wf_client: Optional pre-configured :class:`DaprWorkflowClient`.
             If omitted, a new client is created with default settings.
+        tool_cache: Optional :class:`MCPToolCache` to reuse catalogues from,
+            shared with the other clients given the same cache.  ``None``
+            (default) discovers every server on connect.
 
     Example::
 
@@ -203,34 +370,134 @@ class DaprMCPClient(_DaprMCPClientBase):
         timeout_in_seconds: int = 60,
         allowed_tools: Optional[Set[str]] = None,
         wf_client: Optional[DaprWorkflowClient] = None,
+        tool_cache: Optional[MCPToolCache] = None,
     ) -> None:
         super().__init__(
             timeout_in_seconds=timeout_in_seconds,
             allowed_tools=allowed_tools,
+            tool_cache=tool_cache,
         )
         self._wf_client = wf_client or DaprWorkflowClient()
+        self._refresh_stop: Optional[threading.Event] = None
+        self._refresh_thread: Optional[threading.Thread] = None
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def connect(self, mcpserver_name: str) -> None:
+    def connect(self, mcpserver_name: str, *, refresh: bool = False) -> None:
         """Discover tools from a Dapr MCPServer resource.
 
         Schedules ``dapr.internal.mcp.<name>.ListTools``, blocks until the
         workflow completes, and caches the resulting :class:`MCPToolDef` list.
+        With a ``tool_cache``, an unexpired cached catalogue is used instead.
 
         Args:
             mcpserver_name: Name of the ``MCPServer`` Dapr resource (must
                 match the ``metadata.name`` in the MCPServer YAML).
+            refresh: Discover the tools even if the ``tool_cache`` has them.
 
         Raises:
             RuntimeError: If the workflow times out or ends with a non-COMPLETED
                 status.
         """
-        if not mcpserver_name or not mcpserver_name.strip():
-            raise ValueError('mcpserver_name must be a non-empty string')
+        (mcpserver_name,) = self._validate_server_names([mcpserver_name])
+        self._set_server_tools(mcpserver_name, self._fetch_tools(mcpserver_name, refresh))
+
+    def connect_many(self, mcpserver_names: Iterable[str], *, refresh: bool = False) -> None:
+        """Discover tools from several MCPServer resources at once.
+
+        Like :meth:`connect` for each server, but the ``ListTools`` workflows
+        run concurrently, so startup waits for the slowest server rather than
+        for all of them in turn.  Servers that connect are kept even if others
+        fail.
+
+        Args:
+            mcpserver_names: Names of the ``MCPServer`` Dapr resources.
+            refresh: Discover the tools even if the ``tool_cache`` has them.
+
+        Raises:
+            RuntimeError: If any server could not be connected, listing each
+                failure.
+        """
+        names = self._validate_server_names(mcpserver_names)
+        if not names:
+            return
+        workers = min(len(names), _MAX_PARALLEL_DISCOVERIES)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='DaprMCP') as pool:
+            futures = {name: pool.submit(self._fetch_tools, name, refresh) for name in names}
+        failures: Dict[str, BaseException] = {}
+        for name, future in futures.items():
+            try:
+                self._set_server_tools(name, future.result())
+            except Exception as exc:  # noqa: BLE001 — reported together below
+                failures[name] = exc
+        self._raise_for_failures(failures)
+
+    def start_background_refresh(self, interval_in_seconds: float) -> None:
+        """Rediscover the tools of every connected server periodically.
+
+        Runs on a daemon thread, which also refreshes the ``tool_cache``, so
+        catalogues do not go stale and other clients sharing the cache find
+        them there.  A failed refresh is logged and keeps the previous tools.
+
+        Args:
+            interval_in_seconds: Time between refreshes.
+
+        Raises:
+            RuntimeError: If a background refresh is already running.
+        """
+        if interval_in_seconds <= 0:
+            raise ValueError('interval_in_seconds must be positive')
+        if self._refresh_thread is not None and self._refresh_thread.is_alive():
+            raise RuntimeError('A background refresh is already running')
+        stop = threading.Event()
+        self._refresh_stop = stop
+        self._refresh_thread = threading.Thread(
+            target=self._refresh_loop,
+            args=(interval_in_seconds, stop),
+            name='DaprMCPToolRefresh',
+            daemon=True,
+        )
+        self._refresh_thread.start()
 
+    def stop_background_refresh(self) -> None:
+        """Stop the refresh started by :meth:`start_background_refresh`, if any."""
+        if self._refresh_stop is not None:
+            self._refresh_stop.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join()
+        self._refresh_stop = self._refresh_thread = None
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _refresh_loop(self, interval_in_seconds: float, stop: threading.Event) -> None:
+        while not stop.wait(interval_in_seconds):
+            servers = self.get_connected_servers()
+            if not servers:
+                continue
+            try:
+                self.connect_many(servers, refresh=True)
+            except Exception as exc:  # noqa: BLE001 — keep refreshing
+                logger.warning('Background refresh of MCP tools failed: %s', exc)
+
+    def _fetch_tools(self, mcpserver_name: str, refresh: bool) -> List[MCPToolDef]:
+        """Returns a server's full catalogue from the tool cache or a ListTools run."""
+        cache = self._tool_cache
+        if cache is not None and not refresh:
+            tools = cache.get(mcpserver_name)
+            if tools is not None:
+                logger.debug("Using cached tools of MCPServer '%s'", mcpserver_name)
+                return tools
+        tools = self._list_tools(mcpserver_name)
+        if cache is not None:
+            cache.put(mcpserver_name, tools)
+        return tools
+
+    def _list_tools(self, mcpserver_name: str) -> List[MCPToolDef]:
+        """Runs the server's ListTools workflow and returns its full catalogue."""
         instance_id = str(uuid.uuid4())
         # TODO(@sicoyle): reminder to add a func like I have in durabletask-go to use for here instead of building like this!
         workflow_name = f'{MCP_WORKFLOW_PREFIX}{mcpserver_name}{_MCP_METHOD_LIST_TOOLS}'
@@ -282,4 +549,4 @@ class DaprMCPClient(_DaprMCPClientBase):
                 f'{state.serialized_output or ""}'
             )
 
-        self._process_list_tools_result(mcpserver_name, state.serialized_output)
+        return self._parse_list_tools_result(mcpserver_name, state.serialized_output)
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+from dapr.clients import DaprClient
+from dapr.ext.workflow._durabletask.payloads import (
+    DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+    PayloadStore,
+    PayloadStoreError,
+)
+
+__all__ = [
+    'DEFAULT_PAYLOAD_THRESHOLD_BYTES',
+    'DaprStatePayloadStore',
+    'PayloadStore',
+    'PayloadStoreError',
+]
+
+
+class DaprStatePayloadStore(PayloadStore):
+    """Keeps large workflow payloads in a Dapr state store.
+
+    Pass the same store to :class:`WorkflowRuntime` and to every :class:`DaprWorkflowClient`
+    that reads the workflows' inputs and outputs. Payloads are not deleted when a workflow
+    is purged; set ``ttl_in_seconds`` on a store that supports it to expire them.
+    """
+
+    def __init__(
+        self,
+        store_name: str,
+        *,
+        ttl_in_seconds: Optional[int] = None,
+        dapr_client: Optional[DaprClient] = None,
+    ):
+        """Initializes the payload store.
+
+        Args:
+            store_name: Name of the Dapr state store component to keep payloads in.
+            ttl_in_seconds: Optional time-to-live for stored payloads.
+            dapr_client: Client to reach the state store with. Defaults to a
+                :class:`DaprClient` created on first use, so the store can be handed to a
+                runtime that forks worker processes.
+        """
+        self._store_name = store_name
+        self._state_metadata = (
+            {'ttlInSeconds': str(ttl_in_seconds)} if ttl_in_seconds is not None else {}
+        )
+        self._client = dapr_client
+        self._lock = threading.Lock()
+
+    def save(self, key: str, payload: str) -> None:
+        self._get_client().save_state(
+            self._store_name, key, payload, state_metadata=self._state_metadata
+        )
+
+    def load(self, key: str) -> str:
+        response = self._get_client().get_state(self._store_name, key)
+        if not response.data:
+            raise KeyError(key)
+        return response.text()
+
+    def _get_client(self) -> DaprClient:
+        with self._lock:
+            if self._client is None:
+                self._client = DaprClient()
+            return self._client
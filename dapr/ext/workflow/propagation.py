@@ -23,7 +23,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional, Sequence
 
 import dapr.ext.workflow._durabletask.internal.helpers as pbh
 import dapr.ext.workflow._durabletask.internal.protos as pb
@@ -87,65 +87,161 @@ def _string_value_or_none(sv: Optional[pb.wrappers_pb2.StringValue]) -> Optional
     return sv.value
 
 
-def _resolve_activity(
-    events: list[pb.HistoryEvent], schedule_event: pb.HistoryEvent
-) -> ActivityResult:
-    """Build an ActivityResult by matching TaskCompleted/TaskFailed against the
-    given TaskScheduled event's eventId. SDK retries reuse taskExecutionId, so
-    we match on the scheduling event ID instead."""
-    ts = schedule_event.taskScheduled
-    schedule_id = schedule_event.eventId
-    completed = False
-    failed = False
-    output: Optional[str] = None
-    error: Optional[pb.TaskFailureDetails] = None
-    for e in events:
-        if e.HasField('taskCompleted') and e.taskCompleted.taskScheduledId == schedule_id:
-            completed = True
-            output = _string_value_or_none(e.taskCompleted.result)
-        elif e.HasField('taskFailed') and e.taskFailed.taskScheduledId == schedule_id:
-            failed = True
-            error = e.taskFailed.failureDetails
-    return ActivityResult(
-        name=ts.name,
-        started=True,
-        completed=completed,
-        failed=failed,
-        input=_string_value_or_none(ts.input),
-        output=output,
-        error=error,
-    )
+class _HistoryChunk:
+    """One workflow's slice of a propagated history.
 
+    The chunk's ``rawEvents`` are parsed on first access, and indexed once for the
+    :class:`WorkflowResult` queries on first query, so work items whose code never
+    reads the propagated history pay nothing for it.
+    """
 
-def _resolve_child_workflow(
-    events: list[pb.HistoryEvent], creation_event_id: int, name: str
-) -> ChildWorkflowResult:
-    completed = False
-    failed = False
-    output: Optional[str] = None
-    error: Optional[pb.TaskFailureDetails] = None
-    for e in events:
-        if (
-            e.HasField('childWorkflowInstanceCompleted')
-            and e.childWorkflowInstanceCompleted.taskScheduledId == creation_event_id
-        ):
-            completed = True
-            output = _string_value_or_none(e.childWorkflowInstanceCompleted.result)
-        elif (
-            e.HasField('childWorkflowInstanceFailed')
-            and e.childWorkflowInstanceFailed.taskScheduledId == creation_event_id
-        ):
-            failed = True
-            error = e.childWorkflowInstanceFailed.failureDetails
-    return ChildWorkflowResult(
-        name=name,
-        started=True,
-        completed=completed,
-        failed=failed,
-        output=output,
-        error=error,
+    __slots__ = (
+        'position',
+        'app_id',
+        'instance_id',
+        'workflow_name',
+        '_raw_events',
+        '_events',
+        '_scheduled',
+        '_task_completed',
+        '_task_failed',
+        '_children_created',
+        '_child_completed',
+        '_child_failed',
     )
 
+    def __init__(
+        self,
+        position: int,
+        app_id: str,
+        instance_id: str,
+        workflow_name: str,
+        raw_events: Sequence[bytes],
+    ):
+        self.position = position
+        self.app_id = app_id
+        self.instance_id = instance_id
+        self.workflow_name = workflow_name
+        self._raw_events = raw_events
+        self._events: Optional[list[pb.HistoryEvent]] = None
+        self._scheduled: Optional[dict[str, list[pb.HistoryEvent]]] = None
+
+    def __reduce__(self):
+        # Activities in worker processes get a copy; the proto container does not pickle.
+        return (
+            _HistoryChunk,
+            (
+                self.position,
+                self.app_id,
+                self.instance_id,
+                self.workflow_name,
+                list(self._raw_events),
+            ),
+        )
+
+    @property
+    def events(self) -> list[pb.HistoryEvent]:
+        """The chunk's events, parsed on first access.
+
+        Raises:
+            ValueError: If a ``rawEvents`` entry cannot be decoded.
+        """
+        if self._events is None:
+            events = []
+            for j, raw in enumerate(self._raw_events):
+                event = pb.HistoryEvent()
+                try:
+                    event.ParseFromString(raw)
+                except Exception as ex:
+                    raise ValueError(
+                        f'propagated history: chunk {self.position} (app {self.app_id!r}): '
+                        f'failed to decode rawEvent {j}: {ex}'
+                    ) from ex
+                events.append(event)
+            self._events = events
+        return self._events
+
+    def _build_index(self) -> None:
+        scheduled: dict[str, list[pb.HistoryEvent]] = {}
+        children: dict[str, list[pb.HistoryEvent]] = {}
+        task_completed: dict[int, pb.HistoryEvent] = {}
+        task_failed: dict[int, pb.HistoryEvent] = {}
+        child_completed: dict[int, pb.HistoryEvent] = {}
+        child_failed: dict[int, pb.HistoryEvent] = {}
+        # Later outcomes for the same scheduling event win, as in a linear scan.
+        for e in self.events:
+            kind = e.WhichOneof('eventType')
+            if kind == 'taskScheduled':
+                scheduled.setdefault(e.taskScheduled.name, []).append(e)
+            elif kind == 'taskCompleted':
+                task_completed[e.taskCompleted.taskScheduledId] = e
+            elif kind == 'taskFailed':
+                task_failed[e.taskFailed.taskScheduledId] = e
+            elif kind == 'childWorkflowInstanceCreated':
+                children.setdefault(e.childWorkflowInstanceCreated.name, []).append(e)
+            elif kind == 'childWorkflowInstanceCompleted':
+                child_completed[e.childWorkflowInstanceCompleted.taskScheduledId] = e
+            elif kind == 'childWorkflowInstanceFailed':
+                child_failed[e.childWorkflowInstanceFailed.taskScheduledId] = e
+        self._children_created = children
+        self._task_completed = task_completed
+        self._task_failed = task_failed
+        self._child_completed = child_completed
+        self._child_failed = child_failed
+        self._scheduled = scheduled
+
+    def activities(self, name: str) -> list[ActivityResult]:
+        if self._scheduled is None:
+            self._build_index()
+        return [self._resolve_activity(e) for e in self._scheduled.get(name, ())]
+
+    def child_workflows(self, name: str) -> list[ChildWorkflowResult]:
+        if self._scheduled is None:
+            self._build_index()
+        return [
+            self._resolve_child_workflow(e.eventId, name)
+            for e in self._children_created.get(name, ())
+        ]
+
+    def _resolve_activity(self, schedule_event: pb.HistoryEvent) -> ActivityResult:
+        """Build an ActivityResult by matching TaskCompleted/TaskFailed against the
+        given TaskScheduled event's eventId. SDK retries reuse taskExecutionId, so
+        we match on the scheduling event ID instead."""
+        ts = schedule_event.taskScheduled
+        completed = self._task_completed.get(schedule_event.eventId)
+        failed = self._task_failed.get(schedule_event.eventId)
+        return ActivityResult(
+            name=ts.name,
+            started=True,
+            completed=completed is not None,
+            failed=failed is not None,
+            input=_string_value_or_none(ts.input),
+            output=(
+                _string_value_or_none(completed.taskCompleted.result)
+                if completed is not None
+                else None
+            ),
+            error=failed.taskFailed.failureDetails if failed is not None else None,
+        )
+
+    def _resolve_child_workflow(self, creation_event_id: int, name: str) -> ChildWorkflowResult:
+        completed = self._child_completed.get(creation_event_id)
+        failed = self._child_failed.get(creation_event_id)
+        return ChildWorkflowResult(
+            name=name,
+            started=True,
+            completed=completed is not None,
+            failed=failed is not None,
+            output=(
+                _string_value_or_none(completed.childWorkflowInstanceCompleted.result)
+                if completed is not None
+                else None
+            ),
+            error=(
+                failed.childWorkflowInstanceFailed.failureDetails if failed is not None else None
+            ),
+        )
+
 
 @dataclass(frozen=True)
 class WorkflowResult:
@@ -159,7 +255,7 @@ class WorkflowResult:
     instance_id: str
     app_id: str
     name: str
-    _events: list[pb.HistoryEvent] = field(repr=False)
+    _chunk: _HistoryChunk = field(repr=False)
 
     def get_activities_by_name(self, name: str) -> list[ActivityResult]:
         """Return every activity in this chunk whose scheduled name matches, in
@@ -167,11 +263,7 @@ class WorkflowResult:
 
         See also: :meth:`get_last_activity_by_name` for the most recent match only.
         """
-        return [
-            _resolve_activity(self._events, e)
-            for e in self._events
-            if e.HasField('taskScheduled') and e.taskScheduled.name == name
-        ]
+        return self._chunk.activities(name)
 
     def get_last_activity_by_name(self, name: str) -> ActivityResult:
         """Return the most recent activity in this chunk whose name matches.
@@ -195,12 +287,7 @@ class WorkflowResult:
 
         See also: :meth:`get_last_child_workflow_by_name` for the most recent match.
         """
-        return [
-            _resolve_child_workflow(self._events, e.eventId, name)
-            for e in self._events
-            if e.HasField('childWorkflowInstanceCreated')
-            and e.childWorkflowInstanceCreated.name == name
-        ]
+        return self._chunk.child_workflows(name)
 
     def get_last_child_workflow_by_name(self, name: str) -> ChildWorkflowResult:
         """Return the most recent child workflow in this chunk whose name matches.
@@ -218,13 +305,13 @@ class WorkflowResult:
         return all_results[-1]
 
 
-@dataclass(frozen=True)
-class _HistoryChunk:
-    app_id: str
-    instance_id: str
-    workflow_name: str
-    start_event_index: int
-    event_count: int
+def _index_by(
+    chunks: list[_HistoryChunk], key: Callable[[_HistoryChunk], str]
+) -> dict[str, list[_HistoryChunk]]:
+    index: dict[str, list[_HistoryChunk]] = {}
+    for c in chunks:
+        index.setdefault(key(c), []).append(c)
+    return index
 
 
 class PropagatedHistory:
@@ -235,68 +322,58 @@ class PropagatedHistory:
     the oldest ancestor, the last chunk is the immediate parent. Use the
     ``get_*`` methods to slice the chain by app, instance, or workflow name.
 
+    Chunks are indexed by app, instance and workflow name up front, but their
+    events are only parsed when first read, so a query parses only the chunks
+    it returns.
+
     Attributes:
-        events: All propagated history events, flattened in chunk order.
-            Treat as read-only; mutating the list breaks the chunk index.
         scope: The propagation scope used to produce this history.
     """
 
-    def __init__(
-        self,
-        events: list[pb.HistoryEvent],
-        scope: PropagationScope,
-        chunks: list[_HistoryChunk],
-    ):
-        self.events = events
+    def __init__(self, scope: PropagationScope, chunks: list[_HistoryChunk]):
         self.scope = scope
         self._chunks = chunks
+        self._events: Optional[list[pb.HistoryEvent]] = None
+        self._by_app_id = _index_by(chunks, lambda c: c.app_id)
+        self._by_instance_id = _index_by(chunks, lambda c: c.instance_id)
+        self._by_workflow_name = _index_by(chunks, lambda c: c.workflow_name)
+
+    @property
+    def events(self) -> list[pb.HistoryEvent]:
+        """All propagated history events, flattened in chunk order.
+
+        Parses every chunk on first access. Treat as read-only.
+
+        Raises:
+            ValueError: If a ``rawEvents`` entry cannot be decoded.
+        """
+        if self._events is None:
+            self._events = [event for c in self._chunks for event in c.events]
+        return self._events
 
     def get_app_ids(self) -> list[str]:
         """Ordered, deduplicated list of app IDs in the history chain."""
-        seen: set[str] = set()
-        result: list[str] = []
-        for c in self._chunks:
-            if c.app_id not in seen:
-                seen.add(c.app_id)
-                result.append(c.app_id)
-        return result
-
-    def _chunk_events(self, chunk: _HistoryChunk) -> list[pb.HistoryEvent]:
-        return self.events[chunk.start_event_index : chunk.start_event_index + chunk.event_count]
+        return list(self._by_app_id)
 
     def get_events_by_app_id(self, app_id: str) -> list[pb.HistoryEvent]:
         """Events produced by the given app, in execution order."""
-        return [
-            event
-            for chunk in self._chunks
-            if chunk.app_id == app_id
-            for event in self._chunk_events(chunk)
-        ]
+        return [event for c in self._by_app_id.get(app_id, ()) for event in c.events]
 
     def get_events_by_instance_id(self, instance_id: str) -> list[pb.HistoryEvent]:
         """Events produced by the given workflow instance, in execution order."""
-        return [
-            event
-            for chunk in self._chunks
-            if chunk.instance_id == instance_id
-            for event in self._chunk_events(chunk)
-        ]
+        return [event for c in self._by_instance_id.get(instance_id, ()) for event in c.events]
 
     def get_events_by_workflow_name(self, workflow_name: str) -> list[pb.HistoryEvent]:
         """Events produced by workflows with the given name, in execution order."""
-        return [
-            event
-            for chunk in self._chunks
-            if chunk.workflow_name == workflow_name
-            for event in self._chunk_events(chunk)
-        ]
+        return [event for c in self._by_workflow_name.get(workflow_name, ()) for event in c.events]
 
-    def _make_workflow_result(self, chunk: _HistoryChunk) -> WorkflowResult:
+    @staticmethod
+    def _make_workflow_result(chunk: _HistoryChunk) -> WorkflowResult:
         return WorkflowResult(
             instance_id=chunk.instance_id,
             app_id=chunk.app_id,
             name=chunk.workflow_name,
-            _events=self._chunk_events(chunk),
+            _chunk=chunk,
         )
 
     def get_workflows(self) -> list[WorkflowResult]:
@@ -311,7 +388,7 @@ class PropagatedHistory:
         See also: :meth:`get_last_workflow_by_name` for a single-result helper that
         returns only the most recent match.
         """
-        return [self._make_workflow_result(c) for c in self._chunks if c.workflow_name == name]
+        return [self._make_workflow_result(c) for c in self._by_workflow_name.get(name, ())]
 
     def get_last_workflow_by_name(self, name: str) -> WorkflowResult:
         """Most recent workflow in the chain whose name matches.
@@ -332,9 +409,9 @@ class PropagatedHistory:
     ) -> Optional[PropagatedHistory]:
         """Build a :class:`PropagatedHistory` from the wire-form proto.
 
-        Each chunk's ``rawEvents`` are parsed once and the per-chunk events are
-        concatenated into a single ordered list. Returns ``None`` when the
-        proto itself is ``None``.
+        Only chunk metadata is read here; each chunk's ``rawEvents`` are parsed
+        when its events are first read. Returns ``None`` when the proto itself
+        is ``None``.
 
         Validation policy:
 
@@ -345,47 +422,21 @@ class PropagatedHistory:
           only by the query helpers. Some sidecars may not populate
           ``workflowName`` at all, so they are accepted as empty rather than
           rejected here.
-        * A ``rawEvents`` entry that fails to decode is fatal for the entire
-          history: a chunk's ``HistoryEvent`` count and the indices used by
-          downstream queries are derived from this loop, so silently dropping
-          a bad event would leave the structure internally inconsistent (e.g.
-          a TaskCompleted without its TaskScheduled). Fail at the trust
-          boundary instead.
+        * A ``rawEvents`` entry that fails to decode is fatal for its whole
+          chunk: every read of the chunk's events, directly or through a query,
+          raises rather than returning a partial chunk whose queries would be
+          internally inconsistent (e.g. a TaskCompleted without its
+          TaskScheduled). Fail at the trust boundary instead.
 
         Raises:
-            ValueError: If the proto is structurally malformed (empty
-                ``appId`` or an unparseable ``rawEvents`` entry).
+            ValueError: If a chunk has an empty ``appId``.
         """
         if propagated_history is None:
             return None
 
-        events: list[pb.HistoryEvent] = []
         chunks: list[_HistoryChunk] = []
         for i, c in enumerate(propagated_history.chunks):
             if not c.appId:
                 raise ValueError(f'propagated history: chunk {i} has empty appId')
-            start = len(events)
-            for j, raw in enumerate(c.rawEvents):
-                event = pb.HistoryEvent()
-                try:
-                    event.ParseFromString(raw)
-                except Exception as ex:
-                    raise ValueError(
-                        f'propagated history: chunk {i} (app {c.appId!r}): '
-                        f'failed to decode rawEvent {j}: {ex}'
-                    ) from ex
-                events.append(event)
-            chunks.append(
-                _HistoryChunk(
-                    app_id=c.appId,
-                    instance_id=c.instanceId,
-                    workflow_name=c.workflowName,
-                    start_event_index=start,
-                    event_count=len(events) - start,
-                )
-            )
-        return cls(
-            events=events,
-            scope=PropagationScope(propagated_history.scope),
-            chunks=chunks,
-        )
+            chunks.append(_HistoryChunk(i, c.appId, c.instanceId, c.workflowName, c.rawEvents))
+        return cls(scope=PropagationScope(propagated_history.scope), chunks=chunks)
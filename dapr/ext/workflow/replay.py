@@ -0,0 +1,517 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import time
+import tracemalloc
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Optional, Sequence, Union
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import worker
+from dapr.ext.workflow._durabletask.internal import timer as timer_helpers
+from dapr.ext.workflow.workflow_context import Workflow
+
+# Events the sidecar commits after a turn to confirm its actions, rather than deliver to it.
+_CONFIRMATION_EVENTS = frozenset(
+    {
+        'taskScheduled',
+        'timerCreated',
+        'childWorkflowInstanceCreated',
+        'detachedWorkflowInstanceCreated',
+        'eventSent',
+        'executionCompleted',
+        'workflowCompleted',
+        'continueAsNew',
+        'executionStalled',
+    }
+)
+
+# Recorded histories start here, so they are the same on every run.
+_RECORDING_START = datetime(2025, 1, 1)
+
+
+@dataclass(frozen=True)
+class TurnCost:
+    """The cost of one orchestration turn, run on the live execution of the previous one.
+
+    Attributes:
+        turn: The turn's 1-based position in the history.
+        committed_events: Events committed since the previous turn that the turn applied
+            first, such as the confirmations of the previous turn's actions.
+        new_events: Events delivered to the turn.
+        seconds: Time the turn took.
+    """
+
+    turn: int
+    committed_events: int
+    new_events: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class HotFrame:
+    """A function the profiler saw during a full replay, in ``pstats`` terms."""
+
+    function: str
+    calls: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    """What replaying a history cost.
+
+    Attributes:
+        events: Events in the history.
+        turns: Cost of each turn run incrementally, as a worker with sticky execution runs
+            them.
+        replay_seconds: Best time to replay the whole history from scratch, as a worker
+            does after a restart or an eviction.
+        peak_bytes: Peak memory traced during one full replay, if allocations were traced.
+        allocated_blocks: Memory blocks allocated by one full replay and still held by its
+            result, if allocations were traced.
+        allocated_bytes: Size of those blocks.
+        hot_frames: Functions with the most own time during one full replay, if it was
+            profiled.
+    """
+
+    events: int
+    turns: tuple[TurnCost, ...]
+    replay_seconds: float
+    peak_bytes: Optional[int] = None
+    allocated_blocks: Optional[int] = None
+    allocated_bytes: Optional[int] = None
+    hot_frames: tuple[HotFrame, ...] = ()
+
+    @property
+    def per_event_seconds(self) -> float:
+        """Full replay time per history event."""
+        return self.replay_seconds / self.events if self.events else 0.0
+
+    @property
+    def per_turn_seconds(self) -> float:
+        """Mean incremental turn time."""
+        return sum(t.seconds for t in self.turns) / len(self.turns) if self.turns else 0.0
+
+    @property
+    def max_turn_seconds(self) -> float:
+        return max((t.seconds for t in self.turns), default=0.0)
+
+    def format(self) -> str:
+        """Returns the report as text, for printing."""
+        lines = [
+            f'events: {self.events}, turns: {len(self.turns)}',
+            f'full replay: {self.replay_seconds * 1e3:.3f}ms'
+            f' ({self.per_event_seconds * 1e6:.2f}us/event)',
+            f'incremental turns: mean {self.per_turn_seconds * 1e6:.1f}us,'
+            f' max {self.max_turn_seconds * 1e6:.1f}us',
+        ]
+        if self.peak_bytes is not None:
+            lines.append(
+                f'allocations: peak {self.peak_bytes:,} bytes,'
+                f' {self.allocated_blocks:,} blocks ({self.allocated_bytes:,} bytes) retained'
+            )
+        if self.hot_frames:
+            lines.append(f'{"calls":>10} {"self s":>10} {"cum s":>10}  function')
+            for frame in self.hot_frames:
+                lines.append(
+                    f'{frame.calls:>10} {frame.self_seconds:>10.4f}'
+                    f' {frame.cumulative_seconds:>10.4f}  {frame.function}'
+                )
+        return '\n'.join(lines)
+
+
+def split_turns(
+    history: Sequence[pb.HistoryEvent],
+) -> list[tuple[list[pb.HistoryEvent], list[pb.HistoryEvent]]]:
+    """Splits a history into turns.
+
+    A turn starts at each ``workflowStarted`` event. Returns, per turn, the events
+    delivered to it and the events committed after it to confirm its actions.
+    """
+    turns: list[tuple[list[pb.HistoryEvent], list[pb.HistoryEvent]]] = []
+    for event in history:
+        kind = event.WhichOneof('eventType')
+        if kind == 'workflowStarted' or not turns:
+            turns.append(([], []))
+        delivered, confirmed = turns[-1]
+        (confirmed if kind in _CONFIRMATION_EVENTS else delivered).append(event)
+    return turns
+
+
+class WorkflowReplayer:
+    """Records and replays workflow histories in process, without a sidecar.
+
+    Replays run through the same executor as a running :class:`WorkflowRuntime`, with its
+    registered workflows, codec and payload store, so the cost they measure is the cost
+    the runtime pays. Get one from :meth:`WorkflowRuntime.replayer`.
+    """
+
+    def __init__(self, task_hub_worker: worker.TaskHubGrpcWorker):
+        self._worker = task_hub_worker
+
+    def record(
+        self,
+        workflow: Union[Workflow, str],
+        input: Any = None,
+        *,
+        instance_id: str = 'replay',
+        results: Optional[Callable[[str, Any], Any]] = None,
+        events: Iterable[tuple[str, Any]] = (),
+        completions_per_turn: Optional[int] = None,
+        generations: int = 1,
+        max_turns: int = 1_000_000,
+    ) -> list[list[pb.HistoryEvent]]:
+        """Runs a workflow against a simulated sidecar and returns the history it writes.
+
+        Each turn, completions of activities and child workflows are delivered first; when
+        there are none, the next of ``events`` is raised; when there are none of those
+        either, the earliest timer fires and the clock moves to it.
+
+        Args:
+            workflow: The registered workflow, or its name.
+            input: The workflow input.
+            instance_id: The instance ID of the recorded workflow.
+            results: Called with the name and input of every activity and child workflow to
+                get its result. An exception it raises fails the task. Defaults to
+                returning None.
+            events: ``(name, data)`` pairs to raise as external events, in order.
+            completions_per_turn: How many completions to deliver per turn. Defaults to
+                None, meaning all that are outstanding.
+            generations: How many times to follow ``continue_as_new``.
+            max_turns: Turns after which recording stops with a ``RuntimeError``.
+
+        Returns:
+            One history per generation.
+
+        Raises:
+            ValueError: If the workflow waits for something the recording cannot deliver,
+                or produces an action it cannot simulate.
+        """
+        if completions_per_turn is not None and completions_per_turn < 1:
+            raise ValueError('completions_per_turn must be at least 1')
+        name = workflow if isinstance(workflow, str) else _workflow_name(workflow)
+        codec = self._worker._codec
+        recorder = _Recorder(codec, results, deque(events), completions_per_turn, max_turns)
+        histories = []
+        encoded_input = codec.encode(input) if input is not None else None
+        carryover: list[pb.HistoryEvent] = []
+        for _ in range(generations):
+            history, continued = recorder.record_generation(
+                self._worker._new_orchestration_executor(),
+                name,
+                instance_id,
+                encoded_input,
+                carryover,
+            )
+            histories.append(history)
+            if continued is None:
+                break
+            encoded_input, carryover = continued
+        return histories
+
+    def benchmark(
+        self,
+        history: Sequence[pb.HistoryEvent],
+        *,
+        instance_id: Optional[str] = None,
+        rounds: int = 3,
+        profile: bool = False,
+        trace_allocations: bool = False,
+        top_frames: int = 20,
+    ) -> ReplayReport:
+        """Measures what replaying a history costs.
+
+        Args:
+            history: A recorded history, from :meth:`record` or a sidecar.
+            instance_id: The instance ID to replay as. Defaults to the one in the history.
+            rounds: Repetitions of each measurement; the best is reported.
+            profile: Also profile one full replay with cProfile and report its hot frames.
+            trace_allocations: Also trace one full replay with tracemalloc and report its
+                peak and retained memory.
+            top_frames: How many hot frames to report.
+        """
+        if rounds < 1:
+            raise ValueError('rounds must be at least 1')
+        turns = split_turns(history)
+        if not turns:
+            raise ValueError('The history is empty')
+        if instance_id is None:
+            instance_id = _instance_id(history)
+        last_delivered = turns[-1][0]
+        committed = list(history[: len(history) - len(last_delivered) - len(turns[-1][1])])
+
+        def replay() -> Any:
+            executor = self._worker._new_orchestration_executor()
+            return executor.execute(instance_id, committed, last_delivered)
+
+        replay_seconds = min(_timed(replay) for _ in range(rounds))
+        turn_costs = [
+            min(costs)
+            for costs in zip(*(self._run_turns(instance_id, turns) for _ in range(rounds)))
+        ]
+
+        report: dict[str, Any] = {}
+        if trace_allocations:
+            report.update(_trace_allocations(replay))
+        if profile:
+            report['hot_frames'] = _profile(replay, top_frames)
+        return ReplayReport(
+            events=len(history),
+            turns=tuple(
+                TurnCost(i + 1, committed_events, new_events, seconds)
+                for i, (committed_events, new_events, seconds) in enumerate(turn_costs)
+            ),
+            replay_seconds=replay_seconds,
+            **report,
+        )
+
+    def _run_turns(
+        self,
+        instance_id: str,
+        turns: list[tuple[list[pb.HistoryEvent], list[pb.HistoryEvent]]],
+    ) -> list[tuple[int, int, float]]:
+        executor = self._worker._new_orchestration_executor()
+        costs = []
+        confirmed: list[pb.HistoryEvent] = []
+        for i, (delivered, next_confirmed) in enumerate(turns):
+            start = time.perf_counter()
+            if i == 0:
+                executor.execute(instance_id, [], delivered)
+            else:
+                executor.execute_delta(confirmed, delivered)
+            costs.append((len(confirmed), len(delivered), time.perf_counter() - start))
+            confirmed = next_confirmed
+        return costs
+
+
+class _Recorder:
+    def __init__(
+        self,
+        codec,
+        results: Optional[Callable[[str, Any], Any]],
+        events: deque,
+        completions_per_turn: Optional[int],
+        max_turns: int,
+    ):
+        self._codec = codec
+        self._results = results if results is not None else (lambda name, input: None)
+        self._events = events
+        self._completions_per_turn = completions_per_turn
+        self._max_turns = max_turns
+
+    def record_generation(
+        self,
+        executor: Any,
+        name: str,
+        instance_id: str,
+        encoded_input: Optional[str],
+        carryover: list[pb.HistoryEvent],
+    ) -> tuple[list[pb.HistoryEvent], Optional[tuple[Optional[str], list[pb.HistoryEvent]]]]:
+        now = _RECORDING_START
+        history: list[pb.HistoryEvent] = []
+        completions: deque[pb.HistoryEvent] = deque()
+        timers: list[tuple[datetime, pb.HistoryEvent]] = []
+        delivered = [
+            helpers.new_workflow_started_event(now),
+            helpers.new_execution_started_event(name, instance_id, encoded_input),
+            *carryover,
+        ]
+        confirmed: list[pb.HistoryEvent] = []
+        for turn in range(self._max_turns):
+            if turn == 0:
+                result = executor.execute(instance_id, [], delivered)
+            else:
+                result = executor.execute_delta(confirmed, delivered)
+            history.extend(delivered)
+            confirmed = []
+            for action in result.actions:
+                kind = action.WhichOneof('workflowActionType')
+                if kind == 'completeWorkflow':
+                    complete = action.completeWorkflow
+                    history.append(
+                        pb.HistoryEvent(
+                            eventId=-1,
+                            executionCompleted=pb.ExecutionCompletedEvent(
+                                workflowStatus=complete.workflowStatus,
+                                result=complete.result if complete.HasField('result') else None,
+                                failureDetails=(
+                                    complete.failureDetails
+                                    if complete.HasField('failureDetails')
+                                    else None
+                                ),
+                            ),
+                        )
+                    )
+                    if complete.workflowStatus == pb.ORCHESTRATION_STATUS_CONTINUED_AS_NEW:
+                        new_input = complete.result.value if complete.HasField('result') else None
+                        return history, (new_input, list(complete.carryoverEvents))
+                    return history, None
+                confirmed.extend(self._apply(action, kind, completions, timers))
+            history.extend(confirmed)
+            delivered_events, now = self._next_events(completions, timers, now)
+            if not delivered_events:
+                raise ValueError(
+                    f"Workflow '{name}' is waiting after {turn + 1} turn(s), but there is"
+                    f' nothing left to deliver to it'
+                )
+            delivered = [helpers.new_workflow_started_event(now), *delivered_events]
+        raise RuntimeError(f"Workflow '{name}' did not complete within {self._max_turns} turns")
+
+    def _apply(
+        self,
+        action: pb.WorkflowAction,
+        kind: Optional[str],
+        completions: deque,
+        timers: list,
+    ) -> list[pb.HistoryEvent]:
+        if kind == 'scheduleTask':
+            schedule = action.scheduleTask
+            encoded = schedule.input.value if schedule.HasField('input') else None
+            try:
+                output = self._result(schedule.name, encoded)
+                completions.append(helpers.new_task_completed_event(action.id, output))
+            except Exception as ex:
+                completions.append(helpers.new_task_failed_event(action.id, ex))
+            return [helpers.new_task_scheduled_event(action.id, schedule.name, encoded)]
+        if kind == 'createChildWorkflow':
+            create = action.createChildWorkflow
+            encoded = create.input.value if create.HasField('input') else None
+            try:
+                output = self._result(create.name, encoded)
+                completions.append(helpers.new_child_workflow_completed_event(action.id, output))
+            except Exception as ex:
+                completions.append(helpers.new_child_workflow_failed_event(action.id, ex))
+            return [
+                helpers.new_child_workflow_created_event(
+                    action.id, create.name, create.instanceId, encoded
+                )
+            ]
+        if kind == 'createTimer':
+            create_timer = action.createTimer
+            created = timer_helpers.new_timer_created_event(action.id, create_timer.fireAt)
+            origin = create_timer.WhichOneof('origin')
+            if origin is not None:
+                getattr(created.timerCreated, origin).CopyFrom(getattr(create_timer, origin))
+            # The sentinel timer of an indefinite wait_for_external_event never fires.
+            if not timer_helpers.is_optional_timer_action(action):
+                timers.append(
+                    (
+                        create_timer.fireAt.ToDatetime(),
+                        timer_helpers.new_timer_fired_event(action.id, create_timer.fireAt),
+                    )
+                )
+            return [created]
+        if kind == 'sendEvent':
+            send = action.sendEvent
+            return [
+                pb.HistoryEvent(
+                    eventId=action.id,
+                    eventSent=pb.EventSentEvent(
+                        instanceId=send.instance.instanceId, name=send.name, input=send.data
+                    ),
+                )
+            ]
+        raise ValueError(f"Cannot record a '{kind}' action")
+
+    def _result(self, name: str, encoded_input: Optional[str]) -> Optional[str]:
+        value = self._results(
+            name, self._codec.decode(encoded_input) if encoded_input is not None else None
+        )
+        return self._codec.encode(value) if value is not None else None
+
+    def _next_events(
+        self, completions: deque, timers: list, now: datetime
+    ) -> tuple[list[pb.HistoryEvent], datetime]:
+        now += timedelta(seconds=1)
+        if completions:
+            count = self._completions_per_turn or len(completions)
+            return [completions.popleft() for _ in range(min(count, len(completions)))], now
+        if self._events:
+            name, data = self._events.popleft()
+            encoded = self._codec.encode(data) if data is not None else None
+            return [helpers.new_event_raised_event(name, encoded)], now
+        if timers:
+            timers.sort(key=lambda t: t[0])
+            fire_at = timers[0][0]
+            fired = [event for at, event in timers if at == fire_at]
+            timers[:] = [(at, event) for at, event in timers if at != fire_at]
+            return fired, max(now, fire_at)
+        return [], now
+
+
+def _workflow_name(fn: Workflow) -> str:
+    return fn.__dict__.get('_dapr_alternate_name') or fn.__name__
+
+
+def _instance_id(history: Sequence[pb.HistoryEvent]) -> str:
+    for event in history:
+        if event.HasField('executionStarted'):
+            return event.executionStarted.workflowInstance.instanceId
+    return 'replay'
+
+
+def _timed(fn: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _trace_allocations(fn: Callable[[], Any]) -> dict[str, int]:
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.take_snapshot()
+        baseline, _ = tracemalloc.get_traced_memory()
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+        del result
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+    diff = [stat for stat in after.compare_to(before, 'filename') if stat.count_diff > 0]
+    return {
+        'peak_bytes': peak - baseline,
+        'allocated_blocks': sum(stat.count_diff for stat in diff),
+        'allocated_bytes': sum(stat.size_diff for stat in diff if stat.size_diff > 0),
+    }
+
+
+def _profile(fn: Callable[[], Any], top: int) -> tuple[HotFrame, ...]:
+    profiler = cProfile.Profile()
+    profiler.runcall(fn)
+    stats = pstats.Stats(profiler).stats  # type: ignore[attr-defined]
+    ranked = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:top]
+    return tuple(
+        HotFrame(
+            function=f'{os.path.basename(filename)}:{line}({function})',
+            calls=calls,
+            self_seconds=self_seconds,
+            cumulative_seconds=cumulative_seconds,
+        )
+        for (filename, line, function), (_, calls, self_seconds, cumulative_seconds, _) in ranked
+    )
@@ -13,6 +13,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import importlib
 import inspect
 import time
 from functools import wraps
@@ -20,15 +21,21 @@ from typing import Any, Awaitable, Callable, Optional, Sequence, TypeVar, Union
 
 import grpc
 
+from dapr.aio.clients.grpc.interceptors import DaprClientTimeoutInterceptorAsync
 from dapr.clients import DaprInternalError
 from dapr.clients.grpc.interceptors import DaprClientTimeoutInterceptor
 from dapr.clients.http.client import DAPR_API_TOKEN_HEADER
 from dapr.conf import settings
 from dapr.conf.helpers import GrpcEndpoint
 from dapr.ext.workflow._durabletask import task, worker
+from dapr.ext.workflow._durabletask.codecs import PayloadCodec
 from dapr.ext.workflow._durabletask.internal.shared import is_async_callable as _is_async_callable
+from dapr.ext.workflow._durabletask.metrics import WorkerMetrics
+from dapr.ext.workflow._worker_supervisor import _WorkerSupervisor
 from dapr.ext.workflow.dapr_workflow_context import DaprWorkflowContext
 from dapr.ext.workflow.logger import Logger, LoggerOptions
+from dapr.ext.workflow.payload_store import DEFAULT_PAYLOAD_THRESHOLD_BYTES, PayloadStore
+from dapr.ext.workflow.replay import WorkflowReplayer
 from dapr.ext.workflow.util import get_grpc_channel_options, getAddress
 from dapr.ext.workflow.workflow_activity_context import Activity, WorkflowActivityContext
 from dapr.ext.workflow.workflow_context import Workflow
@@ -60,6 +67,11 @@ def _coerce_activity_input(inp: object | None, input_model: type | None) -> obje
     return _model_protocol.coerce_to_model(inp, input_model)
 
 
+def _log_activity_failure(logger: Logger, ctx: task.ActivityContext, exc: Exception) -> None:
+    activity_id = getattr(ctx, 'task_id', 'unknown')
+    logger.warning(f'Activity execution failed - task_id: {activity_id}, error: {exc}')
+
+
 def _make_activity_wrapper(fn: Activity, logger: Logger) -> ActivityWrapper:
     """Wrap a user activity for the durabletask worker.
 
@@ -74,10 +86,6 @@ def _make_activity_wrapper(fn: Activity, logger: Logger) -> ActivityWrapper:
             return (wf_ctx,)
         return (wf_ctx, _coerce_activity_input(inp, input_model))
 
-    def _log_failure(ctx: task.ActivityContext, exc: Exception) -> None:
-        activity_id = getattr(ctx, 'task_id', 'unknown')
-        logger.warning(f'Activity execution failed - task_id: {activity_id}, error: {exc}')
-
     is_async = _is_async_callable(fn)
     activity_name = getattr(fn, '__name__', repr(fn))
     kind = 'async' if is_async else 'sync'
@@ -90,7 +98,7 @@ def _make_activity_wrapper(fn: Activity, logger: Logger) -> ActivityWrapper:
             try:
                 return await fn(*_call_args(ctx, inp))
             except Exception as exc:
-                _log_failure(ctx, exc)
+                _log_activity_failure(logger, ctx, exc)
                 raise
 
         return async_activity_wrapper
@@ -99,12 +107,65 @@ def _make_activity_wrapper(fn: Activity, logger: Logger) -> ActivityWrapper:
         try:
             return fn(*_call_args(ctx, inp))
         except Exception as exc:
-            _log_failure(ctx, exc)
+            _log_activity_failure(logger, ctx, exc)
             raise
 
     return sync_activity_wrapper
 
 
+class _ProcessActivityWrapper:
+    """Sync activity wrapper that can be sent to a worker process.
+
+    The closure from :func:`_make_activity_wrapper` cannot be pickled, so this wrapper
+    pickles the user function as a reference to its module and qualified name, resolved
+    again (through ``@wfr.activity``'s replacement, if any) in the worker process. The
+    logger goes by name and level; a worker process logs through its default handler.
+    """
+
+    def __init__(self, fn: Activity, logger: Logger):
+        qualname = getattr(fn, '__qualname__', '')
+        if not qualname or '<locals>' in qualname or '<lambda>' in qualname:
+            raise ValueError(
+                f'Activity {getattr(fn, "__name__", fn)!r} must be a module-level function '
+                "to run with executor='process'."
+            )
+        if _is_async_callable(fn):
+            raise ValueError(
+                f'Activity {fn.__name__!r} is async; only sync activities can run with '
+                "executor='process'."
+            )
+        self._module = fn.__module__
+        self._qualname = qualname
+        self._logger = logger
+        self._bind(fn)
+
+    def _bind(self, fn: Activity) -> None:
+        self._fn = fn
+        self._accepts_input, self._input_model = _model_protocol.resolve_input(fn)
+
+    def __getstate__(self) -> tuple[str, str, str, Any]:
+        options = self._logger.get_options()
+        return self._module, self._qualname, self._logger._logger.name, options.log_level
+
+    def __setstate__(self, state: tuple[str, str, str, Any]) -> None:
+        self._module, self._qualname, logger_name, log_level = state
+        self._logger = Logger(logger_name, LoggerOptions(log_level=log_level))
+        target: Any = importlib.import_module(self._module)
+        for part in self._qualname.split('.'):
+            target = getattr(target, part)
+        self._bind(getattr(target, '_dapr_activity_fn', target))
+
+    def __call__(self, ctx: task.ActivityContext, inp: object | None = None) -> object:
+        wf_ctx = WorkflowActivityContext(ctx)
+        try:
+            if not self._accepts_input:
+                return self._fn(wf_ctx)
+            return self._fn(wf_ctx, _coerce_activity_input(inp, self._input_model))
+        except Exception as exc:
+            _log_activity_failure(self._logger, ctx, exc)
+            raise
+
+
 class WorkflowRuntime:
     """WorkflowRuntime is the entry point for registering workflows and activities."""
 
@@ -117,12 +178,29 @@ class WorkflowRuntime:
         maximum_concurrent_activity_work_items: Optional[int] = None,
         maximum_concurrent_orchestration_work_items: Optional[int] = None,
         maximum_thread_pool_workers: Optional[int] = None,
+        maximum_process_pool_workers: Optional[int] = None,
+        process_activity_timeout: Optional[float] = None,
         worker_ready_timeout: Optional[float] = None,
         max_grpc_message_length: Optional[int] = None,
         disable_stateful_history: bool = False,
         history_cache_ttl: Optional[float] = None,
         history_cache_max_instances: Optional[int] = None,
         history_cache_max_bytes: Optional[int] = None,
+        history_cache_serialized: bool = True,
+        enable_sticky_execution: bool = False,
+        sticky_execution_max_instances: Optional[int] = None,
+        use_grpc_aio: bool = False,
+        aio_interceptors: Optional[Sequence[Any]] = None,
+        worker_processes: int = 1,
+        adaptive_concurrency: bool = False,
+        minimum_concurrent_activity_work_items: Optional[int] = None,
+        minimum_concurrent_orchestration_work_items: Optional[int] = None,
+        payload_store: Optional[PayloadStore] = None,
+        payload_threshold_bytes: int = DEFAULT_PAYLOAD_THRESHOLD_BYTES,
+        codec: Optional[PayloadCodec] = None,
+        max_actions_per_turn: Optional[int] = None,
+        max_action_bytes_per_turn: Optional[int] = None,
+        metrics: Optional[WorkerMetrics] = None,
     ):
         """Initializes the workflow runtime.
 
@@ -142,6 +220,12 @@ class WorkflowRuntime:
             maximum_thread_pool_workers: Size of the worker's thread pool for
                 executing sync activities. ``None`` lets the durabletask worker
                 pick a default.
+            maximum_process_pool_workers: Number of worker processes for activities
+                registered with ``executor='process'``. ``None`` uses ``cpu_count``.
+            process_activity_timeout: Seconds a process-pool activity may run before
+                it is failed. A call that times out while running restarts the process
+                pool, which also fails the other activities running on it. ``None`` (the
+                default) means no timeout.
             worker_ready_timeout: Seconds to wait in :meth:`start` for the
                 worker's gRPC stream to be ready. Defaults to 30s.
             max_grpc_message_length: Maximum gRPC message size in bytes for the
@@ -162,6 +246,66 @@ class WorkflowRuntime:
                 worker default (100,000).
             history_cache_max_bytes: Total byte budget across cached histories,
                 LRU-evicted beyond that. ``None`` or ``0`` means unbounded.
+            history_cache_serialized: Keep cached histories in their compact wire
+                form, parsing events only while replaying them. Defaults to True;
+                False keeps parsed events, trading memory for replay speed.
+            enable_sticky_execution: Keep each workflow's live generator in memory
+                between turns instead of replaying its full history on every turn, so
+                workflow code runs once rather than once per turn. Defaults to False
+                (every turn replays).
+            sticky_execution_max_instances: Maximum number of live workflow
+                executions kept in memory, LRU-evicted beyond that. ``None`` uses
+                the worker default (10,000).
+            use_grpc_aio: Run the work-item stream and all sidecar calls on a
+                ``grpc.aio`` channel on the worker's event loop instead of a reader
+                thread and blocking calls. Defaults to False.
+            aio_interceptors: Additional ``grpc.aio`` client interceptors, used
+                instead of ``interceptors`` when ``use_grpc_aio`` is set. The
+                built-in ``DaprClientTimeoutInterceptorAsync`` is always appended
+                after these.
+            worker_processes: Number of worker processes :meth:`start` forks, each
+                with its own work-item stream, history cache and concurrency limits,
+                so workflow replay scales past one core. Register everything before
+                :meth:`start`, and start before creating any other gRPC client in
+                this process. Requires the ``fork`` start method. Defaults to 1
+                (the worker runs in this process).
+            adaptive_concurrency: Let the activity and orchestration work-item limits
+                move at runtime with completion latency and sidecar deadline errors,
+                between the ``minimum_*`` and ``maximum_*`` bounds. The current limits
+                are exposed as :attr:`concurrency_limits`. Defaults to False.
+            minimum_concurrent_activity_work_items: Lower bound, and starting point,
+                of the adaptive activity limit. ``None`` uses ``cpu_count``.
+            minimum_concurrent_orchestration_work_items: Same, for orchestrations.
+            payload_store: Store for activity inputs, child workflow inputs and workflow
+                results whose encoded JSON exceeds ``payload_threshold_bytes``, for example
+                a :class:`DaprStatePayloadStore`. History then carries a small reference
+                instead, keeping replay and history transfers cheap. Clients that read
+                these workflows' outputs need the same store. Payloads sent to other apps,
+                child workflow results and activity outputs stay inline, as their readers
+                may run in other apps; see ``externalize_output`` in
+                :meth:`register_activity` to move activity outputs too. Defaults to None.
+            payload_threshold_bytes: Encoded size above which a payload is moved to
+                ``payload_store``. Defaults to 64 KiB.
+            codec: How workflow and activity inputs and top-level workflow results are
+                encoded in history, for example :class:`OrjsonCodec` for faster JSON, or
+                :class:`MsgpackCodec` or a ``compression_threshold_bytes`` for smaller
+                histories. Payloads written with any codec can be read by all of them, so
+                the codec can be changed while workflows are running. Activity outputs and
+                child workflow results, which callers in other apps or SDKs may read,
+                always use plain JSON, as do inputs sent to other apps. Defaults to None
+                (plain JSON through the ``json`` module).
+            max_actions_per_turn: Most activities and child workflows a workflow schedules
+                per turn. Beyond that, they stay pending and are scheduled in later turns as
+                earlier ones complete. Defaults to None (no limit).
+            max_action_bytes_per_turn: Encoded size of a turn's actions beyond which further
+                activities and child workflows are held back for later turns, so very large
+                fan-outs fit in one gRPC message. Defaults to three quarters of
+                ``max_grpc_message_length`` (or of 4 MiB when unset); 0 disables the limit.
+            metrics: Receives, for every work item, how long it waited for a concurrency
+                slot, how its history was obtained and how long that took, its replay,
+                execution and completion times, and its event and action counts. Use
+                :class:`OpenTelemetryWorkerMetrics` or :class:`PrometheusWorkerMetrics` to
+                export them. Defaults to None (nothing is measured).
         """
         self._logger = Logger('WorkflowRuntime', logger_options)
         self._worker_ready_timeout = 30.0 if worker_ready_timeout is None else worker_ready_timeout
@@ -181,11 +325,18 @@ class WorkflowRuntime:
         if interceptors:
             all_interceptors.extend(interceptors)
         all_interceptors.append(DaprClientTimeoutInterceptor())
+        all_aio_interceptors = list(aio_interceptors or [])
+        all_aio_interceptors.append(DaprClientTimeoutInterceptorAsync())
         channel_options = get_grpc_channel_options(max_grpc_message_length)
         concurrency_options = worker.ConcurrencyOptions(
             maximum_concurrent_activity_work_items=maximum_concurrent_activity_work_items,
             maximum_concurrent_orchestration_work_items=maximum_concurrent_orchestration_work_items,
             maximum_thread_pool_workers=maximum_thread_pool_workers,
+            maximum_process_pool_workers=maximum_process_pool_workers,
+            process_activity_timeout=process_activity_timeout,
+            adaptive_concurrency=adaptive_concurrency,
+            minimum_concurrent_activity_work_items=minimum_concurrent_activity_work_items,
+            minimum_concurrent_orchestration_work_items=minimum_concurrent_orchestration_work_items,
         )
         self.__worker = worker.TaskHubGrpcWorker(
             host_address=uri.endpoint,
@@ -202,6 +353,22 @@ class WorkflowRuntime:
             history_cache_ttl=history_cache_ttl or 0,
             history_cache_max_instances=history_cache_max_instances or 0,
             history_cache_max_bytes=history_cache_max_bytes or 0,
+            history_cache_serialized=history_cache_serialized,
+            enable_sticky_execution=enable_sticky_execution,
+            sticky_execution_max_instances=sticky_execution_max_instances or 0,
+            use_grpc_aio=use_grpc_aio,
+            aio_interceptors=all_aio_interceptors,
+            payload_store=payload_store,
+            payload_threshold_bytes=payload_threshold_bytes,
+            codec=codec,
+            max_actions_per_turn=max_actions_per_turn,
+            max_action_bytes_per_turn=max_action_bytes_per_turn,
+            metrics=metrics,
+        )
+        self._supervisor = (
+            _WorkerSupervisor(self.__worker, worker_processes, self._logger)
+            if worker_processes != 1
+            else None
         )
 
     def register_workflow(self, fn: Workflow, *, name: Optional[str] = None):
@@ -291,15 +458,34 @@ class WorkflowRuntime:
         )
         fn.__dict__['_workflow_registered'] = True
 
-    def register_activity(self, fn: Activity, *, name: Optional[str] = None):
+    def register_activity(
+        self,
+        fn: Activity,
+        *,
+        name: Optional[str] = None,
+        executor: str = 'thread',
+        externalize_output: bool = False,
+    ):
         """Register a workflow activity. ``def`` and ``async def`` are both supported.
         Async activities run on the worker's event loop. Sync activities run in the
-        thread pool sized by ``maximum_thread_pool_workers``.
+        thread pool sized by ``maximum_thread_pool_workers``, or with
+        ``executor='process'`` in the worker process pool sized by
+        ``maximum_process_pool_workers``, for CPU-bound work the GIL would serialize.
+        A process activity must be a module-level function with picklable input and
+        output.
+
+        Activity outputs stay inline in history by default, since the workflows calling
+        the activity may run in other apps. ``externalize_output=True`` moves outputs
+        over ``payload_threshold_bytes`` to the runtime's ``payload_store``; every app
+        that calls the activity must then share that store.
         """
         effective_name = name or fn.__name__
         self._logger.info(f"Registering activity '{effective_name}' with runtime")
 
-        activity_wrapper = _make_activity_wrapper(fn, self._logger)
+        if executor == 'process':
+            activity_wrapper = _ProcessActivityWrapper(fn, self._logger)
+        else:
+            activity_wrapper = _make_activity_wrapper(fn, self._logger)
 
         if hasattr(fn, '_activity_registered'):
             # whenever an activity is registered, it has a _dapr_alternate_name attribute
@@ -314,15 +500,46 @@ class WorkflowRuntime:
             fn.__dict__['_dapr_alternate_name'] = name if name else fn.__name__
 
         self.__worker._registry.add_named_activity(
-            fn.__dict__['_dapr_alternate_name'], activity_wrapper
+            fn.__dict__['_dapr_alternate_name'],
+            activity_wrapper,
+            executor=executor,
+            externalize_output=externalize_output,
         )
         fn.__dict__['_activity_registered'] = True
 
+    @property
+    def history_cache_stats(self) -> worker.HistoryCacheStats:
+        """Size and hit/eviction counters of the worker's stateful-history cache.
+
+        With ``worker_processes`` > 1, the sum over the worker processes, refreshed
+        by each of them about every half second.
+        """
+        if self._supervisor is not None:
+            return self._supervisor.history_cache_stats()
+        return self.__worker.history_cache_stats
+
+    @property
+    def concurrency_limits(self) -> worker.ConcurrencyLimits:
+        """Current work-item limits and in-flight counts of the worker.
+
+        With ``worker_processes`` > 1, the sum over the worker processes, refreshed
+        like :attr:`history_cache_stats`.
+        """
+        if self._supervisor is not None:
+            return self._supervisor.concurrency_limits()
+        return self.__worker.concurrency_limits
+
+    def replayer(self) -> WorkflowReplayer:
+        """Returns a replayer that records and benchmarks histories of this runtime's
+        workflows offline, with the runtime's codec and payload store."""
+        return WorkflowReplayer(self.__worker)
+
     def wait_for_worker_ready(self, timeout: float = 30.0) -> bool:
         """
         Wait for the worker's gRPC stream to become ready to receive work items.
         This method polls the worker's is_worker_ready() method until it returns True
-        or the timeout is reached.
+        or the timeout is reached. With ``worker_processes`` > 1, waits until every
+        worker process is ready.
 
         Args:
             timeout: Maximum time in seconds to wait for the worker to be ready.
@@ -331,14 +548,18 @@ class WorkflowRuntime:
         Returns:
             True if the worker's gRPC stream is ready to receive work items, False if timeout.
         """
-        if not hasattr(self.__worker, 'is_worker_ready'):
+        if self._supervisor is not None:
+            is_ready = self._supervisor.is_ready
+        elif hasattr(self.__worker, 'is_worker_ready'):
+            is_ready = self.__worker.is_worker_ready
+        else:
             return False
 
         elapsed = 0.0
         poll_interval = 0.1  # 100ms
 
         while elapsed < timeout:
-            if self.__worker.is_worker_ready():
+            if is_ready():
                 return True
             time.sleep(poll_interval)
             elapsed += poll_interval
@@ -353,7 +574,17 @@ class WorkflowRuntime:
         This method waits for the worker's gRPC stream to be fully initialized
         before returning, ensuring that workflows can be scheduled immediately
         after start() completes.
+
+        With ``worker_processes`` > 1 it forks the worker processes instead and
+        waits until every one of them has its stream ready.
         """
+        if self._supervisor is not None:
+            try:
+                self._supervisor.start(timeout=self._worker_ready_timeout)
+            except Exception as start_error:
+                self._logger.exception(f'WorkflowRuntime workers did not start: {start_error}')
+                raise
+            return
         try:
             try:
                 self.__worker.start()
@@ -385,6 +616,9 @@ class WorkflowRuntime:
 
     def shutdown(self):
         """Stops the listening for work items on a background thread."""
+        if self._supervisor is not None:
+            self._supervisor.stop()
+            return
         try:
             self.__worker.stop()
         except Exception:
@@ -470,7 +704,14 @@ class WorkflowRuntime:
 
         return wrapper
 
-    def activity(self, __fn: Activity = None, *, name: Optional[str] = None):
+    def activity(
+        self,
+        __fn: Activity = None,
+        *,
+        name: Optional[str] = None,
+        executor: str = 'thread',
+        externalize_output: bool = False,
+    ):
         """Decorator to register an activity function.
 
         This example shows how to register an activity function with an alternate name:
@@ -491,18 +732,33 @@ class WorkflowRuntime:
                 def add(ctx, x: int, y: int) -> int:
                     return x + y
 
+        This example runs a CPU-bound activity in the worker process pool:
+
+                @wfr.activity(executor='process')
+                def resize(ctx, image: bytes) -> bytes:
+                    ...
+
         Args:
             name (Optional[str], optional): Name to identify the activity function as in
             the workflow runtime. Defaults to None.
+            executor (str, optional): ``'thread'`` (the default) or ``'process'``. See
+            :meth:`register_activity`.
+            externalize_output (bool, optional): Move large outputs to the
+            ``payload_store``. See :meth:`register_activity`. Defaults to False.
         """
 
         def wrapper(fn: Activity):
-            self.register_activity(fn, name=name)
+            self.register_activity(
+                fn, name=name, executor=executor, externalize_output=externalize_output
+            )
 
             @wraps(fn)
             def innerfn():
                 return fn
 
+            # Lets a process-pool worker get back to fn through the module attribute.
+            innerfn.__dict__['_dapr_activity_fn'] = fn
+
             if hasattr(fn, '_dapr_alternate_name'):
                 innerfn.__dict__['_dapr_alternate_name'] = fn.__dict__['_dapr_alternate_name']
             else:
@@ -30,6 +30,12 @@ class WorkflowStatus(Enum):
     STALLED = 7
 
 
+def _to_orchestration_status(status: WorkflowStatus) -> client.OrchestrationStatus:
+    if status == WorkflowStatus.UNKNOWN:
+        raise ValueError('WorkflowStatus.UNKNOWN does not match any workflow instance')
+    return client.OrchestrationStatus[status.name]
+
+
 class WorkflowState:
     """Represents a snapshot of a workflow instance's current state, including runtime status."""
 
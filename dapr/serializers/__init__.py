@@ -14,6 +14,7 @@ limitations under the License.
 """
 
 from dapr.serializers.base import Serializer
+from dapr.serializers.compression import CompressingSerializer
 from dapr.serializers.json import DefaultJSONSerializer
 
-__all__ = ['Serializer', 'DefaultJSONSerializer']
+__all__ = ['Serializer', 'CompressingSerializer', 'DefaultJSONSerializer']
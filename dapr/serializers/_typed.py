@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Type-directed decoding for :class:`dapr.serializers.DefaultJSONSerializer`.
+
+A decoder is compiled once per type annotation and cached. It takes a JSON value parsed
+without date coercion and materializes it as the annotated type: dataclasses, TypedDicts,
+Enums and models implementing ``model_validate`` (such as pydantic models), along with
+the containers, Optionals and date-time types around them. Parts of the value that the
+annotation does not describe, such as ``Any`` or ``dict`` fields, go to an ``untyped``
+function instead.
+"""
+
+import collections.abc
+import dataclasses
+import datetime
+import enum
+import functools
+import inspect
+import types
+import typing
+from typing import Any, Callable, Optional
+
+from dateutil import parser
+
+from dapr.serializers.util import convert_from_dapr_duration
+
+Decoder = Callable[[Any], Any]
+
+_SCALARS = (str, int, float, bool, bytes, type(None), None)
+_SEQUENCES = {
+    list: list,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Iterable: list,
+    collections.abc.Collection: list,
+    set: set,
+    collections.abc.Set: set,
+    collections.abc.MutableSet: set,
+    frozenset: frozenset,
+}
+_MAPPINGS = (dict, collections.abc.Mapping, collections.abc.MutableMapping)
+
+
+def is_model_class(tp: Any) -> bool:
+    """Whether ``tp`` is a class implementing the model protocol (model_dump + model_validate)."""
+    return (
+        inspect.isclass(tp)
+        and callable(getattr(tp, 'model_dump', None))
+        and callable(getattr(tp, 'model_validate', None))
+    )
+
+
+def json_validator(tp: Any) -> Optional[Callable[[str], Any]]:
+    """Returns ``tp.model_validate_json`` for model classes that parse JSON themselves."""
+    try:
+        return _json_validator_cached(tp)
+    except TypeError:
+        # Unhashable annotations, as in compile_decoder.
+        return _json_validator(tp)
+
+
+@functools.lru_cache(maxsize=None)
+def _json_validator_cached(tp: Any) -> Optional[Callable[[str], Any]]:
+    return _json_validator(tp)
+
+
+def _json_validator(tp: Any) -> Optional[Callable[[str], Any]]:
+    if is_model_class(tp) and callable(getattr(tp, 'model_validate_json', None)):
+        return tp.model_validate_json
+    return None
+
+
+def compile_decoder(tp: Any, untyped: Optional[Decoder] = None) -> Optional[Decoder]:
+    """Returns the cached decoder of values annotated ``tp``.
+
+    Args:
+        tp: The type annotation.
+        untyped: Applied to the parts of a value that ``tp`` does not describe. Defaults
+            to leaving them unchanged.
+
+    Returns:
+        The decoder, or None when ``tp`` says nothing about the value (``object``,
+        ``Any``, ``dict``, unknown classes, ...), which then only needs ``untyped``.
+    """
+    try:
+        return _compile_cached(tp, untyped)
+    except TypeError:
+        # Unhashable annotations, such as Annotated with a list, are compiled every time.
+        return _compile(tp, untyped)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_cached(tp: Any, untyped: Optional[Decoder]) -> Optional[Decoder]:
+    return _compile(tp, untyped)
+
+
+def _compile(tp: Any, untyped: Optional[Decoder]) -> Optional[Decoder]:
+    if tp in _SCALARS or tp is typing.Literal:
+        return _identity
+    if tp is datetime.datetime:
+        return _to_datetime
+    if tp is datetime.date:
+        return _to_date
+    if tp is datetime.timedelta:
+        return _to_timedelta
+    if inspect.isclass(tp):
+        if issubclass(tp, enum.Enum):
+            return tp
+        if dataclasses.is_dataclass(tp):
+            return _dataclass_decoder(tp, untyped)
+        if typing.is_typeddict(tp):
+            return _typeddict_decoder(tp, untyped)
+        if is_model_class(tp):
+            return tp.model_validate
+        return None
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Annotated:
+        return compile_decoder(args[0], untyped)
+    if origin is typing.Literal:
+        return _identity
+    if origin is typing.Union or origin is types.UnionType:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) != 1:
+            return None
+        inner = compile_decoder(options[0], untyped)
+        if inner is None:
+            return None
+        return lambda value: None if value is None else inner(value)
+    if origin is tuple:
+        return _tuple_decoder(args, untyped)
+    if origin in _SEQUENCES:
+        item = compile_decoder(args[0], untyped) if args else None
+        container = _SEQUENCES[origin]
+        if item is None:
+            if container is list:
+                return None
+            item = untyped or _identity
+        return lambda value: container([item(x) for x in value])
+    if origin in _MAPPINGS:
+        item = compile_decoder(args[1], untyped) if len(args) == 2 else None
+        if item is None:
+            return None
+        return lambda value: {key: item(x) for key, x in value.items()}
+    return None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _to_datetime(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    # ISO 8601, as DaprJSONEncoder writes it, is parsed natively; dateutil takes the rest.
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value)
+
+
+def _to_date(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        return parser.parse(value).date()
+
+
+def _to_timedelta(value: Any) -> Any:
+    return convert_from_dapr_duration(value) if isinstance(value, str) else value
+
+
+def _type_hints(cls: type) -> dict:
+    try:
+        return typing.get_type_hints(cls)
+    except Exception:
+        # Unresolvable forward references: the fields that have them are left untyped.
+        return {
+            name: hint
+            for klass in reversed(cls.__mro__)
+            for name, hint in getattr(klass, '__annotations__', {}).items()
+        }
+
+
+def _field_decoders(
+    cls: type, names: typing.Iterable[str], untyped: Optional[Decoder]
+) -> tuple[tuple[str, Optional[Decoder]], ...]:
+    """Returns (name, decoder) pairs, with None for fields taken as they are."""
+    hints = _type_hints(cls)
+    fields = []
+    for name in names:
+        decode = compile_decoder(hints.get(name, object), untyped) or untyped
+        fields.append((name, None if decode is _identity else decode))
+    return tuple(fields)
+
+
+def _expect_object(value: Any, cls: type) -> None:
+    if not isinstance(value, dict):
+        raise TypeError(
+            f'Cannot decode {type(value).__name__} into {cls.__name__}; expected a JSON object'
+        )
+
+
+def _dataclass_decoder(cls: type, untyped: Optional[Decoder]) -> Decoder:
+    init_fields = [field.name for field in dataclasses.fields(cls) if field.init]
+    # Field decoders are compiled on first use, so that self-referencing dataclasses find
+    # their own decoder in the cache.
+    compiled: Optional[tuple[tuple[str, Optional[Decoder]], ...]] = None
+
+    def decode(value: Any) -> Any:
+        nonlocal compiled
+        _expect_object(value, cls)
+        if compiled is None:
+            compiled = _field_decoders(cls, init_fields, untyped)
+        kwargs = {}
+        for name, decode_field in compiled:
+            if name in value:
+                field_value = value[name]
+                kwargs[name] = field_value if decode_field is None else decode_field(field_value)
+        return cls(**kwargs)
+
+    return decode
+
+
+def _typeddict_decoder(cls: type, untyped: Optional[Decoder]) -> Decoder:
+    compiled: Optional[tuple[tuple[str, Optional[Decoder]], ...]] = None
+
+    def decode(value: Any) -> Any:
+        nonlocal compiled
+        _expect_object(value, cls)
+        if compiled is None:
+            compiled = _field_decoders(cls, cls.__annotations__, untyped)
+        for name, decode_field in compiled:
+            if decode_field is not None and name in value:
+                value[name] = decode_field(value[name])
+        return value
+
+    return decode
+
+
+def _tuple_decoder(args: tuple, untyped: Optional[Decoder]) -> Decoder:
+    fallback = untyped or _identity
+    if len(args) == 2 and args[1] is Ellipsis:
+        item = compile_decoder(args[0], untyped) or fallback
+        return lambda value: tuple([item(x) for x in value])
+    if not args or args == ((),):
+        return lambda value: tuple([fallback(x) for x in value])
+    items = [compile_decoder(arg, untyped) or fallback for arg in args]
+    return lambda value: tuple([decode(x) for decode, x in zip(items, value)])
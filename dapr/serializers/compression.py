@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import base64
+import json
+import lzma
+import re
+import zlib
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from dapr.serializers.base import Serializer
+from dapr.serializers.json import DefaultJSONSerializer
+
+# Compressed values are stored as a JSON object ``{"__daprz1__":"<algorithm>:<base64>"}``.
+# Actor state values are embedded verbatim in the JSON transaction body sent to
+# the sidecar, so the envelope itself must be valid JSON. Serialized objects
+# that start with the reserved key are always written as envelopes, so that
+# reading one back never mistakes a user value for compressed data.
+ENVELOPE_KEY = '__daprz1__'
+_ENVELOPE_START = b'{"' + ENVELOPE_KEY.encode('ascii') + b'":"'
+_RESERVED_START = re.compile(rb'\s*\{\s*"' + ENVELOPE_KEY.encode('ascii') + rb'"\s*:')
+
+DEFAULT_COMPRESSION_THRESHOLD = 4096
+
+_Codec = Tuple[Callable[[bytes, Optional[int]], bytes], Callable[[bytes], bytes]]
+
+
+def _zlib_compress(data: bytes, level: Optional[int]) -> bytes:
+    return zlib.compress(data, -1 if level is None else level)
+
+
+def _lzma_compress(data: bytes, level: Optional[int]) -> bytes:
+    return lzma.compress(data, preset=level)
+
+
+def _load_zstd() -> _Codec:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+
+        return (lambda data, level: zstd.compress(data, level)), zstd.decompress
+    except ImportError:
+        pass
+    try:
+        import zstandard  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise ImportError(
+            'zstd compression requires Python 3.14+ or the "zstandard" package'
+        ) from exc
+
+    def compress(data: bytes, level: Optional[int]) -> bytes:
+        return zstandard.ZstdCompressor(level=3 if level is None else level).compress(data)
+
+    return compress, zstandard.ZstdDecompressor().decompress
+
+
+_CODECS: Dict[str, _Codec] = {
+    'zlib': (_zlib_compress, zlib.decompress),
+    'lzma': (_lzma_compress, lzma.decompress),
+}
+
+
+def _get_codec(algorithm: str) -> _Codec:
+    codec = _CODECS.get(algorithm)
+    if codec is None and algorithm == 'zstd':
+        codec = _CODECS['zstd'] = _load_zstd()
+    if codec is None:
+        raise ValueError(f'unsupported compression algorithm: {algorithm}')
+    return codec
+
+
+class CompressingSerializer(Serializer):
+    """Serializer wrapper that compresses large values.
+
+    Values whose serialized form is at least ``threshold`` bytes are compressed
+    and stored in a self-describing envelope that names the algorithm. Values
+    below the threshold, or that do not shrink, are written unchanged. Objects
+    whose serialized form starts with the reserved ``__daprz1__`` key are always
+    wrapped in an envelope, so that they read back unchanged; a dict holding only
+    that key with an ``"<algorithm>:<data>"`` string is taken as an envelope.
+    Deserialization accepts both forms, so existing uncompressed state keeps
+    loading after the serializer is switched on, and envelopes written with
+    any supported algorithm can be read regardless of the configured one.
+
+    Pass it as ``state_serializer`` when registering an actor::
+
+        await ActorRuntime.register_actor(
+            MyActor, state_serializer=CompressingSerializer(threshold=8192)
+        )
+
+    Args:
+        inner (Serializer): serializer that produces the uncompressed bytes.
+        algorithm (str): ``'zlib'``, ``'lzma'`` or ``'zstd'``. ``zstd`` needs
+            Python 3.14+ or the ``zstandard`` package.
+        threshold (int): minimum serialized size in bytes before compressing.
+        level (int, optional): compression level passed to the codec.
+    """
+
+    def __init__(
+        self,
+        inner: Serializer = DefaultJSONSerializer(),
+        algorithm: str = 'zlib',
+        threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        level: Optional[int] = None,
+    ) -> None:
+        if threshold < 0:
+            raise ValueError('threshold must not be negative')
+        self._compress = _get_codec(algorithm)[0]
+        self._inner = inner
+        self._algorithm = algorithm
+        self._threshold = threshold
+        self._level = level
+
+    @property
+    def algorithm(self) -> str:
+        return self._algorithm
+
+    @property
+    def threshold(self) -> int:
+        return self._threshold
+
+    def serialize(
+        self, obj: object, custom_hook: Optional[Callable[[object], bytes]] = None
+    ) -> bytes:
+        # The gRPC actor client re-serializes values parsed back out of the
+        # transaction body; an envelope seen here is already compressed.
+        if _is_envelope(obj):
+            return b''.join((_ENVELOPE_START, obj[ENVELOPE_KEY].encode('ascii'), b'"}'))
+
+        raw = self._inner.serialize(obj, custom_hook)
+        if _RESERVED_START.match(raw):
+            return self._envelope(raw)
+        if len(raw) < self._threshold:
+            return raw
+        envelope = self._envelope(raw)
+        return envelope if len(envelope) < len(raw) else raw
+
+    def _envelope(self, raw: bytes) -> bytes:
+        compressed = base64.b64encode(self._compress(raw, self._level))
+        return b''.join((_ENVELOPE_START, self._algorithm.encode('ascii'), b':', compressed, b'"}'))
+
+    def deserialize(
+        self,
+        data: bytes,
+        data_type: Optional[Type] = object,
+        custom_hook: Optional[Callable[[bytes], object]] = None,
+    ) -> Any:
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if isinstance(data, bytes) and _RESERVED_START.match(data):
+            data = self.decompress(data)
+        return self._inner.deserialize(data, data_type, custom_hook)
+
+    @staticmethod
+    def decompress(data: bytes) -> bytes:
+        """Returns the inner serialized bytes of an envelope produced by this class.
+
+        Raises:
+            ValueError: ``data`` is not a valid envelope or names an unknown algorithm.
+        """
+        envelope = json.loads(data)
+        if not _is_envelope(envelope):
+            raise ValueError('data is not a compressed envelope')
+        algorithm, _, payload = envelope[ENVELOPE_KEY].partition(':')
+        return _get_codec(algorithm)[1](base64.b64decode(payload))
+
+
+def _is_envelope(obj: object) -> bool:
+    if not isinstance(obj, dict) or len(obj) != 1:
+        return False
+    body = obj.get(ENVELOPE_KEY)
+    return isinstance(body, str) and body.isascii() and ':' in body
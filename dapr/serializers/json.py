@@ -14,13 +14,16 @@ limitations under the License.
 """
 
 import base64
+import dataclasses
 import datetime
+import enum
 import json
 import re
 from typing import Any, Callable, Optional, Type
 
 from dateutil import parser
 
+from dapr.serializers._typed import compile_decoder, is_model_class, json_validator
 from dapr.serializers.base import Serializer
 from dapr.serializers.util import (
     DAPR_DURATION_PARSER,
@@ -30,8 +33,27 @@ from dapr.serializers.util import (
 
 
 class DefaultJSONSerializer(Serializer):
-    def __init__(self, ensure_ascii: bool = True) -> None:
+    """Serializes objects to JSON, with datetimes, timedeltas and bytes as strings.
+
+    Dataclasses, Enums and models with ``model_dump`` (such as pydantic models) are
+    serialized by value. When ``deserialize`` is given a ``data_type`` that describes them,
+    the value is decoded as that type: dataclasses, TypedDicts, Enums and models with
+    ``model_validate``, also inside lists, dicts, tuples and Optionals. Strings in typed
+    fields are only converted to dates and durations where the field asks for one.
+
+    Args:
+        ensure_ascii: Escape non-ASCII characters in serialized JSON.
+        coerce_datetimes: Deserialize strings that look like dates as
+            :class:`datetime.datetime` and Dapr durations as :class:`datetime.timedelta`.
+            Set to False for strict decoding, where every JSON string stays a ``str``.
+    """
+
+    def __init__(self, ensure_ascii: bool = True, coerce_datetimes: bool = True) -> None:
         self.ensure_ascii = ensure_ascii
+        self.coerce_datetimes = coerce_datetimes
+        self._decoder = DaprJSONDecoder(coerce_datetimes=coerce_datetimes)
+        self._typed_decoder = DaprJSONDecoder(coerce_datetimes=False)
+        self._untyped = _coerce_value if coerce_datetimes else None
 
     def serialize(
         self, obj: object, custom_hook: Optional[Callable[[object], bytes]] = None
@@ -63,9 +85,19 @@ class DefaultJSONSerializer(Serializer):
         if not isinstance(data, (str, bytes)):
             raise ValueError('data must be str or bytes types')
 
-        obj = json.loads(data, cls=DaprJSONDecoder)
+        if isinstance(data, bytes):
+            data = data.decode(json.detect_encoding(data), 'surrogatepass')
+        if data_type is object or callable(custom_hook):
+            obj = self._decoder.decode(data)
+            return custom_hook(obj) if callable(custom_hook) else obj
 
-        return custom_hook(obj) if callable(custom_hook) else obj
+        validate_json = json_validator(data_type)
+        if validate_json is not None:
+            return validate_json(data)
+        decode_as = compile_decoder(data_type, self._untyped)
+        if decode_as is None:
+            return self._decoder.decode(data)
+        return decode_as(self._typed_decoder.decode(data))
 
 
 class DaprJSONEncoder(json.JSONEncoder):
@@ -84,26 +116,97 @@ class DaprJSONEncoder(json.JSONEncoder):
             return convert_to_dapr_duration(obj)
         elif isinstance(obj, bytes):
             return base64.b64encode(obj).decode('utf-8')
+        elif isinstance(obj, enum.Enum):
+            return obj.value
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            return {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+        elif is_model_class(type(obj)):
+            try:
+                return obj.model_dump(mode='json')
+            except TypeError:
+                return obj.model_dump()
         else:
             return json.JSONEncoder.default(self, obj)
 
 
+# Date-time and duration strings both start with a digit, so a document with no string
+# starting with one (or with a \u escape, which may be one) has nothing to convert.
+_CANDIDATE_STRING = re.compile(r'"(?:\d|\\u)')
+
+
+def _coerce_value(value: Any) -> Any:
+    """Converts the date-time and duration strings in a decoded value, like DaprJSONDecoder."""
+    kind = type(value)
+    if kind is str:
+        return DaprJSONDecoder.convert_string(value) if value[:1].isdecimal() else value
+    if kind is dict or kind is list:
+        DaprJSONDecoder._convert_values(value)
+    return value
+
+
 class DaprJSONDecoder(json.JSONDecoder):
+    """Decodes JSON, converting date-time string values to :class:`datetime.datetime` and
+    Dapr duration string values to :class:`datetime.timedelta`.
+
+    Documents are parsed by the C scanner, then only the string values that can be dates
+    or durations are converted. With an ``object_hook`` or ``object_pairs_hook``, which
+    must see converted values, strings are converted while scanning instead. Object keys
+    are never converted.
+
+    Args:
+        coerce_datetimes: Set to False to leave every string as a ``str``.
+    """
+
     # TODO: improve regex
     datetime_regex = re.compile(r'(\d{4}[-/]\d{2}[-/]\d{2})')
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, coerce_datetimes: bool = True, **kwargs):
         json.JSONDecoder.__init__(self, *args, **kwargs)
-        self.parse_string = DaprJSONDecoder.custom_scanstring
-        self.scan_once = json.scanner.py_make_scanner(self)  # type: ignore
+        self._convert_after_scan = coerce_datetimes
+        if coerce_datetimes and (self.object_hook or self.object_pairs_hook):
+            self.parse_string = DaprJSONDecoder.custom_scanstring
+            self.scan_once = json.scanner.py_make_scanner(self)  # type: ignore
+            self._convert_after_scan = False
+
+    def raw_decode(self, s, idx=0):
+        obj, end = json.JSONDecoder.raw_decode(self, s, idx)
+        if self._convert_after_scan and _CANDIDATE_STRING.search(s, idx, end):
+            if type(obj) is str:
+                obj = self.convert_string(obj)
+            elif type(obj) in (dict, list):
+                self._convert_values(obj)
+        return obj, end
 
     @classmethod
-    def custom_scanstring(cls, s, end, strict=True):
-        (s, end) = json.decoder.scanstring(s, end, strict)  # type: ignore
+    def _convert_values(cls, container) -> None:
+        """Converts the date-time and duration strings in a dict or list, in place."""
+        stack = [container]
+        while stack:
+            current = stack.pop()
+            items = current.items() if type(current) is dict else enumerate(current)
+            for key, value in items:
+                kind = type(value)
+                if kind is str:
+                    # Anything to convert starts with a digit.
+                    if value[:1].isdecimal():
+                        converted = cls.convert_string(value)
+                        if converted is not value:
+                            current[key] = converted
+                elif kind is dict or kind is list:
+                    stack.append(value)
+
+    @classmethod
+    def convert_string(cls, s: str) -> Any:
+        """Returns the datetime or timedelta a string holds, or the string itself."""
         if cls.datetime_regex.match(s):
-            return (parser.parse(s), end)
+            return parser.parse(s)
 
         duration = DAPR_DURATION_PARSER.match(s)
         if duration is not None and duration.lastindex is not None:
-            return (convert_from_dapr_duration(s), end)
-        return (s, end)
+            return convert_from_dapr_duration(s)
+        return s
+
+    @classmethod
+    def custom_scanstring(cls, s, end, strict=True):
+        (s, end) = json.decoder.scanstring(s, end, strict)  # type: ignore
+        return (cls.convert_string(s), end)
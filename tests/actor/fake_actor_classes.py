@@ -14,8 +14,10 @@ limitations under the License.
 """
 
 import asyncio
-from datetime import timedelta
-from typing import Optional
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import List, Optional
 
 from dapr.actor.actor_interface import ActorInterface, actormethod
 from dapr.actor.runtime.actor import Actor
@@ -41,6 +43,34 @@ class FakeSimpleActor(Actor, FakeSimpleActorInterface):
         pass
 
 
+class FakeOrderStatus(Enum):
+    PLACED = 'placed'
+    SHIPPED = 'shipped'
+
+
+@dataclass
+class FakeOrder:
+    order_id: str
+    status: FakeOrderStatus
+    placed_at: datetime
+    items: List[str]
+
+
+# Fake actor with typed arguments and return values
+class FakeTypedActorInterface(ActorInterface):
+    @actormethod(name='Ship')
+    async def ship(self, order: FakeOrder) -> FakeOrder: ...
+
+
+class FakeTypedActor(Actor, FakeTypedActorInterface):
+    def __init__(self, ctx, actor_id):
+        super(FakeTypedActor, self).__init__(ctx, actor_id)
+
+    async def ship(self, order: FakeOrder) -> FakeOrder:
+        assert isinstance(order, FakeOrder)
+        return FakeOrder(order.order_id, FakeOrderStatus.SHIPPED, order.placed_at, order.items)
+
+
 class FakeSimpleReminderActor(Actor, FakeSimpleActorInterface, Remindable):
     def __init__(self, ctx, actor_id):
         super(FakeSimpleReminderActor, self).__init__(ctx, actor_id)
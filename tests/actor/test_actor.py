@@ -18,6 +18,8 @@ from datetime import timedelta
 from unittest import mock
 
 from dapr.actor.id import ActorId
+from dapr.actor.runtime._reminder_data import ActorReminderData
+from dapr.actor.runtime._timer_data import ActorTimerData
 from dapr.actor.runtime._type_information import ActorTypeInformation
 from dapr.actor.runtime.config import ActorRuntimeConfig
 from dapr.actor.runtime.context import ActorRuntimeContext
@@ -261,3 +263,88 @@ class ActorTests(unittest.TestCase):
                 timedelta(seconds=1),
             )
         )
+
+    def _reminder_actor(self, client):
+        test_type_info = ActorTypeInformation.create(FakeSimpleReminderActor)
+        ctx = ActorRuntimeContext(test_type_info, self._serializer, self._serializer, client)
+        return FakeSimpleReminderActor(ctx, ActorId('test_id'))
+
+    def test_register_reminders(self):
+        client = FakeDaprActorClient()
+        client.register_reminder = _async_mock()
+        test_actor = self._reminder_actor(client)
+
+        reminders = [
+            ActorReminderData(f'r{i}', b'state', timedelta(seconds=1), timedelta(seconds=1))
+            for i in range(5)
+        ]
+        _run(test_actor.register_reminders(reminders, max_concurrency=2))
+
+        self.assertEqual(5, client.register_reminder.mock.call_count)
+        names = sorted(c.args[2] for c in client.register_reminder.mock.call_args_list)
+        self.assertEqual(['r0', 'r1', 'r2', 'r3', 'r4'], names)
+        client.register_reminder.mock.assert_any_call(
+            'FakeSimpleReminderActor',
+            'test_id',
+            'r0',
+            b'{"reminderName":"r0","dueTime":"0h0m1s0ms0\\u03bcs","period":"0h0m1s0ms0\\u03bcs","data":"c3RhdGU="}',  # noqa E501
+        )
+
+    def test_register_reminders_raises_after_attempting_all(self):
+        client = FakeDaprActorClient()
+        client.register_reminder = _async_mock(side_effect=[None, ValueError('boom'), None])
+        test_actor = self._reminder_actor(client)
+
+        reminders = [ActorReminderData(f'r{i}', b'', timedelta(seconds=1)) for i in range(3)]
+        with self.assertRaises(ValueError):
+            _run(test_actor.register_reminders(reminders))
+        self.assertEqual(3, client.register_reminder.mock.call_count)
+
+    def test_register_timers(self):
+        client = FakeDaprActorClient()
+        client.register_timer = _async_mock()
+        test_type_info = ActorTypeInformation.create(FakeSimpleTimerActor)
+        ctx = ActorRuntimeContext(test_type_info, self._serializer, self._serializer, client)
+        test_actor = FakeSimpleTimerActor(ctx, ActorId('test_id'))
+
+        timers = [
+            ActorTimerData(
+                f't{i}', test_actor.timer_callback, None, timedelta(seconds=1), timedelta(0)
+            )
+            for i in range(3)
+        ]
+        _run(test_actor.register_timers(timers))
+        names = sorted(c.args[2] for c in client.register_timer.mock.call_args_list)
+        self.assertEqual(['t0', 't1', 't2'], names)
+
+    def test_get_reminder(self):
+        client = FakeDaprActorClient()
+        client.get_reminder = _async_mock(
+            return_value=b'{"dueTime":"0h0m1s0ms","period":"0h0m2s0ms","data":"c3RhdGU="}'
+        )
+        test_actor = self._reminder_actor(client)
+
+        reminder = _run(test_actor.get_reminder('r0'))
+        client.get_reminder.mock.assert_called_once_with('FakeSimpleReminderActor', 'test_id', 'r0')
+        self.assertEqual('r0', reminder.reminder_name)
+        self.assertEqual(b'state', reminder.state)
+        self.assertEqual(timedelta(seconds=1), reminder.due_time)
+        self.assertEqual(timedelta(seconds=2), reminder.period)
+
+    def test_get_reminder_not_found(self):
+        client = FakeDaprActorClient()
+        client.get_reminder = _async_mock(return_value=None)
+        self.assertIsNone(_run(self._reminder_actor(client).get_reminder('missing')))
+
+    def test_list_reminders(self):
+        client = FakeDaprActorClient()
+        client.list_reminders = _async_mock(
+            return_value=b'[{"actorId":"test_id","name":"r0","dueTime":"0h0m1s0ms",'
+            b'"period":null,"data":""}]'
+        )
+        test_actor = self._reminder_actor(client)
+
+        reminders = _run(test_actor.list_reminders())
+        client.list_reminders.mock.assert_called_once_with('FakeSimpleReminderActor', 'test_id')
+        self.assertEqual(['r0'], [r.reminder_name for r in reminders])
+        self.assertIsNone(reminders[0].period)
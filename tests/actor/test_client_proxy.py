@@ -13,10 +13,11 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import unittest
 from unittest import mock
 
-from dapr.actor.client.proxy import ActorProxy
+from dapr.actor.client.proxy import ActorProxy, ActorProxyFactory
 from dapr.actor.id import ActorId
 from dapr.serializers import DefaultJSONSerializer
 from tests.actor.fake_actor_classes import (
@@ -97,3 +98,81 @@ class ActorProxyTests(unittest.TestCase):
     def test_raise_exception_non_existing_method(self):
         with self.assertRaises(AttributeError):
             _run(self._proxy.non_existing())
+
+
+class ActorProxyFactoryInvokeManyTests(unittest.TestCase):
+    def setUp(self):
+        with mock.patch('dapr.clients.http.client.DaprHealth.wait_for_sidecar'):
+            self._factory = ActorProxyFactory()
+        self._calls = []
+
+        async def invoke_method(actor_type, actor_id, method, data=None):
+            self._calls.append((actor_type, actor_id, method, data))
+            await asyncio.sleep(0)
+            if actor_id == 'bad':
+                raise ValueError('boom')
+            return f'"{actor_id}"'.encode()
+
+        self._factory._dapr_client = mock.MagicMock()
+        self._factory._dapr_client.invoke_method = invoke_method
+
+    async def _collect(self, *args, **kwargs):
+        return [r async for r in self._factory.invoke_many(*args, **kwargs)]
+
+    def test_invoke_many_serializes_payload_once(self):
+        with mock.patch.object(
+            self._factory._message_serializer,
+            'serialize',
+            wraps=self._factory._message_serializer.serialize,
+        ) as serialize:
+            results = _run(
+                self._collect('FakeActor', ['1', ActorId('2'), '3'], 'ActionMethod', {'a': 1})
+            )
+        serialize.assert_called_once_with({'a': 1})
+        self.assertEqual({'1', '2', '3'}, {str(r.actor_id) for r in results})
+        self.assertTrue(all(r.succeeded for r in results))
+        self.assertEqual({b'{"a":1}'}, {c[3] for c in self._calls})
+
+    def test_invoke_many_reports_per_id_errors(self):
+        results = _run(self._collect('FakeActor', ['1', 'bad', '2'], 'ActionMethod', b'raw'))
+        by_id = {str(r.actor_id): r for r in results}
+        self.assertIsInstance(by_id['bad'].error, ValueError)
+        self.assertIsNone(by_id['bad'].result)
+        self.assertEqual(b'"1"', by_id['1'].result)
+        self.assertTrue(by_id['2'].succeeded)
+
+    def test_invoke_many_deserializes_with_interface(self):
+        results = _run(
+            self._collect(
+                'FakeActor', ['1'], 'ActionMethod', actor_interface=FakeActorCls2Interface
+            )
+        )
+        self.assertEqual('1', results[0].result)
+
+    def test_invoke_many_unknown_method_with_interface(self):
+        with self.assertRaises(AttributeError):
+            _run(
+                self._collect('FakeActor', ['1'], 'Missing', actor_interface=FakeActorCls2Interface)
+            )
+
+    def test_invoke_many_bounds_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def invoke_method(actor_type, actor_id, method, data=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return b'null'
+
+        self._factory._dapr_client.invoke_method = invoke_method
+        ids = (str(i) for i in range(50))
+        results = _run(self._collect('FakeActor', ids, 'ActionMethod', max_concurrency=5))
+        self.assertEqual(50, len(results))
+        self.assertEqual(5, peak)
+
+    def test_invoke_many_rejects_invalid_concurrency(self):
+        with self.assertRaises(ValueError):
+            _run(self._collect('FakeActor', ['1'], 'ActionMethod', max_concurrency=0))
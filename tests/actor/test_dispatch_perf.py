@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Microbenchmark for the per-call overhead of ``ActorManager.dispatch``.
+
+Drives tiny-payload calls against an already-activated actor so the measured time is
+the dispatch path itself (lookup, decode, invoke, encode), not activation or I/O.
+"""
+
+import asyncio
+import time
+from unittest import mock
+
+import pytest
+
+from dapr.actor.id import ActorId
+from dapr.actor.runtime._method_context import ActorMethodContext
+from dapr.actor.runtime._type_information import ActorTypeInformation
+from dapr.actor.runtime.context import ActorRuntimeContext
+from dapr.actor.runtime.manager import ActorManager
+from dapr.actor.runtime.method_dispatcher import ActorMethodInvoker
+from dapr.serializers import DefaultJSONSerializer
+from tests.actor.fake_actor_classes import FakeSimpleActor
+from tests.actor.fake_client import FakeDaprActorClient
+
+pytestmark = pytest.mark.perf
+
+N_CALLS = 20000
+# Generous per-call ceiling; the dispatch path itself costs a few microseconds.
+MAX_MEAN_CALL_S = 0.0005
+
+
+def _manager() -> ActorManager:
+    serializer = DefaultJSONSerializer()
+    ctx = ActorRuntimeContext(
+        ActorTypeInformation.create(FakeSimpleActor),
+        serializer,
+        serializer,
+        FakeDaprActorClient(),
+    )
+    return ActorManager(ctx)
+
+
+async def _dispatch_batch(manager: ActorManager, n_calls: int) -> float:
+    actor_id = ActorId('bench')
+    await manager.activate_actor(actor_id)
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        await manager.dispatch(actor_id, 'ActorMethod', b'1')
+    return time.perf_counter() - start
+
+
+def test_dispatch_reuses_compiled_invoker():
+    """Dispatching must not rebuild per-method state or re-resolve the method per call."""
+    manager = _manager()
+    compiled = manager._dispatcher.get_invoker('ActorMethod')
+
+    async def run():
+        actor_id = ActorId('bench')
+        await manager.activate_actor(actor_id)
+        # The invoker calls the function captured from the actor class, so an
+        # instance attribute shadowing the method is never looked up.
+        actor = manager._active_actors[actor_id.id]
+        actor.actor_method = mock.Mock(side_effect=AssertionError('resolved on the instance'))
+        for _ in range(10):
+            await manager.dispatch(actor_id, 'ActorMethod', b'1')
+
+    with (
+        mock.patch.object(
+            ActorMethodContext, 'create_for_actor', wraps=ActorMethodContext.create_for_actor
+        ) as create_context,
+        mock.patch.object(
+            ActorMethodInvoker, 'invoke', autospec=True, side_effect=ActorMethodInvoker.invoke
+        ) as invoke,
+    ):
+        asyncio.run(run())
+
+    assert create_context.call_count == 0
+    assert invoke.call_count == 10
+    assert all(c.args[0] is compiled for c in invoke.call_args_list)
+
+
+def test_dispatch_per_call_overhead():
+    elapsed = asyncio.run(_dispatch_batch(_manager(), N_CALLS))
+    mean = elapsed / N_CALLS
+    assert mean < MAX_MEAN_CALL_S, f'dispatch took {mean * 1e6:.1f}us/call'
@@ -14,12 +14,19 @@ limitations under the License.
 """
 
 import unittest
+from datetime import datetime
 
+from dapr.actor.error import ActorMethodNotFoundError
 from dapr.actor.runtime._type_information import ActorTypeInformation
 from dapr.actor.runtime.context import ActorRuntimeContext
 from dapr.actor.runtime.method_dispatcher import ActorMethodDispatcher
 from dapr.serializers import DefaultJSONSerializer
-from tests.actor.fake_actor_classes import FakeSimpleActor
+from tests.actor.fake_actor_classes import (
+    FakeOrder,
+    FakeOrderStatus,
+    FakeSimpleActor,
+    FakeTypedActor,
+)
 from tests.actor.fake_client import FakeDaprActorClient
 from tests.actor.utils import _run
 
@@ -53,3 +60,38 @@ class ActorMethodDispatcherTests(unittest.TestCase):
         actorInstance = FakeSimpleActor(self._fake_runtime_ctx, None)
         result = _run(dispatcher.dispatch(actorInstance, 'ActorMethod', 10))
         self.assertEqual({'name': 'actor_method'}, result)
+
+    def test_get_invoker(self):
+        dispatcher = ActorMethodDispatcher(self._testActorTypeInfo, self._serializer)
+        invoker = dispatcher.get_invoker('ActorMethod')
+        self.assertEqual('actor_method', invoker.method_name)
+        self.assertEqual('ActorMethod', invoker.method_context.method_name)
+        self.assertIs(invoker, dispatcher.get_invoker('ActorMethod'))
+
+        actorInstance = FakeSimpleActor(self._fake_runtime_ctx, None)
+        result = _run(invoker.invoke(actorInstance, b'10'))
+        self.assertEqual({'name': 'actor_method'}, result)
+        self.assertEqual(b'{"name":"actor_method"}', invoker.encode(result))
+
+    def test_invoker_decodes_typed_arguments(self):
+        type_info = ActorTypeInformation.create(FakeTypedActor)
+        ctx = ActorRuntimeContext(type_info, self._serializer, self._serializer, self._fake_client)
+        invoker = ActorMethodDispatcher(type_info, self._serializer).get_invoker('Ship')
+
+        body = b'{"order_id":"2024-0001","status":"placed","placed_at":"2024-01-02T03:04:05","items":["a"]}'
+        result = _run(invoker.invoke(FakeTypedActor(ctx, None), body))
+        self.assertEqual(
+            FakeOrder('2024-0001', FakeOrderStatus.SHIPPED, datetime(2024, 1, 2, 3, 4, 5), ['a']),
+            result,
+        )
+        self.assertEqual(body.replace(b'placed"', b'shipped"'), invoker.encode(result))
+
+    def test_get_invoker_unknown_method(self):
+        dispatcher = ActorMethodDispatcher(self._testActorTypeInfo, self._serializer)
+        with self.assertRaises(ActorMethodNotFoundError):
+            dispatcher.get_invoker('UnknownMethod')
+
+    def test_get_invoker_without_serializer(self):
+        dispatcher = ActorMethodDispatcher(self._testActorTypeInfo)
+        with self.assertRaises(ValueError):
+            dispatcher.get_invoker('ActorMethod')
@@ -2,7 +2,7 @@ import datetime
 import unittest
 from typing import Optional
 
-from dapr.actor import Actor, ActorInterface, Remindable, actormethod
+from dapr.actor import Actor, ActorInterface, ActorReminderData, Remindable, actormethod
 from dapr.actor.runtime.mock_actor import create_mock_actor
 from dapr.actor.runtime.state_change import StateChangeKind
 
@@ -193,6 +193,17 @@ class ActorMockActorTests(unittest.IsolatedAsyncioTestCase):
         await mockactor.toggle_reminder('test', False)
         self.assertEqual(len(mockactor._state_manager._mock_reminders), 0)  # type: ignore
 
+    async def test_register_and_list_reminders(self):
+        mockactor = create_mock_actor(MockTestActor, '1')
+        reminders = [
+            ActorReminderData(name, b'', datetime.timedelta(seconds=1)) for name in ('a', 'b')
+        ]
+        await mockactor.register_reminders(reminders)
+        listed = await mockactor.list_reminders()
+        self.assertEqual(['a', 'b'], [r.reminder_name for r in listed])
+        self.assertIs(reminders[0], await mockactor.get_reminder('a'))
+        self.assertIsNone(await mockactor.get_reminder('missing'))
+
     async def test_toggle_timer(self):
         mockactor = create_mock_actor(MockTestActor, '1')
         await mockactor._on_activate()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Save/load latency and stored size of actor state by value size.
+
+Runs ``StateProvider.save_state`` and ``try_load_state`` against an in-memory client,
+with and without :class:`CompressingSerializer`, and reports latency per call and the
+bytes that would be sent to the state store.
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict
+
+import pytest
+
+from dapr.actor.runtime._state_provider import StateProvider
+from dapr.actor.runtime.state_change import ActorStateChange, StateChangeKind
+from dapr.serializers import CompressingSerializer, DefaultJSONSerializer, Serializer
+from tests.actor.fake_client import FakeDaprActorClient
+
+pytestmark = pytest.mark.perf
+
+VALUE_SIZES = (256, 4 * 1024, 64 * 1024, 256 * 1024)
+ITERATIONS = 5
+
+
+class _InMemoryStateClient(FakeDaprActorClient):
+    def __init__(self) -> None:
+        self.store: Dict[str, bytes] = {}
+        self.bytes_sent = 0
+
+    async def save_state_transactionally(self, actor_type: str, actor_id: str, data: bytes):
+        self.bytes_sent += len(data)
+        for op in json.loads(data):
+            self.store[op['request']['key']] = json.dumps(op['request']['value']).encode()
+
+    async def get_state(self, actor_type: str, actor_id: str, name: str) -> bytes:
+        return self.store.get(name, b'')
+
+
+def _document(size: int) -> dict:
+    # Repetitive structured records, like the JSON documents actors typically hold.
+    record = {'id': 0, 'status': 'active', 'tags': ['alpha', 'beta'], 'note': 'state'}
+    count = max(1, size // len(json.dumps(record)))
+    return {'records': [dict(record, id=i) for i in range(count)]}
+
+
+async def _measure(serializer: Serializer, value: dict):
+    client = _InMemoryStateClient()
+    provider = StateProvider(client, serializer)
+    change = [ActorStateChange('doc', value, StateChangeKind.update)]
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await provider.save_state('Actor', '1', change)
+    save_s = (time.perf_counter() - start) / ITERATIONS
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        found, loaded = await provider.try_load_state('Actor', '1', 'doc')
+    load_s = (time.perf_counter() - start) / ITERATIONS
+
+    assert found and loaded == value
+    return save_s, load_s, client.bytes_sent // ITERATIONS
+
+
+def test_state_save_load_latency_by_size():
+    serializers = {
+        'json': DefaultJSONSerializer(),
+        'zlib': CompressingSerializer(algorithm='zlib'),
+        'lzma': CompressingSerializer(algorithm='lzma'),
+    }
+    print()
+    for size in VALUE_SIZES:
+        value = _document(size)
+        sent = {}
+        for name, serializer in serializers.items():
+            save_s, load_s, sent[name] = asyncio.run(_measure(serializer, value))
+            print(
+                f'{size:>8}B {name:>5}: save {save_s * 1e3:7.3f}ms'
+                f' load {load_s * 1e3:7.3f}ms sent {sent[name]:>8}B'
+            )
+        if size > CompressingSerializer().threshold:
+            assert sent['zlib'] < sent['json']
+        else:
+            assert sent['zlib'] == sent['json']
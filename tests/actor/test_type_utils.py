@@ -28,6 +28,7 @@ from tests.actor.fake_actor_classes import (
     FakeActorCls1Interface,
     FakeActorCls2Interface,
     FakeMultiInterfacesActor,
+    FakeOrder,
     FakeSimpleActor,
 )
 
@@ -48,6 +49,15 @@ class TypeUtilsTests(unittest.TestCase):
         rtn_type = get_method_return_types(FakeSimpleActor.non_actor_method)
         self.assertEqual(str, rtn_type)
 
+    def test_string_annotations_are_resolved(self):
+        async def method(self, order: 'FakeOrder') -> 'None': ...
+
+        async def unresolvable(self, order: 'Missing') -> 'Missing': ...  # noqa: F821
+
+        self.assertEqual([FakeOrder], get_method_arg_types(method))
+        self.assertEqual(object, get_method_return_types(method))
+        self.assertEqual(['Missing'], get_method_arg_types(unresolvable))
+
     def test_is_dapr_actor_true(self):
         self.assertTrue(is_dapr_actor(FakeSimpleActor))
 
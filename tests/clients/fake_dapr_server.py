@@ -56,6 +56,7 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
         # Unary actor RPCs record (rpc_name, request) tuples and use actor_state as backing store.
         self.actor_requests: List[Tuple[str, Message]] = []
         self.actor_state: Dict[Tuple[str, str, str], bytes] = {}
+        self.actor_reminders: Dict[Tuple[str, str, str], api_v1.ActorReminder] = {}
         # SubscribeActorEventsAlpha1: one plan is consumed per stream connection. Each plan is a
         # dict with 'rounds' (lists of SubscribeActorEventsResponseAlpha1 pushed per round, the
         # server reads one correlated reply per pushed message before the next round) and 'end'
@@ -349,13 +350,47 @@ class FakeDaprSidecar(api_service_v1.DaprServicer):
     def RegisterActorReminder(self, request, context):
         self.check_for_exception(context)
         self.actor_requests.append(('RegisterActorReminder', request))
+        reminder = api_v1.ActorReminder(
+            actor_type=request.actor_type,
+            actor_id=request.actor_id,
+            due_time=request.due_time,
+            data=GrpcAny(value=request.data),
+        )
+        if request.period:
+            reminder.period = request.period
+        if request.ttl:
+            reminder.ttl = request.ttl
+        self.actor_reminders[(request.actor_type, request.actor_id, request.name)] = reminder
         return empty_pb2.Empty()
 
     def UnregisterActorReminder(self, request, context):
         self.check_for_exception(context)
         self.actor_requests.append(('UnregisterActorReminder', request))
+        self.actor_reminders.pop((request.actor_type, request.actor_id, request.name), None)
         return empty_pb2.Empty()
 
+    def GetActorReminder(self, request, context):
+        self.check_for_exception(context)
+        self.actor_requests.append(('GetActorReminder', request))
+        reminder = self.actor_reminders.get((request.actor_type, request.actor_id, request.name))
+        if reminder is None:
+            context.abort(grpc.StatusCode.NOT_FOUND, 'reminder not found')
+        response = api_v1.GetActorReminderResponse()
+        response.ParseFromString(reminder.SerializeToString())
+        return response
+
+    def ListActorReminders(self, request, context):
+        self.check_for_exception(context)
+        self.actor_requests.append(('ListActorReminders', request))
+        return api_v1.ListActorRemindersResponse(
+            reminders=[
+                api_v1.NamedActorReminder(name=name, reminder=reminder)
+                for (actor_type, actor_id, name), reminder in self.actor_reminders.items()
+                if actor_type == request.actor_type
+                and (not request.HasField('actor_id') or actor_id == request.actor_id)
+            ]
+        )
+
     def RegisterActorTimer(self, request, context):
         self.check_for_exception(context)
         self.actor_requests.append(('RegisterActorTimer', request))
@@ -44,6 +44,7 @@ class DaprActorGrpcClientTests(unittest.IsolatedAsyncioTestCase):
     def setUp(self):
         self._fake_dapr_server.actor_requests.clear()
         self._fake_dapr_server.actor_state.clear()
+        self._fake_dapr_server.actor_reminders.clear()
         self._serializer = DefaultJSONSerializer()
         self.client = DaprActorGrpcClient(address=f'localhost:{self.grpc_port}')
 
@@ -226,6 +227,50 @@ class DaprActorGrpcClientTests(unittest.IsolatedAsyncioTestCase):
         rpc_names = [name for name, _ in self._fake_dapr_server.actor_requests]
         self.assertEqual(['UnregisterActorReminder', 'UnregisterActorTimer'], rpc_names)
 
+    def _reminder_body(self, name: str, state: bytes) -> bytes:
+        reminder = ActorReminderData(
+            name, state, timedelta(seconds=1), timedelta(seconds=5), timedelta(hours=1)
+        )
+        return self._serializer.serialize(reminder.as_dict())
+
+    async def test_register_reminders(self):
+        reminders = [(f'a{i}', f'r{i}', self._reminder_body(f'r{i}', b'state')) for i in range(10)]
+        await self.client.register_reminders('DemoActor', reminders, max_concurrency=3)
+
+        registered = sorted(
+            (req.actor_id, req.name)
+            for name, req in self._fake_dapr_server.actor_requests
+            if name == 'RegisterActorReminder'
+        )
+        self.assertEqual(sorted((f'a{i}', f'r{i}') for i in range(10)), registered)
+
+    async def test_get_reminder(self):
+        await self.client.register_reminder(
+            'DemoActor', 'a1', 'r1', self._reminder_body('r1', b'state')
+        )
+
+        body = json.loads(await self.client.get_reminder('DemoActor', 'a1', 'r1'))
+        missing = await self.client.get_reminder('DemoActor', 'a1', 'missing')
+
+        self.assertEqual('0h0m1s0ms0μs', body['dueTime'])
+        self.assertEqual('0h0m5s0ms0μs', body['period'])
+        self.assertEqual('1h0m0s0ms0μs', body['ttl'])
+        self.assertEqual(b'state', base64.b64decode(body['data']))
+        self.assertIsNone(missing)
+
+    async def test_list_reminders(self):
+        for actor_id, name in (('a1', 'r1'), ('a1', 'r2'), ('a2', 'r3')):
+            await self.client.register_reminder(
+                'DemoActor', actor_id, name, self._reminder_body(name, b'')
+            )
+
+        for_actor = json.loads(await self.client.list_reminders('DemoActor', 'a1'))
+        for_type = json.loads(await self.client.list_reminders('DemoActor'))
+
+        self.assertEqual({'r1', 'r2'}, {r['name'] for r in for_actor})
+        self.assertEqual({'a1'}, {r['actorId'] for r in for_actor})
+        self.assertEqual({'r1', 'r2', 'r3'}, {r['name'] for r in for_type})
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import unittest
+
+from dapr.clients.base import gather_bounded
+
+
+class GatherBoundedTests(unittest.IsolatedAsyncioTestCase):
+    async def test_runs_all_and_raises_first_error(self):
+        ran = []
+
+        async def work(i):
+            ran.append(i)
+            if i == 1:
+                raise ValueError('boom')
+
+        with self.assertRaises(ValueError):
+            await gather_bounded((work(i) for i in range(5)), 2)
+        self.assertEqual(sorted(ran), list(range(5)))
+
+    async def test_cancelling_the_caller_cancels_in_flight_work(self):
+        started = []
+        cancelled = []
+
+        async def work(i):
+            started.append(i)
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(i)
+                raise
+
+        outer = asyncio.ensure_future(gather_bounded((work(i) for i in range(10)), 3))
+        while len(started) < 3:
+            await asyncio.sleep(0)
+        outer.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await outer
+
+        self.assertEqual(sorted(cancelled), [0, 1, 2])
+        self.assertEqual(len(started), 3)
+
+    async def test_failing_iterator_cancels_in_flight_work(self):
+        finished = []
+
+        async def work(i):
+            await asyncio.sleep(0.01)
+            finished.append(i)
+
+        def items():
+            yield work(0)
+            raise RuntimeError('iterator failed')
+
+        with self.assertRaises(RuntimeError):
+            await gather_bounded(items(), 3)
+        await asyncio.sleep(0.05)
+        self.assertEqual(finished, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2023 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from flask import Flask
+
+from dapr.actor import Actor, ActorInterface, actormethod
+from dapr.actor.runtime.config import ActorRuntimeConfig
+from dapr.actor.runtime.runtime import ActorRuntime
+from dapr.ext.flask import DaprActor
+from tests.actor.fake_client import FakeDaprActorClient
+
+
+class LoopRecorderInterface(ActorInterface):
+    @actormethod(name='CurrentLoop')
+    async def current_loop(self) -> int: ...
+
+
+class LoopRecorderActor(Actor, LoopRecorderInterface):
+    async def current_loop(self) -> int:
+        return id(asyncio.get_running_loop())
+
+
+class DaprActorTest(unittest.TestCase):
+    def setUp(self):
+        ActorRuntime._actor_managers = {}
+        ActorRuntime.set_actor_config(ActorRuntimeConfig())
+        self.app = Flask('test_app')
+        self.app.testing = True
+        self.dapr_actor = DaprActor(self.app)
+        self.dapr_actor.register_actor(LoopRecorderActor, actor_client=FakeDaprActorClient())
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        self.dapr_actor.shutdown(timeout=5)
+        ActorRuntime._actor_managers = {}
+
+    def _call(self, actor_id):
+        return self.client.put(f'/actors/LoopRecorderActor/{actor_id}/method/CurrentLoop')
+
+    def test_requests_share_one_event_loop(self):
+        first = self._call('1')
+        second = self._call('2')
+
+        self.assertEqual(200, first.status_code)
+        self.assertEqual(200, second.status_code)
+        self.assertEqual(json.loads(first.data), json.loads(second.data))
+        self.assertEqual(id(self.dapr_actor._loop), json.loads(first.data))
+
+    def test_deactivation_runs_on_loop(self):
+        self._call('1')
+        resp = self.client.delete('/actors/LoopRecorderActor/1')
+        self.assertEqual(200, resp.status_code)
+
+    def test_unknown_actor_type_returns_error(self):
+        resp = self.client.put('/actors/Unknown/1/method/CurrentLoop')
+        self.assertEqual(500, resp.status_code)
+
+    def test_shutdown_stops_loop_and_rejects_later_calls(self):
+        self._call('1')
+        thread = self.dapr_actor._loop_thread
+        self.dapr_actor.shutdown(timeout=5)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(self.dapr_actor._loop)
+
+        # The active actor's primitives belong to the stopped loop; no new loop is started.
+        resp = self._call('1')
+        self.assertEqual(500, resp.status_code)
+        self.assertIsNone(self.dapr_actor._loop_thread)
+
+    def test_teardown_shuts_down(self):
+        thread = self.dapr_actor._loop_thread
+        self.dapr_actor.teardown(None)
+        self.assertFalse(thread.is_alive())
+
+    def test_loop_is_shut_down_at_exit(self):
+        dapr_actor = DaprActor()
+        with mock.patch('dapr.ext.flask.actor.atexit') as mock_atexit:
+            dapr_actor._ensure_loop()
+            mock_atexit.register.assert_called_once_with(dapr_actor.shutdown)
+            dapr_actor.shutdown(timeout=5)
+            mock_atexit.unregister.assert_called_once_with(dapr_actor.shutdown)
+
+
+if __name__ == '__main__':
+    unittest.main()
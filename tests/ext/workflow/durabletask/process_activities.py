@@ -0,0 +1,43 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Module-level activities for the process-pool tests.
+
+Worker processes are spawned, so they must be able to import these by name.
+"""
+
+import os
+import time
+
+from dapr.ext.workflow._durabletask import task
+
+
+def fib(ctx: task.ActivityContext, n: int) -> int:
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def pid(ctx: task.ActivityContext, _) -> int:
+    return os.getpid()
+
+
+def fail(ctx: task.ActivityContext, message: str):
+    raise ValueError(message)
+
+
+def sleep(ctx: task.ActivityContext, seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def crash(ctx: task.ActivityContext, _) -> None:
+    os._exit(1)
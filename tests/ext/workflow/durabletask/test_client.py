@@ -1,5 +1,9 @@
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+from google.protobuf import wrappers_pb2
+
+import dapr.ext.workflow._durabletask.internal.protos as pb
 from dapr.ext.workflow._durabletask import client
 from dapr.ext.workflow._durabletask.internal.grpc_interceptor import DefaultClientInterceptorImpl
 from dapr.ext.workflow._durabletask.internal.shared import (
@@ -175,3 +179,43 @@ def test_taskhub_client_close_closes_channel_handles_exceptions():
         task_hub_client = client.TaskHubGrpcClient()
         task_hub_client.close()
         mock_channel.close.assert_called_once()
+
+
+def test_purge_filter_request_and_result():
+    created_from = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    req = client.new_purge_filter_request(
+        created_from,
+        None,
+        [client.OrchestrationStatus.COMPLETED, client.OrchestrationStatus.FAILED],
+        False,
+    )
+
+    assert req.purgeInstanceFilter.createdTimeFrom.ToDatetime(timezone.utc) == created_from
+    assert not req.purgeInstanceFilter.HasField('createdTimeTo')
+    assert list(req.purgeInstanceFilter.runtimeStatus) == [
+        pb.ORCHESTRATION_STATUS_COMPLETED,
+        pb.ORCHESTRATION_STATUS_FAILED,
+    ]
+    assert req.instanceId == '' and not req.recursive
+
+    partial = pb.PurgeInstancesResponse(
+        deletedInstanceCount=7, isComplete=wrappers_pb2.BoolValue(value=False)
+    )
+    assert client.new_purge_instances_result(partial) == client.PurgeInstancesResult(7, False)
+    assert client.new_purge_instances_result(
+        pb.PurgeInstancesResponse()
+    ) == client.PurgeInstancesResult(0, None)
+
+
+def test_list_instance_ids_request_and_page():
+    req = client.new_list_instance_ids_request(50, 'tok-1')
+    assert req.pageSize == 50 and req.continuationToken == 'tok-1'
+    first = client.new_list_instance_ids_request(None, None)
+    assert not first.HasField('pageSize') and not first.HasField('continuationToken')
+
+    res = pb.ListInstanceIDsResponse(instanceIds=['a', 'b'], continuationToken='tok-2')
+    assert client.new_instance_id_page(res) == client.InstanceIdPage(['a', 'b'], 'tok-2')
+    last = pb.ListInstanceIDsResponse(instanceIds=['c'])
+    assert client.new_instance_id_page(last) == client.InstanceIdPage(['c'], None)
+    empty_token = pb.ListInstanceIDsResponse(continuationToken='')
+    assert client.new_instance_id_page(empty_token).continuation_token is None
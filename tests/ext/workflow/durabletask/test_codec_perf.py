@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Encode/decode throughput of the payload codecs on typical activity payloads.
+
+Each codec round-trips a small record (an order), a medium one (a page of 50 records)
+and a large one (2,000 records), and the benchmark reports operations per second and the
+encoded size. Run with ``-s`` to see the table.
+"""
+
+import time
+
+import pytest
+
+from dapr.ext.workflow._durabletask.codecs import JsonCodec, MsgpackCodec, OrjsonCodec
+
+pytestmark = pytest.mark.perf
+
+ROUNDS = 5
+
+
+def _record(i: int) -> dict:
+    return {
+        'id': f'order-{i:06d}',
+        'customer': {'id': i % 97, 'name': f'Customer {i % 97}', 'tier': 'gold'},
+        'items': [
+            {'sku': f'SKU-{j:04d}', 'quantity': j % 5 + 1, 'price': 9.99 + j} for j in range(4)
+        ],
+        'total': 123.45 + i,
+        'paid': i % 2 == 0,
+        'notes': None,
+    }
+
+
+PAYLOADS = {
+    'small': _record(1),
+    'medium': [_record(i) for i in range(50)],
+    'large': [_record(i) for i in range(2000)],
+}
+
+CODECS = {
+    'json': JsonCodec(),
+    'orjson': OrjsonCodec(),
+    'msgpack': MsgpackCodec(),
+    'json+zlib': JsonCodec(compression_threshold_bytes=1024),
+    'orjson+zlib': OrjsonCodec(compression_threshold_bytes=1024),
+}
+
+
+def _ops_per_second(fn, value, target_s: float = 0.05) -> float:
+    n = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(n):
+            fn(value)
+        elapsed = time.perf_counter() - start
+        if elapsed >= target_s:
+            break
+        n *= 2
+    best = elapsed
+    for _ in range(ROUNDS - 1):
+        start = time.perf_counter()
+        for _ in range(n):
+            fn(value)
+        best = min(best, time.perf_counter() - start)
+    return n / best
+
+
+def _measure(codec, payload) -> tuple[float, float, int]:
+    encoded = codec.encode(payload)
+    assert codec.decode(encoded) == payload
+    return (
+        _ops_per_second(codec.encode, payload),
+        _ops_per_second(codec.decode, encoded),
+        len(encoded),
+    )
+
+
+def test_codec_throughput():
+    results = {
+        (codec_name, payload_name): _measure(codec, payload)
+        for codec_name, codec in CODECS.items()
+        for payload_name, payload in PAYLOADS.items()
+    }
+
+    print(f'\n{"codec":<12} {"payload":<8} {"encode/s":>12} {"decode/s":>12} {"bytes":>10}')
+    for (codec_name, payload_name), (encode, decode, size) in results.items():
+        print(f'{codec_name:<12} {payload_name:<8} {encode:>12,.0f} {decode:>12,.0f} {size:>10,}')
+
+    # orjson should beat the json module both ways once payloads are not trivial.
+    json_encode, json_decode, json_size = results[('json', 'large')]
+    orjson_encode, orjson_decode, _ = results[('orjson', 'large')]
+    assert orjson_encode > json_encode
+    assert orjson_decode > json_decode
+    # Compression should shrink a large, repetitive payload severalfold, base64 included.
+    assert results[('json+zlib', 'large')][2] * 3 < json_size
+    # Small payloads stay under the compression threshold and are written as plain JSON.
+    assert results[('json+zlib', 'small')][2] == results[('json', 'small')][2]
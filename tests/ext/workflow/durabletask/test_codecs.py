@@ -0,0 +1,236 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import pickle
+from collections import namedtuple
+from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from google.protobuf import wrappers_pb2
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import client, task, worker
+from dapr.ext.workflow._durabletask.codecs import (
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    is_tagged,
+)
+from dapr.ext.workflow._durabletask.internal import shared
+
+TEST_LOGGER = logging.getLogger('tests')
+TEST_INSTANCE_ID = 'abc123'
+
+
+@dataclass
+class Order:
+    id: int
+    items: list
+
+
+Point = namedtuple('Point', ['x', 'y'])
+
+CODECS = [
+    JsonCodec(),
+    OrjsonCodec(),
+    MsgpackCodec(),
+    JsonCodec(compression_threshold_bytes=0),
+    OrjsonCodec(compression_threshold_bytes=0),
+    MsgpackCodec(compression_threshold_bytes=0),
+]
+
+VALUES = [
+    None,
+    42,
+    'text',
+    [1, 'two', 3.5],
+    {'nested': {'order': Order(1, ['a', 'b'])}},
+    Point(1, 2),
+    SimpleNamespace(a=1),
+]
+
+
+def _normalized(value):
+    return json.loads(shared.to_json(value))
+
+
+@pytest.mark.parametrize('codec', CODECS, ids=repr)
+def test_round_trip_matches_the_json_module(codec):
+    for value in VALUES:
+        encoded = codec.encode(value)
+        assert isinstance(encoded, str)
+        expected = shared.from_json(shared.to_json(value))
+        for reader in (codec, JsonCodec(), OrjsonCodec(), MsgpackCodec()):
+            assert repr(reader.decode(encoded)) == repr(expected)
+        assert json.loads(codec.to_json(encoded)) == _normalized(value)
+
+
+def test_json_codecs_write_untagged_json():
+    value = {'order': Order(7, [1, 2])}
+    assert JsonCodec().encode(value) == shared.to_json(value)
+    assert json.loads(OrjsonCodec().encode(value)) == json.loads(shared.to_json(value))
+    assert is_tagged(MsgpackCodec().encode(value))
+
+
+def test_untagged_payloads_decode_as_json():
+    # Payloads written before codecs existed.
+    legacy = shared.to_json({'order': Order(1, [])})
+    for codec in CODECS:
+        assert codec.decode(legacy)['order'].id == 1
+        assert codec.to_json(legacy) is legacy
+
+
+def test_compression_threshold():
+    codec = JsonCodec(compression_threshold_bytes=100)
+    small = codec.encode('x' * 10)
+    large = codec.encode('x' * 1000)
+
+    assert small == '"xxxxxxxxxx"'
+    assert large.startswith('~json+zlib:')
+    assert len(large) < 100
+    assert codec.decode(large) == 'x' * 1000
+
+
+def test_orjson_keeps_wide_integers_exact():
+    codec = OrjsonCodec()
+    value = {'big': 2**70, 'keys': {1: 'one'}}
+    encoded = codec.encode(value)
+    assert encoded == shared.to_json(value)
+    assert codec.decode(encoded) == {'big': 2**70, 'keys': {'1': 'one'}}
+
+
+def test_unserializable_values_raise_type_error():
+    for codec in CODECS:
+        with pytest.raises(TypeError):
+            codec.encode(object())
+
+
+def test_invalid_payloads_and_options_are_rejected():
+    with pytest.raises(ValueError):
+        JsonCodec().decode('~unknown:AAAA')
+    with pytest.raises(ValueError):
+        JsonCodec().decode('~no-separator')
+    with pytest.raises(ValueError):
+        JsonCodec(compression_threshold_bytes=-1)
+    with pytest.raises(ValueError):
+        JsonCodec(compression_level=0)
+
+
+def test_codecs_can_be_sent_to_worker_processes():
+    for codec in CODECS:
+        clone = pickle.loads(pickle.dumps(codec))
+        assert clone.decode(codec.encode([1, 2])) == [1, 2]
+
+
+def test_orchestration_encodes_with_its_codec():
+    codec = MsgpackCodec()
+
+    def orchestrator(ctx: task.OrchestrationContext, order):
+        local = yield ctx.call_activity('local', input=order.items)
+        yield ctx.call_activity('remote', input=order.items, app_id='other-app')
+        return local
+
+    registry = worker._Registry()
+    name = registry.add_orchestrator(orchestrator)
+    old_events = [
+        helpers.new_workflow_started_event(),
+        helpers.new_execution_started_event(
+            name, TEST_INSTANCE_ID, encoded_input=codec.encode(Order(1, ['a']))
+        ),
+    ]
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER, codec=codec)
+
+    result = executor.execute(TEST_INSTANCE_ID, [], old_events)
+    (local,) = result.actions
+    assert codec.decode(local.scheduleTask.input.value) == ['a']
+    assert is_tagged(local.scheduleTask.input.value)
+
+    old_events.append(helpers.new_task_scheduled_event(1, 'local'))
+    result = executor.execute(
+        TEST_INSTANCE_ID, old_events, [helpers.new_task_completed_event(1, codec.encode('done'))]
+    )
+    (remote,) = result.actions
+    # Other apps may not share the codec, so they get plain JSON.
+    assert remote.scheduleTask.input.value == '["a"]'
+
+    old_events += [
+        helpers.new_task_completed_event(1, codec.encode('done')),
+        helpers.new_task_scheduled_event(2, 'remote'),
+    ]
+    result = executor.execute(
+        TEST_INSTANCE_ID, old_events, [helpers.new_task_completed_event(2, 'null')]
+    )
+    (complete,) = result.actions
+    assert complete.completeWorkflow.workflowStatus == pb.ORCHESTRATION_STATUS_COMPLETED
+    assert codec.decode(complete.completeWorkflow.result.value) == 'done'
+
+
+def test_child_workflow_results_are_plain_json():
+    codec = MsgpackCodec()
+
+    def orchestrator(ctx: task.OrchestrationContext, order):
+        return order.items
+
+    registry = worker._Registry()
+    name = registry.add_orchestrator(orchestrator)
+    started = helpers.new_execution_started_event(
+        name, TEST_INSTANCE_ID, encoded_input=codec.encode(Order(1, ['a']))
+    )
+    started.executionStarted.parentInstance.appID = 'caller-app'
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER, codec=codec)
+
+    result = executor.execute(TEST_INSTANCE_ID, [], [helpers.new_workflow_started_event(), started])
+    (complete,) = result.actions
+    # The parent may run in another app or SDK that cannot read the codec.
+    assert complete.completeWorkflow.result.value == '["a"]'
+
+
+def test_activity_executor_reads_its_codec_and_writes_plain_json():
+    codec = JsonCodec(compression_threshold_bytes=0)
+    executor = worker._ActivityExecutor(TEST_LOGGER, codec)
+
+    def double(ctx, value):
+        return value * 2
+
+    encoded = executor.execute(double, TEST_INSTANCE_ID, 'double', 1, codec.encode('ab'))
+    # The calling workflow may run in another app or SDK that cannot read the codec.
+    assert encoded == '"abab"'
+
+
+def test_client_encodes_inputs_and_reads_plain_json():
+    codec = MsgpackCodec()
+    c = client.TaskHubGrpcClient(codec=codec)
+    c._stub = mock.Mock()
+    c._stub.StartInstance.return_value = pb.CreateInstanceResponse(instanceId='abc')
+
+    c.schedule_new_orchestration('wf', input={'n': 1}, instance_id='abc')
+    (req,), _ = c._stub.StartInstance.call_args
+    assert codec.decode(req.input.value) == {'n': 1}
+    assert is_tagged(req.input.value)
+
+    c._stub.GetInstance.return_value = pb.GetInstanceResponse(
+        exists=True,
+        workflowState=pb.WorkflowState(
+            instanceId='abc',
+            name='wf',
+            workflowStatus=pb.ORCHESTRATION_STATUS_COMPLETED,
+            input=wrappers_pb2.StringValue(value=req.input.value),
+            output=wrappers_pb2.StringValue(value='"done"'),
+        ),
+    )
+    state = c.get_orchestration_state('abc')
+    assert state.serialized_input == '{"n": 1}'
+    assert state.serialized_output == '"done"'
@@ -24,6 +24,8 @@ def test_default_concurrency_options():
     assert options.maximum_concurrent_activity_work_items == expected_default
     assert options.maximum_concurrent_orchestration_work_items == expected_default
     assert options.maximum_thread_pool_workers == expected_workers
+    assert options.maximum_process_pool_workers == processor_count
+    assert options.process_activity_timeout is None
 
 
 def test_custom_concurrency_options():
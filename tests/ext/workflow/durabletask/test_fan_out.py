@@ -0,0 +1,154 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for large fan-outs: batching a turn's actions and folding results."""
+
+import json
+import logging
+from datetime import timedelta
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import task, worker
+
+TEST_LOGGER = logging.getLogger('tests')
+TEST_INSTANCE_ID = 'abc123'
+
+
+def _fan_out(count: int, payload: str = ''):
+    def work(ctx, value):
+        return value
+
+    def orchestrator(ctx: task.OrchestrationContext, _):
+        tasks = [ctx.call_activity(work, input=f'{i}{payload}') for i in range(count)]
+        done = yield task.when_any(
+            [
+                task.when_all_reduce(tasks, lambda acc, _: acc + 1, 0),
+                ctx.create_timer(timedelta(hours=1)),
+            ]
+        )
+        return done.get_result()
+
+    registry = worker._Registry()
+    name = registry.add_orchestrator(orchestrator)
+    start = [
+        helpers.new_workflow_started_event(),
+        helpers.new_execution_started_event(name, TEST_INSTANCE_ID, encoded_input=None),
+    ]
+    return registry, start
+
+
+def _kinds(actions):
+    return [a.WhichOneof('workflowActionType') for a in actions]
+
+
+def _confirmations(actions):
+    events = []
+    for a in actions:
+        kind = a.WhichOneof('workflowActionType')
+        if kind == 'scheduleTask':
+            events.append(helpers.new_task_scheduled_event(a.id, a.scheduleTask.name))
+        elif kind == 'createTimer':
+            events.append(
+                pb.HistoryEvent(
+                    eventId=a.id, timerCreated=pb.TimerCreatedEvent(fireAt=a.createTimer.fireAt)
+                )
+            )
+    return events
+
+
+def test_actions_beyond_the_limit_wait_for_later_turns():
+    registry, start = _fan_out(7)
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER, max_actions_per_turn=3)
+
+    first = executor.execute(TEST_INSTANCE_ID, [], start).actions
+    # Other actions always go out; only activities and child workflows are held back.
+    assert _kinds(first) == ['scheduleTask'] * 3 + ['createTimer']
+    assert [a.id for a in first] == [1, 2, 3, 8]
+
+    history = start + _confirmations(first)
+    sent = list(first)
+    new_events = [helpers.new_task_completed_event(i, '"x"') for i in (1, 2, 3)]
+    while True:
+        # A fresh replay picks up the held-back actions where the last turn stopped.
+        result = worker._OrchestrationExecutor(
+            registry, TEST_LOGGER, max_actions_per_turn=3
+        ).execute(TEST_INSTANCE_ID, history, new_events)
+        history += new_events
+        if _kinds(result.actions) == ['completeWorkflow']:
+            break
+        assert 1 <= len(result.actions) <= 3
+        sent += result.actions
+        history += _confirmations(result.actions)
+        new_events = [helpers.new_task_completed_event(a.id, '"x"') for a in result.actions]
+
+    assert sorted(a.id for a in sent if a.HasField('scheduleTask')) == list(range(1, 8))
+    (complete,) = result.actions
+    assert json.loads(complete.completeWorkflow.result.value) == 7
+
+
+def test_live_execution_sends_held_back_actions():
+    registry, start = _fan_out(5)
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER, max_actions_per_turn=2)
+
+    first = executor.execute(TEST_INSTANCE_ID, [], start).actions
+    second = executor.execute_delta(
+        _confirmations(first), [helpers.new_task_completed_event(1, '"0"')]
+    ).actions
+
+    assert [a.id for a in first if a.HasField('scheduleTask')] == [1, 2]
+    assert [a.id for a in second] == [3, 4]
+
+
+def test_actions_are_batched_by_size():
+    registry, start = _fan_out(10, payload='x' * 1000)
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER, max_action_bytes_per_turn=3500)
+
+    actions = executor.execute(TEST_INSTANCE_ID, [], start).actions
+
+    assert _kinds(actions).count('scheduleTask') == 3
+    assert sum(a.ByteSize() for a in actions) <= 3500
+
+
+def test_one_activity_is_sent_even_when_over_the_size_limit():
+    registry, start = _fan_out(3, payload='x' * 1000)
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER, max_action_bytes_per_turn=10)
+
+    actions = executor.execute(TEST_INSTANCE_ID, [], start).actions
+
+    assert _kinds(actions) == ['scheduleTask', 'createTimer']
+
+
+def test_worker_derives_the_size_limit_from_the_channel():
+    assert worker.TaskHubGrpcWorker()._max_action_bytes_per_turn == 3 * 1024 * 1024
+    w = worker.TaskHubGrpcWorker(channel_options=[('grpc.max_send_message_length', 1000)])
+    assert w._max_action_bytes_per_turn == 750
+    assert worker.TaskHubGrpcWorker(max_action_bytes_per_turn=0)._max_action_bytes_per_turn is None
+
+
+def test_many_waiters_for_the_same_event_are_served_in_order():
+    def orchestrator(ctx: task.OrchestrationContext, _):
+        values = yield task.when_all([ctx.wait_for_external_event('tick') for _ in range(500)])
+        return values[:3] + values[-1:]
+
+    registry = worker._Registry()
+    name = registry.add_orchestrator(orchestrator)
+    events = [
+        helpers.new_workflow_started_event(),
+        helpers.new_execution_started_event(name, TEST_INSTANCE_ID, encoded_input=None),
+    ] + [helpers.new_event_raised_event('tick', str(i)) for i in range(500)]
+
+    result = worker._OrchestrationExecutor(registry, TEST_LOGGER).execute(
+        TEST_INSTANCE_ID, [], events
+    )
+
+    (complete,) = result.actions
+    assert json.loads(complete.completeWorkflow.result.value) == [0, 1, 2, 499]
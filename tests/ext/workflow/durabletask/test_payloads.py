@@ -0,0 +1,248 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+
+import pytest
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import task, worker
+from dapr.ext.workflow._durabletask.payloads import (
+    PayloadStore,
+    PayloadStoreError,
+    _PayloadClaimCheck,
+    is_payload_reference,
+)
+
+TEST_LOGGER = logging.getLogger('tests')
+TEST_INSTANCE_ID = 'abc123'
+
+
+class MemoryPayloadStore(PayloadStore):
+    def __init__(self):
+        self.data = {}
+        self.loads = 0
+        self.fail = False
+
+    def save(self, key, payload):
+        if self.fail:
+            raise ConnectionError('store down')
+        self.data[key] = payload
+
+    def load(self, key):
+        if self.fail:
+            raise ConnectionError('store down')
+        self.loads += 1
+        return self.data[key]
+
+
+def test_small_payloads_stay_inline():
+    payloads = _PayloadClaimCheck(MemoryPayloadStore(), threshold_bytes=16)
+    assert payloads.externalize('"small"') == '"small"'
+    assert payloads.externalize(None) is None
+    assert payloads.resolve('"small"') == '"small"'
+    assert not _PayloadClaimCheck(None).enabled
+
+
+def test_large_payloads_round_trip_through_a_reference():
+    store = MemoryPayloadStore()
+    payloads = _PayloadClaimCheck(store, threshold_bytes=16)
+    encoded = json.dumps('x' * 1000)
+
+    reference = payloads.externalize(encoded)
+    assert is_payload_reference(reference)
+    assert len(reference) < len(encoded)
+    assert list(store.data.values()) == [encoded]
+    # Content-addressed: the same payload maps to the same reference.
+    assert payloads.externalize(encoded) == reference
+    assert payloads.externalize(reference) == reference
+
+    fresh = _PayloadClaimCheck(store, threshold_bytes=16)
+    assert fresh.resolve(reference) == encoded
+    assert fresh.resolve(reference) == encoded
+    assert store.loads == 1
+
+
+def test_cache_is_bounded():
+    store = MemoryPayloadStore()
+    payloads = _PayloadClaimCheck(store, threshold_bytes=4, cache_max_bytes=50)
+    first = payloads.externalize(json.dumps('a' * 30))
+    payloads.externalize(json.dumps('b' * 30))
+
+    assert payloads.resolve(first) == json.dumps('a' * 30)
+    assert store.loads == 1
+
+
+def test_store_failures_raise_payload_store_error():
+    store = MemoryPayloadStore()
+    payloads = _PayloadClaimCheck(store, threshold_bytes=4)
+    reference = payloads.externalize(json.dumps('payload'))
+    store.fail = True
+
+    with pytest.raises(PayloadStoreError):
+        payloads.externalize(json.dumps('another payload'))
+    with pytest.raises(PayloadStoreError):
+        _PayloadClaimCheck(store, threshold_bytes=4).resolve(reference)
+
+
+def test_externalize_actions_skips_cross_app_actions():
+    payloads = _PayloadClaimCheck(MemoryPayloadStore(), threshold_bytes=4)
+    encoded = json.dumps('large input')
+    local = helpers.new_schedule_task_action(1, 'act', encoded, None)
+    remote = helpers.new_schedule_task_action(2, 'act', encoded, None)
+    remote.router.sourceAppID = 'app-a'
+    remote.router.targetAppID = 'app-b'
+    event = pb.WorkflowAction(
+        id=3,
+        sendEvent=pb.SendEventAction(instance=pb.WorkflowInstance(instanceId='other'), name='evt'),
+    )
+    event.sendEvent.data.value = encoded
+    complete = helpers.new_complete_workflow_action(4, pb.ORCHESTRATION_STATUS_COMPLETED, encoded)
+
+    payloads.externalize_actions([local, remote, event, complete])
+
+    assert is_payload_reference(local.scheduleTask.input.value)
+    assert remote.scheduleTask.input.value == encoded
+    assert event.sendEvent.data.value == encoded
+    assert is_payload_reference(complete.completeWorkflow.result.value)
+
+
+def _activity_orchestrator():
+    def dummy_activity(ctx, _):
+        pass
+
+    def orchestrator(ctx: task.OrchestrationContext, _):
+        result = yield ctx.call_activity(dummy_activity)
+        return len(result)
+
+    registry = worker._Registry()
+    name = registry.add_orchestrator(orchestrator)
+    old_events = [
+        helpers.new_workflow_started_event(),
+        helpers.new_execution_started_event(name, TEST_INSTANCE_ID, encoded_input=None),
+        helpers.new_task_scheduled_event(1, task.get_name(dummy_activity)),
+    ]
+    return registry, old_events
+
+
+def test_executor_resolves_referenced_results():
+    store = MemoryPayloadStore()
+    payloads = _PayloadClaimCheck(store, threshold_bytes=16)
+    reference = payloads.externalize(json.dumps('y' * 100))
+    registry, old_events = _activity_orchestrator()
+
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER, payloads)
+    result = executor.execute(
+        TEST_INSTANCE_ID, old_events, [helpers.new_task_completed_event(1, reference)]
+    )
+
+    (action,) = result.actions
+    assert action.completeWorkflow.workflowStatus == pb.ORCHESTRATION_STATUS_COMPLETED
+    assert action.completeWorkflow.result.value == '100'
+
+
+def test_store_outage_is_not_a_workflow_failure():
+    store = MemoryPayloadStore()
+    payloads = _PayloadClaimCheck(store, threshold_bytes=16)
+    reference = payloads.externalize(json.dumps('y' * 100))
+    store.fail = True
+    registry, old_events = _activity_orchestrator()
+
+    executor = worker._OrchestrationExecutor(
+        registry, TEST_LOGGER, _PayloadClaimCheck(store, threshold_bytes=16)
+    )
+    with pytest.raises(PayloadStoreError):
+        executor.execute(
+            TEST_INSTANCE_ID, old_events, [helpers.new_task_completed_event(1, reference)]
+        )
+
+
+def test_worker_redispatches_on_store_outage():
+    store = MemoryPayloadStore()
+    w = worker.TaskHubGrpcWorker(payload_store=store, payload_threshold_bytes=16)
+
+    def orchestrator(ctx: task.OrchestrationContext, _):
+        return ctx.instance_id * 20
+
+    name = w.add_orchestrator(orchestrator)
+    req = pb.WorkflowRequest(
+        instanceId=TEST_INSTANCE_ID,
+        newEvents=[
+            helpers.new_workflow_started_event(),
+            helpers.new_execution_started_event(name, TEST_INSTANCE_ID, encoded_input=None),
+        ],
+    )
+
+    res, _ = w._build_orchestrator_response(req, [], None)
+    (action,) = res.actions
+    assert is_payload_reference(action.completeWorkflow.result.value)
+
+    # A payload already in the store is not written again, so use a new one.
+    store.fail = True
+    req.instanceId = 'other'
+    with pytest.raises(worker._HistoryResolutionError):
+        w._build_orchestrator_response(req, [], None)
+
+
+def test_externalize_actions_keeps_child_workflow_results_inline():
+    payloads = _PayloadClaimCheck(MemoryPayloadStore(), threshold_bytes=4)
+    encoded = json.dumps('large result')
+    complete = helpers.new_complete_workflow_action(1, pb.ORCHESTRATION_STATUS_COMPLETED, encoded)
+
+    payloads.externalize_actions([complete], has_parent=True)
+
+    assert complete.completeWorkflow.result.value == encoded
+
+
+def test_worker_keeps_results_for_callers_in_other_apps_inline():
+    store = MemoryPayloadStore()
+    w = worker.TaskHubGrpcWorker(payload_store=store, payload_threshold_bytes=16)
+
+    def orchestrator(ctx: task.OrchestrationContext, _):
+        return ctx.instance_id * 20
+
+    def produce(ctx, _):
+        return 'z' * 100
+
+    def produce_shared(ctx, _):
+        return 'z' * 100
+
+    name = w.add_orchestrator(orchestrator)
+    w.add_activity(produce)
+    w.add_activity(produce_shared, externalize_output=True)
+
+    # A child workflow started by a parent in another app.
+    started = helpers.new_execution_started_event(name, TEST_INSTANCE_ID, encoded_input=None)
+    started.executionStarted.parentInstance.appID = 'caller-app'
+    started.executionStarted.parentInstance.workflowInstance.instanceId = 'parent'
+    req = pb.WorkflowRequest(
+        instanceId=TEST_INSTANCE_ID, newEvents=[helpers.new_workflow_started_event(), started]
+    )
+    res, _ = w._build_orchestrator_response(req, [], None)
+    (action,) = res.actions
+    assert action.completeWorkflow.result.value == json.dumps(TEST_INSTANCE_ID * 20)
+
+    # Activity outputs stay inline unless the activity opts in.
+    activity_req = pb.ActivityRequest(
+        name=task.get_name(produce),
+        workflowInstance=pb.WorkflowInstance(instanceId='parent'),
+        taskId=1,
+    )
+    res = w._run_activity(produce, activity_req, 'parent', 'token')
+    assert res.result.value == json.dumps('z' * 100)
+    assert not store.data
+
+    activity_req.name = task.get_name(produce_shared)
+    res = w._run_activity(produce_shared, activity_req, 'parent', 'token')
+    assert is_payload_reference(res.result.value)
+    assert list(store.data.values()) == [json.dumps('z' * 100)]
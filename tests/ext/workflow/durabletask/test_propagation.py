@@ -17,6 +17,8 @@ durabletask-go/api/propagation_test.go.
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 from google.protobuf import wrappers_pb2
 
@@ -348,8 +350,40 @@ def test_from_proto_rejects_malformed_raw_event():
             ),
         ],
     )
-    with pytest.raises(ValueError, match='rawEvent'):
-        PropagatedHistory.from_proto(bad_proto)
+    ph = PropagatedHistory.from_proto(bad_proto)
+    assert ph is not None
+    with pytest.raises(ValueError, match='rawEvent 0'):
+        ph.events
+    with pytest.raises(ValueError, match='rawEvent 0'):
+        ph.get_events_by_app_id('appA')
+    with pytest.raises(ValueError, match='rawEvent 0'):
+        ph.get_last_workflow_by_name('X').get_activities_by_name('A')
+
+
+def test_chunks_are_parsed_on_first_access():
+    proto = _make_proto_history()
+    proto.chunks.append(
+        pb.PropagatedHistoryChunk(
+            appId='appC', instanceId='wf-3', workflowName='Broken', rawEvents=[b'\xff garbage']
+        )
+    )
+    ph = PropagatedHistory.from_proto(proto)
+    assert ph is not None
+
+    # Metadata and the other chunks stay readable; only the malformed chunk raises.
+    assert ph.get_app_ids() == ['appA', 'appB', 'appC']
+    assert len(ph.get_events_by_app_id('appA')) == 4
+    payment = ph.get_last_workflow_by_name('ProcessPayment')
+    assert len(payment.get_activities_by_name('ValidateCard')) == 2
+    with pytest.raises(ValueError, match='chunk 2'):
+        ph.get_events_by_workflow_name('Broken')
+
+
+def test_propagated_history_pickles():
+    ph = PropagatedHistory.from_proto(_make_proto_history())
+    clone = pickle.loads(pickle.dumps(ph))
+    assert clone.events == ph.events
+    assert clone.get_last_workflow_by_name('ProcessPayment').app_id == 'appB'
 
 
 def test_from_proto_round_trip_preserves_events():
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Replay microbenchmark for ``_OrchestrationExecutor.process_event``.
+
+Replays a synthetic 10k-event history (sequential activities: taskScheduled/taskCompleted
+pairs, each preceded by a workflowStarted) and reports the per-event cost. It also times
+the event-type lookup on its own, the table lookup against the ``HasField`` probe chain it
+replaced, over the same events.
+"""
+
+import json
+import logging
+import time
+from datetime import datetime
+
+import pytest
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import task, worker
+
+pytestmark = pytest.mark.perf
+
+N_EVENTS = 10_000
+# Generous per-event ceiling; replaying one event costs a few microseconds.
+MAX_MEAN_EVENT_S = 0.0002
+
+# The order the old if/elif chain probed event types in.
+_PROBE_ORDER = (
+    'workflowStarted',
+    'executionStarted',
+    'timerCreated',
+    'timerFired',
+    'taskScheduled',
+    'taskCompleted',
+    'taskFailed',
+    'childWorkflowInstanceCreated',
+    'childWorkflowInstanceCompleted',
+    'childWorkflowInstanceFailed',
+    'eventRaised',
+    'executionSuspended',
+    'executionResumed',
+    'executionTerminated',
+    'executionStalled',
+)
+
+
+def _sequence(ctx: task.OrchestrationContext, steps: int):
+    total = 0
+    for i in range(steps):
+        total += yield ctx.call_activity('add', input=i)
+    return total
+
+
+def _history(n_events: int) -> tuple[list[pb.HistoryEvent], int]:
+    steps = (n_events - 2) // 3
+    start = datetime(2020, 1, 1)
+    events = [
+        helpers.new_workflow_started_event(start),
+        helpers.new_execution_started_event('_sequence', 'bench', json.dumps(steps)),
+    ]
+    for i in range(steps):
+        task_id = i + 1
+        events.append(helpers.new_task_scheduled_event(task_id, 'add'))
+        events.append(helpers.new_workflow_started_event(start))
+        events.append(helpers.new_task_completed_event(task_id, json.dumps(i)))
+    return events, steps
+
+
+def _replay(events: list[pb.HistoryEvent]) -> float:
+    registry = worker._Registry()
+    registry.add_orchestrator(_sequence)
+    executor = worker._OrchestrationExecutor(registry, logging.getLogger('bench'))
+    old_events, new_events = events[:-1], events[-1:]
+    start = time.perf_counter()
+    result = executor.execute('bench', old_events, new_events)
+    elapsed = time.perf_counter() - start
+    (action,) = result.actions
+    assert action.completeWorkflow.workflowStatus == pb.ORCHESTRATION_STATUS_COMPLETED
+    return elapsed
+
+
+def _probe_chain(events: list[pb.HistoryEvent]) -> float:
+    start = time.perf_counter()
+    for event in events:
+        for name in _PROBE_ORDER:
+            if event.HasField(name):
+                break
+    return time.perf_counter() - start
+
+
+def _table_lookup(events: list[pb.HistoryEvent]) -> float:
+    handlers = worker._OrchestrationExecutor._EVENT_HANDLERS
+    start = time.perf_counter()
+    for event in events:
+        handlers.get(event.WhichOneof('eventType'))
+    return time.perf_counter() - start
+
+
+def test_replay_per_event_cost():
+    events, _ = _history(N_EVENTS)
+    elapsed = min(_replay(events) for _ in range(3))
+    mean = elapsed / len(events)
+    print(f'\nreplay: {len(events)} events in {elapsed:.3f}s ({mean * 1e6:.2f}us/event)')
+    assert mean < MAX_MEAN_EVENT_S, f'replay took {mean * 1e6:.2f}us/event'
+
+
+def test_table_lookup_beats_probe_chain():
+    events, _ = _history(N_EVENTS)
+    chain = min(_probe_chain(events) for _ in range(5))
+    table = min(_table_lookup(events) for _ in range(5))
+    print(
+        f'\nevent-type lookup: probe chain {chain / len(events) * 1e9:.0f}ns/event,'
+        f' table {table / len(events) * 1e9:.0f}ns/event'
+    )
+    assert table < chain
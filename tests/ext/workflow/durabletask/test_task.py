@@ -359,3 +359,64 @@ def test_when_all_failure_propagates_to_parent():
     # The parent WhenAnyTask should also have completed
     assert any_task.is_complete
     assert any_task.get_result() is all_task
+
+
+def test_when_all_reduce_folds_in_completion_order():
+    children = [task.CompletableTask() for _ in range(3)]
+    children[0].complete('a')
+
+    reduce_task = task.when_all_reduce(children, lambda acc, value: acc + value, '')
+
+    assert not reduce_task.is_complete
+    assert reduce_task.pending_tasks == 2
+    children[2].complete('c')
+    children[1].complete('b')
+
+    assert reduce_task.is_complete
+    assert reduce_task.get_result() == 'acb'
+    assert reduce_task.get_completed_tasks() == 3
+    assert reduce_task.get_tasks() == []
+
+
+def test_when_all_reduce_empty_returns_initial():
+    reduce_task = task.when_all_reduce([], lambda acc, value: acc + value, 0)
+
+    assert reduce_task.is_complete
+    assert reduce_task.get_result() == 0
+
+
+def test_when_all_reduce_fails_after_all_children_finish():
+    c1, c2, c3 = (task.CompletableTask() for _ in range(3))
+    folded = []
+
+    def reducer(acc, value):
+        folded.append(value)
+        return acc + value
+
+    reduce_task = task.when_all_reduce([c1, c2, c3], reducer, 0)
+    c1.complete(1)
+    c2.fail('boom', _make_failure_details('boom'))
+
+    assert not reduce_task.is_complete
+    assert not reduce_task.is_failed
+    c3.complete(3)
+
+    assert reduce_task.is_complete
+    assert isinstance(reduce_task.get_exception(), task.TaskFailedError)
+    # Nothing is folded after the first failure.
+    assert folded == [1]
+
+
+def test_when_all_reduce_surfaces_reducer_errors():
+    c1, c2 = task.CompletableTask(), task.CompletableTask()
+
+    def reducer(acc, value):
+        raise KeyError(value)
+
+    reduce_task = task.when_all_reduce([c1, c2], reducer, None)
+    c1.complete('x')
+    c2.complete('y')
+
+    assert reduce_task.is_complete
+    with pytest.raises(KeyError):
+        reduce_task.get_result()
@@ -0,0 +1,222 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+from unittest import mock
+
+import grpc
+import pytest
+
+from dapr.ext.workflow._durabletask.worker import (
+    ConcurrencyLimits,
+    ConcurrencyOptions,
+    TaskHubGrpcWorker,
+    _AdaptiveLimit,
+    _AsyncWorkerManager,
+    _ConcurrencyLimit,
+)
+
+
+def _feed(policy: _AdaptiveLimit, latency: float, samples: int, saturated: bool = True):
+    for _ in range(samples):
+        policy.record(latency, saturated)
+
+
+def test_limit_grows_while_saturated_and_healthy():
+    limiter = _ConcurrencyLimit(4)
+    policy = _AdaptiveLimit(limiter, 4, 100)
+
+    _feed(policy, 0.01, 10)
+    assert limiter.limit == 6  # 4 + sqrt(4)
+    _feed(policy, 0.01, 10)
+    assert limiter.limit == 8  # 6 + sqrt(6), truncated
+
+
+def test_limit_holds_when_not_saturated():
+    limiter = _ConcurrencyLimit(4)
+    policy = _AdaptiveLimit(limiter, 4, 100)
+
+    _feed(policy, 0.01, 50, saturated=False)
+    assert limiter.limit == 4
+
+
+def test_limit_never_exceeds_maximum():
+    limiter = _ConcurrencyLimit(4)
+    policy = _AdaptiveLimit(limiter, 4, 10)
+
+    _feed(policy, 0.01, 200)
+    assert limiter.limit == 10
+
+
+def test_overload_backs_off_multiplicatively_down_to_minimum():
+    limiter = _ConcurrencyLimit(40)
+    policy = _AdaptiveLimit(limiter, 20, 100)
+
+    policy.record_overload()
+    _feed(policy, 0.01, 40)
+    assert limiter.limit == 30
+
+    for _ in range(5):
+        policy.record_overload()
+        _feed(policy, 0.01, limiter.limit)
+    assert limiter.limit == 20
+
+
+def test_rising_latency_shrinks_the_limit():
+    limiter = _ConcurrencyLimit(40)
+    policy = _AdaptiveLimit(limiter, 4, 100)
+    _feed(policy, 0.01, 40, saturated=False)  # baseline
+    assert limiter.limit == 40
+
+    _feed(policy, 0.04, 40)  # 4x baseline, gradient 0.5
+    assert limiter.limit == 20
+
+
+def test_latency_within_tolerance_does_not_shrink():
+    limiter = _ConcurrencyLimit(40)
+    policy = _AdaptiveLimit(limiter, 4, 100)
+    _feed(policy, 0.01, 40, saturated=False)
+
+    _feed(policy, 0.019, 40, saturated=False)
+    assert limiter.limit == 40
+
+
+def test_concurrency_limit_can_be_resized_in_use():
+    async def scenario():
+        limiter = _ConcurrencyLimit(1)
+        release = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def work():
+            nonlocal running, peak
+            async with limiter:
+                running += 1
+                peak = max(peak, running)
+                await release.wait()
+                running -= 1
+
+        tasks = [asyncio.create_task(work()) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        assert (running, limiter.saturated) == (1, True)
+
+        limiter.set_limit(3)
+        await asyncio.sleep(0.01)
+        assert running == 3
+
+        limiter.set_limit(1)  # admitted work keeps running
+        release.set()
+        await asyncio.gather(*tasks)
+        assert (peak, limiter.in_use) == (3, 0)
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_passes_its_slot_on():
+    async def scenario():
+        limiter = _ConcurrencyLimit(1)
+        async with limiter:
+            first = asyncio.create_task(limiter.__aenter__())
+            second = asyncio.create_task(limiter.__aenter__())
+            await asyncio.sleep(0)
+        first.cancel()  # woken, but cancelled before it could take the slot
+        await asyncio.sleep(0.01)
+        assert second.done() and limiter.in_use == 1
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiters_are_not_kept():
+    async def scenario():
+        limiter = _ConcurrencyLimit(1)
+        async with limiter:
+            waiters = [asyncio.create_task(limiter.__aenter__()) for _ in range(100)]
+            await asyncio.sleep(0)
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+            assert len(limiter._waiters) == 0
+        # Nothing waits any more, so the free slot leaves the limiter unsaturated.
+        assert not limiter.saturated
+        async with limiter:
+            assert limiter.in_use == 1
+
+    asyncio.run(scenario())
+
+
+def test_manager_adapts_limits_from_completed_work_items():
+    options = ConcurrencyOptions(
+        maximum_concurrent_activity_work_items=50,
+        maximum_concurrent_orchestration_work_items=50,
+        adaptive_concurrency=True,
+        minimum_concurrent_activity_work_items=2,
+        minimum_concurrent_orchestration_work_items=3,
+    )
+    manager = _AsyncWorkerManager(options, logging.getLogger(__name__))
+
+    async def activity():
+        await asyncio.sleep(0.001)
+
+    async def scenario():
+        runner = asyncio.create_task(manager.run())
+        await asyncio.sleep(0)
+        assert manager.limits() == ConcurrencyLimits(2, 0, 3, 0)
+        for _ in range(100):
+            manager.submit_activity(activity)
+        await manager.activity_queue.join()
+        manager._shutdown = True
+        await runner
+
+    asyncio.run(scenario())
+    limits = manager.limits()
+    assert limits.activity_limit > 2
+    assert limits.orchestration_limit == 3
+    manager.shutdown()
+
+
+def test_fixed_limits_by_default():
+    worker = TaskHubGrpcWorker(
+        concurrency_options=ConcurrencyOptions(
+            maximum_concurrent_activity_work_items=7,
+            maximum_concurrent_orchestration_work_items=9,
+        )
+    )
+    assert worker.concurrency_limits == ConcurrencyLimits(7, 0, 9, 0)
+    # Reporting overload without the adaptive policy is a no-op.
+    worker._async_worker_manager.record_overload('activity')
+    worker._async_worker_manager.shutdown()
+
+
+def test_deadline_errors_are_reported_as_overload():
+    worker = TaskHubGrpcWorker()
+    manager = worker._async_worker_manager
+    error = mock.MagicMock()
+
+    with mock.patch.object(manager, 'record_overload') as record_overload:
+        error.code.return_value = grpc.StatusCode.DEADLINE_EXCEEDED
+        worker._handle_grpc_execution_error(error, 'activity')
+        error.code.return_value = grpc.StatusCode.UNAVAILABLE
+        worker._handle_grpc_execution_error(error, 'orchestrator')
+
+    record_overload.assert_called_once_with('activity')
+    manager.shutdown()
+
+
+def test_minimum_is_capped_at_maximum_and_validated():
+    options = ConcurrencyOptions(
+        maximum_concurrent_activity_work_items=2,
+        maximum_concurrent_orchestration_work_items=2,
+        minimum_concurrent_activity_work_items=8,
+    )
+    assert options.minimum_concurrent_activity_work_items == 2
+    with pytest.raises(ValueError):
+        ConcurrencyOptions(minimum_concurrent_orchestration_work_items=0)
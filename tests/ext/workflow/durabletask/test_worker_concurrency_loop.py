@@ -141,8 +141,8 @@ def test_worker_concurrency_sync():
     time.sleep(1.5)  # Let work process
     manager.shutdown()
     # Unblock the consumers by putting dummy items in the queues
-    manager.activity_queue.put_nowait((lambda: None, (), {}))
-    manager.orchestration_queue.put_nowait((lambda: None, (), {}))
+    manager.activity_queue.put_nowait((lambda: None, (), {}, time.monotonic()))
+    manager.orchestration_queue.put_nowait((lambda: None, (), {}, time.monotonic()))
     t.join(timeout=2)
 
     # Check that all work items completed
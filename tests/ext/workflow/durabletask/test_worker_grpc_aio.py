@@ -0,0 +1,217 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the ``use_grpc_aio`` worker path against an in-process sidecar.
+
+The sidecar serves one work-item stream per connection; each test pushes work items into
+it and checks the completions the worker delivers back over the same ``grpc.aio`` channel.
+"""
+
+import json
+import queue
+import threading
+import time
+from concurrent import futures
+from datetime import datetime
+
+import grpc
+from google.protobuf import empty_pb2
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.orchestrator_service_pb2_grpc as stubs
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import task
+from dapr.ext.workflow._durabletask.worker import TaskHubGrpcWorker
+
+_END_OF_STREAM = object()
+
+
+class _Sidecar(stubs.TaskHubSidecarServiceServicer):
+    def __init__(self) -> None:
+        self.work_items: queue.Queue = queue.Queue()
+        self.activity_results: queue.Queue = queue.Queue()
+        self.orchestrator_results: queue.Queue = queue.Queue()
+        self.streams_opened = 0
+        self.metadata: list[tuple[str, str]] = []
+        self.history: dict[str, list[pb.HistoryEvent]] = {}
+
+    def Hello(self, request, context):
+        self.metadata = list(context.invocation_metadata())
+        return empty_pb2.Empty()
+
+    def GetWorkItems(self, request, context):
+        self.streams_opened += 1
+        while context.is_active():
+            try:
+                item = self.work_items.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if item is _END_OF_STREAM:
+                return
+            yield item
+
+    def GetInstanceHistory(self, request, context):
+        return pb.GetInstanceHistoryResponse(events=self.history[request.instanceId])
+
+    def CompleteActivityTask(self, request, context):
+        self.activity_results.put(request)
+        return pb.CompleteTaskResponse()
+
+    def CompleteOrchestratorTask(self, request, context):
+        self.orchestrator_results.put(request)
+        return pb.CompleteTaskResponse()
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.sidecar = _Sidecar()
+        self._server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+        stubs.add_TaskHubSidecarServiceServicer_to_server(self.sidecar, self._server)
+        self.port = self._server.add_insecure_port('localhost:0')
+
+    def __enter__(self):
+        self._server.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.stop(None)
+
+
+def _worker(port: int, **kwargs) -> TaskHubGrpcWorker:
+    kwargs.setdefault('keepalive_interval', 0)
+    return TaskHubGrpcWorker(
+        host_address=f'localhost:{port}', use_grpc_aio=True, stop_timeout=10, **kwargs
+    )
+
+
+def _activity_item(name: str, value, task_id: int = 1) -> pb.WorkItem:
+    return pb.WorkItem(
+        activityRequest=pb.ActivityRequest(
+            name=name,
+            taskId=task_id,
+            input=helpers.get_string_value(json.dumps(value)),
+            workflowInstance=pb.WorkflowInstance(instanceId='wf'),
+        ),
+        completionToken='token',
+    )
+
+
+def _workflow_item(instance_id: str, name: str, **fields) -> pb.WorkItem:
+    return pb.WorkItem(
+        workflowRequest=pb.WorkflowRequest(
+            instanceId=instance_id,
+            newEvents=[
+                helpers.new_workflow_started_event(datetime(2020, 1, 1)),
+                helpers.new_execution_started_event(name, instance_id),
+            ],
+            **fields,
+        ),
+        completionToken='token',
+    )
+
+
+def _double(ctx: task.ActivityContext, value: int) -> int:
+    return value * 2
+
+
+async def _triple(ctx: task.ActivityContext, value: int) -> int:
+    return value * 3
+
+
+def _hello(ctx: task.OrchestrationContext, _):
+    return 'hello'
+
+
+def test_sync_and_async_activities_complete_over_aio_channel():
+    with _Server() as server:
+        worker = _worker(server.port, metadata=[('dapr-api-token', 'secret')])
+        worker.add_activity(_double)
+        worker.add_activity(_triple)
+        worker.start()
+        try:
+            server.sidecar.work_items.put(_activity_item('_double', 21, task_id=1))
+            server.sidecar.work_items.put(_activity_item('_triple', 5, task_id=2))
+            results = {}
+            for _ in range(2):
+                res = server.sidecar.activity_results.get(timeout=10)
+                results[res.taskId] = json.loads(res.result.value)
+        finally:
+            worker.stop()
+
+    assert results == {1: 42, 2: 15}
+    assert ('dapr-api-token', 'secret') in server.sidecar.metadata
+
+
+def test_orchestration_completes_over_aio_channel():
+    with _Server() as server:
+        worker = _worker(server.port)
+        worker.add_orchestrator(_hello)
+        worker.start()
+        try:
+            server.sidecar.work_items.put(_workflow_item('wf', '_hello'))
+            res = server.sidecar.orchestrator_results.get(timeout=10)
+        finally:
+            worker.stop()
+
+    (action,) = res.actions
+    assert action.completeWorkflow.workflowStatus == pb.ORCHESTRATION_STATUS_COMPLETED
+    assert action.completeWorkflow.result.value == json.dumps('hello')
+
+
+def test_cache_miss_history_is_fetched_over_aio_channel():
+    with _Server() as server:
+        # A delta send for a stream the worker has no cache for: it must fetch the history.
+        server.sidecar.history['wf'] = []
+        worker = _worker(server.port)
+        worker.add_orchestrator(_hello)
+        worker.start()
+        try:
+            server.sidecar.work_items.put(
+                _workflow_item('wf', '_hello', cachedHistory=pb.CachedHistory(eventCount=0))
+            )
+            res = server.sidecar.orchestrator_results.get(timeout=10)
+        finally:
+            worker.stop()
+
+    (action,) = res.actions
+    assert action.completeWorkflow.workflowStatus == pb.ORCHESTRATION_STATUS_COMPLETED
+
+
+def test_reconnects_when_stream_ends():
+    with _Server() as server:
+        worker = _worker(server.port)
+        worker.add_activity(_double)
+        worker.start()
+        try:
+            server.sidecar.work_items.put(_END_OF_STREAM)
+            server.sidecar.work_items.put(_activity_item('_double', 1))
+            res = server.sidecar.activity_results.get(timeout=10)
+        finally:
+            worker.stop()
+
+    assert json.loads(res.result.value) == 2
+    assert server.sidecar.streams_opened == 2
+
+
+def test_stop_interrupts_idle_stream_promptly():
+    with _Server() as server:
+        worker = _worker(server.port)
+        worker.start()
+        run_loop = worker._runLoop
+        assert run_loop is not None
+
+        start = time.monotonic()
+        worker.stop()
+        elapsed = time.monotonic() - start
+
+    assert not run_loop.is_alive()
+    assert elapsed < 5
+    assert not [t for t in threading.enumerate() if t.name == 'StreamReader']
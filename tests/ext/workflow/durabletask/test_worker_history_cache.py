@@ -24,6 +24,7 @@ import dapr.ext.workflow._durabletask.internal.orchestrator_service_pb2_grpc as
 import dapr.ext.workflow._durabletask.internal.protos as pb
 from dapr.ext.workflow._durabletask.worker import (
     TaskHubGrpcWorker,
+    _CompactHistory,
     _HistoryResolutionError,
     _WorkflowHistoryCache,
 )
@@ -160,6 +161,105 @@ def test_ttl_sweep_is_sliding():
     assert cache.get('active') is not None
 
 
+def test_sweep_stops_at_first_live_entry():
+    clock = _Clock()
+    cache = _WorkflowHistoryCache(ttl=60.0, clock=clock)
+
+    cache.put('a', _events(1))
+    clock.now += 30
+    cache.put('b', _events(1))
+    clock.now += 40  # 'a' is 70s idle, 'b' 40s
+
+    cache.sweep_expired()
+    assert list(cache._entries) == ['b']
+    assert cache.stats().expirations == 1
+
+
+def test_extended_history_is_sized_incrementally():
+    cache = _WorkflowHistoryCache()
+    cache.put('a', _events(3))
+    prefix_bytes = cache._total_bytes
+    delta = [pb.HistoryEvent(eventId=100)]
+
+    cached = cache.get('a')
+    assert cached is not None
+    cache.put('a', cached.extended(delta))
+
+    assert cache._total_bytes == prefix_bytes + delta[0].ByteSize()
+
+    cache.put('a', _events(2))  # an unrelated history is sized from scratch
+    assert cache._total_bytes == sum(e.ByteSize() for e in _events(2))
+
+
+# --- compact history ----------------------------------------------------------------
+
+
+@pytest.mark.parametrize('serialized', [True, False])
+def test_compact_history_reads_like_a_list(serialized):
+    events = _events(7)
+    history = _CompactHistory.of(events[:3], serialized=serialized)
+    history = history.extended(events[3:4]).extended([]).extended(events[4:])
+    history.compact()
+
+    assert len(history) == 7
+    assert list(history) == events
+    assert [history[i] for i in range(7)] == events
+    assert history[-1] == events[-1]
+    assert history[2:5] == events[2:5]
+    assert history.num_bytes == sum(e.ByteSize() for e in events)
+    with pytest.raises(IndexError):
+        history[7]
+
+
+def test_compact_history_extends_without_copying():
+    base = _CompactHistory.of(_events(3))
+    extended = base.extended(_events(2))
+
+    assert extended._segments is base._segments
+    assert len(base) == 3  # the shorter view is unaffected by the append
+
+
+def test_compact_history_branches_when_a_view_is_extended_twice():
+    base = _CompactHistory.of(_events(3))
+    first = base.extended([pb.HistoryEvent(eventId=10)])
+    second = base.extended([pb.HistoryEvent(eventId=20)])
+
+    assert first[3].eventId == 10
+    assert second[3].eventId == 20
+    assert len(first) == len(second) == 4
+
+
+def test_compact_history_stores_wire_form_once_compacted():
+    events = _events(2)
+    history = _CompactHistory.of(events)
+    assert history._segments[0] == tuple(events)  # replayed as given
+
+    history.compact()
+    assert all(isinstance(raw, bytes) for raw in history._segments[0])
+    assert list(history) == events
+
+
+def test_compact_history_keeps_parsed_events_when_not_serialized():
+    history = _CompactHistory.of(_events(2), serialized=False)
+    history.compact()
+    assert history._segments[0] == tuple(_events(2))
+
+
+def test_stats_track_hits_misses_and_evictions():
+    cache = _WorkflowHistoryCache(max_instances=1)
+
+    cache.get('a')
+    cache.put('a', _events(2))
+    cache.get('a')
+    cache.put('b', _events(1))  # over the cap → evicts 'a'
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (1, 1, 1)
+    assert stats.entries == 1
+    assert stats.total_bytes == sum(e.ByteSize() for e in _events(1))
+    assert stats.hit_rate == 0.5
+
+
 def test_non_positive_config_uses_defaults():
     cache = _WorkflowHistoryCache(ttl=0, max_instances=-1, max_bytes=-5)
     assert cache._ttl > 0
@@ -236,6 +336,53 @@ def test_update_cache_stores_then_evicts_on_complete():
     assert worker._history_cache.get('a') is None
 
 
+class _CachePeekingStub:
+    """A stub that records whether the cached history was serialized before delivery."""
+
+    def __init__(self, worker: TaskHubGrpcWorker) -> None:
+        self._worker = worker
+        self.serialized_before_delivery: list[bool] = []
+
+    def CompleteOrchestratorTask(self, response: pb.WorkflowResponse) -> None:
+        cached = self._worker._history_cache.get('a')
+        self.serialized_before_delivery.append(
+            any(isinstance(e, bytes) for seg in cached._segments for e in seg)
+        )
+
+
+def test_turn_replays_parsed_events_and_serializes_after_delivery():
+    worker = _worker()
+
+    def orchestrator(ctx, _):
+        yield ctx.create_timer(ctx.current_utc_datetime)
+
+    name = worker.add_orchestrator(orchestrator)
+    started = pb.HistoryEvent(
+        eventId=-1,
+        executionStarted=pb.ExecutionStartedEvent(
+            name=name, workflowInstance=pb.WorkflowInstance(instanceId='a')
+        ),
+    )
+    req = pb.WorkflowRequest(
+        instanceId='a',
+        pastEvents=[
+            pb.HistoryEvent(eventId=-1, workflowStarted=pb.WorkflowStartedEvent()),
+            started,
+        ],
+        newEvents=[pb.HistoryEvent(eventId=-1, workflowStarted=pb.WorkflowStartedEvent())],
+    )
+    stub = _CachePeekingStub(worker)
+
+    worker._execute_orchestrator(
+        req, cast(stubs.TaskHubSidecarServiceStub, stub), 'token', lambda: None
+    )
+
+    assert stub.serialized_before_delivery == [False]
+    cached = worker._history_cache.get('a')
+    assert all(isinstance(e, bytes) for seg in cached._segments for e in seg)
+    assert list(cached) == list(req.pastEvents)
+
+
 def test_resolve_fetch_failure_raises_history_resolution_error():
     worker = _worker()
     stub = _FailingHistoryStub()
@@ -0,0 +1,345 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import logging
+
+import pytest
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import worker
+from dapr.ext.workflow._durabletask.metrics import (
+    HISTORY_CACHED,
+    HISTORY_FETCHED,
+    HISTORY_FULL,
+    ActivityWorkItemMetrics,
+    OpenTelemetryWorkerMetrics,
+    OrchestrationWorkItemMetrics,
+    PrometheusWorkerMetrics,
+    WorkerMetrics,
+)
+
+TEST_LOGGER = logging.getLogger('tests')
+INSTANCE_ID = 'abc123'
+
+
+class _Recorder(WorkerMetrics):
+    def __init__(self):
+        self.orchestrations: list[OrchestrationWorkItemMetrics] = []
+        self.activities: list[ActivityWorkItemMetrics] = []
+
+    def on_orchestration(self, metrics):
+        self.orchestrations.append(metrics)
+
+    def on_activity(self, metrics):
+        self.activities.append(metrics)
+
+
+class _Stub:
+    def __init__(self, history=(), fail_completions=False):
+        self._history = list(history)
+        self._fail_completions = fail_completions
+        self.responses = []
+
+    def GetInstanceHistory(self, request):
+        return pb.GetInstanceHistoryResponse(events=self._history)
+
+    def CompleteOrchestratorTask(self, response):
+        self._complete(response)
+
+    def CompleteActivityTask(self, response):
+        self._complete(response)
+
+    def _complete(self, response):
+        if self._fail_completions:
+            raise ValueError('Cannot invoke RPC on closed channel!')
+        self.responses.append(response)
+
+
+def _worker(metrics, **kwargs) -> worker.TaskHubGrpcWorker:
+    w = worker.TaskHubGrpcWorker(host_address='localhost:0', metrics=metrics, **kwargs)
+
+    def counter(ctx, _):
+        yield ctx.call_activity('step', input=1)
+        yield ctx.call_activity('step', input=2)
+        return 'done'
+
+    def step(ctx, value):
+        if value < 0:
+            raise ValueError('negative')
+        return value
+
+    w.add_orchestrator(counter)
+    w.add_activity(step)
+    return w
+
+
+def _started():
+    return [
+        helpers.new_workflow_started_event(),
+        helpers.new_execution_started_event('counter', INSTANCE_ID, encoded_input=None),
+    ]
+
+
+def _execute(w, req, stub):
+    w._execute_orchestrator(req, stub, 'token', lambda: None)
+
+
+def test_orchestration_work_items_are_measured():
+    recorder = _Recorder()
+    w = _worker(recorder)
+    stub = _Stub()
+    # First turn: a full send with nothing committed yet.
+    _execute(w, pb.WorkflowRequest(instanceId=INSTANCE_ID, newEvents=_started()), stub)
+
+    (first,) = recorder.orchestrations
+    assert first.instance_id == INSTANCE_ID
+    assert first.name == 'counter'
+    assert first.history_source == HISTORY_FULL
+    assert first.queue_wait_seconds is None
+    assert (first.history_events, first.replayed_events, first.new_events) == (0, 0, 2)
+    assert first.actions == 1
+    assert first.history_bytes == sum(event.ByteSize() for event in _started())
+    assert first.replay_seconds >= 0
+    assert first.new_events_seconds > 0
+    assert first.complete_seconds is not None
+
+    # Second turn with a cold live execution: the whole history is replayed.
+    w._sticky_executions.reset()
+    past = _started() + [helpers.new_task_scheduled_event(1, 'step')]
+    req = pb.WorkflowRequest(
+        instanceId=INSTANCE_ID,
+        pastEvents=past,
+        newEvents=[helpers.new_task_completed_event(1, '1')],
+    )
+    _execute(w, req, stub)
+
+    second = recorder.orchestrations[-1]
+    assert (second.history_events, second.replayed_events, second.new_events) == (3, 3, 1)
+    assert second.replay_seconds > 0
+
+
+def test_history_sources():
+    recorder = _Recorder()
+    w = _worker(recorder)
+    stub = _Stub(history=_started())
+    delta = [helpers.new_task_scheduled_event(1, 'step')]
+    new_events = [helpers.new_task_completed_event(1, '1')]
+
+    w._history_cache.put(INSTANCE_ID, _started())
+    req = pb.WorkflowRequest(instanceId=INSTANCE_ID, pastEvents=delta, newEvents=new_events)
+    req.cachedHistory.eventCount = 2
+    _execute(w, req, stub)
+    assert recorder.orchestrations[-1].history_source == HISTORY_CACHED
+    assert recorder.orchestrations[-1].history_events == 3
+
+    w._history_cache.reset()
+    req.cachedHistory.eventCount = 5
+    _execute(w, req, stub)
+    assert recorder.orchestrations[-1].history_source == HISTORY_FETCHED
+    assert recorder.orchestrations[-1].history_events == 2
+
+
+def test_undelivered_responses_have_no_completion_latency():
+    recorder = _Recorder()
+    w = _worker(recorder)
+    _execute(
+        w,
+        pb.WorkflowRequest(instanceId=INSTANCE_ID, newEvents=_started()),
+        _Stub(fail_completions=True),
+    )
+    assert recorder.orchestrations[-1].complete_seconds is None
+
+
+def test_activity_work_items_are_measured():
+    recorder = _Recorder()
+    w = _worker(recorder)
+    stub = _Stub()
+
+    for value in (1, -1):
+        req = pb.ActivityRequest(
+            name='step',
+            taskId=7,
+            input=helpers.get_string_value(str(value)),
+            workflowInstance=pb.WorkflowInstance(instanceId=INSTANCE_ID),
+        )
+        w._execute_activity(w._registry.get_activity('step'), req, stub, 'token')
+
+    succeeded, failed = recorder.activities
+    assert (succeeded.instance_id, succeeded.name, succeeded.task_id) == (INSTANCE_ID, 'step', 7)
+    assert not succeeded.failed
+    assert failed.failed
+    assert succeeded.execution_seconds > 0
+    assert succeeded.complete_seconds is not None
+
+
+def test_failing_hooks_do_not_affect_work_items(caplog):
+    class Broken(WorkerMetrics):
+        def on_orchestration(self, metrics):
+            raise RuntimeError('broken hook')
+
+    w = _worker(Broken())
+    stub = _Stub()
+    with caplog.at_level(logging.WARNING):
+        _execute(w, pb.WorkflowRequest(instanceId=INSTANCE_ID, newEvents=_started()), stub)
+
+    assert len(stub.responses) == 1
+    assert 'broken hook' in caplog.text
+
+
+def test_queue_wait_is_visible_to_sync_and_async_work_items():
+    manager = worker._AsyncWorkerManager(
+        worker.ConcurrencyOptions(
+            maximum_concurrent_activity_work_items=1, maximum_concurrent_orchestration_work_items=1
+        ),
+        TEST_LOGGER,
+    )
+    waits = []
+
+    def sync_item():
+        waits.append(('sync', worker._queue_wait.get()))
+
+    async def async_item():
+        await asyncio.sleep(0.05)
+        waits.append(('async', worker._queue_wait.get()))
+
+    async def run():
+        runner = asyncio.create_task(manager.run())
+        manager.submit_activity(async_item)
+        manager.submit_activity(async_item)
+        manager.submit_orchestration(sync_item)
+        while len(waits) < 3:
+            await asyncio.sleep(0.01)
+        manager._shutdown = True
+        await runner
+
+    asyncio.run(run())
+    manager.thread_pool.shutdown()
+
+    assert sorted(kind for kind, _ in waits) == ['async', 'async', 'sync']
+    assert all(wait is not None and wait >= 0 for _, wait in waits)
+    # With one activity slot, the second async item waited for the first.
+    assert max(wait for kind, wait in waits if kind == 'async') >= 0.04
+    assert worker._queue_wait.get() is None
+
+
+def test_execution_results_split_replay_and_new_event_time():
+    registry = worker._Registry()
+
+    def orchestrator(ctx, _):
+        yield ctx.call_activity('step')
+        return 'done'
+
+    name = registry.add_orchestrator(orchestrator)
+    old_events = [
+        helpers.new_workflow_started_event(),
+        helpers.new_execution_started_event(name, INSTANCE_ID, encoded_input=None),
+        helpers.new_task_scheduled_event(1, 'step'),
+    ]
+    executor = worker._OrchestrationExecutor(registry, TEST_LOGGER)
+    result = executor.execute(
+        INSTANCE_ID, old_events, [helpers.new_task_completed_event(1, 'null')]
+    )
+
+    assert result.replayed_events == 3
+    assert result.replay_seconds > 0
+    assert result.new_events_seconds > 0
+
+
+def _orchestration_metrics(**overrides) -> OrchestrationWorkItemMetrics:
+    values = dict(
+        instance_id=INSTANCE_ID,
+        name='counter',
+        queue_wait_seconds=0.01,
+        history_source=HISTORY_CACHED,
+        history_seconds=0.002,
+        history_events=10,
+        history_bytes=2048,
+        replayed_events=10,
+        replay_seconds=0.003,
+        new_events=1,
+        new_events_seconds=0.001,
+        actions=2,
+        complete_seconds=0.004,
+    )
+    values.update(overrides)
+    return OrchestrationWorkItemMetrics(**values)
+
+
+def _activity_metrics(**overrides) -> ActivityWorkItemMetrics:
+    values = dict(
+        instance_id=INSTANCE_ID,
+        name='step',
+        task_id=1,
+        queue_wait_seconds=None,
+        execution_seconds=0.5,
+        failed=False,
+        complete_seconds=0.004,
+    )
+    values.update(overrides)
+    return ActivityWorkItemMetrics(**values)
+
+
+def test_opentelemetry_adapter():
+    sdk_metrics = pytest.importorskip('opentelemetry.sdk.metrics')
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    reader = InMemoryMetricReader()
+    provider = sdk_metrics.MeterProvider(metric_readers=[reader])
+    adapter = OpenTelemetryWorkerMetrics(provider.get_meter('tests'))
+
+    adapter.on_orchestration(_orchestration_metrics())
+    adapter.on_activity(_activity_metrics(failed=True))
+
+    (resource_metrics,) = reader.get_metrics_data().resource_metrics
+    points = {
+        metric.name: list(metric.data.data_points)
+        for scope in resource_metrics.scope_metrics
+        for metric in scope.metrics
+    }
+    (history,) = points['dapr.workflow.orchestration.history']
+    assert history.attributes['history.source'] == HISTORY_CACHED
+    assert history.sum == pytest.approx(0.002)
+    (events,) = points['dapr.workflow.orchestration.events']
+    assert events.sum == 11
+    (execution,) = points['dapr.workflow.activity.execution']
+    assert execution.attributes['activity.failed'] is True
+    # The activity had no queue wait, so only the orchestration's was recorded.
+    (queue_wait,) = points['dapr.workflow.work_item.queue_wait']
+    assert queue_wait.attributes['work_item'] == 'orchestration'
+    assert {
+        point.attributes['work_item'] for point in points['dapr.workflow.work_item.complete']
+    } == {
+        'orchestration',
+        'activity',
+    }
+
+
+def test_prometheus_adapter():
+    prometheus_client = pytest.importorskip('prometheus_client')
+    registry = prometheus_client.CollectorRegistry()
+    adapter = PrometheusWorkerMetrics(registry)
+
+    adapter.on_orchestration(_orchestration_metrics(complete_seconds=None))
+    adapter.on_activity(_activity_metrics())
+
+    def sample(name, **labels):
+        return registry.get_sample_value(name, labels)
+
+    assert sample('dapr_workflow_orchestration_history_seconds_count', source='cached') == 1
+    assert sample('dapr_workflow_orchestration_history_size_bytes_sum') == 2048
+    assert sample('dapr_workflow_orchestration_actions_sum') == 2
+    assert sample('dapr_workflow_activity_execution_seconds_sum', failed='false') == 0.5
+    assert sample('dapr_workflow_work_item_complete_seconds_count', work_item='activity') == 1
+    assert (
+        sample('dapr_workflow_work_item_complete_seconds_count', work_item='orchestration') is None
+    )
@@ -0,0 +1,164 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for activities registered with ``executor='process'``."""
+
+import asyncio
+import json
+import logging
+import os
+from concurrent.futures.process import BrokenProcessPool
+from typing import cast
+
+import pytest
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.orchestrator_service_pb2_grpc as stubs
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask.worker import (
+    ConcurrencyOptions,
+    TaskHubGrpcWorker,
+    _ActivityProcessPool,
+    _Registry,
+)
+from tests.ext.workflow.durabletask import process_activities
+
+_ACTIVITIES = {
+    name: getattr(process_activities, name) for name in ('fib', 'pid', 'fail', 'sleep', 'crash')
+}
+
+
+def _started_pool(max_workers: int, timeout) -> _ActivityProcessPool:
+    pool = _ActivityProcessPool(_ACTIVITIES, max_workers, timeout, logging.getLogger('test'))
+    # Wait for the spawned workers, so their startup doesn't count against the timeout.
+    pool._pool.submit(process_activities.pid, None, None).result(timeout=30)
+    return pool
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = _started_pool(2, 0.5)
+    yield pool
+    pool.shutdown()
+
+
+def _execute(pool: _ActivityProcessPool, name: str, value) -> object:
+    encoded = asyncio.run(pool.execute(name, 'wf', 1, json.dumps(value), '', None))
+    return json.loads(encoded) if encoded is not None else None
+
+
+def test_activity_runs_in_worker_process(pool):
+    assert _execute(pool, 'fib', 30) == 832040
+    assert _execute(pool, 'pid', None) != os.getpid()
+
+
+def test_worker_processes_are_reused(pool):
+    pids = {_execute(pool, 'pid', None) for _ in range(6)}
+    assert 1 <= len(pids) <= 2
+
+
+def test_activity_error_is_raised_in_parent(pool):
+    with pytest.raises(ValueError, match='boom'):
+        _execute(pool, 'fail', 'boom')
+
+
+def test_activity_timeout(pool):
+    with pytest.raises(TimeoutError):
+        _execute(pool, 'sleep', 1.5)
+
+
+def test_timed_out_call_replaces_pool():
+    pool = _started_pool(1, 1.0)
+    try:
+        busy_pid = _execute(pool, 'pid', None)
+        with pytest.raises(TimeoutError):
+            _execute(pool, 'sleep', 30)
+        # Without the restart, the only worker process would stay busy sleeping.
+        pool._pool.submit(process_activities.pid, None, None).result(timeout=30)
+        assert _execute(pool, 'pid', None) != busy_pid
+    finally:
+        pool.shutdown()
+
+
+def test_dead_worker_process_replaces_pool():
+    pool = _started_pool(1, None)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            _execute(pool, 'crash', None)
+        assert _execute(pool, 'fib', 10) == 55
+    finally:
+        pool.shutdown()
+
+
+class _SidecarStub:
+    def __init__(self) -> None:
+        self.responses: list[pb.ActivityResponse] = []
+
+    def CompleteActivityTask(self, response: pb.ActivityResponse) -> None:
+        self.responses.append(response)
+
+
+def _deliver(worker: TaskHubGrpcWorker, name: str, value) -> pb.ActivityResponse:
+    stub = _SidecarStub()
+    req = pb.ActivityRequest(
+        name=name,
+        taskId=7,
+        input=helpers.get_string_value(json.dumps(value)),
+        workflowInstance=pb.WorkflowInstance(instanceId='wf'),
+    )
+    fn = worker._registry.get_activity(name)
+    assert worker._is_loop_activity(fn, name)
+    asyncio.run(
+        worker._execute_activity_async(
+            fn, req, cast(stubs.TaskHubSidecarServiceStub, stub), 'token'
+        )
+    )
+    (response,) = stub.responses
+    return response
+
+
+def test_worker_routes_process_activities_to_the_pool():
+    worker = TaskHubGrpcWorker(
+        host_address='localhost:0',
+        concurrency_options=ConcurrencyOptions(
+            maximum_process_pool_workers=1, process_activity_timeout=2.0
+        ),
+    )
+    for fn in _ACTIVITIES.values():
+        worker.add_activity(fn, executor='process')
+    worker._activity_processes = _started_pool(1, 0.5)
+    try:
+        ok = _deliver(worker, 'fib', 20)
+        failed = _deliver(worker, 'fail', 'bad input')
+        timed_out = _deliver(worker, 'sleep', 1.5)
+    finally:
+        worker._activity_processes.shutdown()
+        worker._async_worker_manager.shutdown()
+
+    assert json.loads(ok.result.value) == 6765
+    assert failed.failureDetails.errorType == 'ValueError'
+    assert failed.failureDetails.errorMessage == 'bad input'
+    assert timed_out.failureDetails.errorType == 'TimeoutError'
+
+
+def test_registry_rejects_invalid_process_activities():
+    registry = _Registry()
+
+    async def async_activity(ctx, _):
+        return None
+
+    with pytest.raises(ValueError, match='async'):
+        registry.add_named_activity('a', async_activity, executor='process')
+    with pytest.raises(ValueError, match='executor'):
+        registry.add_named_activity('b', process_activities.fib, executor='fiber')
+
+    registry.add_named_activity('fib', process_activities.fib, executor='process')
+    assert registry.process_activities == {'fib'}
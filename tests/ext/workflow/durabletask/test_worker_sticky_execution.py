@@ -0,0 +1,268 @@
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for sticky execution: keeping a live orchestration between turns.
+
+A simulated sidecar commits each turn the way the backend does (the turn's history, then
+its new events, then the events confirming its actions), so these tests check that a
+continued execution produces exactly the actions a full replay would, and that every kind
+of mismatch falls back to a full replay.
+"""
+
+import json
+from datetime import datetime
+from typing import cast
+
+import grpc
+
+import dapr.ext.workflow._durabletask.internal.helpers as helpers
+import dapr.ext.workflow._durabletask.internal.orchestrator_service_pb2_grpc as stubs
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import task
+from dapr.ext.workflow._durabletask.worker import (
+    TaskHubGrpcWorker,
+    _OrchestrationExecutor,
+    _StickyExecutionCache,
+)
+
+INSTANCE_ID = 'wf'
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _RpcError(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.UNAVAILABLE
+
+
+class _SidecarStub:
+    """Records responses; optionally fails the next delivery."""
+
+    def __init__(self) -> None:
+        self.responses: list[pb.WorkflowResponse] = []
+        self.fail_next = False
+
+    def CompleteOrchestratorTask(self, response: pb.WorkflowResponse) -> None:
+        if self.fail_next:
+            self.fail_next = False
+            raise _RpcError()
+        self.responses.append(response)
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.starts = 0
+
+
+def _sequence_worker(steps: int, **kwargs):
+    counter = _Counter()
+
+    def sequence(ctx: task.OrchestrationContext, _):
+        counter.starts += 1
+        total = 0
+        for i in range(steps):
+            total += yield ctx.call_activity('add', input=i)
+        return total
+
+    kwargs.setdefault('disable_stateful_history', True)
+    kwargs.setdefault('enable_sticky_execution', True)
+    worker = TaskHubGrpcWorker(host_address='localhost:0', **kwargs)
+    worker.add_orchestrator(sequence)
+    return worker, counter
+
+
+def _run_turn(worker, stub, history, new_events):
+    req = pb.WorkflowRequest(instanceId=INSTANCE_ID, pastEvents=history, newEvents=new_events)
+    worker._execute_orchestrator(
+        req, cast(stubs.TaskHubSidecarServiceStub, stub), 'token', lambda: None
+    )
+    return stub.responses[-1]
+
+
+def _commit(history, new_events, response):
+    """Appends a delivered turn to the committed history, as the sidecar does."""
+    confirmed = [
+        helpers.new_task_scheduled_event(a.id, a.scheduleTask.name)
+        for a in response.actions
+        if a.HasField('scheduleTask')
+    ]
+    return history + list(new_events) + confirmed
+
+
+def _start_events():
+    return [
+        helpers.new_workflow_started_event(datetime(2020, 1, 1)),
+        helpers.new_execution_started_event('sequence', INSTANCE_ID),
+    ]
+
+
+def _completion_events(response, value):
+    (action,) = [a for a in response.actions if a.HasField('scheduleTask')]
+    return [
+        helpers.new_workflow_started_event(datetime(2020, 1, 1)),
+        helpers.new_task_completed_event(action.id, json.dumps(value)),
+    ]
+
+
+def _drive(worker, stub, steps):
+    history: list[pb.HistoryEvent] = []
+    new_events = _start_events()
+    for i in range(steps + 1):
+        response = _run_turn(worker, stub, history, new_events)
+        if i < steps:
+            history = _commit(history, new_events, response)
+            new_events = _completion_events(response, i)
+    return response
+
+
+def test_live_execution_is_continued_across_turns():
+    worker, counter = _sequence_worker(5)
+    stub = _SidecarStub()
+
+    response = _drive(worker, stub, 5)
+
+    assert counter.starts == 1  # the generator was never rebuilt
+    (action,) = response.actions
+    assert action.completeWorkflow.workflowStatus == pb.ORCHESTRATION_STATUS_COMPLETED
+    assert action.completeWorkflow.result.value == json.dumps(sum(range(5)))
+    assert len(worker._sticky_executions) == 0  # dropped once the workflow ended
+
+
+def test_live_execution_over_compact_history():
+    worker, counter = _sequence_worker(3, disable_stateful_history=False)
+    stub = _SidecarStub()
+
+    response = _drive(worker, stub, 3)
+
+    assert counter.starts == 1
+    (action,) = response.actions
+    assert action.completeWorkflow.result.value == json.dumps(sum(range(3)))
+
+
+def test_live_executions_are_opt_in():
+    worker = TaskHubGrpcWorker(host_address='localhost:0', disable_stateful_history=True)
+    counter = _Counter()
+
+    def sequence(ctx: task.OrchestrationContext, _):
+        counter.starts += 1
+        total = 0
+        for i in range(2):
+            total += yield ctx.call_activity('add', input=i)
+        return total
+
+    worker.add_orchestrator(sequence)
+    _drive(worker, _SidecarStub(), 2)
+
+    assert counter.starts == 3
+    assert len(worker._sticky_executions) == 0
+
+
+def test_continued_turns_match_full_replay():
+    sticky, _ = _sequence_worker(4)
+    replayed, counter = _sequence_worker(4, enable_sticky_execution=False)
+    sticky_stub, replay_stub = _SidecarStub(), _SidecarStub()
+
+    _drive(sticky, sticky_stub, 4)
+    _drive(replayed, replay_stub, 4)
+
+    assert counter.starts == 5  # one full replay per turn
+    assert [list(r.actions) for r in sticky_stub.responses] == [
+        list(r.actions) for r in replay_stub.responses
+    ]
+
+
+def test_redelivered_turn_falls_back_to_replay():
+    worker, counter = _sequence_worker(3)
+    stub = _SidecarStub()
+    new_events = _start_events()
+    first = _run_turn(worker, stub, [], new_events)
+
+    # The sidecar re-dispatches the same turn (e.g. it never saw the response).
+    again = _run_turn(worker, stub, [], new_events)
+
+    assert counter.starts == 2
+    assert list(first.actions) == list(again.actions)
+
+
+def test_history_mismatch_falls_back_to_replay():
+    worker, counter = _sequence_worker(3)
+    stub = _SidecarStub()
+    new_events = _start_events()
+    response = _run_turn(worker, stub, [], new_events)
+    history = _commit([], new_events, response)
+    history[0] = helpers.new_workflow_started_event(datetime(2021, 1, 1))
+
+    _run_turn(worker, stub, history, _completion_events(response, 0))
+
+    assert counter.starts == 2
+
+
+def test_failed_delivery_is_not_kept():
+    worker, _ = _sequence_worker(3)
+    stub = _SidecarStub()
+    stub.fail_next = True
+    req = pb.WorkflowRequest(instanceId=INSTANCE_ID, newEvents=_start_events())
+
+    worker._execute_orchestrator(
+        req, cast(stubs.TaskHubSidecarServiceStub, stub), 'token', lambda: None
+    )
+
+    assert len(worker._sticky_executions) == 0
+
+
+def test_version_change_is_a_mismatch():
+    worker, _ = _sequence_worker(3)
+    stub = _SidecarStub()
+    new_events = _start_events()
+    response = _run_turn(worker, stub, [], new_events)
+    history = _commit([], new_events, response)
+    started = helpers.new_workflow_started_event(datetime(2020, 1, 1))
+    started.workflowStarted.version.name = 'v2'
+
+    sticky = worker._sticky_executions.take(INSTANCE_ID)
+    assert sticky is not None
+    assert sticky.delta(history) == history[len(new_events) :]
+    assert sticky.delta(history + [started]) is None
+
+
+def test_cache_evicts_lru_beyond_cap():
+    cache = _StickyExecutionCache(max_instances=2)
+    executor = cast(_OrchestrationExecutor, object())
+
+    cache.put('a', executor, [], [])
+    cache.put('b', executor, [], [])
+    cache.put('a', executor, [], [])  # refreshes 'a'
+    cache.put('c', executor, [], [])  # over the cap → evict LRU ('b')
+
+    assert cache.take('b') is None
+    assert cache.take('a') is not None
+    assert cache.take('c') is not None
+
+
+def test_cache_ttl_sweep():
+    clock = _Clock()
+    cache = _StickyExecutionCache(ttl=60.0, clock=clock)
+    executor = cast(_OrchestrationExecutor, object())
+
+    cache.put('idle', executor, [], [])
+    clock.now += 45
+    cache.put('active', executor, [], [])
+    clock.now += 30
+
+    cache.sweep_expired()
+    assert cache.take('idle') is None
+    assert cache.take('active') is not None
@@ -40,7 +40,9 @@ class FakeRegistry:
     def __init__(self):
         self.activities: dict[str, object] = {}
 
-    def add_named_activity(self, name: str, fn) -> None:
+    def add_named_activity(
+        self, name: str, fn, executor: str = 'thread', externalize_output: bool = False
+    ) -> None:
         self.activities[name] = fn
 
 
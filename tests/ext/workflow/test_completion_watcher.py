@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import grpc
+
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow._durabletask import client
+from dapr.ext.workflow._durabletask.aio.client import AsyncTaskHubGrpcClient
+from dapr.ext.workflow.aio import CompletionWatcher, DaprWorkflowClient
+from dapr.ext.workflow.workflow_state import WorkflowStatus
+
+
+def _state(instance_id):
+    return client.WorkflowState(
+        instance_id,
+        'wf',
+        client.OrchestrationStatus.COMPLETED,
+        datetime.now(),
+        datetime.now(),
+        None,
+        '"done"',
+        None,
+        None,
+    )
+
+
+class FakeLongPollClient:
+    """Completes each instance after it has been polled a set number of times."""
+
+    def __init__(self, polls_needed):
+        self.polls_needed = dict(polls_needed)
+        self.polled = []
+        self.in_flight = 0
+        self.peak = 0
+
+    async def _poll_orchestration_completion(self, instance_id, fetch_payloads, timeout):
+        self.polled.append(instance_id)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+            self.polls_needed[instance_id] -= 1
+            if self.polls_needed[instance_id] > 0:
+                raise client._TransientTimeout()
+            if instance_id == 'missing':
+                return None
+            if instance_id == 'broken':
+                raise grpc.RpcError('boom')
+            return _state(instance_id)
+        finally:
+            self.in_flight -= 1
+
+
+class CompletionWatcherTest(unittest.IsolatedAsyncioTestCase):
+    async def test_polls_are_bounded_and_rotate_fairly(self):
+        fake = FakeLongPollClient({'slow': 5, 'a': 1, 'b': 2, 'c': 1, 'd': 3})
+        async with CompletionWatcher(fake, max_concurrent_polls=2) as watcher:
+            futures = watcher.watch(['slow', 'a', 'b', 'c', 'd'])
+            states = await asyncio.gather(*futures)
+
+        self.assertEqual([s.instance_id for s in states], ['slow', 'a', 'b', 'c', 'd'])
+        self.assertEqual(states[0].runtime_status, WorkflowStatus.COMPLETED)
+        self.assertLessEqual(fake.peak, 2)
+        # The slow instance yields its slot after every poll instead of starving the others.
+        self.assertEqual(fake.polled[:4], ['slow', 'a', 'b', 'c'])
+        self.assertEqual(watcher.pending, 0)
+
+    async def test_iteration_yields_results_in_completion_order(self):
+        fake = FakeLongPollClient({'late': 3, 'missing': 1, 'broken': 1})
+        async with CompletionWatcher(fake, max_concurrent_polls=3) as watcher:
+            futures = watcher.watch(['late', 'missing', 'broken'])
+            results = [result async for result in watcher]
+
+        self.assertEqual([r.instance_id for r in results], ['missing', 'broken', 'late'])
+        self.assertEqual([r.index for r in results], [1, 2, 0])
+        self.assertIsNone(results[0].value)
+        self.assertIsInstance(results[1].error, grpc.RpcError)
+        self.assertEqual(results[2].value.instance_id, 'late')
+        self.assertIsInstance(futures[2].exception(), grpc.RpcError)
+
+    async def test_watching_twice_shares_the_future(self):
+        fake = FakeLongPollClient({'a': 2})
+        async with CompletionWatcher(fake) as watcher:
+            first = watcher.watch(['a'])
+            second = watcher.watch(['a'])
+            self.assertIs(first[0], second[0])
+            await first[0]
+        self.assertEqual(fake.polled, ['a', 'a'])
+
+    async def test_timeout_fails_the_future(self):
+        timeouts = []
+
+        class NeverCompletes:
+            async def _poll_orchestration_completion(self, instance_id, fetch_payloads, timeout):
+                timeouts.append(timeout)
+                await asyncio.sleep(timeout)
+                raise client._TransientTimeout()
+
+        async with CompletionWatcher(NeverCompletes(), poll_timeout_in_seconds=0.02) as watcher:
+            (future,) = watcher.watch(['never'], timeout_in_seconds=0.05)
+            with self.assertRaises(TimeoutError):
+                await future
+
+        self.assertGreaterEqual(len(timeouts), 2)
+        # The last poll is clamped to what is left of the caller's timeout.
+        self.assertLess(timeouts[-1], 0.02)
+
+    async def test_cancelling_a_future_stops_its_poll(self):
+        started = asyncio.Event()
+        poll_cancelled = asyncio.Event()
+
+        class HangingClient:
+            async def _poll_orchestration_completion(self, instance_id, fetch_payloads, timeout):
+                started.set()
+                try:
+                    await asyncio.Event().wait()
+                except asyncio.CancelledError:
+                    poll_cancelled.set()
+                    raise
+
+        watcher = CompletionWatcher(HangingClient())
+        (future,) = watcher.watch(['a'])
+        await started.wait()
+        future.cancel()
+        await asyncio.wait_for(poll_cancelled.wait(), 5)
+        self.assertEqual(watcher.pending, 0)
+
+        others = watcher.watch(['b', 'c'])
+        await watcher.aclose()
+        self.assertTrue(all(f.cancelled() for f in others))
+        with self.assertRaises(RuntimeError):
+            watcher.watch(['d'])
+
+    async def test_cancelling_or_closing_wakes_iteration(self):
+        class HangingClient:
+            async def _poll_orchestration_completion(self, instance_id, fetch_payloads, timeout):
+                await asyncio.Event().wait()
+
+        watcher = CompletionWatcher(HangingClient())
+        (future,) = watcher.watch(['a'])
+        iteration = asyncio.ensure_future(self._collect(watcher))
+        await asyncio.sleep(0.01)
+        future.cancel()
+        self.assertEqual(await asyncio.wait_for(iteration, 5), [])
+
+        watcher.watch(['b'])
+        iteration = asyncio.ensure_future(self._collect(watcher))
+        await asyncio.sleep(0.01)
+        await watcher.aclose()
+        self.assertEqual(await asyncio.wait_for(iteration, 5), [])
+
+    @staticmethod
+    async def _collect(watcher):
+        return [result async for result in watcher]
+
+    async def test_transient_errors_are_retried_within_a_poll(self):
+        calls = 0
+
+        async def wait_for_completion(req, timeout):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                error = grpc.RpcError()
+                error.code = lambda: grpc.StatusCode.UNAVAILABLE
+                raise error
+            return pb.GetInstanceResponse(
+                exists=True,
+                workflowState=pb.WorkflowState(
+                    instanceId=req.instanceId,
+                    name='wf',
+                    workflowStatus=pb.ORCHESTRATION_STATUS_COMPLETED,
+                ),
+            )
+
+        inner = AsyncTaskHubGrpcClient()
+        inner._stub = mock.Mock()
+        inner._stub.WaitForInstanceCompletion = wait_for_completion
+
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.aio.client.AsyncTaskHubGrpcClient',
+            return_value=inner,
+        ):
+            wfClient = DaprWorkflowClient()
+        async with wfClient.completion_watcher(poll_timeout_in_seconds=10) as watcher:
+            (state,) = await asyncio.gather(*watcher.watch(['a']))
+
+        self.assertEqual(calls, 2)
+        self.assertEqual(state.runtime_status, WorkflowStatus.COMPLETED)
+
+    def test_rejects_invalid_limits(self):
+        with self.assertRaises(ValueError):
+            CompletionWatcher(mock.Mock(), max_concurrent_polls=0)
+        with self.assertRaises(ValueError):
+            CompletionWatcher(mock.Mock(), poll_timeout_in_seconds=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Fan-out benchmarks at 1k, 10k and 50k activities. Each fan-out is recorded with
+``WorkflowReplayer``, with results collected by ``when_all`` or folded by
+``when_all_reduce``, and with every activity scheduled in the first turn or in batches
+of 1,000. Reports the full-replay cost per event, the slowest turn and the largest
+response. Run with ``-s`` to see the table.
+"""
+
+import time
+
+import pytest
+
+from dapr.ext.workflow import DaprWorkflowContext, WorkflowRuntime, when_all, when_all_reduce
+
+pytestmark = pytest.mark.perf
+
+# Generous ceilings; replaying one event costs tens of microseconds at most, and the
+# cost per event must not grow with the size of the fan-out.
+MAX_EVENT_S = 0.0005
+BATCH = 1000
+
+
+def _runtime(**kwargs) -> WorkflowRuntime:
+    runtime = WorkflowRuntime(**kwargs)
+
+    @runtime.activity(name='work')
+    def work(ctx, value: int) -> int:
+        return value
+
+    @runtime.workflow(name='collect')
+    def collect(ctx: DaprWorkflowContext, count: int):
+        results = yield when_all([ctx.call_activity(work, input=i) for i in range(count)])
+        return sum(results)
+
+    @runtime.workflow(name='fold')
+    def fold(ctx: DaprWorkflowContext, count: int):
+        total = yield when_all_reduce(
+            [ctx.call_activity(work, input=i) for i in range(count)], lambda acc, r: acc + r, 0
+        )
+        return total
+
+    return runtime
+
+
+UNBATCHED = _runtime()
+BATCHED = _runtime(max_actions_per_turn=BATCH)
+
+SCENARIOS = [
+    (1_000, 'collect', UNBATCHED),
+    (1_000, 'fold', BATCHED),
+    (10_000, 'collect', UNBATCHED),
+    (10_000, 'fold', BATCHED),
+    (50_000, 'fold', BATCHED),
+]
+
+
+def _largest_turn(history) -> int:
+    largest = current = 0
+    for event in history:
+        if event.HasField('workflowStarted'):
+            current = 0
+        elif event.HasField('taskScheduled'):
+            current += 1
+            largest = max(largest, current)
+    return largest
+
+
+def test_fan_out_scales_linearly():
+    rows = []
+    for count, workflow, runtime in SCENARIOS:
+        replayer = runtime.replayer()
+        start = time.perf_counter()
+        (history,) = replayer.record(workflow, count, results=lambda name, value: value)
+        record_seconds = time.perf_counter() - start
+        result = history[-1].executionCompleted.result.value
+        assert int(result) == count * (count - 1) // 2
+        report = replayer.benchmark(history, rounds=1)
+        rows.append((count, workflow, runtime is BATCHED, record_seconds, report, history))
+
+    print(
+        f'\n{"tasks":>7} {"results":<8} {"batched":<8} {"record s":>9} {"replay s":>9}'
+        f' {"us/event":>9} {"turns":>6} {"max turn ms":>12} {"max sent":>9}'
+    )
+    for count, workflow, batched, record_seconds, report, history in rows:
+        print(
+            f'{count:>7} {workflow:<8} {str(batched):<8} {record_seconds:>9.3f}'
+            f' {report.replay_seconds:>9.3f} {report.per_event_seconds * 1e6:>9.2f}'
+            f' {len(report.turns):>6} {report.max_turn_seconds * 1e3:>12.2f}'
+            f' {_largest_turn(history):>9}'
+        )
+        assert report.per_event_seconds < MAX_EVENT_S
+        if batched:
+            assert _largest_turn(history) <= BATCH
@@ -13,16 +13,20 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import json
+import threading
+import time
 import unittest
 from datetime import datetime
+from typing import Dict, List, Optional, Set
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import grpc
 
 from dapr.ext.workflow._durabletask import client
 from dapr.ext.workflow.aio.mcp import DaprMCPClient as AioDaprMCPClient
-from dapr.ext.workflow.mcp import MCP_WORKFLOW_PREFIX, DaprMCPClient, MCPToolDef
+from dapr.ext.workflow.mcp import MCP_WORKFLOW_PREFIX, DaprMCPClient, MCPToolCache, MCPToolDef
 from dapr.ext.workflow.workflow_state import WorkflowState
 
 
@@ -551,6 +555,211 @@ class TestAioDaprMCPClientConnectRetry(unittest.IsolatedAsyncioTestCase):
         mock_wf.wait_for_workflow_completion.assert_not_awaited()
 
 
+class _FakeListToolsClient:
+    """A workflow client whose ListTools workflows return one tool named after the server.
+
+    With *barrier*, each wait blocks until that many ListTools runs are waiting at once.
+    """
+
+    def __init__(self, barrier: Optional[threading.Barrier] = None, failing: Set[str] = ()):
+        self._servers: Dict[str, str] = {}
+        self._barrier = barrier
+        self._failing = set(failing)
+        self.scheduled: List[str] = []
+
+    def schedule_new_workflow(self, *, workflow, input, instance_id):
+        self._servers[instance_id] = input['mcpServerName']
+        self.scheduled.append(input['mcpServerName'])
+        return instance_id
+
+    def wait_for_workflow_completion(self, *, instance_id, timeout_in_seconds, fetch_payloads):
+        if self._barrier is not None:
+            self._barrier.wait(timeout=5)
+        server = self._servers[instance_id]
+        if server in self._failing:
+            return _make_failed_state()
+        return _make_completed_state({'tools': [{'name': f'{server}_tool'}]})
+
+
+class _AsyncFakeListToolsClient(_FakeListToolsClient):
+    def __init__(self, expected_concurrency: int = 1, failing: Set[str] = ()):
+        super().__init__(failing=failing)
+        self._expected = expected_concurrency
+        self._waiting = 0
+        self._all_waiting = asyncio.Event()
+
+    async def schedule_new_workflow(self, **kwargs):
+        return super().schedule_new_workflow(**kwargs)
+
+    async def wait_for_workflow_completion(self, **kwargs):
+        self._waiting += 1
+        if self._waiting >= self._expected:
+            self._all_waiting.set()
+        await asyncio.wait_for(self._all_waiting.wait(), timeout=5)
+        return super().wait_for_workflow_completion(**kwargs)
+
+
+class _FakeStateClient:
+    """An in-memory stand-in for the DaprClient state API."""
+
+    def __init__(self):
+        self.state: Dict[str, str] = {}
+        self.metadata: Dict[str, dict] = {}
+
+    def save_state(self, store_name, key, value, state_metadata=None):
+        self.state[key] = value
+        self.metadata[key] = state_metadata
+
+    def get_state(self, store_name, key):
+        value = self.state.get(key)
+        return MagicMock(data=value.encode() if value is not None else b'')
+
+    def delete_state(self, store_name, key):
+        self.state.pop(key, None)
+
+
+class TestMCPToolCache(unittest.TestCase):
+    def test_entries_expire_after_ttl(self):
+        cache = MCPToolCache(ttl_in_seconds=10)
+        tools = [MCPToolDef(name='a', description='')]
+        with patch('dapr.ext.workflow.mcp.time.time', return_value=1000.0):
+            cache.put('weather', tools)
+        with patch('dapr.ext.workflow.mcp.time.time', return_value=1009.0):
+            self.assertEqual(cache.get('weather'), tools)
+        with patch('dapr.ext.workflow.mcp.time.time', return_value=1011.0):
+            self.assertIsNone(cache.get('weather'))
+        self.assertIsNone(cache.get('other'))
+
+    def test_invalid_ttl_raises(self):
+        with self.assertRaises(ValueError):
+            MCPToolCache(ttl_in_seconds=0)
+
+    def test_clients_sharing_a_cache_discover_once(self):
+        cache = MCPToolCache()
+        wf_client = _FakeListToolsClient()
+        DaprMCPClient(wf_client=wf_client, tool_cache=cache).connect('weather')
+        other = DaprMCPClient(wf_client=wf_client, tool_cache=cache, allowed_tools={'nothing'})
+        other.connect('weather')
+
+        self.assertEqual(wf_client.scheduled, ['weather'])
+        # The cache keeps whole catalogues; each client applies its own allowed_tools.
+        self.assertEqual(other.get_server_tools('weather'), [])
+        self.assertEqual(cache.get('weather')[0].name, 'weather_tool')
+
+        other.connect('weather', refresh=True)
+        self.assertEqual(wf_client.scheduled, ['weather', 'weather'])
+
+    def test_catalogues_persist_in_a_state_store(self):
+        state = _FakeStateClient()
+        wf_client = _FakeListToolsClient()
+        first = MCPToolCache(60, store_name='statestore', dapr_client=state)
+        DaprMCPClient(wf_client=wf_client, tool_cache=first).connect('weather')
+
+        (key,) = state.state
+        self.assertEqual(key, 'dapr-mcp-tools||v1||weather')
+        self.assertEqual(state.metadata[key], {'ttlInSeconds': '60'})
+
+        # A new process starts with an empty memory cache and reads the store.
+        restarted = DaprMCPClient(
+            wf_client=wf_client,
+            tool_cache=MCPToolCache(60, store_name='statestore', dapr_client=state),
+        )
+        restarted.connect('weather')
+        self.assertEqual(wf_client.scheduled, ['weather'])
+        tool = restarted.get_server_tools('weather')[0]
+        self.assertEqual(tool.call_tool_workflow, 'dapr.internal.mcp.weather.CallTool.weather_tool')
+
+        first.invalidate('weather')
+        self.assertEqual(state.state, {})
+
+    def test_state_store_failures_are_cache_misses(self):
+        broken = MagicMock()
+        broken.get_state.side_effect = RuntimeError('store down')
+        broken.save_state.side_effect = RuntimeError('store down')
+        wf_client = _FakeListToolsClient()
+        cache = MCPToolCache(store_name='statestore', dapr_client=broken)
+        mcp_client = DaprMCPClient(wf_client=wf_client, tool_cache=cache)
+
+        with self.assertLogs('dapr.ext.workflow.mcp', level='WARNING'):
+            mcp_client.connect('weather')
+        self.assertEqual(len(mcp_client.get_server_tools('weather')), 1)
+
+
+class TestDaprMCPClientConnectMany(unittest.TestCase):
+    def test_servers_are_discovered_concurrently(self):
+        # Each ListTools wait blocks until all three are waiting together.
+        wf_client = _FakeListToolsClient(barrier=threading.Barrier(3))
+        mcp_client = DaprMCPClient(wf_client=wf_client)
+
+        mcp_client.connect_many(['weather', 'search', 'calendar', 'weather'])
+
+        self.assertEqual(mcp_client.get_connected_servers(), ['weather', 'search', 'calendar'])
+        self.assertEqual(sorted(wf_client.scheduled), ['calendar', 'search', 'weather'])
+
+    def test_failures_are_reported_together(self):
+        wf_client = _FakeListToolsClient(failing={'search', 'calendar'})
+        mcp_client = DaprMCPClient(wf_client=wf_client)
+
+        with self.assertRaisesRegex(RuntimeError, "2 MCPServer.*'search'.*'calendar'"):
+            mcp_client.connect_many(['weather', 'search', 'calendar'])
+        self.assertEqual(mcp_client.get_connected_servers(), ['weather'])
+
+    def test_empty_name_raises(self):
+        with self.assertRaises(ValueError):
+            DaprMCPClient(wf_client=_FakeListToolsClient()).connect_many(['weather', ''])
+
+    def test_background_refresh(self):
+        wf_client = _FakeListToolsClient()
+        cache = MCPToolCache()
+        mcp_client = DaprMCPClient(wf_client=wf_client, tool_cache=cache)
+        mcp_client.connect_many(['weather', 'search'])
+
+        mcp_client.start_background_refresh(0.01)
+        with self.assertRaises(RuntimeError):
+            mcp_client.start_background_refresh(0.01)
+        deadline = time.monotonic() + 5
+        while len(wf_client.scheduled) < 6 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        mcp_client.stop_background_refresh()
+
+        self.assertGreaterEqual(len(wf_client.scheduled), 6)
+        self.assertEqual(len(mcp_client.get_all_tools()), 2)
+
+
+class TestAioDaprMCPClientConnectMany(unittest.IsolatedAsyncioTestCase):
+    async def test_servers_are_discovered_concurrently(self):
+        wf_client = _AsyncFakeListToolsClient(expected_concurrency=3)
+        mcp_client = AioDaprMCPClient(wf_client=wf_client)
+
+        await mcp_client.connect_many(['weather', 'search', 'calendar'])
+
+        self.assertEqual(len(mcp_client.get_all_tools()), 3)
+
+    async def test_failures_are_reported_together(self):
+        wf_client = _AsyncFakeListToolsClient(expected_concurrency=2, failing={'search'})
+        mcp_client = AioDaprMCPClient(wf_client=wf_client)
+
+        with self.assertRaisesRegex(RuntimeError, "1 MCPServer.*'search'"):
+            await mcp_client.connect_many(['weather', 'search'])
+        self.assertEqual(mcp_client.get_connected_servers(), ['weather'])
+
+    async def test_cache_and_background_refresh(self):
+        wf_client = _AsyncFakeListToolsClient()
+        cache = MCPToolCache(store_name='statestore', dapr_client=_FakeStateClient())
+        await AioDaprMCPClient(wf_client=wf_client, tool_cache=cache).connect('weather')
+        mcp_client = AioDaprMCPClient(wf_client=wf_client, tool_cache=cache)
+        await mcp_client.connect('weather')
+        self.assertEqual(wf_client.scheduled, ['weather'])
+
+        mcp_client.start_background_refresh(0.01)
+        for _ in range(500):
+            if len(wf_client.scheduled) >= 3:
+                break
+            await asyncio.sleep(0.01)
+        await mcp_client.stop_background_refresh()
+        self.assertGreaterEqual(len(wf_client.scheduled), 3)
+
+
 class TestMCPWorkflowPrefix(unittest.TestCase):
     """Tests for the workflow naming constant."""
 
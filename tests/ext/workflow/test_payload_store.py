@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import unittest
+from unittest import mock
+
+from google.protobuf import wrappers_pb2
+
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.clients.grpc._response import StateResponse
+from dapr.ext.workflow import DaprStatePayloadStore, DaprWorkflowClient
+from dapr.ext.workflow._durabletask.payloads import is_payload_reference
+
+
+class DaprStatePayloadStoreTest(unittest.TestCase):
+    def test_save_and_load(self):
+        dapr_client = mock.Mock()
+        dapr_client.get_state.return_value = StateResponse(data=b'"payload"', etag='1')
+        store = DaprStatePayloadStore('statestore', ttl_in_seconds=3600, dapr_client=dapr_client)
+
+        store.save('key', '"payload"')
+        self.assertEqual(store.load('key'), '"payload"')
+
+        dapr_client.save_state.assert_called_once_with(
+            'statestore', 'key', '"payload"', state_metadata={'ttlInSeconds': '3600'}
+        )
+        dapr_client.get_state.assert_called_once_with('statestore', 'key')
+
+    def test_missing_key_raises_key_error(self):
+        dapr_client = mock.Mock()
+        dapr_client.get_state.return_value = StateResponse(data=b'', etag='')
+        store = DaprStatePayloadStore('statestore', dapr_client=dapr_client)
+
+        with self.assertRaises(KeyError):
+            store.load('missing')
+
+    def test_client_is_created_on_first_use(self):
+        with mock.patch('dapr.ext.workflow.payload_store.DaprClient') as mock_client_cls:
+            store = DaprStatePayloadStore('statestore')
+            mock_client_cls.assert_not_called()
+
+            store.save('a', '1')
+            store.save('b', '2')
+            mock_client_cls.assert_called_once_with()
+
+
+class WorkflowClientPayloadTest(unittest.TestCase):
+    def test_client_externalizes_inputs_and_resolves_outputs(self):
+        saved = {}
+        dapr_client = mock.Mock()
+        dapr_client.save_state.side_effect = lambda store, key, value, **kw: saved.update(
+            {key: value}
+        )
+        dapr_client.get_state.side_effect = lambda store, key: StateResponse(
+            data=saved[key].encode('utf-8'), etag='1'
+        )
+        store = DaprStatePayloadStore('statestore', dapr_client=dapr_client)
+        wfClient = DaprWorkflowClient(payload_store=store, payload_threshold_bytes=64)
+        inner = wfClient._DaprWorkflowClient__obj
+        inner._stub = mock.Mock()
+
+        wfClient.schedule_new_workflow('wf', input='x' * 100, instance_id='abc')
+        (req,), _ = inner._stub.StartInstance.call_args
+        self.assertTrue(is_payload_reference(req.input.value))
+        self.assertEqual(list(saved.values()), [json.dumps('x' * 100)])
+
+        reference = req.input.value
+        inner._stub.GetInstance.return_value = pb.GetInstanceResponse(
+            exists=True,
+            workflowState=pb.WorkflowState(
+                instanceId='abc',
+                name='wf',
+                workflowStatus=pb.ORCHESTRATION_STATUS_COMPLETED,
+                input=wrappers_pb2.StringValue(value=reference),
+                output=wrappers_pb2.StringValue(value=reference),
+            ),
+        )
+        result = wfClient.get_workflow_state('abc')
+
+        self.assertEqual(result.serialized_input, json.dumps('x' * 100))
+        self.assertEqual(result.serialized_output, json.dumps('x' * 100))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import unittest
+from datetime import timedelta
+
+import dapr.ext.workflow._durabletask.internal.protos as pb
+from dapr.ext.workflow import DaprWorkflowContext, WorkflowRuntime, when_all
+from dapr.ext.workflow.replay import split_turns
+
+
+def _kinds(history):
+    return [event.WhichOneof('eventType') for event in history]
+
+
+class WorkflowReplayerTest(unittest.TestCase):
+    def setUp(self):
+        self.runtime = WorkflowRuntime()
+
+        @self.runtime.activity(name='double')
+        def double(ctx, value: int) -> int:
+            return value * 2
+
+        @self.runtime.workflow(name='fan_out')
+        def fan_out(ctx: DaprWorkflowContext, count: int):
+            results = yield when_all([ctx.call_activity(double, input=i) for i in range(count)])
+            yield ctx.create_timer(timedelta(minutes=5))
+            bonus = yield ctx.wait_for_external_event('bonus')
+            return sum(results) + bonus
+
+        @self.runtime.workflow(name='countdown')
+        def countdown(ctx: DaprWorkflowContext, n: int):
+            if n > 0:
+                yield ctx.call_activity(double, input=n)
+                ctx.continue_as_new(n - 1)
+                return
+            return 'done'
+
+        self.fan_out = fan_out
+        self.replayer = self.runtime.replayer()
+
+    def test_record_simulates_the_sidecar(self):
+        (history,) = self.replayer.record(
+            self.fan_out,
+            4,
+            results=lambda name, value: value * 2,
+            events=[('bonus', 100)],
+            completions_per_turn=3,
+        )
+
+        kinds = _kinds(history)
+        self.assertEqual(kinds[:2], ['workflowStarted', 'executionStarted'])
+        self.assertEqual(kinds.count('taskScheduled'), 4)
+        self.assertEqual(kinds.count('taskCompleted'), 4)
+        self.assertEqual(kinds.count('timerFired'), 1)
+        self.assertEqual(kinds.count('eventRaised'), 1)
+        completed = history[-1].executionCompleted
+        self.assertEqual(completed.workflowStatus, pb.ORCHESTRATION_STATUS_COMPLETED)
+        self.assertEqual(json.loads(completed.result.value), 112)
+        # Completions arrive three per turn, then the timer, then the event.
+        self.assertEqual(len(split_turns(history)), 5)
+
+    def test_failed_activities_fail_their_tasks(self):
+        def results(name, value):
+            raise RuntimeError('boom')
+
+        (history,) = self.replayer.record(self.fan_out, 1, results=results)
+
+        self.assertIn('taskFailed', _kinds(history))
+        completed = history[-1].executionCompleted
+        self.assertEqual(completed.workflowStatus, pb.ORCHESTRATION_STATUS_FAILED)
+
+    def test_record_raises_when_the_workflow_is_stuck(self):
+        with self.assertRaisesRegex(ValueError, 'nothing left to deliver'):
+            self.replayer.record(self.fan_out, 2)
+
+    def test_continue_as_new_generations(self):
+        histories = self.replayer.record('countdown', 3, generations=10)
+
+        self.assertEqual(len(histories), 4)
+        for history in histories[:-1]:
+            self.assertEqual(
+                history[-1].executionCompleted.workflowStatus,
+                pb.ORCHESTRATION_STATUS_CONTINUED_AS_NEW,
+            )
+        self.assertEqual(json.loads(histories[-1][-1].executionCompleted.result.value), 'done')
+        self.assertEqual(len(self.replayer.record('countdown', 3, generations=2)), 2)
+
+    def test_split_turns(self):
+        (history,) = self.replayer.record(
+            self.fan_out, 2, events=[('bonus', 0)], completions_per_turn=1
+        )
+        turns = split_turns(history)
+
+        self.assertEqual(sum(len(d) + len(c) for d, c in turns), len(history))
+        first_delivered, first_confirmed = turns[0]
+        self.assertEqual(_kinds(first_delivered), ['workflowStarted', 'executionStarted'])
+        self.assertEqual(_kinds(first_confirmed), ['taskScheduled', 'taskScheduled'])
+        self.assertEqual(_kinds(turns[-1][1]), ['executionCompleted'])
+
+    def test_benchmark(self):
+        (history,) = self.replayer.record(
+            self.fan_out, 10, events=[('bonus', 0)], completions_per_turn=2
+        )
+        report = self.replayer.benchmark(history, rounds=1)
+
+        self.assertEqual(report.events, len(history))
+        self.assertEqual(len(report.turns), len(split_turns(history)))
+        self.assertEqual(report.turns[0].committed_events, 0)
+        self.assertEqual(report.turns[1].committed_events, 10)
+        self.assertEqual(report.turns[1].new_events, 3)
+        self.assertGreater(report.replay_seconds, 0)
+        self.assertGreater(report.per_event_seconds, 0)
+        self.assertIsNone(report.peak_bytes)
+        self.assertEqual(report.hot_frames, ())
+        self.assertIn('events: ', report.format())
+
+    def test_benchmark_profiles_and_traces_allocations(self):
+        (history,) = self.replayer.record(self.fan_out, 10, events=[('bonus', 0)])
+        report = self.replayer.benchmark(
+            history, rounds=1, profile=True, trace_allocations=True, top_frames=5
+        )
+
+        self.assertEqual(len(report.hot_frames), 5)
+        self_seconds = [frame.self_seconds for frame in report.hot_frames]
+        self.assertEqual(self_seconds, sorted(self_seconds, reverse=True))
+        self.assertTrue(all(frame.calls > 0 for frame in report.hot_frames))
+        self.assertGreater(report.peak_bytes, 0)
+        self.assertGreater(report.allocated_blocks, 0)
+        self.assertIn('function', report.format())
+
+    def test_benchmark_rejects_empty_histories(self):
+        with self.assertRaises(ValueError):
+            self.replayer.benchmark([])
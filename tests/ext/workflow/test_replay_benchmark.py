@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+Replay benchmarks for common workflow shapes: fan-out, timers, external events and long
+continue_as_new chains. Each records a synthetic history with ``WorkflowReplayer`` and
+reports its full-replay and per-turn cost. Run with ``-s`` to see the reports.
+"""
+
+from datetime import timedelta
+
+import pytest
+
+from dapr.ext.workflow import DaprWorkflowContext, WorkflowRuntime, when_all
+
+pytestmark = pytest.mark.perf
+
+# Generous ceilings; replaying one event costs tens of microseconds at most.
+MAX_EVENT_S = 0.0005
+MAX_TURN_S = 0.01
+
+runtime = WorkflowRuntime()
+
+
+@runtime.activity(name='work')
+def work(ctx, value: int) -> int:
+    return value
+
+
+@runtime.workflow(name='fan_out')
+def fan_out(ctx: DaprWorkflowContext, count: int):
+    results = yield when_all([ctx.call_activity(work, input=i) for i in range(count)])
+    return sum(results)
+
+
+@runtime.workflow(name='timers')
+def timers(ctx: DaprWorkflowContext, count: int):
+    for _ in range(count):
+        yield ctx.create_timer(timedelta(minutes=1))
+    return count
+
+
+@runtime.workflow(name='events')
+def events(ctx: DaprWorkflowContext, count: int):
+    total = 0
+    for _ in range(count):
+        total += yield ctx.wait_for_external_event('tick')
+    return total
+
+
+@runtime.workflow(name='chain')
+def chain(ctx: DaprWorkflowContext, n: int):
+    if n > 0:
+        yield ctx.call_activity(work, input=n)
+        ctx.continue_as_new(n - 1)
+        return
+    return 'done'
+
+
+def _report(title, history):
+    report = runtime.replayer().benchmark(history, trace_allocations=True)
+    print(f'\n{title}\n{report.format()}')
+    assert report.per_event_seconds < MAX_EVENT_S
+    assert report.max_turn_seconds < MAX_TURN_S
+    return report
+
+
+@pytest.mark.parametrize('completions_per_turn', [None, 1])
+def test_fan_out(completions_per_turn):
+    (history,) = runtime.replayer().record(
+        fan_out, 200, results=lambda name, value: value, completions_per_turn=completions_per_turn
+    )
+    _report(f'fan-out of 200, {completions_per_turn or "all"} completion(s) per turn', history)
+
+
+def test_timers():
+    (history,) = runtime.replayer().record(timers, 200)
+    _report('200 sequential timers', history)
+
+
+def test_external_events():
+    (history,) = runtime.replayer().record(events, 200, events=[('tick', 1)] * 200)
+    report = _report('200 external events', history)
+    # Sticky turns do not replay earlier turns, so the last turn is no slower than the
+    # whole history.
+    assert report.turns[-1].seconds < report.replay_seconds
+
+
+def test_continue_as_new_chain():
+    histories = runtime.replayer().record(chain, 500, generations=501)
+    assert len(histories) == 501
+    reports = [runtime.replayer().benchmark(history, rounds=1) for history in histories]
+    total = sum(report.replay_seconds for report in reports)
+    print(
+        f'\n500 continue_as_new generations: {total * 1e3:.2f}ms to replay them all'
+        f' ({total / len(reports) * 1e6:.1f}us per generation)'
+    )
+    # Each generation starts from a fresh history, so cost does not grow along the chain.
+    assert max(report.events for report in reports) <= 6
+    # Single rounds of a few events are noisy, so bound the mean rather than the worst.
+    assert total / sum(report.events for report in reports) < MAX_EVENT_S
@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import time
+import unittest
+from unittest import mock
+
+from dapr.ext.workflow._durabletask.worker import (
+    ConcurrencyLimits,
+    HistoryCacheStats,
+    _ActivityProcessPool,
+)
+from dapr.ext.workflow._worker_supervisor import _WorkerSupervisor
+from dapr.ext.workflow.workflow_runtime import WorkflowRuntime
+from tests.ext.workflow.durabletask import process_activities
+
+
+class _RecordingWorker:
+    """Stands in for TaskHubGrpcWorker; reports start/stop from each worker process."""
+
+    def __init__(
+        self, fail_start: bool = False, start_delay: float = 0.0, process_activities: bool = False
+    ):
+        self.events = multiprocessing.get_context('fork').Queue()
+        self._fail_start = fail_start
+        self._start_delay = start_delay
+        self._process_activities = process_activities
+        self._activity_processes = None
+
+    def start(self):
+        time.sleep(self._start_delay)
+        if self._fail_start:
+            raise RuntimeError('sidecar unreachable')
+        if self._process_activities:
+            # Like TaskHubGrpcWorker with activities registered with executor='process'.
+            self._activity_processes = _ActivityProcessPool(
+                {'pid': process_activities.pid}, 1, None, logging.getLogger('test')
+            )
+            encoded = asyncio.run(self._activity_processes.execute('pid', 'wf', 1, None, '', None))
+            self.events.put(('activity', json.loads(encoded)))
+        self.events.put(('start', os.getpid()))
+
+    def stop(self):
+        if self._activity_processes is not None:
+            self._activity_processes.shutdown()
+        self.events.put(('stop', os.getpid()))
+
+    @property
+    def history_cache_stats(self) -> HistoryCacheStats:
+        return HistoryCacheStats(
+            entries=2, total_bytes=100, hits=3, misses=1, evictions=0, expirations=1
+        )
+
+    @property
+    def concurrency_limits(self) -> ConcurrencyLimits:
+        return ConcurrencyLimits(
+            activity_limit=4,
+            activity_in_flight=1,
+            orchestration_limit=8,
+            orchestration_in_flight=2,
+        )
+
+    def drain(self, count: int) -> list:
+        return [self.events.get(timeout=10) for _ in range(count)]
+
+
+class WorkerSupervisorTest(unittest.TestCase):
+    def setUp(self):
+        self.logger = mock.MagicMock()
+
+    def test_runs_one_worker_per_process_and_stops_them(self):
+        worker = _RecordingWorker()
+        supervisor = _WorkerSupervisor(worker, 3, self.logger)
+
+        supervisor.start(timeout=10)
+        self.assertTrue(supervisor.is_ready())
+        started = worker.drain(3)
+        supervisor.stop(timeout=10)
+        stopped = worker.drain(3)
+
+        start_pids = {pid for kind, pid in started if kind == 'start'}
+        self.assertEqual(len(start_pids), 3)
+        self.assertNotIn(os.getpid(), start_pids)
+        self.assertEqual({pid for _, pid in stopped}, start_pids)
+        self.assertFalse(supervisor.is_ready())
+
+    def test_worker_processes_can_run_process_activities(self):
+        worker = _RecordingWorker(process_activities=True)
+        supervisor = _WorkerSupervisor(worker, 2, self.logger)
+
+        supervisor.start(timeout=60)
+        try:
+            started = worker.drain(4)
+        finally:
+            supervisor.stop(timeout=30)
+        worker_pids = {pid for kind, pid in started if kind == 'start'}
+        activity_pids = {pid for kind, pid in started if kind == 'activity'}
+        self.assertEqual(len(worker_pids), 2)
+        # Each worker process runs its activities in processes of its own.
+        self.assertEqual(len(activity_pids), 2)
+        self.assertFalse(activity_pids & worker_pids)
+        self.assertEqual([kind for kind, _ in worker.drain(2)], ['stop', 'stop'])
+
+    def test_worker_process_that_fails_to_start_fails_start(self):
+        supervisor = _WorkerSupervisor(_RecordingWorker(fail_start=True), 2, self.logger)
+
+        with self.assertRaisesRegex(RuntimeError, 'exited with code 1'):
+            supervisor.start(timeout=10)
+        self.assertFalse(supervisor.is_ready())
+
+    def test_start_times_out(self):
+        supervisor = _WorkerSupervisor(_RecordingWorker(start_delay=5), 1, self.logger)
+
+        begin = time.monotonic()
+        with self.assertRaisesRegex(RuntimeError, 'not ready within'):
+            supervisor.start(timeout=0.3)
+        # The process still starting is stopped rather than waited for.
+        self.assertLess(time.monotonic() - begin, 3)
+
+    def test_dead_worker_process_is_not_ready(self):
+        worker = _RecordingWorker()
+        supervisor = _WorkerSupervisor(worker, 2, self.logger)
+        supervisor.start(timeout=10)
+        worker.drain(2)  # nothing is left mid-write on the queue when a process is killed
+        try:
+            process, _, _ = supervisor._shards[0]
+            process.kill()
+            process.join()
+            self.assertFalse(supervisor.is_ready())
+            # Only the live process is counted.
+            self.assertEqual(supervisor.history_cache_stats().entries, 2)
+        finally:
+            supervisor.stop(timeout=10)
+
+    def test_rejects_non_positive_process_count(self):
+        with self.assertRaises(ValueError):
+            _WorkerSupervisor(_RecordingWorker(), 0, self.logger)
+
+
+class WorkflowRuntimeWorkerProcessesTest(unittest.TestCase):
+    def test_start_and_shutdown_use_the_supervisor(self):
+        worker = _RecordingWorker()
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker', return_value=worker
+        ):
+            runtime = WorkflowRuntime(worker_processes=2, worker_ready_timeout=10)
+
+        runtime.start()
+        try:
+            self.assertTrue(runtime.wait_for_worker_ready(timeout=1))
+            self.assertEqual([kind for kind, _ in worker.drain(2)], ['start', 'start'])
+        finally:
+            runtime.shutdown()
+        self.assertEqual([kind for kind, _ in worker.drain(2)], ['stop', 'stop'])
+
+    def test_stats_are_summed_over_worker_processes(self):
+        worker = _RecordingWorker()
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker', return_value=worker
+        ):
+            runtime = WorkflowRuntime(worker_processes=3, worker_ready_timeout=10)
+
+        runtime.start()
+        try:
+            self.assertEqual(
+                runtime.history_cache_stats,
+                HistoryCacheStats(
+                    entries=6, total_bytes=300, hits=9, misses=3, evictions=0, expirations=3
+                ),
+            )
+            self.assertEqual(
+                runtime.concurrency_limits,
+                ConcurrencyLimits(
+                    activity_limit=12,
+                    activity_in_flight=3,
+                    orchestration_limit=24,
+                    orchestration_in_flight=6,
+                ),
+            )
+        finally:
+            runtime.shutdown()
+        self.assertEqual(runtime.history_cache_stats.entries, 0)
+
+    def test_single_process_is_the_default(self):
+        with mock.patch('dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'):
+            runtime = WorkflowRuntime()
+        self.assertIsNone(runtime._supervisor)
+
+
+if __name__ == '__main__':
+    unittest.main()
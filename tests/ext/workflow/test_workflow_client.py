@@ -13,18 +13,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import threading
+import time
 import unittest
 import warnings
 from datetime import datetime
 from typing import Any, Union
 from unittest import mock
 
-from grpc import RpcError
+from grpc import RpcError, StatusCode
 
 from dapr.conf import settings
 from dapr.ext.workflow._durabletask import client
 from dapr.ext.workflow.dapr_workflow_client import DaprWorkflowClient
 from dapr.ext.workflow.dapr_workflow_context import DaprWorkflowContext
+from dapr.ext.workflow.workflow_state import WorkflowStatus
 
 mock_schedule_result = 'workflow001'
 mock_raise_event_result = 'event001'
@@ -289,3 +292,193 @@ class WorkflowClientTest(unittest.TestCase):
             assert actual_purge_result == mock_purge_result
             actual_purge_result = wfClient.purge_workflow(instance_id=mock_instance_id)
             assert actual_purge_result == mock_purge_result
+
+
+class WorkflowClientBulkTest(unittest.TestCase):
+    def setUp(self):
+        self.inner = mock.MagicMock()
+        patcher = mock.patch(
+            'dapr.ext.workflow._durabletask.client.TaskHubGrpcClient', return_value=self.inner
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.wfClient = DaprWorkflowClient()
+
+    def test_results_are_per_item_and_in_input_order(self):
+        def terminate(instance_id, *, output, recursive):
+            if instance_id == 'b':
+                raise SimulatedRpcError(code='UNKNOWN', details='boom')
+
+        self.inner.terminate_orchestration.side_effect = terminate
+
+        results = self.wfClient.terminate_workflows(['a', 'b', 'c'], max_concurrency=2)
+
+        self.assertEqual([r.instance_id for r in results], ['a', 'b', 'c'])
+        self.assertEqual([r.index for r in results], [0, 1, 2])
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertEqual(results[1].error.details(), 'boom')
+
+    def test_schedule_gives_missing_instance_ids_a_guid(self):
+        self.inner.schedule_new_orchestration.side_effect = (
+            lambda name, *, input, instance_id, start_at, reuse_id_policy: instance_id
+        )
+
+        results = self.wfClient.schedule_new_workflows('wf', [('order-1', 1), (None, 2)])
+
+        self.assertEqual(results[0].value, 'order-1')
+        self.assertTrue(results[1].ok)
+        self.assertEqual(len(results[1].instance_id), 32)
+        self.assertEqual(results[1].value, results[1].instance_id)
+        inputs = [c.kwargs['input'] for c in self.inner.schedule_new_orchestration.call_args_list]
+        self.assertCountEqual(inputs, [1, 2])
+
+    def test_input_is_streamed_with_bounded_concurrency(self):
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        consumed = []
+
+        def raise_event(instance_id, event_name, *, data):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                # The input is pulled lazily, never far ahead of the calls in flight.
+                self.assertLessEqual(len(consumed), int(instance_id) + 3)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        def ids():
+            for i in range(20):
+                consumed.append(i)
+                yield str(i)
+
+        self.inner.raise_orchestration_event.side_effect = raise_event
+
+        results = self.wfClient.raise_workflow_events(ids(), 'go', max_concurrency=3)
+
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(len(results), 20)
+        self.assertLessEqual(peak, 3)
+        with self.assertRaises(ValueError):
+            self.wfClient.purge_workflows(['a'], max_concurrency=0)
+
+    def test_get_workflow_states_reports_missing_instances_as_none(self):
+        self.inner.get_orchestration_state.side_effect = SimulatedRpcError(
+            code='UNKNOWN', details='no such instance exists'
+        )
+
+        results = self.wfClient.get_workflow_states(['gone'])
+
+        self.assertTrue(results[0].ok)
+        self.assertIsNone(results[0].value)
+
+    def test_purge_by_filter_repeats_until_complete(self):
+        self.inner.purge_orchestrations_by.side_effect = [
+            client.PurgeInstancesResult(100, False),
+            client.PurgeInstancesResult(5, True),
+        ]
+        created_to = datetime(2026, 1, 1)
+
+        purged = self.wfClient.purge_workflows_by_filter(
+            created_time_to=created_to,
+            runtime_statuses=[WorkflowStatus.COMPLETED, WorkflowStatus.FAILED],
+        )
+
+        self.assertEqual(purged, 105)
+        self.inner.purge_orchestrations_by.assert_called_with(
+            None,
+            created_to,
+            [client.OrchestrationStatus.COMPLETED, client.OrchestrationStatus.FAILED],
+            True,
+        )
+
+    def test_purge_by_filter_requires_sidecar_support(self):
+        self.inner.purge_orchestrations_by.side_effect = SimulatedRpcError(
+            code=StatusCode.UNIMPLEMENTED, details='not supported'
+        )
+
+        with self.assertRaises(NotImplementedError):
+            self.wfClient.purge_workflows_by_filter(runtime_statuses=[WorkflowStatus.TERMINATED])
+        with self.assertRaises(ValueError):
+            self.wfClient.purge_workflows_by_filter(runtime_statuses=[WorkflowStatus.UNKNOWN])
+
+
+class WorkflowClientListTest(unittest.TestCase):
+    def setUp(self):
+        self.inner = mock.MagicMock()
+        patcher = mock.patch(
+            'dapr.ext.workflow._durabletask.client.TaskHubGrpcClient', return_value=self.inner
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.wfClient = DaprWorkflowClient()
+        self.pages = {
+            None: client.InstanceIdPage(['a', 'b'], 't1'),
+            't1': client.InstanceIdPage([], 't2'),
+            't2': client.InstanceIdPage(['c'], None),
+        }
+
+    def test_instance_ids_follow_continuation_tokens(self):
+        self.inner.list_instance_ids.side_effect = lambda size, token: self.pages[token]
+
+        for prefetch in (True, False):
+            ids = self.wfClient.list_workflow_instance_ids(page_size=2, prefetch=prefetch)
+            self.assertEqual(list(ids), ['a', 'b', 'c'])
+        self.inner.list_instance_ids.assert_called_with(2, 't2')
+
+    def test_next_page_is_prefetched_while_current_page_is_consumed(self):
+        requested = []
+        second_page_requested = threading.Event()
+
+        def list_instance_ids(size, token):
+            requested.append(token)
+            if token == 't1':
+                second_page_requested.set()
+            return self.pages[token]
+
+        self.inner.list_instance_ids.side_effect = list_instance_ids
+
+        ids = self.wfClient.list_workflow_instance_ids()
+        self.assertEqual(next(ids), 'a')
+        self.assertTrue(second_page_requested.wait(5))
+        ids.close()
+        self.assertEqual(requested, [None, 't1'])
+
+    def test_states_are_fetched_per_page_and_numbered_in_listing_order(self):
+        self.inner.list_instance_ids.side_effect = lambda size, token: self.pages[token]
+        self.inner.get_orchestration_state.side_effect = lambda instance_id, *, fetch_payloads: (
+            None
+            if instance_id == 'b'
+            else client.WorkflowState(
+                instance_id,
+                'wf',
+                client.OrchestrationStatus.RUNNING,
+                datetime.now(),
+                datetime.now(),
+                None,
+                None,
+                None,
+                None,
+            )
+        )
+
+        results = list(self.wfClient.list_workflow_states(max_concurrency=2))
+
+        self.assertEqual(
+            [(r.index, r.instance_id) for r in results], [(0, 'a'), (1, 'b'), (2, 'c')]
+        )
+        self.assertEqual(results[0].value.runtime_status, WorkflowStatus.RUNNING)
+        self.assertIsNone(results[1].value)
+        self.inner.get_orchestration_state.assert_called_with('c', fetch_payloads=False)
+
+    def test_listing_requires_sidecar_support(self):
+        self.inner.list_instance_ids.side_effect = SimulatedRpcError(
+            code=StatusCode.UNIMPLEMENTED, details='not supported'
+        )
+
+        with self.assertRaises(NotImplementedError):
+            list(self.wfClient.list_workflow_instance_ids())
+        with self.assertRaises(ValueError):
+            self.wfClient.list_workflow_states(page_size=0)
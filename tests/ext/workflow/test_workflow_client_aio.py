@@ -13,18 +13,21 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import asyncio
 import unittest
 import warnings
 from datetime import datetime
 from typing import Any, Union
 from unittest import mock
 
+from grpc import StatusCode
 from grpc.aio import AioRpcError
 
 from dapr.conf import settings
 from dapr.ext.workflow._durabletask import client
 from dapr.ext.workflow.aio import DaprWorkflowClient
 from dapr.ext.workflow.dapr_workflow_context import DaprWorkflowContext
+from dapr.ext.workflow.workflow_state import WorkflowStatus
 
 mock_schedule_result = 'workflow001'
 mock_raise_event_result = 'event001'
@@ -295,3 +298,127 @@ class WorkflowClientAioTest(unittest.IsolatedAsyncioTestCase):
             assert actual_purge_result == mock_purge_result
             actual_purge_result = await wfClient.purge_workflow(instance_id=mock_instance_id)
             assert actual_purge_result == mock_purge_result
+
+
+class WorkflowClientAioBulkTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.inner = mock.MagicMock()
+        patcher = mock.patch(
+            'dapr.ext.workflow._durabletask.aio.client.AsyncTaskHubGrpcClient',
+            return_value=self.inner,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.wfClient = DaprWorkflowClient()
+
+    async def test_results_are_per_item_and_in_input_order(self):
+        async def terminate(instance_id, *, output, recursive):
+            await asyncio.sleep(0.01 if instance_id == 'a' else 0)
+            if instance_id == 'b':
+                raise SimulatedAioRpcError(code='UNKNOWN', details='boom')
+
+        self.inner.terminate_orchestration.side_effect = terminate
+
+        results = await self.wfClient.terminate_workflows(['a', 'b', 'c'])
+
+        self.assertEqual([r.instance_id for r in results], ['a', 'b', 'c'])
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertEqual(results[1].error.details(), 'boom')
+
+    async def test_async_input_is_streamed_with_bounded_concurrency(self):
+        in_flight = 0
+        peak = 0
+
+        async def purge(instance_id, recursive):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        async def ids():
+            for i in range(20):
+                yield f'id-{i}'
+
+        self.inner.purge_orchestration.side_effect = purge
+
+        results = await self.wfClient.purge_workflows(ids(), max_concurrency=4)
+
+        self.assertEqual([r.instance_id for r in results], [f'id-{i}' for i in range(20)])
+        self.assertTrue(all(r.ok for r in results))
+        self.assertEqual(peak, 4)
+
+    async def test_schedule_gives_missing_instance_ids_a_guid(self):
+        async def schedule(name, *, input, instance_id, start_at, reuse_id_policy):
+            return instance_id
+
+        self.inner.schedule_new_orchestration.side_effect = schedule
+
+        results = await self.wfClient.schedule_new_workflows('wf', [('order-1', 1), (None, 2)])
+
+        self.assertEqual(results[0].value, 'order-1')
+        self.assertEqual(results[1].value, results[1].instance_id)
+
+    async def test_purge_by_filter_repeats_until_complete(self):
+        self.inner.purge_orchestrations_by = mock.AsyncMock(
+            side_effect=[
+                client.PurgeInstancesResult(3, False),
+                client.PurgeInstancesResult(0, False),
+            ]
+        )
+
+        purged = await self.wfClient.purge_workflows_by_filter(
+            runtime_statuses=[WorkflowStatus.COMPLETED]
+        )
+
+        self.assertEqual(purged, 3)
+        self.assertEqual(self.inner.purge_orchestrations_by.await_count, 2)
+
+
+class WorkflowClientAioListTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.inner = mock.MagicMock()
+        patcher = mock.patch(
+            'dapr.ext.workflow._durabletask.aio.client.AsyncTaskHubGrpcClient',
+            return_value=self.inner,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.wfClient = DaprWorkflowClient()
+        pages = {
+            None: client.InstanceIdPage(['a', 'b'], 't1'),
+            't1': client.InstanceIdPage(['c'], None),
+        }
+
+        async def list_instance_ids(size, token):
+            return pages[token]
+
+        self.inner.list_instance_ids.side_effect = list_instance_ids
+
+    async def test_instance_ids_follow_continuation_tokens(self):
+        for prefetch in (True, False):
+            ids = [i async for i in self.wfClient.list_workflow_instance_ids(prefetch=prefetch)]
+            self.assertEqual(ids, ['a', 'b', 'c'])
+
+    async def test_states_are_fetched_per_page_and_numbered_in_listing_order(self):
+        async def get_state(instance_id, *, fetch_payloads):
+            if instance_id == 'b':
+                raise SimulatedAioRpcError(code='UNKNOWN', details='boom')
+            return None
+
+        self.inner.get_orchestration_state.side_effect = get_state
+
+        results = [r async for r in self.wfClient.list_workflow_states(page_size=2)]
+
+        self.assertEqual(
+            [(r.index, r.instance_id) for r in results], [(0, 'a'), (1, 'b'), (2, 'c')]
+        )
+        self.assertEqual([r.ok for r in results], [True, False, True])
+
+    async def test_listing_requires_sidecar_support(self):
+        self.inner.list_instance_ids.side_effect = SimulatedAioRpcError(
+            code=StatusCode.UNIMPLEMENTED, details='not supported'
+        )
+
+        with self.assertRaises(NotImplementedError):
+            [i async for i in self.wfClient.list_workflow_instance_ids()]
@@ -13,6 +13,7 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import pickle
 import unittest
 from typing import List, Optional
 from unittest import mock
@@ -20,8 +21,11 @@ from unittest import mock
 import grpc
 from pydantic import BaseModel, ValidationError
 
+from dapr.aio.clients.grpc.interceptors import DaprClientTimeoutInterceptorAsync
 from dapr.conf import settings
+from dapr.ext.workflow import OrjsonCodec, WorkerMetrics
 from dapr.ext.workflow.dapr_workflow_context import DaprWorkflowContext
+from dapr.ext.workflow.payload_store import DaprStatePayloadStore
 from dapr.ext.workflow.workflow_activity_context import WorkflowActivityContext
 from dapr.ext.workflow.workflow_runtime import WorkflowRuntime, alternate_name
 
@@ -35,18 +39,35 @@ listOrchestrators: List[str] = []
 listActivities: List[str] = []
 
 
+def square_activity(ctx, inp: int) -> int:
+    return inp * inp
+
+
+def cube_activity(ctx, inp: int) -> int:
+    return inp**3
+
+
+def failing_process_activity(ctx, inp: int) -> int:
+    raise ValueError('process boom')
+
+
 class FakeTaskHubGrpcWorker:
     def __init__(self):
         self._orchestrator_fns = {}
         self._activity_fns = {}
+        self._activity_executors = {}
+        self._externalized_activities = set()
 
     def add_named_orchestrator(self, name: str, fn, **kwargs):
         listOrchestrators.append(name)
         self._orchestrator_fns[name] = fn
 
-    def add_named_activity(self, name: str, fn):
+    def add_named_activity(self, name: str, fn, **kwargs):
         listActivities.append(name)
         self._activity_fns[name] = fn
+        self._activity_executors[name] = kwargs.get('executor', 'thread')
+        if kwargs.get('externalize_output'):
+            self._externalized_activities.add(name)
 
 
 class WorkflowRuntimeTimeoutInterceptorTest(unittest.TestCase):
@@ -151,6 +172,96 @@ class WorkflowRuntimeStatefulHistoryTest(unittest.TestCase):
             self.assertEqual(call_kwargs['history_cache_max_instances'], 50)
             self.assertEqual(call_kwargs['history_cache_max_bytes'], 4096)
 
+    def test_sticky_execution_options_are_forwarded(self):
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'
+        ) as mock_worker_cls:
+            WorkflowRuntime()
+            self.assertFalse(mock_worker_cls.call_args[1]['enable_sticky_execution'])
+            self.assertEqual(mock_worker_cls.call_args[1]['sticky_execution_max_instances'], 0)
+
+            WorkflowRuntime(enable_sticky_execution=True, sticky_execution_max_instances=8)
+            call_kwargs = mock_worker_cls.call_args[1]
+
+            self.assertTrue(call_kwargs['enable_sticky_execution'])
+            self.assertEqual(call_kwargs['sticky_execution_max_instances'], 8)
+
+    def test_grpc_aio_options_are_forwarded(self):
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'
+        ) as mock_worker_cls:
+            WorkflowRuntime()
+            self.assertFalse(mock_worker_cls.call_args[1]['use_grpc_aio'])
+
+            custom = mock.Mock()
+            WorkflowRuntime(use_grpc_aio=True, aio_interceptors=[custom])
+            call_kwargs = mock_worker_cls.call_args[1]
+
+            self.assertTrue(call_kwargs['use_grpc_aio'])
+            aio_interceptors = call_kwargs['aio_interceptors']
+            self.assertIs(aio_interceptors[0], custom)
+            self.assertIsInstance(aio_interceptors[-1], DaprClientTimeoutInterceptorAsync)
+
+    def test_adaptive_concurrency_options_are_forwarded(self):
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'
+        ) as mock_worker_cls:
+            runtime = WorkflowRuntime(
+                adaptive_concurrency=True,
+                minimum_concurrent_activity_work_items=3,
+                minimum_concurrent_orchestration_work_items=4,
+            )
+            options = mock_worker_cls.call_args[1]['concurrency_options']
+
+            self.assertTrue(options.adaptive_concurrency)
+            self.assertEqual(options.minimum_concurrent_activity_work_items, 3)
+            self.assertEqual(options.minimum_concurrent_orchestration_work_items, 4)
+            self.assertIs(
+                runtime.concurrency_limits, mock_worker_cls.return_value.concurrency_limits
+            )
+
+    def test_payload_store_options_are_forwarded(self):
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'
+        ) as mock_worker_cls:
+            store = DaprStatePayloadStore('statestore', dapr_client=mock.Mock())
+            WorkflowRuntime(payload_store=store, payload_threshold_bytes=1024)
+            call_kwargs = mock_worker_cls.call_args[1]
+
+            self.assertIs(call_kwargs['payload_store'], store)
+            self.assertEqual(call_kwargs['payload_threshold_bytes'], 1024)
+
+    def test_codec_is_forwarded(self):
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'
+        ) as mock_worker_cls:
+            WorkflowRuntime()
+            self.assertIsNone(mock_worker_cls.call_args[1]['codec'])
+
+            codec = OrjsonCodec(compression_threshold_bytes=4096)
+            WorkflowRuntime(codec=codec)
+            self.assertIs(mock_worker_cls.call_args[1]['codec'], codec)
+
+    def test_action_batching_options_are_forwarded(self):
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'
+        ) as mock_worker_cls:
+            WorkflowRuntime(max_actions_per_turn=500, max_action_bytes_per_turn=1024)
+            kwargs = mock_worker_cls.call_args[1]
+            self.assertEqual(kwargs['max_actions_per_turn'], 500)
+            self.assertEqual(kwargs['max_action_bytes_per_turn'], 1024)
+
+    def test_metrics_are_forwarded(self):
+        with mock.patch(
+            'dapr.ext.workflow._durabletask.worker.TaskHubGrpcWorker'
+        ) as mock_worker_cls:
+            WorkflowRuntime()
+            self.assertIsNone(mock_worker_cls.call_args[1]['metrics'])
+
+            metrics = WorkerMetrics()
+            WorkflowRuntime(metrics=metrics)
+            self.assertIs(mock_worker_cls.call_args[1]['metrics'], metrics)
+
 
 class WorkflowRuntimeTest(unittest.TestCase):
     def setUp(self):
@@ -554,6 +665,66 @@ class OrchestratorWrapperTest(unittest.TestCase):
             mock_warn.assert_called_once()
             self.assertIn('task-42', str(mock_warn.call_args))
 
+    def test_activity_outputs_are_externalized_only_when_opted_in(self):
+        @self.runtime.activity(name='shared_output', externalize_output=True)
+        def shared_output(ctx):
+            return 'x'
+
+        @self.runtime.activity
+        def inline_output(ctx):
+            return 'x'
+
+        self.assertEqual(self.fake_registry._externalized_activities, {'shared_output'})
+
+    def test_process_activity_wrapper_pickles_by_reference(self):
+        self.runtime.register_activity(square_activity, executor='process')
+        self.assertEqual(self.fake_registry._activity_executors['square_activity'], 'process')
+        wrapper_fn = self.fake_registry._activity_fns['square_activity']
+
+        restored = pickle.loads(pickle.dumps(wrapper_fn))
+        self.assertEqual(restored(mock.MagicMock(), 7), 49)
+
+    def test_process_activity_decorator_resolves_original_function(self):
+        decorated = self.runtime.activity(executor='process')(cube_activity)
+        wrapper_fn = self.fake_registry._activity_fns['cube_activity']
+
+        # The decorator's return value is what a worker process finds under the module name.
+        with mock.patch(f'{__name__}.cube_activity', decorated):
+            restored = pickle.loads(pickle.dumps(wrapper_fn))
+        self.assertEqual(restored(mock.MagicMock(), 3), 27)
+
+    def test_process_activity_wrapper_logs_and_reraises_on_exception(self):
+        self.runtime.register_activity(failing_process_activity, executor='process')
+        wrapper_fn = self.fake_registry._activity_fns['failing_process_activity']
+
+        mock_ctx = mock.MagicMock()
+        mock_ctx.task_id = 'task-7'
+        with mock.patch.object(self.runtime._logger, 'warning') as mock_warn:
+            with self.assertRaises(ValueError):
+                wrapper_fn(mock_ctx, 1)
+            mock_warn.assert_called_once()
+            self.assertIn('task-7', str(mock_warn.call_args))
+
+        # In a worker process, the wrapper logs under the runtime logger's name.
+        restored = pickle.loads(pickle.dumps(wrapper_fn))
+        with self.assertLogs('WorkflowRuntime', level='WARNING') as logs:
+            with self.assertRaises(ValueError):
+                restored(mock_ctx, 1)
+        self.assertIn('process boom', logs.output[0])
+
+    def test_process_activity_must_be_module_level_and_sync(self):
+        def local_act(ctx, inp):
+            return inp
+
+        async def async_act(ctx, inp):
+            return inp
+
+        with self.assertRaises(ValueError):
+            self.runtime.register_activity(local_act, executor='process')
+        with self.assertRaises(ValueError):
+            self.runtime.register_activity(async_act, executor='process')
+        self.assertEqual(listActivities, [])
+
 
 class VersionedWorkflowTest(unittest.TestCase):
     """Tests for register_versioned_workflow and @versioned_workflow decorator."""
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+
+"""
+Copyright 2026 The Dapr Authors
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+    http://www.apache.org/licenses/LICENSE-2.0
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+"""
+
+import json
+import unittest
+
+from dapr.actor.runtime._state_provider import StateProvider
+from dapr.actor.runtime.state_change import ActorStateChange, StateChangeKind
+from dapr.clients.grpc.dapr_actor_grpc_client import _to_transactional_operation
+from dapr.serializers import CompressingSerializer, DefaultJSONSerializer
+from tests.actor.fake_client import FakeDaprActorClient
+from tests.actor.utils import _async_mock, _run
+
+LARGE_VALUE = {'doc': 'lorem ipsum ' * 1000, 'count': 3}
+
+
+class CompressingSerializerTests(unittest.TestCase):
+    def test_small_value_is_not_compressed(self):
+        serializer = CompressingSerializer(threshold=1024)
+        self.assertEqual(b'{"a":1}', serializer.serialize({'a': 1}))
+
+    def test_large_value_round_trip(self):
+        for algorithm in ('zlib', 'lzma'):
+            serializer = CompressingSerializer(algorithm=algorithm, threshold=1024)
+            serialized = serializer.serialize(LARGE_VALUE)
+            self.assertTrue(serialized.startswith(f'{{"__daprz1__":"{algorithm}:'.encode()))
+            self.assertLess(len(serialized), len(DefaultJSONSerializer().serialize(LARGE_VALUE)))
+            self.assertEqual(LARGE_VALUE, serializer.deserialize(serialized))
+
+    def test_envelope_is_valid_json(self):
+        serialized = CompressingSerializer(threshold=0).serialize(LARGE_VALUE)
+        self.assertEqual(['__daprz1__'], list(json.loads(serialized)))
+
+    def test_reads_uncompressed_values(self):
+        serializer = CompressingSerializer(threshold=0)
+        self.assertEqual({'a': 1}, serializer.deserialize(b'{"a":1}'))
+
+    def test_reads_envelopes_from_other_algorithms(self):
+        written = CompressingSerializer(algorithm='lzma', threshold=0).serialize(LARGE_VALUE)
+        self.assertEqual(LARGE_VALUE, CompressingSerializer().deserialize(written))
+
+    def test_incompressible_value_is_stored_raw(self):
+        serializer = CompressingSerializer(threshold=0)
+        self.assertEqual(b'"x"', serializer.serialize('x'))
+
+    def test_values_resembling_envelopes_round_trip(self):
+        serializer = CompressingSerializer(threshold=1024)
+        for value in (
+            'daprz1:foo',
+            'daprz1:zlib:AAAA',
+            {'__daprz1__': 1},
+            {'__daprz1__': 'zlib:AAAA', 'other': True},
+            [{'__daprz1__': 'zlib:AAAA'}],
+        ):
+            serialized = serializer.serialize(value)
+            self.assertEqual(value, serializer.deserialize(serialized))
+            self.assertEqual(serialized, serializer.serialize(json.loads(serialized)))
+
+    def test_reserializing_envelope_is_idempotent(self):
+        serializer = CompressingSerializer(threshold=0)
+        serialized = serializer.serialize(LARGE_VALUE)
+        self.assertEqual(serialized, serializer.serialize(json.loads(serialized)))
+
+    def test_unknown_algorithm(self):
+        with self.assertRaises(ValueError):
+            CompressingSerializer(algorithm='brotli')
+        with self.assertRaises(ValueError):
+            CompressingSerializer().deserialize(b'{"__daprz1__":"brotli:AAAA"}')
+
+    def test_negative_threshold(self):
+        with self.assertRaises(ValueError):
+            CompressingSerializer(threshold=-1)
+
+    def test_state_provider_round_trip(self):
+        serializer = CompressingSerializer(threshold=1024)
+        client = FakeDaprActorClient()
+        provider = StateProvider(client, serializer)
+        change = ActorStateChange('doc', LARGE_VALUE, StateChangeKind.add)
+
+        client.save_state_transactionally = _async_mock()
+        _run(provider.save_state('Actor', '1', [change]))
+        body = json.loads(client.save_state_transactionally.mock.call_args[0][2])
+        stored = body[0]['request']['value']
+        self.assertTrue(stored['__daprz1__'].startswith('zlib:'))
+
+        client.get_state = _async_mock(return_value=json.dumps(stored).encode())
+        self.assertEqual((True, LARGE_VALUE), _run(provider.try_load_state('Actor', '1', 'doc')))
+
+    def test_grpc_transaction_keeps_envelope(self):
+        serializer = CompressingSerializer(threshold=1024)
+        envelope = serializer.serialize(LARGE_VALUE)
+        operation = {
+            'operation': 'upsert',
+            'request': {'key': 'doc', 'value': json.loads(envelope)},
+        }
+        proto = _to_transactional_operation(operation, serializer)
+        self.assertEqual(envelope, proto.value.value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,10 +13,42 @@ See the License for the specific language governing permissions and
 limitations under the License.
 """
 
+import dataclasses
 import datetime
+import enum
+import json
 import unittest
+from typing import Annotated, Any, Dict, List, Optional, Tuple, TypedDict
 
-from dapr.serializers.json import DefaultJSONSerializer
+import pydantic
+
+from dapr.serializers._typed import compile_decoder
+from dapr.serializers.json import DaprJSONDecoder, DefaultJSONSerializer
+
+
+class Status(enum.Enum):
+    OPEN = 'open'
+    CLOSED = 'closed'
+
+
+@dataclasses.dataclass
+class Task:
+    task_id: str
+    status: Status
+    due: Optional[datetime.datetime] = None
+    every: Optional[datetime.timedelta] = None
+    subtasks: List['Task'] = dataclasses.field(default_factory=list)
+    extra: Dict[str, Any] = dataclasses.field(default_factory=dict)
+
+
+class Event(TypedDict):
+    name: str
+    on: datetime.date
+
+
+class Account(pydantic.BaseModel):
+    account_id: str
+    opened: datetime.datetime
 
 
 class DefaultJSONSerializerTests(unittest.TestCase):
@@ -77,6 +109,123 @@ class DefaultJSONSerializerTests(unittest.TestCase):
             ),
         )
 
+    def test_deserialize_converts_nested_values_only(self):
+        serializer = DefaultJSONSerializer()
+        payload = (
+            b'{"2020-01-01":"key","items":[{"at":"2021-02-03T04:05:06Z","every":"1h30m"},'
+            b'"5s",["2022/01/02"]],"id":"2023","count":12,"empty":""}'
+        )
+
+        obj = serializer.deserialize(payload)
+        self.assertEqual(obj['2020-01-01'], 'key')
+        self.assertEqual(
+            obj['items'][0]['at'],
+            datetime.datetime(2021, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc),
+        )
+        self.assertEqual(obj['items'][0]['every'], datetime.timedelta(hours=1, minutes=30))
+        self.assertEqual(obj['items'][1], datetime.timedelta(seconds=5))
+        self.assertEqual(obj['items'][2], [datetime.datetime(2022, 1, 2)])
+        self.assertEqual((obj['id'], obj['count'], obj['empty']), ('2023', 12, ''))
+        self.assertEqual(serializer.deserialize('"10m"'), datetime.timedelta(minutes=10))
+        self.assertEqual(
+            serializer.deserialize(b'"\\u0032020-01-01"'), datetime.datetime(2020, 1, 1)
+        )
+
+    def test_deserialize_strict(self):
+        serializer = DefaultJSONSerializer(coerce_datetimes=False)
+        payload = b'{"at":"2020-01-01T01:00:00Z","every":"1h","items":["5s"]}'
+
+        obj = serializer.deserialize(payload)
+        self.assertEqual(obj, {'at': '2020-01-01T01:00:00Z', 'every': '1h', 'items': ['5s']})
+
+    def test_decoder_matches_scanning_conversion(self):
+        # The post-pass must give the same result as converting every string as it is
+        # scanned, which object hooks still use.
+        payload = json.dumps(
+            {
+                'dates': ['2020-01-01', '2020/01/02 03:04', '2020-12-31T23:59'],
+                'durations': ['1h', '4h15m40s123ms35μs', '4h15m40s123ms35μshello', '5'],
+                'nested': {'deep': [{'at': '2021-06-07T08:09:10.123+02:00'}]},
+                'other': ['abc', '', 42, 1.5, None, True],
+            }
+        )
+
+        post_pass = json.loads(payload, cls=DaprJSONDecoder)
+        while_scanning = json.loads(payload, cls=DaprJSONDecoder, object_pairs_hook=dict)
+        self.assertEqual(repr(post_pass), repr(while_scanning))
+        self.assertIsInstance(post_pass['nested']['deep'][0]['at'], datetime.datetime)
+        self.assertEqual(post_pass['durations'][2:], ['4h15m40s123ms35μshello', '5'])
+
+    def test_deserialize_dataclass(self):
+        serializer = DefaultJSONSerializer()
+        task = Task(
+            'a',
+            Status.OPEN,
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+            datetime.timedelta(minutes=5),
+            [Task('b', Status.CLOSED)],
+            {'seen': datetime.datetime(2024, 1, 1)},
+        )
+
+        data = serializer.serialize(task)
+        self.assertEqual(task, serializer.deserialize(data, Task))
+        # Without a type, the same payload decodes to plain dicts as before.
+        self.assertEqual('open', serializer.deserialize(data)['status'])
+
+    def test_deserialize_typed_strings_stay_strings(self):
+        serializer = DefaultJSONSerializer()
+        payload = b'{"task_id":"2024-01-01","status":"open","extra":{"at":"2024-01-01"}}'
+
+        task = serializer.deserialize(payload, Task)
+        self.assertEqual('2024-01-01', task.task_id)
+        # Untyped parts keep the default date coercion, unless it is turned off.
+        self.assertEqual(datetime.datetime(2024, 1, 1), task.extra['at'])
+        strict = DefaultJSONSerializer(coerce_datetimes=False)
+        self.assertEqual('2024-01-01', strict.deserialize(payload, Task).extra['at'])
+        self.assertEqual('2024-01-01', serializer.deserialize(b'"2024-01-01"', str))
+
+    def test_deserialize_typeddict_enum_and_containers(self):
+        serializer = DefaultJSONSerializer()
+
+        event = serializer.deserialize(b'{"name":"2024-01-01","on":"2024-01-02","x":1}', Event)
+        self.assertEqual({'name': '2024-01-01', 'on': datetime.date(2024, 1, 2), 'x': 1}, event)
+        self.assertEqual(Status.CLOSED, serializer.deserialize(b'"closed"', Status))
+        self.assertEqual(
+            {'a': [Status.OPEN]}, serializer.deserialize(b'{"a":["open"]}', Dict[str, List[Status]])
+        )
+        self.assertEqual(
+            (Status.OPEN, '1h'), serializer.deserialize(b'["open","1h"]', Tuple[Status, str])
+        )
+        self.assertIsNone(serializer.deserialize(b'null', Optional[Task]))
+        with self.assertRaises(ValueError):
+            serializer.deserialize(b'"unknown"', Status)
+        with self.assertRaises(TypeError):
+            serializer.deserialize(b'[]', Task)
+
+    def test_deserialize_model(self):
+        serializer = DefaultJSONSerializer()
+        account = Account(account_id='2024-01-01', opened=datetime.datetime(2024, 1, 2))
+
+        data = serializer.serialize(account)
+        self.assertEqual(b'{"account_id":"2024-01-01","opened":"2024-01-02T00:00:00"}', data)
+        self.assertEqual(account, serializer.deserialize(data, Account))
+        self.assertEqual([account], serializer.deserialize(b'[' + data + b']', List[Account]))
+        with self.assertRaises(pydantic.ValidationError):
+            serializer.deserialize(b'{"account_id":1}', Account)
+
+    def test_decoders_are_compiled_once(self):
+        self.assertIs(compile_decoder(Task), compile_decoder(Task))
+        self.assertIs(compile_decoder(List[Task]), compile_decoder(List[Task]))
+        self.assertIsNone(compile_decoder(Dict[str, Any]))
+        self.assertIsNone(compile_decoder(object))
+
+    def test_deserialize_unhashable_annotation(self):
+        serializer = DefaultJSONSerializer()
+        self.assertEqual(1, serializer.deserialize(b'1', Annotated[int, []]))
+        self.assertEqual(
+            [Status.OPEN], serializer.deserialize(b'["open"]', Annotated[List[Status], {}])
+        )
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 The Dapr Authors
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decode throughput of :class:`DefaultJSONSerializer` on typical state payloads.
+
+Compares the C-scanner decoder with its post-pass against the pure-Python scanner that
+converted every string as it was scanned, on payloads with no, some and many
+date-like strings. Also compares decoding straight into dataclasses with decoding dicts
+and converting them by hand.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import time
+from typing import List
+
+import pytest
+
+from dapr.serializers import DefaultJSONSerializer
+from dapr.serializers.json import DaprJSONDecoder
+
+pytestmark = pytest.mark.perf
+
+ROUNDS = 5
+
+
+class _ScanningDecoder(json.JSONDecoder):
+    """The previous decoder: every string goes through the Python scanner."""
+
+    def __init__(self, *args, **kwargs):
+        json.JSONDecoder.__init__(self, *args, **kwargs)
+        self.parse_string = DaprJSONDecoder.custom_scanstring
+        self.scan_once = json.scanner.py_make_scanner(self)
+
+
+def _records(count: int, with_dates: bool) -> bytes:
+    records = []
+    for i in range(count):
+        record = {
+            'id': f'order-{i}',
+            'customer': {'name': 'Ada Lovelace', 'email': 'ada@example.com', 'tier': 'gold'},
+            'items': [{'sku': f'sku-{j}', 'quantity': j, 'price': 9.99} for j in range(5)],
+            'status': 'shipped',
+            'notes': 'leave at the door',
+        }
+        if with_dates:
+            record['created'] = '2026-01-02T03:04:05.123456+00:00'
+            record['ttl'] = '1h30m'
+        records.append(record)
+    return json.dumps(records).encode('utf-8')
+
+
+# (title, payload, minimum speedup). Parsing the dates themselves costs the same either
+# way, so payloads full of them gain less.
+PAYLOADS = [
+    ('1k records, no dates', _records(1_000, with_dates=False), 3),
+    ('1k records, 2 dates each', _records(1_000, with_dates=True), 1),
+    ('10k records, no dates', _records(10_000, with_dates=False), 3),
+]
+
+
+def _best(fn) -> float:
+    best = float('inf')
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def test_decode_throughput():
+    serializer = DefaultJSONSerializer()
+    rows = []
+    for title, payload, minimum in PAYLOADS:
+        text = payload.decode('utf-8')
+        assert repr(serializer.deserialize(payload)) == repr(json.loads(text, cls=_ScanningDecoder))
+        scanning = _best(lambda: json.loads(text, cls=_ScanningDecoder))
+        current = _best(lambda: serializer.deserialize(payload))
+        rows.append((title, len(payload), scanning, current, minimum))
+
+    print(f'\n{"payload":<26} {"bytes":>10} {"scanning ms":>12} {"current ms":>11} {"speedup":>8}')
+    for title, size, scanning, current, minimum in rows:
+        print(
+            f'{title:<26} {size:>10} {scanning * 1e3:>12.2f} {current * 1e3:>11.2f}'
+            f' {scanning / current:>7.1f}x'
+        )
+        # Generous bounds; typically 6-10x without dates and 1.5-2x with them.
+        assert scanning / current > minimum
+
+
+class _Status(enum.Enum):
+    PLACED = 'placed'
+
+
+@dataclasses.dataclass
+class _Item:
+    sku: str
+    quantity: int
+    price: float
+
+
+@dataclasses.dataclass
+class _Order:
+    id: str
+    status: _Status
+    created: datetime.datetime
+    items: List[_Item]
+
+
+def _orders(count: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                'id': f'order-{i}',
+                'status': 'placed',
+                'created': '2026-01-02T03:04:05.123+00:00',
+                'items': [{'sku': f'sku-{j}', 'quantity': j, 'price': 9.99} for j in range(5)],
+            }
+            for i in range(count)
+        ]
+    ).encode('utf-8')
+
+
+def test_typed_decode_throughput():
+    serializer = DefaultJSONSerializer()
+    payload = _orders(1_000)
+
+    def by_hand():
+        return [
+            _Order(
+                record['id'],
+                _Status(record['status']),
+                record['created'],
+                [_Item(**item) for item in record['items']],
+            )
+            for record in serializer.deserialize(payload)
+        ]
+
+    def typed():
+        return serializer.deserialize(payload, List[_Order])
+
+    assert typed() == by_hand()
+    untyped_seconds = _best(lambda: serializer.deserialize(payload))
+    by_hand_seconds = _best(by_hand)
+    typed_seconds = _best(typed)
+
+    print(
+        f'\n1k orders: {untyped_seconds * 1e3:.2f}ms as dicts, {by_hand_seconds * 1e3:.2f}ms'
+        f' converted by hand, {typed_seconds * 1e3:.2f}ms typed'
+    )
+    # Typed decoding skips date detection and parses ISO dates natively; typically 5x
+    # faster than converting by hand.
+    assert typed_seconds * 2 < by_hand_seconds